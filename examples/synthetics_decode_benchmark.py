@@ -0,0 +1,89 @@
+"""
+Benchmark of decoding synthetic tests (as done by KentikSynthClient.get_all_tests) from a ListTests response.
+Compares current SynTestSettings.from_pb with the previous implementation, which deep-copied every TestSettings
+message before filtering ignored and legacy task types.
+Does not contact the API. Usage: python -m examples.synthetics_decode_benchmark [number of tests]
+"""
+
+import sys
+import timeit
+from copy import deepcopy
+from typing import Any, List
+
+import kentik_api.generated.kentik.synthetics.v202202.synthetics_pb2 as pb
+from kentik_api.internal.grpc import _from_pb_plans
+from kentik_api.synthetics.synth_client import make_synth_test
+from kentik_api.synthetics.synth_tests import IPTest
+from kentik_api.synthetics.synth_tests.base import SynTestSettings
+from kentik_api.synthetics.synth_tests.ip import IPTestSettings
+
+
+def make_response(count: int) -> pb.ListTestsResponse:
+    tests = []
+    for i in range(count):
+        test = IPTest.create(f"test-{i}", [f"10.0.{i // 256}.{i % 256}"], [str(a) for a in range(i % 10 + 1)])
+        obj = test.to_pb()
+        obj.id = str(i)
+        if i % 10 == 0:
+            obj.settings.tasks.append("knock")  # legacy task type
+        obj.settings.notification_channels.extend(f"channel-{c}" for c in range(5))
+        tests.append(obj)
+    # round-trip through serialization, as with real API responses
+    return pb.ListTestsResponse.FromString(pb.ListTestsResponse(tests=tests).SerializeToString())
+
+
+def decode(response: pb.ListTestsResponse) -> List[Any]:
+    return [make_synth_test(t) for t in response.tests]
+
+
+def decode_settings(response: pb.ListTestsResponse) -> List[Any]:
+    return [IPTestSettings.from_pb(t.settings) for t in response.tests]
+
+
+def previous_from_pb(cls: Any, obj: Any) -> Any:
+    """SynTestSettings.from_pb as implemented before task types were filtered without copying the message"""
+
+    IGNORED_TASK_TYPES = ["bgp-monitor"]
+    LEGACY_TASK_TYPES = {"knock": "ping"}
+
+    obj = deepcopy(obj)
+
+    # remove ignored task types
+    for ignored in IGNORED_TASK_TYPES:
+        while ignored in obj.tasks:
+            obj.tasks.remove(ignored)
+
+    # replace legacy task types
+    for legacy, replacement in LEGACY_TASK_TYPES.items():
+        while legacy in obj.tasks:
+            obj.tasks.remove(legacy)
+            obj.tasks.append(replacement)
+
+    return super(SynTestSettings, cls).from_pb(obj)
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    response = make_response(count)
+    current_from_pb = SynTestSettings.from_pb.__func__  # type: ignore
+    impls = [("deepcopy", previous_from_pb), ("current", current_from_pb)]
+    for label, func in [("tests", decode), ("settings only", decode_settings)]:
+        results = {name: float("inf") for name, _ in impls}
+        # implementations are run alternately, so that both are equally affected by changing system load
+        for _ in range(10):
+            for name, impl in impls:
+                SynTestSettings.from_pb = classmethod(impl)  # type: ignore
+                _from_pb_plans.clear()  # conversion plans hold references to from_pb methods of nested types
+                try:
+                    results[name] = min(results[name], timeit.timeit(lambda: func(response), number=1))
+                finally:
+                    SynTestSettings.from_pb = classmethod(current_from_pb)  # type: ignore
+                    _from_pb_plans.clear()
+        print(f"decoding {count} {label}:")
+        for name, seconds in results.items():
+            print(f"{name:>10}: {seconds * 1000:8.1f} ms")
+        print(f"   speedup: {results['deepcopy'] / results['current']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
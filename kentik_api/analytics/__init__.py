@@ -10,3 +10,4 @@ except ImportError:
 from .data_frame_cache import DFCache, dedup_data_frame
 from .flatness import FlatnessResults, flatness_analysis
 from .mapped_query import DataQueryDefinition, SQLQueryDefinition
+from .synth_results_cache import SynthResultsCache
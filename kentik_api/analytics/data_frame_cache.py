@@ -1,17 +1,114 @@
 import logging
+import os
 import sys
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Generator, List, Optional, Tuple
+from typing import Any, Dict, Generator, List, Optional, Sequence, Set, Tuple, Union
 
+import numpy as np
 import pandas as pd
 
 from kentik_api.utils.time_sequence import time_seq
 
+from .df_manifest import DFManifest
 from .mapped_query import MappedQueryFn
 
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+except ImportError:
+    # filters and columns are applied after reading each file
+    ds = None
+
 log = logging.getLogger("DFCache")
 
+# row filters in DNF form used by pyarrow and pandas.read_parquet: list of (column, op, value) tuples (conjunction)
+# or list of such lists (disjunction of conjunctions)
+Filter = Tuple[str, str, Any]
+Filters = Union[List[Filter], List[List[Filter]]]
+
+_FILTER_OPS = {
+    "=": lambda c, v: c == v,
+    "==": lambda c, v: c == v,
+    "!=": lambda c, v: c != v,
+    "<": lambda c, v: c < v,
+    "<=": lambda c, v: c <= v,
+    ">": lambda c, v: c > v,
+    ">=": lambda c, v: c >= v,
+    "in": lambda c, v: c.isin(list(v)),
+    "not in": lambda c, v: ~c.isin(list(v)),
+}
+
+
+def _disjunction(filters: Filters) -> List[List[Filter]]:
+    if filters and isinstance(filters[0], list):
+        return filters  # type: ignore
+    return [filters]  # type: ignore
+
+
+def _parquet_columns(path: Path) -> Optional[List[str]]:
+    """Names of columns stored in Parquet file (read from file metadata), None if there is no engine to read them"""
+    try:
+        import pyarrow.parquet as pq  # pylint: disable=import-outside-toplevel,redefined-outer-name
+
+        return pq.read_schema(path).names
+    except ImportError:
+        pass
+    try:
+        import fastparquet  # type: ignore  # pylint: disable=import-outside-toplevel
+
+        return list(fastparquet.ParquetFile(str(path)).columns)
+    except ImportError:
+        return None
+
+
+def _utc(t: datetime) -> datetime:
+    """Timestamp in UTC; naive timestamps are taken as UTC"""
+    return t.replace(tzinfo=timezone.utc) if t.tzinfo is None else t.astimezone(timezone.utc)
+
+
+def _partition_start(t: datetime, weekly: bool) -> datetime:
+    """Start of the day (or week starting on Monday) containing t, in UTC"""
+    day = _utc(t).replace(hour=0, minute=0, second=0, microsecond=0)
+    return day - timedelta(days=day.weekday()) if weekly else day
+
+
+def _partition_starts(index: pd.Index, weekly: bool) -> Any:
+    """Vectorized _partition_start for DatetimeIndex"""
+    utc = index.tz_localize("UTC") if index.tz is None else index.tz_convert("UTC")
+    days = utc.floor("D")
+    starts = days - pd.to_timedelta(days.weekday, unit="D") if weekly else days
+    return [t.to_pydatetime() for t in starts]
+
+
+def filters_mask(df: pd.DataFrame, filters: Filters) -> Any:
+    """
+    Evaluate DNF filters (see Filters) over DataFrame columns or index levels
+    :return: boolean numpy array selecting matching rows
+    """
+    mask = np.zeros(df.shape[0], dtype=bool)
+    for conjunction in _disjunction(filters):
+        m = np.ones(df.shape[0], dtype=bool)
+        for column, op, value in conjunction:
+            if op not in _FILTER_OPS:
+                raise ValueError(f"Unsupported filter operator '{op}' (supported: {', '.join(_FILTER_OPS)})")
+            if column in df.columns:
+                values = df[column]
+            elif column in df.index.names:
+                values = df.index.get_level_values(column).to_series()
+            else:
+                # column missing in the file - all values are null, which never match (as in pyarrow)
+                m &= False
+                continue
+            m &= np.asarray(_FILTER_OPS[op](values, value), dtype=bool)
+        mask |= m
+    return mask
+
+
+def _filter_columns(filters: Optional[Filters]) -> List[str]:
+    return [c for conjunction in _disjunction(filters) for c, _, _ in conjunction] if filters else []
+
 
 def dedup_data_frame(df: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
     """
@@ -44,6 +141,7 @@ class DFCache:
     extension = ".parquet"
     separator = "_"
     filename_format = "{start}" + separator + "{end}" + extension
+    partitions = {"day": timedelta(days=1), "week": timedelta(days=7)}  # supported compaction partitions
 
     @classmethod
     def parse_df_filename(cls, filename: Path) -> Tuple[Optional[datetime], Optional[datetime]]:
@@ -90,23 +188,35 @@ class DFCache:
             if not directory.is_dir():
                 raise RuntimeError("{}: Path is not a directory: {}".format(self.__class__, directory))
         log.debug("data_dir: %s", self.data_dir)
+        self.manifest = DFManifest(self.data_dir, self._glob_files, self.parse_df_filename)
         log.debug("oldest: %s newest: %s", self.oldest, self.newest)
 
     def __repr__(self) -> str:
         return f"DFCache: dir: {self.data_dir.resolve()}"
 
+    def _glob_files(self) -> List[Path]:
+        return list(self.data_dir.glob(self.filename_format.format(start="*", end="*")))
+
+    def rebuild_manifest(self) -> None:
+        """
+        Rebuild the index of cached files from directory content.
+        Needed only if files were added or removed by other means while the cache object exists.
+        """
+        self.manifest.rebuild()
+
     @property
     def files(self) -> Generator[Path, None, None]:
-        for f in sorted(self.data_dir.glob(self.filename_format.format(start="*", end="*"))):
-            yield f
+        """Files with valid names, ordered by start time"""
+        for e in self.manifest.entries:
+            yield self.data_dir / e.name
 
     @property
     def file_count(self) -> int:
-        return len(list(self.files))
+        return len(self.manifest)
 
     @property
     def data_size(self) -> int:
-        return sum(f.stat().st_size for f in self.files)
+        return self.manifest.size
 
     @property
     def is_empty(self) -> bool:
@@ -114,31 +224,11 @@ class DFCache:
 
     @property
     def oldest(self) -> Optional[datetime]:
-        match = self.filename_format.format(start="*", end="*")
-        try:
-            first = sorted(list(self.data_dir.glob(match)))[0]
-        except IndexError:
-            log.debug("No match for %s in data directory %s", match, self.data_dir)
-            return None
-        start, end = self.parse_df_filename(first)
-        if start is None or end is None:
-            log.critical("Invalid filename %s in data directory %s", first, self.data_dir)
-            return None
-        return start
+        return self.manifest.oldest
 
     @property
     def newest(self) -> Optional[datetime]:
-        match = self.filename_format.format(start="*", end="*")
-        try:
-            first = sorted(list(self.data_dir.glob(match)))[-1]
-        except IndexError:
-            log.debug("No match for %s in data directory %s", match, self.data_dir)
-            return None
-        start, end = self.parse_df_filename(first)
-        if start is None or end is None:
-            log.critical("Invalid filename %s in data directory %s", first, self.data_dir)
-            return None
-        return end
+        return self.manifest.newest
 
     def info(self, out=None):
         if out is None:
@@ -169,24 +259,32 @@ class DFCache:
             start = self.oldest
         if end is None:
             end = self.newest
-        for f in self.files:
-            fs, fe = self.parse_df_filename(f)
-            if fs is None or fe is None:
-                continue
-            if contained:
-                # consider only files containing only data points in the interval
-                if fs >= start and fe <= end:  # type: ignore
-                    yield f
-            # consider all files with any data in the specified interval
-            elif fs <= end and fe > start:  # type: ignore
-                yield f
+        assert start is not None and end is not None
+        entries = self.manifest.contained(start, end) if contained else self.manifest.overlapping(start, end)
+        for e in entries:
+            yield self.data_dir / e.name
 
     def get(
         self,
         start: Optional[datetime] = None,
         end: Optional[datetime] = None,
         dedup_columns: Optional[List[str]] = None,
+        columns: Optional[List[str]] = None,
+        filters: Optional[Filters] = None,
     ) -> Optional[pd.DataFrame]:
+        """
+        Retrieve cached data with index in [start, end]
+        :param start: beginning of the time interval (default: oldest data in the cache)
+        :param end: end of the time interval (default: newest data in the cache)
+        :param dedup_columns: list of column names used for row deduplication
+        :param columns: columns to retrieve (index is always retrieved), default: all
+        :param filters: row filters in the format used by pyarrow and pandas.read_parquet, e.g.
+                        [("link", "in", ["dev1:eth0", "dev2:eth1"]), ("bps", ">", 0)]
+        If pyarrow is installed (version 10 or newer if filters are specified) and columns or filters are specified,
+        files in the time interval are scanned as one dataset (with schemas of individual files unified) and the time
+        interval, filters and column selection are pushed down into the scan (only matching row groups and selected
+        columns are read). Otherwise, they are applied after reading each file.
+        """
         if self.is_empty:
             log.debug("get: cache is empty")
             return None
@@ -194,19 +292,77 @@ class DFCache:
             start = self.oldest
         if end is None:
             end = self.newest
-        log.debug("get: start: %s end: %s", start, end)
-        df = pd.concat([pd.read_parquet(f) for f in self.files_in_range(start, end)])
+        log.debug("get: start: %s end: %s columns: %s filters: %s", start, end, columns, filters)
+        files = list(self.files_in_range(start, end))
+        if not files:
+            log.debug("get: no data for %s -> %s", start, end)
+            return None
+        extra = [c for c in dedup_columns or [] if columns is not None and c not in columns]
+        read_columns = None if columns is None else columns + extra
+        # pq.filters_to_expression is available in pyarrow >= 10
+        if (
+            ds is not None
+            and (columns is not None or filters)
+            and (not filters or hasattr(pq, "filters_to_expression"))
+        ):
+            df = self._scan(files, start, end, read_columns, filters)  # type: ignore
+        else:
+            df = pd.concat([self._read(f, read_columns, filters) for f in files])
         out = pd.DataFrame(data=df.loc[(df.index >= start) & (df.index <= end)])
         if dedup_columns:
             # Deduplicate the data based on specified columns
-            return dedup_data_frame(out, dedup_columns)
+            out = dedup_data_frame(out, dedup_columns)
+        if extra:
+            out = out.drop(columns=[c for c in extra if c in out.columns])
+        return out
+
+    @staticmethod
+    def _scan(
+        files: Sequence[Path],
+        start: datetime,
+        end: datetime,
+        columns: Optional[List[str]],
+        filters: Optional[Filters],
+    ) -> pd.DataFrame:
+        # files may differ in schema (e.g. column added later, or int64 column with NaN in other file stored as double)
+        schemas = [pq.read_schema(f) for f in files]
+        try:
+            schema = pa.unify_schemas(schemas, promote_options="permissive")
+        except TypeError:  # pyarrow < 14 does not support type promotion
+            schema = pa.unify_schemas(schemas)
+        dataset = ds.dataset([str(f) for f in files], schema=schema, format="parquet")
+        metadata = dataset.schema.pandas_metadata or {}
+        index_columns = [c for c in metadata.get("index_columns", []) if isinstance(c, str)]
+        expression = None
+        if len(index_columns) == 1 and pa.types.is_timestamp(dataset.schema.field(index_columns[0]).type):
+            index = ds.field(index_columns[0])
+            expression = (index >= pa.scalar(start)) & (index <= pa.scalar(end))
+        if filters:
+            predicate = pq.filters_to_expression(filters)
+            expression = predicate if expression is None else expression & predicate
+        if columns is not None:
+            # index columns are needed to restore the index
+            columns = index_columns + [c for c in columns if c not in index_columns]
+        return dataset.to_table(columns=columns, filter=expression).to_pandas()
+
+    @staticmethod
+    def _read(file: Path, columns: Optional[List[str]], filters: Optional[Filters]) -> pd.DataFrame:
+        if columns is None:
+            df = pd.read_parquet(file)
         else:
-            return out
+            wanted = columns + [c for c in _filter_columns(filters) if c not in columns]
+            stored = _parquet_columns(file)
+            # columns missing in the file (e.g. added later) are NaN-filled when concatenated with other files
+            df = pd.read_parquet(file, columns=wanted if stored is None else [c for c in wanted if c in stored])
+        if filters:
+            df = df.loc[filters_mask(df, filters)]
+        return df if columns is None else df[[c for c in columns if c in df.columns]]
 
     def store(self, df: pd.DataFrame) -> None:
         out = self.data_dir / self.filename_format.format(start=df.index[0].isoformat(), end=df.index[-1].isoformat())
         log.debug("store: writing df (%s) to %s", " x ".join(str(_d) for _d in df.shape), out)
         df.to_parquet(out, index=True)
+        self.manifest.add(out, rows=df.shape[0])
 
     def clear(self) -> None:
         log.debug("clear: all data be gone")
@@ -214,9 +370,103 @@ class DFCache:
 
     def drop(self, start: Optional[datetime], end: Optional[datetime]) -> None:
         log.debug("drop: start: %s end: %s", start, end)
-        for f in self.files_in_range(start, end, contained=True):
+        dropped = []
+        for f in list(self.files_in_range(start, end, contained=True)):
             log.debug("drop: deleting %s", f.name)
-            f.unlink()
+            f.unlink(missing_ok=True)
+            dropped.append(f.name)
+        self.manifest.remove(dropped)
+
+    def compact(
+        self,
+        partition: str = "day",
+        dedup_columns: Optional[List[str]] = None,
+        before: Optional[datetime] = None,
+        max_partitions: Optional[int] = None,
+        **kwargs,
+    ) -> List[Path]:
+        """
+        Merge files into one file per time partition. Partition boundaries are computed in UTC (naive timestamps are
+        taken as UTC); rows of files crossing a boundary (e.g. midnight) are split among the partitions they belong to.
+        Merged data are de-duplicated and sorted by index, written to temporary files and then moved in place of
+        the original files, so that data are never missing from the cache. If the process is interrupted after
+        the move, remaining original files contain only duplicate data and they are merged again by the next run.
+        Only partitions with more than one file, or with a file extending beyond the partition, are processed, so
+        compaction can be run repeatedly (e.g. after each fetch_latest) and its cost is proportional to the amount
+        of new data.
+        :param partition: "day" or "week" (weeks start on Monday)
+        :param dedup_columns: list of column names used for row deduplication (default: identical rows are removed)
+        :param before: compact only partitions ending at or before this time (e.g. to skip partition still
+                       being written); rows of processed files in later partitions are written to separate files
+        :param max_partitions: maximum number of partitions compacted in one call (oldest first)
+        :param kwargs: additional arguments for DataFrame.to_parquet (e.g. row_group_size with pyarrow engine)
+        :return: list of written files
+        """
+        if partition not in self.partitions:
+            raise ValueError(f"Unsupported partition: {partition} (supported: {', '.join(self.partitions)})")
+        step = self.partitions[partition]
+        weekly = partition == "week"
+        limit = None if before is None else _utc(before)
+        spans: Dict[str, List[datetime]] = {}  # partitions overlapped by each file
+        partitions: Dict[datetime, List[str]] = {}
+        for e in self.manifest.entries:
+            p, last = _partition_start(e.start, weekly), _partition_start(e.end, weekly)
+            spans[e.name] = []
+            while p <= last:
+                spans[e.name].append(p)
+                partitions.setdefault(p, []).append(e.name)
+                p += step
+        selected = [
+            p
+            for p, names in sorted(partitions.items())
+            if (limit is None or p + step <= limit) and (len(names) > 1 or len(spans[names[0]]) > 1)
+        ]
+        if max_partitions is not None:
+            selected = selected[:max_partitions]
+        chosen = set(selected)
+        out: List[Path] = []
+        done: Set[datetime] = set()
+        for p in selected:
+            if p in done:
+                continue
+            # selected partitions connected by files crossing their boundaries are merged together
+            group, names = {p}, list(partitions[p])
+            for n in names:
+                for q in spans[n]:
+                    if q in chosen and q not in group:
+                        group.add(q)
+                        names.extend(m for m in partitions[q] if m not in names)
+            done |= group
+            log.debug("compact: merging %d files of partition(s) %s", len(names), ", ".join(map(str, sorted(group))))
+            df = pd.concat([pd.read_parquet(self.data_dir / n) for n in names])
+            written: List[Tuple[Path, Optional[int]]] = []
+            for _, rows in df.groupby(_partition_starts(df.index, weekly), sort=True):
+                target = self.data_dir / self.filename_format.format(
+                    start=rows.index.min().isoformat(), end=rows.index.max().isoformat()
+                )
+                if target.exists() and target.name not in names:
+                    # rows of a file crossing into unprocessed partition collide with a file of that partition
+                    rows = pd.concat([rows, pd.read_parquet(target)])
+                    names.append(target.name)
+                rows = self._dedup(rows, dedup_columns).sort_index(kind="stable")
+                tmp = target.with_suffix(".tmp")
+                rows.to_parquet(tmp, index=True, **kwargs)
+                os.replace(tmp, target)
+                written.append((target, rows.shape[0]))
+            targets = {t.name for t, _ in written}
+            for n in names:
+                if n not in targets:
+                    (self.data_dir / n).unlink(missing_ok=True)
+            self.manifest.replace(names, written)
+            out.extend(t for t, _ in written)
+        log.debug("compact: wrote %d file(s)", len(out))
+        return out
+
+    @staticmethod
+    def _dedup(df: pd.DataFrame, dedup_columns: Optional[List[str]]) -> pd.DataFrame:
+        if dedup_columns:
+            return dedup_data_frame(df, dedup_columns)
+        return df[~df.reset_index().duplicated().to_numpy()]
 
     def fetch(
         self,
@@ -0,0 +1,258 @@
+import bisect
+import json
+import logging
+import os
+import uuid
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+log = logging.getLogger("DFManifest")
+
+
+@dataclass(frozen=True)
+class ManifestEntry:
+    name: str  # file name relative to the cache directory
+    start: datetime
+    end: datetime
+    rows: Optional[int]  # None if unknown (e.g. Parquet metadata could not be read)
+    size: int  # bytes
+
+    def to_dict(self) -> Dict:
+        d = asdict(self)
+        d["start"] = self.start.isoformat()
+        d["end"] = self.end.isoformat()
+        return d
+
+    @classmethod
+    def from_dict(cls, d: Dict) -> "ManifestEntry":
+        return cls(
+            d["name"], datetime.fromisoformat(d["start"]), datetime.fromisoformat(d["end"]), d["rows"], d["size"]
+        )
+
+
+def parquet_row_count(path: Path) -> Optional[int]:
+    """Number of rows according to Parquet file metadata (without reading the data), None if it cannot be read"""
+    try:
+        import pyarrow.parquet as pq  # pylint: disable=import-outside-toplevel
+
+        return pq.read_metadata(path).num_rows
+    except ImportError:
+        pass
+    except Exception as exc:  # pylint: disable=broad-except
+        log.warning("Failed to read metadata of %s: %s", path, exc)
+        return None
+    try:
+        import fastparquet  # type: ignore  # pylint: disable=import-outside-toplevel
+
+        return fastparquet.ParquetFile(str(path)).count()
+    except Exception as exc:  # pylint: disable=broad-except
+        log.warning("Failed to read metadata of %s: %s", path, exc)
+        return None
+
+
+class DFManifest:
+    """
+    Sorted interval index of DFCache files persisted in the cache directory.
+    Entries are kept sorted by start time, together with running maximum of end times, so that:
+    - files overlapping an interval are found by binary search (O(log n + k), k being number of files starting
+      in the interval or overlapping it),
+    - file count, total size, oldest and newest timestamps are available in O(1).
+    The manifest is loaded once and reconciled with directory content (files added or removed by other means, e.g.
+    copied from another machine); refresh() repeats the reconciliation.
+    The manifest file is replaced atomically on every change. Queries and updates check whether it was replaced
+    (e.g. by another DFManifest instance for the same directory) and reload it if so. Concurrent updates from
+    multiple writers are not serialized, so one writer's changes may be lost; refresh() recovers them.
+    """
+
+    filename = "manifest.json"
+    version = 1
+
+    def __init__(
+        self,
+        directory: Path,
+        list_files: Callable[[], Iterable[Path]],
+        parse_filename: Callable[[Path], Tuple[Optional[datetime], Optional[datetime]]],
+    ) -> None:
+        self.directory = directory
+        self._list_files = list_files
+        self._parse_filename = parse_filename
+        self._entries: List[ManifestEntry] = []
+        self._starts: List[datetime] = []
+        self._max_ends: List[datetime] = []
+        self._size = 0
+        self._signature: Optional[Tuple[int, int, int]] = None  # (inode, mtime, size) of the loaded manifest file
+        self._load()
+        self.refresh()
+
+    @property
+    def path(self) -> Path:
+        return self.directory / self.filename
+
+    # persistence
+
+    def _stat(self) -> Optional[Tuple[int, int, int]]:
+        try:
+            st = self.path.stat()
+        except FileNotFoundError:
+            return None
+        return st.st_ino, st.st_mtime_ns, st.st_size
+
+    def _reload_if_changed(self) -> None:
+        signature = self._stat()
+        if signature is not None and signature != self._signature:
+            log.debug("Manifest %s changed, reloading", self.path)
+            self._load()
+
+    def _load(self) -> None:
+        # stat before reading - if the file is replaced in between, it is reloaded again on next check
+        self._signature = self._stat()
+        try:
+            with self.path.open() as f:
+                data = json.load(f)
+            if data.get("version") != self.version:
+                raise ValueError(f"unsupported version {data.get('version')}")
+            self._set_entries([ManifestEntry.from_dict(d) for d in data["entries"]])
+        except FileNotFoundError:
+            pass
+        except (ValueError, KeyError, TypeError) as exc:
+            log.warning("Ignoring invalid manifest %s: %s", self.path, exc)
+
+    def _save(self) -> None:
+        # unique temporary file, so that concurrent writers don't write to the same one
+        tmp = self.path.with_name(f"{self.path.stem}.{uuid.uuid4().hex}.tmp")
+        try:
+            with tmp.open("x") as f:
+                json.dump({"version": self.version, "entries": [e.to_dict() for e in self._entries]}, f)
+                f.flush()
+                st = os.fstat(f.fileno())
+            os.replace(tmp, self.path)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+        # os.replace keeps inode and mtime of the temporary file
+        self._signature = st.st_ino, st.st_mtime_ns, st.st_size
+
+    def refresh(self) -> None:
+        """Reconcile the manifest with files present in the directory"""
+        self._reload_if_changed()
+        self._reconcile()
+
+    def rebuild(self) -> None:
+        """Build the manifest from scratch from files in the directory"""
+        self._set_entries([])
+        self._reconcile()
+        self._save()
+
+    def _reconcile(self) -> None:
+        present = {f.name: f for f in self._list_files()}
+        known = {e.name for e in self._entries}
+        entries = [e for e in self._entries if e.name in present]
+        added = [e for e in (self._make_entry(present[name]) for name in present.keys() - known) if e is not None]
+        entries.extend(added)
+        if len(entries) != len(self._entries) or added:
+            log.debug("refresh: %d file(s) added, %d removed", len(added), len(known - present.keys()))
+            self._set_entries(entries)
+            self._save()
+
+    def _make_entry(self, path: Path, rows: Optional[int] = None) -> Optional[ManifestEntry]:
+        start, end = self._parse_filename(path)
+        if start is None or end is None:
+            return None
+        if rows is None:
+            rows = parquet_row_count(path)
+        return ManifestEntry(path.name, start, end, rows, path.stat().st_size)
+
+    # index maintenance
+
+    def _set_entries(self, entries: List[ManifestEntry]) -> None:
+        self._entries = sorted(entries, key=lambda e: (e.start, e.end, e.name))
+        self._reindex()
+
+    def _reindex(self) -> None:
+        self._starts = [e.start for e in self._entries]
+        self._max_ends = []
+        for e in self._entries:
+            self._max_ends.append(max(self._max_ends[-1], e.end) if self._max_ends else e.end)
+        self._size = sum(e.size for e in self._entries)
+
+    def add(self, path: Path, rows: Optional[int] = None) -> None:
+        """Register (new or rewritten) file"""
+        self._reload_if_changed()
+        entry = self._make_entry(path, rows)
+        if entry is None:
+            log.warning("add: ignoring file with invalid name: %s", path)
+            return
+        entries = [e for e in self._entries if e.name != entry.name]
+        if len(entries) == len(self._entries) and (not self._entries or entry.start >= self._starts[-1]):
+            # common case - appending newer data
+            self._entries.append(entry)
+            self._starts.append(entry.start)
+            self._max_ends.append(max(self._max_ends[-1], entry.end) if self._max_ends else entry.end)
+            self._size += entry.size
+        else:
+            entries.append(entry)
+            self._set_entries(entries)
+        self._save()
+
+    def replace(self, names: Iterable[str], paths: Iterable[Tuple[Path, Optional[int]]]) -> None:
+        """
+        Replace entries of files in names by entries for paths (which may include some of the replaced files)
+        :param paths: (path, rows) tuples, rows may be None if unknown
+        """
+        self._reload_if_changed()
+        added = [self._make_entry(path, rows) for path, rows in paths]
+        removed = set(names) | {e.name for e in added if e is not None}
+        entries = [e for e in self._entries if e.name not in removed]
+        entries.extend(e for e in added if e is not None)
+        self._set_entries(entries)
+        self._save()
+
+    def remove(self, names: Iterable[str]) -> None:
+        self._reload_if_changed()
+        removed = set(names)
+        if removed:
+            self._set_entries([e for e in self._entries if e.name not in removed])
+            self._save()
+
+    # queries
+
+    @property
+    def entries(self) -> List[ManifestEntry]:
+        self._reload_if_changed()
+        return list(self._entries)
+
+    def __len__(self) -> int:
+        self._reload_if_changed()
+        return len(self._entries)
+
+    @property
+    def size(self) -> int:
+        self._reload_if_changed()
+        return self._size
+
+    @property
+    def oldest(self) -> Optional[datetime]:
+        self._reload_if_changed()
+        return self._starts[0] if self._starts else None
+
+    @property
+    def newest(self) -> Optional[datetime]:
+        self._reload_if_changed()
+        return self._max_ends[-1] if self._max_ends else None
+
+    def overlapping(self, start: datetime, end: datetime) -> List[ManifestEntry]:
+        """Entries with start <= end and end > start"""
+        self._reload_if_changed()
+        hi = bisect.bisect_right(self._starts, end)
+        # running maximum of ends is non-decreasing, entries before lo end at or before start
+        lo = bisect.bisect_right(self._max_ends, start, 0, hi)
+        return [e for e in self._entries[lo:hi] if e.end > start]
+
+    def contained(self, start: datetime, end: datetime) -> List[ManifestEntry]:
+        """Entries with start >= start and end <= end"""
+        self._reload_if_changed()
+        lo = bisect.bisect_left(self._starts, start)
+        hi = bisect.bisect_right(self._starts, end)
+        return [e for e in self._entries[lo:hi] if e.end <= end]
@@ -0,0 +1,205 @@
+import logging
+import os
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from kentik_api.public.types import ID
+from kentik_api.synthetics.synth_client import KentikSynthClient
+from kentik_api.synthetics.synth_tests.results import RESULTS_COLUMNS, results_data_frame
+
+from .data_frame_cache import DFCache
+
+log = logging.getLogger("SynthResultsCache")
+
+Interval = Tuple[datetime, datetime]
+
+# columns identifying a row; there may be multiple tasks (e.g. ping and http) per test, agent and time
+KEY_COLUMNS = ["test_id", "agent_id", "time", "task_type", "target"]
+
+
+def _utc(t: datetime) -> datetime:
+    return t.astimezone(timezone.utc)
+
+
+def merge_intervals(intervals: List[Interval]) -> List[Interval]:
+    """Merge overlapping and adjacent intervals, return them sorted"""
+    out: List[Interval] = []
+    for start, end in sorted(intervals):
+        if out and start <= out[-1][1]:
+            out[-1] = (out[-1][0], max(out[-1][1], end))
+        else:
+            out.append((start, end))
+    return out
+
+
+def subtract_intervals(start: datetime, end: datetime, covered: List[Interval]) -> List[Interval]:
+    """Return parts of [start, end) not covered by (merged and sorted) intervals"""
+    gaps = []
+    cursor = start
+    for s, e in covered:
+        if e <= cursor:
+            continue
+        if s >= end:
+            break
+        if s > cursor:
+            gaps.append((cursor, s))
+        cursor = max(cursor, e)
+    if cursor < end:
+        gaps.append((cursor, end))
+    return gaps
+
+
+def _select(df: pd.DataFrame, start: datetime, end: datetime, agent_ids: Optional[List[ID]]) -> pd.DataFrame:
+    """Rows with time in [start, end] (and of given agents), de-duplicated and sorted by time"""
+    mask = (df["time"] >= start) & (df["time"] <= end)
+    if agent_ids:
+        mask &= df["agent_id"].isin([str(a) for a in agent_ids])
+    df = df.loc[mask].drop_duplicates(subset=KEY_COLUMNS)
+    return df.sort_values(["time", "test_id", "agent_id"], kind="stable").reset_index(drop=True)[RESULTS_COLUMNS]
+
+
+class SynthResultsCache:
+    """
+    On-disk cache of synthetic test results (as produced by KentikSynthClient.results_for_tests_df).
+    Results are stored in Parquet files, one directory per test, with file names recording the time interval
+    requested from the API (in the same format as DFCache), so that the cache knows which intervals are already
+    covered for every test even if the API returned no results for them. fetch() requests only the missing
+    intervals and serves the rest from disk.
+    Results are always fetched for all agents and tasks and filtered when read, so that the coverage is per test only.
+    Results of the last settle_delay before now may still be incomplete (results arrive with delay), so fetch()
+    returns them but doesn't record that part of the interval as covered; it is requested again by the next fetch().
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        settle_delay: timedelta = timedelta(minutes=10),
+        clock: Callable[[], datetime] = lambda: datetime.now(timezone.utc),
+    ) -> None:
+        self.data_dir = directory
+        self.settle_delay = settle_delay
+        self._clock = clock
+        if not self.data_dir.exists():
+            self.data_dir.mkdir(parents=True)
+        elif not directory.is_dir():
+            raise RuntimeError("{}: Path is not a directory: {}".format(self.__class__, directory))
+        log.debug("data_dir: %s", self.data_dir)
+
+    def __repr__(self) -> str:
+        return f"SynthResultsCache: dir: {self.data_dir.resolve()}"
+
+    def _test_dir(self, test_id: ID) -> Path:
+        return self.data_dir / str(test_id)
+
+    def _files(self, test_id: ID) -> List[Tuple[Path, datetime, datetime]]:
+        out: List[Tuple[Path, datetime, datetime]] = []
+        test_dir = self._test_dir(test_id)
+        if not test_dir.is_dir():
+            return out
+        for f in sorted(test_dir.glob(DFCache.filename_format.format(start="*", end="*"))):
+            start, end = DFCache.parse_df_filename(f)
+            if start is not None and end is not None:
+                out.append((f, start, end))
+        return out
+
+    @property
+    def test_ids(self) -> List[ID]:
+        return sorted(ID(d.name) for d in self.data_dir.iterdir() if d.is_dir())
+
+    def coverage(self, test_id: ID) -> List[Interval]:
+        """Time intervals for which results of the test are stored"""
+        return merge_intervals([(start, end) for _, start, end in self._files(test_id)])
+
+    def gaps(self, test_id: ID, start: datetime, end: datetime) -> List[Interval]:
+        """Time intervals within [start, end) for which results of the test are not stored"""
+        return subtract_intervals(_utc(start), _utc(end), self.coverage(test_id))
+
+    def store(self, test_id: ID, start: datetime, end: datetime, df: pd.DataFrame) -> None:
+        """Store results of test_id covering [start, end) (the DataFrame may be empty)"""
+        test_dir = self._test_dir(test_id)
+        test_dir.mkdir(exist_ok=True)
+        out = test_dir / DFCache.filename_format.format(start=_utc(start).isoformat(), end=_utc(end).isoformat())
+        log.debug("store: writing %d rows to %s", df.shape[0], out)
+        # readers (and coverage) must never see partially written file; unique name for concurrent writers
+        tmp = out.with_name(f"{out.stem}.{uuid.uuid4().hex}.tmp")
+        try:
+            df.to_parquet(tmp, index=False)
+            os.replace(tmp, out)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+
+    def get(
+        self,
+        test_ids: List[ID],
+        start: datetime,
+        end: datetime,
+        agent_ids: Optional[List[ID]] = None,
+    ) -> pd.DataFrame:
+        """Return stored results for given tests (and agents) with time in [start, end], de-duplicated"""
+        start, end = _utc(start), _utc(end)
+        frames = [
+            pd.read_parquet(f)
+            for test_id in test_ids
+            for f, fs, fe in self._files(test_id)
+            if fs <= end and fe >= start
+        ]
+        if not frames:
+            return results_data_frame([])
+        return _select(pd.concat(frames, ignore_index=True), start, end, agent_ids)
+
+    def fetch(
+        self,
+        client: KentikSynthClient,
+        test_ids: List[ID],
+        start: datetime,
+        end: datetime,
+        agent_ids: Optional[List[ID]] = None,
+        window: Optional[timedelta] = None,
+        **kwargs: Any,
+    ) -> pd.DataFrame:
+        """
+        Return results for given tests in [start, end], fetching only intervals not yet stored in the cache
+        :param client: synthetics client used to fetch missing data
+        :param agent_ids: filter results by agent (missing data are always fetched for all agents)
+        :param window: fetch missing data in chunks of this size (see KentikSynthClient.iter_results_for_tests)
+        :param kwargs: additional arguments for KentikSynthClient.results_for_tests_df (e.g. batch_size)
+        """
+        # tests with identical gaps are fetched together
+        missing: Dict[Interval, List[ID]] = {}
+        for test_id in test_ids:
+            for gap in self.gaps(test_id, start, end):
+                missing.setdefault(gap, []).append(test_id)
+        settled = _utc(self._clock()) - self.settle_delay
+        unsettled = []
+        for (gap_start, gap_end), ids in missing.items():
+            log.debug("fetch: fetching %d test(s) from %s to %s", len(ids), gap_start, gap_end)
+            df = client.results_for_tests_df(ids, gap_start, gap_end, window=window, **kwargs)
+            store_end = min(gap_end, settled)
+            if store_end < gap_end:
+                # results may still arrive for this part, don't record it as covered
+                unsettled.append(df.loc[df["time"] >= store_end])
+                df = df.loc[df["time"] < store_end]
+            if store_end <= gap_start:
+                continue
+            by_test = dict(tuple(df.groupby("test_id", observed=True))) if not df.empty else {}
+            for test_id in ids:
+                self.store(test_id, gap_start, store_end, by_test.get(str(test_id), df.iloc[0:0]))
+        out = self.get(test_ids, start, end, agent_ids)
+        unsettled = [df for df in unsettled if not df.empty]
+        if unsettled:
+            out = _select(pd.concat([out] + unsettled, ignore_index=True), _utc(start), _utc(end), agent_ids)
+        return out
+
+    def drop(self, test_id: ID) -> None:
+        for f, _, _ in self._files(test_id):
+            f.unlink()
+
+    def clear(self) -> None:
+        log.debug("clear: all data be gone")
+        for test_id in self.test_ids:
+            self.drop(test_id)
@@ -1,7 +1,40 @@
 from dataclasses import dataclass
+from typing import Iterable, Iterator, Optional, Union
 
 
 @dataclass
 class APICallResponse:
+    """
+    Response to API call. The body is kept as received: bytes are decoded to text only when "text" is accessed.
+    Streamed responses carry body chunks in "stream" instead of "body"; the stream can be consumed only once.
+    """
+
     http_status_code: int
-    text: str  # response body
+    body: Union[str, bytes] = b""
+    stream: Optional[Iterable[bytes]] = None
+    encoding: str = "utf-8"
+
+    @property
+    def text(self) -> str:
+        """Response body decoded to str (reads whole stream for streamed responses)"""
+        if isinstance(self.body, str) and self.stream is None:
+            return self.body
+        return self.content.decode(self.encoding, errors="replace")
+
+    @property
+    def content(self) -> bytes:
+        """Response body as bytes (reads whole stream for streamed responses)"""
+        if self.stream is not None:
+            self.body = b"".join(self.stream)
+            self.stream = None
+        if isinstance(self.body, str):
+            return self.body.encode(self.encoding)
+        return self.body
+
+    def iter_content(self) -> Iterator[bytes]:
+        """Iterate over response body chunks, without loading the whole body for streamed responses"""
+        if self.stream is not None:
+            stream, self.stream = self.stream, None
+            yield from stream
+        else:
+            yield self.content
@@ -1,7 +1,9 @@
 # Standard library imports
 import logging
+import time
 from http import HTTPStatus
 from typing import Any, Dict, Optional, Tuple, Union
+from urllib.parse import urlparse
 
 # Third party imports
 from requests import RequestException, Response, Timeout
@@ -9,6 +11,7 @@ from requests import RequestException, Response, Timeout
 # Local application imports
 from kentik_api.api_calls.api_call import APICall, APICallMethods
 from kentik_api.api_connection.api_call_response import APICallResponse
+from kentik_api.internal.json_codec import JSONCodec, get_codec
 from kentik_api.public.errors import (
     AuthError,
     BadRequestError,
@@ -21,14 +24,21 @@ from kentik_api.public.errors import (
 )
 from kentik_api.version import get_user_agent
 
+from .http_pool import HTTPPoolConfig, PoolStats
+from .instrumentation import PROTOCOL_HTTP, CallEvent, Instrumentation
+from .rate_limiter import RateLimiter, parse_retry_after
+from .response_cache import ResponseCache, conditional_headers
 from .retryable_session import Retry, prepare_kentik_api_http_session
+from .single_flight import SingleFlight
 
-PROTOCOL_HTTP = "HTTP"
+RETRY_AFTER_STATUS_CODES = frozenset([HTTPStatus.TOO_MANY_REQUESTS.value, HTTPStatus.SERVICE_UNAVAILABLE.value])
 
 
 class APIConnector:
     """APIConnector implements APIConnectorProtocol. Allows sending authorized http requests to Kentik API"""
 
+    STREAM_CHUNK_SIZE = 64 * 1024
+
     def __init__(
         self,
         api_url: str,
@@ -37,54 +47,233 @@ class APIConnector:
         timeout: Union[float, Tuple[float, float]] = (10.0, 60.0),
         retry_strategy: Optional[Retry] = None,
         proxy: Optional[str] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        pool_config: Optional[HTTPPoolConfig] = None,
+        json_codec: Optional[Union[str, JSONCodec]] = None,
+        response_cache: Optional[ResponseCache] = None,
+        instrumentation: Optional[Instrumentation] = None,
+        coalesce_requests: bool = False,
     ) -> None:
+        """
+        coalesce_requests - if True, identical concurrent GET requests (same URL path and params) are sent only once
+                            and all the callers receive the same response. Coalesced requests are not streamed:
+                            the shared response is read whole, also for send_stream
+        """
         self._api_url = api_url
+        self._api_path = urlparse(api_url).path
         self._logger = logging.getLogger(__name__)
-        self._session = prepare_kentik_api_http_session(auth_email, auth_token, retry_strategy, proxy)
+        self._rate_limiter = rate_limiter
+        self._session = prepare_kentik_api_http_session(
+            auth_email,
+            auth_token,
+            retry_strategy,
+            proxy,
+            self._hold_off if rate_limiter is not None else None,
+            pool_config,
+        )
         self._session.headers["User-Agent"] = get_user_agent()
         self._timeout = timeout
+        self._json_codec = get_codec(json_codec) if json_codec is not None else None  # None: process default
+        self._cache = response_cache
+        self._instrumentation = instrumentation
+        self._single_flight: Optional[SingleFlight[APICallResponse]] = SingleFlight() if coalesce_requests else None
         if proxy:
             self._logger.debug("Using proxy: %s", proxy)
 
+    @property
+    def json_codec(self) -> Optional[JSONCodec]:
+        """Codec used for request and response bodies, None if the process default is used"""
+        return self._json_codec
+
+    @property
+    def pool_stats(self) -> PoolStats:
+        return self._session.pool_stats
+
+    def close(self) -> None:
+        self._session.close()
+
     def send(self, api_call: APICall, payload: Optional[Dict[str, Any]] = None) -> APICallResponse:
+        """Send API request"""
+        return self._send_call(api_call, payload, False)
+
+    def send_stream(self, api_call: APICall, payload: Optional[Dict[str, Any]] = None) -> APICallResponse:
+        """
+        Send API request. The response body is not read upfront but returned as iterator over chunks of bytes
+        in APICallResponse.stream; the connection is returned to the pool once the stream is exhausted.
+        Requests served using response cache or coalesced with concurrent identical requests are not streamed.
+        """
+        return self._send_call(api_call, payload, True)
+
+    def _send_call(self, api_call: APICall, payload: Optional[Dict[str, Any]], stream: bool) -> APICallResponse:
+        if self._instrumentation is None:
+            return self._dispatch(api_call, payload, stream, None)
+
+        event = CallEvent(PROTOCOL_HTTP, api_call.url_path, api_call.method.name)
+        start = time.perf_counter()
         try:
-            response = self._do_request(api_call, payload)
+            return self._dispatch(api_call, payload, stream, event)
+        except Exception as err:
+            event.error = type(err).__name__
+            raise
+        finally:
+            event.wall_time = time.perf_counter() - start
+            self._instrumentation.emit(event)
+
+    def _dispatch(
+        self, api_call: APICall, payload: Optional[Dict[str, Any]], stream: bool, event: Optional[CallEvent]
+    ) -> APICallResponse:
+        if self._single_flight is None or api_call.method != APICallMethods.GET:
+            return self._route(api_call, payload, stream, event)
+
+        # a stream can be consumed only once, so the shared response is buffered
+        key = ResponseCache.make_key(api_call.method.name, api_call.url_path, payload)
+        response, shared = self._single_flight.do(key, lambda: self._route(api_call, payload, False, event))
+        if shared and event is not None:
+            event.status, event.response_bytes, event.coalesced = response.http_status_code, len(response.body), True
+        return response
+
+    def _route(
+        self, api_call: APICall, payload: Optional[Dict[str, Any]], stream: bool, event: Optional[CallEvent]
+    ) -> APICallResponse:
+        if self._cache is None:
+            return self._send(api_call, payload, stream, event)
+        if self._cache.cacheable(api_call.method.name, api_call.url_path):
+            return self._send_cached(api_call, payload, event)
+        if api_call.method == APICallMethods.GET:
+            return self._send(api_call, payload, stream, event)
+        try:
+            return self._send(api_call, payload, stream, event)
+        finally:
+            # also when the request failed - the resource may have been modified anyway (e.g. on timeout);
+            # after the request completes, so that responses fetched concurrently with it are dropped too.
+            # Responses still being fetched are not cached at all (see ResponseCache.generation)
+            self._cache.invalidate(api_call.url_path)
+
+    def _send_cached(
+        self, api_call: APICall, payload: Optional[Dict[str, Any]], event: Optional[CallEvent]
+    ) -> APICallResponse:
+        assert self._cache is not None
+        key = self._cache.make_key(api_call.method.name, api_call.url_path, payload)
+        generation = self._cache.generation(api_call.url_path)
+        entry, fresh = self._cache.lookup(key)
+        if entry is not None and fresh:
+            if event is not None:
+                event.status, event.response_bytes, event.cached = entry.status, len(entry.body), True
+            return APICallResponse(entry.status, entry.body, encoding=entry.encoding)
+
+        headers = conditional_headers(entry) if entry is not None else None
+        response = self._send_request(api_call, payload, headers=headers, event=event)
+        if entry is not None and response.status_code == HTTPStatus.NOT_MODIFIED:
+            self._cache.revalidated(key, entry)
+            return APICallResponse(entry.status, entry.body, encoding=entry.encoding)
+
+        encoding = response.encoding or "utf-8"
+        if response.status_code == HTTPStatus.OK:
+            self._cache.store(key, response.status_code, response.content, encoding, response.headers, generation)
+        return APICallResponse(response.status_code, response.content, encoding=encoding)
+
+    def _send(
+        self, api_call: APICall, payload: Optional[Dict[str, Any]], stream: bool, event: Optional[CallEvent]
+    ) -> APICallResponse:
+        response = self._send_request(api_call, payload, stream, event=event)
+        encoding = response.encoding or "utf-8"
+        if stream:
+            return APICallResponse(
+                response.status_code, stream=response.iter_content(self.STREAM_CHUNK_SIZE), encoding=encoding
+            )
+        return APICallResponse(response.status_code, response.content, encoding=encoding)
+
+    def _send_request(
+        self,
+        api_call: APICall,
+        payload: Optional[Dict[str, Any]],
+        stream: bool = False,
+        headers: Optional[Dict[str, str]] = None,
+        event: Optional[CallEvent] = None,
+    ) -> Response:
+        if self._rate_limiter is not None:
+            waited = self._rate_limiter.acquire(api_call.url_path)
+            if event is not None:
+                event.wait_time = waited
+        try:
+            response = self._do_request(api_call, payload, stream, headers)
         except Timeout as e:
             raise TimedOutError(str(e)) from e
         except RequestException as e:
             raise KentikAPIError(str(e)) from e
 
-        self._log_http_roundtrip(response)
+        self._log_http_roundtrip(response, stream)
+        if event is not None:
+            self._fill_event(event, response, stream)
+        if self._rate_limiter is not None and response.status_code in RETRY_AFTER_STATUS_CODES:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after:
+                self._rate_limiter.hold_off(api_call.url_path, retry_after)
         self._raise_on_error(response)
+        return response
 
-        return APICallResponse(response.status_code, response.text)
-
-    def _do_request(self, api_call: APICall, payload: Optional[Dict[str, Any]] = None) -> Response:
+    def _do_request(
+        self,
+        api_call: APICall,
+        payload: Optional[Dict[str, Any]] = None,
+        stream: bool = False,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Response:
         url = self._get_api_query_url(api_call.url_path)
 
         if api_call.method == APICallMethods.GET:
-            response = self._session.get(url, params=payload, timeout=self._timeout)
+            response = self._session.get(url, params=payload, timeout=self._timeout, stream=stream, headers=headers)
         elif api_call.method == APICallMethods.POST:
-            response = self._session.post(url, json=payload, timeout=self._timeout)
+            response = self._session.post(url, data=self._encode(payload), timeout=self._timeout, stream=stream)
         elif api_call.method == APICallMethods.PUT:
-            response = self._session.put(url, json=payload, timeout=self._timeout)
+            response = self._session.put(url, data=self._encode(payload), timeout=self._timeout, stream=stream)
         elif api_call.method == APICallMethods.DELETE:
-            response = self._session.delete(url, json=payload, timeout=self._timeout)
+            response = self._session.delete(url, data=self._encode(payload), timeout=self._timeout, stream=stream)
         else:
             raise ValueError(f"Improper API call method: {api_call.method}")
         return response
 
-    def _log_http_roundtrip(self, response: Response) -> None:
+    def _encode(self, payload: Optional[Dict[str, Any]]) -> Optional[bytes]:
+        if payload is None:
+            return None
+        return get_codec(self._json_codec).dumps(payload)
+
+    def _log_http_roundtrip(self, response: Response, stream: bool = False) -> None:
+        if not self._logger.isEnabledFor(logging.DEBUG):
+            return
+        # don't read the body of streamed response just for logging
+        size = response.headers.get("Content-Length", "?") if stream else len(response.content)
         self._logger.debug(
             f"HTTP request done: "
             f"request: {response.request.method} {response.request.url}, "
-            f"response: {response.status_code} {len(response.text)} bytes, "
+            f"response: {response.status_code} {size} bytes, "
             f"elapsed: {response.elapsed}"
         )
 
+    @staticmethod
+    def _fill_event(event: CallEvent, response: Response, stream: bool) -> None:
+        event.status = response.status_code
+        body = response.request.body
+        event.request_bytes = len(body) if body is not None else 0
+        if stream:
+            # don't read the body of streamed response just for instrumentation
+            length = response.headers.get("Content-Length")
+            event.response_bytes = int(length) if length and length.isdigit() else None
+        else:
+            event.response_bytes = len(response.content)
+        retries = getattr(response.raw, "retries", None)
+        event.retries = len(retries.history) if retries is not None else 0
+
     def _get_api_query_url(self, url_path: str) -> str:
         return self._api_url + url_path
 
+    def _hold_off(self, url: str, seconds: float) -> None:
+        """Called for retried responses with Retry-After header; url is as seen by urllib3 (path or full URL)"""
+        path = urlparse(url).path
+        if path.startswith(self._api_path):
+            path = path[len(self._api_path) :]
+        self._rate_limiter.hold_off(path, seconds)  # type: ignore
+
     @staticmethod
     def _raise_on_error(response: Response) -> None:
         if response.status_code >= 400:
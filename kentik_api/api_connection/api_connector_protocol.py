@@ -9,3 +9,18 @@ from kentik_api.api_connection.api_call_response import APICallResponse
 class APIConnectorProtocol(Protocol):
     def send(self, api_call: APICall, payload: Optional[Dict[str, Any]] = None) -> APICallResponse:
         pass
+
+
+class StreamingAPIConnectorProtocol(APIConnectorProtocol, Protocol):
+    """
+    Connector able to return response body as a stream of chunks (see APICallResponse.stream).
+    Implementing send_stream is optional; API handlers fall back to send for connectors without it.
+    """
+
+    def send_stream(self, api_call: APICall, payload: Optional[Dict[str, Any]] = None) -> APICallResponse:
+        pass
+
+
+class AsyncAPIConnectorProtocol(Protocol):
+    async def send(self, api_call: APICall, payload: Optional[Dict[str, Any]] = None) -> APICallResponse:
+        pass
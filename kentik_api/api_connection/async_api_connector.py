@@ -0,0 +1,193 @@
+# Standard library imports
+import asyncio
+import logging
+from typing import Any, Dict, Optional, Tuple, Union
+
+# Third party imports
+from urllib3 import HTTPResponse
+from urllib3.exceptions import MaxRetryError
+
+try:
+    import aiohttp
+except ImportError:
+    raise RuntimeError("Async support requires 'aiohttp'")
+
+# Local application imports
+from kentik_api.api_calls.api_call import APICall, APICallMethods
+from kentik_api.api_connection.api_call_response import APICallResponse
+from kentik_api.auth.auth import AUTH_API_TOKEN_KEY, AUTH_EMAIL_KEY
+from kentik_api.internal.json_codec import JSONCodec, get_codec
+from kentik_api.public.errors import KentikAPIError, TimedOutError
+from kentik_api.version import get_user_agent
+
+from .api_connector import RETRY_AFTER_STATUS_CODES, new_api_error
+from .rate_limiter import RateLimiter, parse_retry_after
+from .retryable_session import Retry, RetryableSession
+
+_METHOD_NAMES = {
+    APICallMethods.GET: "GET",
+    APICallMethods.POST: "POST",
+    APICallMethods.PUT: "PUT",
+    APICallMethods.DELETE: "DELETE",
+}
+
+
+class AsyncAPIConnector:
+    """
+    AsyncAPIConnector implements AsyncAPIConnectorProtocol. Allows sending authorized http requests to Kentik API
+    from asyncio event loop. Retries are driven by the same urllib3 Retry strategy as in the synchronous APIConnector
+    (RetryableSession.DEFAULT_RETRY_STRATEGY by default), but backoff is awaited instead of blocking the thread.
+    The underlying aiohttp session is created on first request and must be released using close()
+    (or by using the connector as async context manager).
+    """
+
+    def __init__(
+        self,
+        api_url: str,
+        auth_email: str,
+        auth_token: str,
+        timeout: Union[float, Tuple[float, float]] = (10.0, 60.0),
+        retry_strategy: Optional[Retry] = None,
+        proxy: Optional[str] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        json_codec: Optional[Union[str, JSONCodec]] = None,
+    ) -> None:
+        self._api_url = api_url
+        self._logger = logging.getLogger(__name__)
+        self._headers = {
+            AUTH_EMAIL_KEY: auth_email,
+            AUTH_API_TOKEN_KEY: auth_token,
+            "Content-Type": "application/json",
+            "User-Agent": get_user_agent(),
+        }
+        self._retry_strategy = retry_strategy if retry_strategy is not None else RetryableSession.DEFAULT_RETRY_STRATEGY
+        self._timeout = self._make_client_timeout(timeout)
+        self._proxy = proxy
+        self._rate_limiter = rate_limiter
+        self._json_codec = get_codec(json_codec) if json_codec is not None else None  # None: process default
+        self._session: Optional[aiohttp.ClientSession] = None
+        if proxy:
+            self._logger.debug("Using proxy: %s", proxy)
+
+    async def __aenter__(self) -> "AsyncAPIConnector":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
+
+    @property
+    def json_codec(self) -> Optional[JSONCodec]:
+        """Codec used for request and response bodies, None if the process default is used"""
+        return self._json_codec
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def send(self, api_call: APICall, payload: Optional[Dict[str, Any]] = None) -> APICallResponse:
+        await self._acquire(api_call.url_path)
+        try:
+            status, body, encoding = await self._do_request(api_call, payload)
+        except asyncio.TimeoutError as e:
+            raise TimedOutError(str(e)) from e
+        except (aiohttp.ClientError, MaxRetryError) as e:
+            raise KentikAPIError(str(e)) from e
+
+        if status >= 400:
+            raise new_api_error(body.decode(encoding, errors="replace"), status)
+
+        return APICallResponse(status, body, encoding=encoding)
+
+    async def _do_request(self, api_call: APICall, payload: Optional[Dict[str, Any]] = None) -> Tuple[int, bytes, str]:
+        try:
+            method = _METHOD_NAMES[api_call.method]
+        except KeyError:
+            raise ValueError(f"Improper API call method: {api_call.method}")
+        url = self._get_api_query_url(api_call.url_path)
+        if api_call.method == APICallMethods.GET:
+            kwargs: Dict[str, Any] = dict(params=payload)
+        else:
+            kwargs = dict(data=get_codec(self._json_codec).dumps(payload) if payload is not None else None)
+
+        session = self._get_session()
+        retries = self._retry_strategy
+        while True:
+            try:
+                async with session.request(method, url, proxy=self._proxy, **kwargs) as response:
+                    body = await response.read()
+                    encoding = response.charset or "utf-8"
+                    status = response.status
+                    headers = response.headers
+            except (asyncio.TimeoutError, aiohttp.ClientConnectionError) as e:
+                try:
+                    retries = retries.increment(method, url, error=e)
+                except MaxRetryError:
+                    raise e
+                self._logger.debug("HTTP request failed: %s %s (%s), retrying", method, url, e)
+                await self._sleep(retries.get_backoff_time())
+                continue
+
+            self._logger.debug(
+                "HTTP request done: request: %s %s, response: %d %d bytes", method, url, status, len(body)
+            )
+
+            if self._rate_limiter is not None and status in RETRY_AFTER_STATUS_CODES:
+                retry_after = parse_retry_after(headers.get("Retry-After"))
+                if retry_after:
+                    self._rate_limiter.hold_off(api_call.url_path, retry_after)
+
+            has_retry_after = bool(headers.get("Retry-After"))
+            if not retries.is_retry(method, status, has_retry_after):
+                return status, body, encoding
+
+            # represent the response as urllib3 response, so that the Retry object can be used as is
+            urllib3_response = HTTPResponse(headers=dict(headers), status=status, request_method=method)
+            try:
+                retries = retries.increment(method, url, response=urllib3_response)
+            except MaxRetryError:
+                if retries.raise_on_status:
+                    raise
+                return status, body, encoding
+            await self._sleep(self._get_retry_delay(retries, urllib3_response))
+
+    async def _acquire(self, url_path: str) -> None:
+        """Wait until rate limiter allows request to url_path"""
+        bucket = self._rate_limiter.bucket(url_path) if self._rate_limiter is not None else None
+        if bucket is None:
+            return
+        delay = bucket.try_take()
+        while delay > 0:
+            await asyncio.sleep(delay)
+            delay = bucket.try_take()
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(headers=self._headers, timeout=self._timeout)
+        return self._session
+
+    def _get_api_query_url(self, url_path: str) -> str:
+        return self._api_url + url_path
+
+    @staticmethod
+    def _get_retry_delay(retries: Retry, response: HTTPResponse) -> float:
+        """Same delay as Retry.sleep(response) would block for"""
+        if retries.respect_retry_after_header:
+            retry_after = retries.get_retry_after(response)
+            if retry_after:
+                return retry_after
+        return retries.get_backoff_time()
+
+    @staticmethod
+    async def _sleep(delay: float) -> None:
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    @staticmethod
+    def _make_client_timeout(timeout: Union[float, Tuple[float, float]]) -> aiohttp.ClientTimeout:
+        # requests semantics: single value applies to both connect and read, tuple is (connect, read)
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+        else:
+            connect = read = timeout
+        return aiohttp.ClientTimeout(sock_connect=connect, sock_read=read)
@@ -0,0 +1,175 @@
+import itertools
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Generic, Iterable, List, Optional, Tuple, TypeVar
+
+import grpc
+
+log = logging.getLogger(__name__)
+
+StubT = TypeVar("StubT")
+
+_COMPRESSION = {
+    None: grpc.Compression.NoCompression,
+    "gzip": grpc.Compression.Gzip,
+    "deflate": grpc.Compression.Deflate,
+}
+
+
+@dataclass
+class GRPCChannelConfig:
+    """
+    Configuration of gRPC channels owned by synthetics and cloud export connectors.
+    keepalive_time - seconds between keepalive pings, None (default) disables them. Pings detect broken
+                     connections during long calls (e.g. streaming) and, with keepalive_permit_without_calls,
+                     keep idle connections (and NAT or firewall state) alive. The server must allow the ping rate:
+                     by default gRPC servers accept pings at most every 5 minutes and only while calls are in
+                     progress; otherwise they close the connection (GOAWAY "too_many_pings").
+    keepalive_timeout - seconds to wait for ping acknowledgement before the connection is considered broken
+    keepalive_permit_without_calls - send pings also when there are no calls in progress; enable only if the server
+                                     permits pings without calls
+    compression - "gzip" or "deflate" compression of request messages, None to disable
+    pool_size - number of channels (i.e. HTTP/2 connections) to distribute calls over in round-robin fashion;
+                one channel multiplexes concurrent calls, more are useful for many threads issuing large requests
+    insecure - use plaintext connection instead of TLS (e.g. for a local proxy or test server)
+    """
+
+    keepalive_time: Optional[float] = None
+    keepalive_timeout: float = 20.0
+    keepalive_permit_without_calls: bool = False
+    compression: Optional[str] = None
+    pool_size: int = 1
+    insecure: bool = False
+
+    def __post_init__(self) -> None:
+        if self.compression not in _COMPRESSION:
+            raise ValueError(f"Unsupported compression: {self.compression} (supported: gzip, deflate)")
+        if self.pool_size < 1:
+            raise ValueError(f"pool_size must be at least 1, got {self.pool_size}")
+
+    def channel_options(self) -> List[Tuple[str, Any]]:
+        if self.keepalive_time is None:
+            return []
+        options: List[Tuple[str, Any]] = [
+            ("grpc.keepalive_time_ms", int(self.keepalive_time * 1000)),
+            ("grpc.keepalive_timeout_ms", int(self.keepalive_timeout * 1000)),
+            ("grpc.keepalive_permit_without_calls", int(self.keepalive_permit_without_calls)),
+        ]
+        if self.keepalive_permit_without_calls:
+            # otherwise the client stops pinging idle connections after 2 pings
+            options.append(("grpc.http2.max_pings_without_data", 0))
+        return options
+
+    @property
+    def grpc_compression(self) -> grpc.Compression:
+        return _COMPRESSION[self.compression]
+
+
+def _merge_options(config: GRPCChannelConfig, options: Iterable[Tuple[str, Any]]) -> List[Tuple[str, Any]]:
+    # user provided options take precedence over ones derived from config
+    merged: Dict[str, Any] = dict(config.channel_options())
+    if config.pool_size > 1:
+        # otherwise channels with identical arguments share connections via the global subchannel pool
+        merged["grpc.use_local_subchannel_pool"] = 1
+    merged.update(options)
+    return list(merged.items())
+
+
+class ChannelPool(Generic[StubT]):
+    """
+    Long-lived gRPC channels to a single target with stubs created by stub_factory for each of them.
+    Safe for use from multiple threads; channels (and their connections) are released by close().
+    """
+
+    def __init__(
+        self,
+        target: str,
+        stub_factory: Callable[[grpc.Channel], StubT],
+        config: Optional[GRPCChannelConfig] = None,
+        options: Iterable[Tuple[str, Any]] = (),
+    ) -> None:
+        self.config = config or GRPCChannelConfig()
+        merged = _merge_options(self.config, options)
+        self._channels = [self._open_channel(target, merged) for _ in range(self.config.pool_size)]
+        self._stubs = [stub_factory(channel) for channel in self._channels]
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+        self._closed = False
+        log.debug("Opened %d gRPC channel(s) to %s, options: %s", len(self._channels), target, merged)
+
+    def _open_channel(self, target: str, options: List[Tuple[str, Any]]) -> grpc.Channel:
+        if self.config.insecure:
+            return grpc.insecure_channel(target, options, self.config.grpc_compression)
+        return grpc.secure_channel(target, grpc.ssl_channel_credentials(), options, self.config.grpc_compression)
+
+    def stub(self) -> StubT:
+        """Return stubs bound to the next channel in the pool"""
+        if self._closed:
+            raise RuntimeError("gRPC channel pool is closed")
+        return self._stubs[next(self._counter) % len(self._stubs)]
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def close(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        for channel in self._channels:
+            channel.close()
+
+
+class AsyncChannelPool(Generic[StubT]):
+    """
+    Same as ChannelPool, but with grpc.aio channels for use from asyncio code.
+    Channels are opened on first use (so that the pool may be created outside of running event loop) and must be
+    released by awaiting close(). Stubs are bound to the event loop in which the channels were opened.
+    """
+
+    def __init__(
+        self,
+        target: str,
+        stub_factory: Callable[[grpc.aio.Channel], StubT],
+        config: Optional[GRPCChannelConfig] = None,
+        options: Iterable[Tuple[str, Any]] = (),
+    ) -> None:
+        self.config = config or GRPCChannelConfig()
+        self._target = target
+        self._options = _merge_options(self.config, options)
+        self._stub_factory = stub_factory
+        self._channels: List[grpc.aio.Channel] = []
+        self._stubs: List[StubT] = []
+        self._counter = itertools.count()
+        self._closed = False
+
+    def _open_channel(self) -> grpc.aio.Channel:
+        compression = self.config.grpc_compression
+        if self.config.insecure:
+            return grpc.aio.insecure_channel(self._target, self._options, compression)
+        return grpc.aio.secure_channel(self._target, grpc.ssl_channel_credentials(), self._options, compression)
+
+    def stub(self) -> StubT:
+        """Return stubs bound to the next channel in the pool"""
+        if self._closed:
+            raise RuntimeError("gRPC channel pool is closed")
+        if not self._channels:
+            # no await between the check and assignment, so channels are opened only once per event loop
+            self._channels = [self._open_channel() for _ in range(self.config.pool_size)]
+            self._stubs = [self._stub_factory(channel) for channel in self._channels]
+            log.debug(
+                "Opened %d async gRPC channel(s) to %s, options: %s", len(self._channels), self._target, self._options
+            )
+        return self._stubs[next(self._counter) % len(self._stubs)]
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    async def close(self) -> None:
+        self._closed = True
+        channels, self._channels, self._stubs = self._channels, [], []
+        for channel in channels:
+            await channel.close()
@@ -0,0 +1,149 @@
+import logging
+import queue
+import socket
+import threading
+from dataclasses import dataclass, field
+from typing import Any, List, Optional, Tuple, Type
+
+from requests.adapters import DEFAULT_POOLBLOCK, DEFAULT_POOLSIZE, HTTPAdapter
+from urllib3 import HTTPConnectionPool, HTTPSConnectionPool, PoolManager
+from urllib3.connection import HTTPConnection
+
+log = logging.getLogger(__name__)
+
+
+@dataclass
+class HTTPPoolConfig:
+    """
+    Connection pooling settings for the HTTP session used by APIConnector.
+    pool_maxsize should be at least the number of threads sending requests concurrently; otherwise connections
+    are discarded when returned to the full pool (or, with pool_block=True, threads wait for a free connection).
+    """
+
+    pool_connections: int = DEFAULT_POOLSIZE  # number of per-host connection pools to keep
+    pool_maxsize: int = DEFAULT_POOLSIZE  # max number of connections kept open per host
+    pool_block: bool = DEFAULT_POOLBLOCK  # wait for free connection instead of opening extra, non-pooled one
+    keep_alive: bool = True  # False: send "Connection: close" and don't reuse connections
+    tcp_keepalive_idle: Optional[int] = None  # enable TCP keep-alive probes after given number of idle seconds
+
+    def socket_options(self) -> Optional[List[Tuple[int, int, int]]]:
+        if self.tcp_keepalive_idle is None:
+            return None
+        options = list(HTTPConnection.default_socket_options)
+        options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+        if hasattr(socket, "TCP_KEEPIDLE"):
+            options.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, self.tcp_keepalive_idle))
+        elif hasattr(socket, "TCP_KEEPALIVE"):  # macOS
+            options.append((socket.IPPROTO_TCP, socket.TCP_KEEPALIVE, self.tcp_keepalive_idle))  # type: ignore
+        return options
+
+
+@dataclass
+class PoolStats:
+    """Thread-safe counters of connection pool activity"""
+
+    created: int = 0  # new connections opened
+    reused: int = 0  # requests served by connection taken from the pool
+    discarded: int = 0  # connections closed because the pool was full when returned
+
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def inc(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def snapshot(self) -> "PoolStats":
+        with self._lock:
+            return PoolStats(created=self.created, reused=self.reused, discarded=self.discarded)
+
+
+class _StatsConnectionMixin:
+    """Counts opened sockets into "stats" class attribute"""
+
+    stats: PoolStats
+
+    def _new_conn(self) -> Any:
+        sock = super()._new_conn()  # type: ignore
+        self.stats.inc("created")
+        return sock
+
+
+class _StatsPoolMixin:
+    """Counts connection pool events into "stats" class attribute. Relies on urllib3 1.26 pool internals."""
+
+    stats: PoolStats
+    pool: Any
+    host: str
+
+    def _get_conn(self, timeout: Optional[float] = None) -> Any:
+        conn = super()._get_conn(timeout)  # type: ignore
+        # connections are opened lazily; dropped connections are closed by _get_conn and reopened on use
+        if conn.sock is not None:
+            self.stats.inc("reused")
+        return conn
+
+    def _put_conn(self, conn: Any) -> None:
+        # same as HTTPConnectionPool._put_conn, but counts discarded connections
+        try:
+            self.pool.put(conn, block=False)
+            return
+        except AttributeError:
+            pass  # pool is closed
+        except queue.Full:
+            self.stats.inc("discarded")
+            log.warning(
+                "Connection pool is full, discarding connection: %s. Connection pool size: %s",
+                self.host,
+                self.pool.qsize(),
+            )
+        if conn:
+            conn.close()
+
+
+def _make_pool_class(base: Type[HTTPConnectionPool], stats: PoolStats) -> Type[HTTPConnectionPool]:
+    connection_cls = type(base.ConnectionCls.__name__, (_StatsConnectionMixin, base.ConnectionCls), {"stats": stats})
+    return type(base.__name__, (_StatsPoolMixin, base), {"stats": stats, "ConnectionCls": connection_cls})
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter configured from HTTPPoolConfig, collecting PoolStats for direct and HTTP-proxied connections"""
+
+    __attrs__ = HTTPAdapter.__attrs__ + ["pool_config"]
+
+    def __init__(self, config: HTTPPoolConfig, **kwargs: Any) -> None:
+        self.pool_config = config
+        self.stats = PoolStats()
+        super().__init__(
+            pool_connections=config.pool_connections,
+            pool_maxsize=config.pool_maxsize,
+            pool_block=config.pool_block,
+            **kwargs,
+        )
+
+    def init_poolmanager(
+        self, connections: int, maxsize: int, block: bool = DEFAULT_POOLBLOCK, **pool_kwargs: Any
+    ) -> None:
+        socket_options = self.pool_config.socket_options()
+        if socket_options is not None:
+            pool_kwargs["socket_options"] = socket_options
+        super().init_poolmanager(connections, maxsize, block, **pool_kwargs)
+        self._install_stats(self.poolmanager)
+
+    def proxy_manager_for(self, proxy: str, **proxy_kwargs: Any) -> PoolManager:
+        socket_options = self.pool_config.socket_options()
+        if socket_options is not None:
+            proxy_kwargs.setdefault("socket_options", socket_options)
+        manager = super().proxy_manager_for(proxy, **proxy_kwargs)
+        if not proxy.lower().startswith("socks"):
+            self._install_stats(manager)
+        return manager
+
+    def __setstate__(self, state: Any) -> None:
+        self.stats = PoolStats()
+        super().__setstate__(state)
+
+    def _install_stats(self, manager: PoolManager) -> None:
+        manager.pool_classes_by_scheme = {
+            "http": _make_pool_class(HTTPConnectionPool, self.stats),
+            "https": _make_pool_class(HTTPSConnectionPool, self.stats),
+        }
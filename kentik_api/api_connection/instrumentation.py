@@ -0,0 +1,165 @@
+import bisect
+import logging
+import re
+import threading
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+log = logging.getLogger(__name__)
+
+PROTOCOL_HTTP = "HTTP"
+PROTOCOL_GRPC = "gRPC"
+
+
+@dataclass
+class CallEvent:
+    """Single API call as reported to observers"""
+
+    protocol: str  # PROTOCOL_HTTP or PROTOCOL_GRPC
+    endpoint: str  # URL path relative to API root for HTTP, "<connector class>.<method>" for gRPC
+    method: str  # HTTP method, "RPC" for gRPC
+    status: Union[int, str, None] = None  # HTTP status code, gRPC status code name; None if no response was received
+    error: Optional[str] = None  # exception class name if the call failed
+    request_bytes: Optional[int] = None  # size of request body or serialized request messages; None if unknown
+    response_bytes: Optional[int] = None  # size of response body or serialized response; None if unknown
+    retries: int = 0  # number of retries performed by the transport
+    wait_time: float = 0.0  # seconds spent waiting for client-side rate limiter
+    wall_time: float = 0.0  # total duration of the call in seconds, including wait_time and retries
+    cached: bool = False  # response served from response cache without contacting the API
+    coalesced: bool = False  # response shared with identical concurrent call (see APIConnector coalesce_requests)
+
+    @property
+    def failed(self) -> bool:
+        return self.error is not None
+
+
+CallObserver = Callable[[CallEvent], None]
+
+
+class Instrumentation:
+    """
+    Dispatches CallEvent to registered observers.
+    One instance may be shared by REST and gRPC connectors and by multiple threads. Observers are called synchronously
+    in the thread performing the call, so they should be cheap; exceptions raised by observers are logged and ignored.
+    """
+
+    def __init__(self, observers: Iterable[CallObserver] = ()) -> None:
+        self._observers: List[CallObserver] = list(observers)
+        self._lock = threading.Lock()
+
+    def add_observer(self, observer: CallObserver) -> None:
+        with self._lock:
+            self._observers = self._observers + [observer]
+
+    def remove_observer(self, observer: CallObserver) -> None:
+        with self._lock:
+            self._observers = [o for o in self._observers if o is not observer]
+
+    def emit(self, event: CallEvent) -> None:
+        for observer in self._observers:
+            try:
+                observer(event)
+            except Exception:  # pylint: disable=broad-except
+                log.exception("Call observer %s failed", observer)
+
+
+# upper bounds of latency histogram buckets in seconds
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, float("inf"))
+
+StatsKey = Tuple[str, str, str]  # (protocol, method, route)
+
+_ID_SEGMENT = re.compile(r"/(\d+|[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})(?=/|$)", re.IGNORECASE)
+
+
+def route(endpoint: str) -> str:
+    """Replace resource IDs in URL path with "{id}", so that calls to the same endpoint are aggregated together"""
+    return _ID_SEGMENT.sub("/{id}", endpoint.split("?", 1)[0])
+
+
+@dataclass
+class EndpointStats:
+    buckets: Sequence[float]
+    counts: List[int] = field(default_factory=list)  # number of calls per bucket
+    calls: int = 0
+    errors: int = 0
+    cached: int = 0
+    coalesced: int = 0
+    retries: int = 0
+    total_time: float = 0.0
+    max_time: float = 0.0
+    wait_time: float = 0.0
+    request_bytes: int = 0
+    response_bytes: int = 0
+
+    def __post_init__(self) -> None:
+        if not self.counts:
+            self.counts = [0] * len(self.buckets)
+
+    @property
+    def mean_time(self) -> float:
+        return self.total_time / self.calls if self.calls else 0.0
+
+    def percentile(self, q: float) -> float:
+        """Upper bound of the bucket containing q-th percentile (0 < q <= 100) of call latency"""
+        if not self.calls:
+            return 0.0
+        rank = self.calls * q / 100.0
+        seen = 0
+        for bound, count in zip(self.buckets, self.counts):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max_time)
+        return self.max_time
+
+    def add(self, event: CallEvent) -> None:
+        self.counts[bisect.bisect_left(self.buckets, event.wall_time)] += 1
+        self.calls += 1
+        self.errors += event.failed
+        self.cached += event.cached
+        self.coalesced += event.coalesced
+        self.retries += event.retries
+        self.total_time += event.wall_time
+        self.max_time = max(self.max_time, event.wall_time)
+        self.wait_time += event.wait_time
+        self.request_bytes += event.request_bytes or 0
+        self.response_bytes += event.response_bytes or 0
+
+
+class LatencyHistogram:
+    """
+    In-memory call observer aggregating latency histogram, error and byte counts per endpoint.
+    Usage:
+        histogram = LatencyHistogram()
+        api = KentikAPI(email, token, instrumentation=Instrumentation([histogram]))
+        ...
+        for key, stats in histogram.top(5):
+            print(key, stats.calls, stats.total_time, stats.percentile(95))
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        if list(buckets) != sorted(buckets) or buckets[-1] != float("inf"):
+            raise ValueError("buckets must be sorted and end with float('inf')")
+        self._buckets = tuple(buckets)
+        self._stats: Dict[StatsKey, EndpointStats] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, event: CallEvent) -> None:
+        key = (event.protocol, event.method, route(event.endpoint))
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = EndpointStats(self._buckets)
+            stats.add(event)
+
+    def stats(self) -> Dict[StatsKey, EndpointStats]:
+        """Snapshot of statistics per (protocol, method, route)"""
+        with self._lock:
+            return {key: EndpointStats(**{**vars(s), "counts": list(s.counts)}) for key, s in self._stats.items()}
+
+    def top(self, n: int = 10, by: str = "total_time") -> List[Tuple[StatsKey, EndpointStats]]:
+        """Endpoints with the highest value of given EndpointStats attribute, e.g. "total_time", "calls", "errors" """
+        return sorted(self.stats().items(), key=lambda item: getattr(item[1], by), reverse=True)[:n]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
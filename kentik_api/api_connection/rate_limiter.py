@@ -0,0 +1,135 @@
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+log = logging.getLogger(__name__)
+
+
+@dataclass
+class RateLimit:
+    """Allow "requests" requests per "period" seconds, with bursts of up to "burst" requests"""
+
+    requests: float
+    period: float = 1.0  # in seconds
+    burst: Optional[float] = None  # bucket capacity; defaults to "requests", but at least 1
+
+    @property
+    def rate(self) -> float:
+        return self.requests / self.period
+
+    @property
+    def capacity(self) -> float:
+        return max(1.0, self.requests if self.burst is None else self.burst)
+
+
+class TokenBucket:
+    """Thread-safe token bucket. Tokens are refilled continuously at constant rate up to bucket capacity"""
+
+    def __init__(self, limit: RateLimit, clock: Callable[[], float] = time.monotonic) -> None:
+        self._rate = limit.rate
+        self._capacity = limit.capacity
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._tokens = self._capacity
+        self._updated = clock()
+        self._blocked_until = 0.0
+
+    def try_take(self) -> float:
+        """
+        Take one token if available
+        :return: 0 if token was taken, otherwise number of seconds after which next attempt may succeed
+        """
+        with self._lock:
+            now = self._clock()
+            if now < self._blocked_until:
+                return self._blocked_until - now
+            self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+            self._updated = now
+            if self._tokens >= 1.0:
+                self._tokens -= 1.0
+                return 0.0
+            return (1.0 - self._tokens) / self._rate
+
+    def hold_off(self, seconds: float) -> None:
+        """Hand out no tokens for given number of seconds, then resume with empty bucket (no burst)"""
+        with self._lock:
+            blocked_until = self._clock() + seconds
+            if blocked_until > self._blocked_until:
+                self._blocked_until = blocked_until
+                self._tokens = 0.0
+                self._updated = blocked_until
+
+
+class RateLimiter:
+    """
+    Client-side rate limiter with separate token bucket per API endpoint group.
+    Endpoint groups are defined by URL path prefixes relative to the API root (e.g. "/query/" or "/query/*"
+    for all query methods and "/devices" for device listing). Request is accounted to the group with the longest
+    matching prefix. Requests not matching any group are limited by the "default" limit, if provided.
+    One RateLimiter instance may be shared by any number of threads and KentikAPI instances.
+    """
+
+    def __init__(
+        self,
+        limits: Dict[str, RateLimit],
+        default: Optional[RateLimit] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._clock = clock
+        # longest prefix first
+        self._buckets: List[Tuple[str, TokenBucket]] = sorted(
+            ((prefix.rstrip("*"), TokenBucket(limit, clock)) for prefix, limit in limits.items()),
+            key=lambda item: len(item[0]),
+            reverse=True,
+        )
+        self._default = TokenBucket(default, clock) if default is not None else None
+
+    def bucket(self, url_path: str) -> Optional[TokenBucket]:
+        for prefix, bucket in self._buckets:
+            if url_path.startswith(prefix):
+                return bucket
+        return self._default
+
+    def acquire(self, url_path: str) -> float:
+        """
+        Block until request to url_path is allowed
+        :return: number of seconds spent waiting
+        """
+        bucket = self.bucket(url_path)
+        if bucket is None:
+            return 0.0
+        start = self._clock()
+        while True:
+            delay = bucket.try_take()
+            if delay <= 0:
+                return self._clock() - start
+            time.sleep(delay)
+
+    def hold_off(self, url_path: str, seconds: float) -> None:
+        """Suspend requests in the endpoint group of url_path for given number of seconds (e.g. from Retry-After)"""
+        bucket = self.bucket(url_path)
+        if bucket is not None and seconds > 0:
+            log.debug("Holding off requests to %s for %.3f s", url_path, seconds)
+            bucket.hold_off(seconds)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Return number of seconds specified by Retry-After header value (delay-seconds or HTTP-date)"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        log.debug("Invalid Retry-After header value: %s", value)
+        return None
+    if retry_date.tzinfo is None:
+        retry_date = retry_date.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_date - datetime.now(timezone.utc)).total_seconds())
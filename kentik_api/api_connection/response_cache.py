@@ -0,0 +1,194 @@
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Mapping, Optional, Tuple
+
+log = logging.getLogger(__name__)
+
+CacheKey = Tuple[str, str, str]  # (method, url path, serialized params)
+
+
+@dataclass
+class CachedResponse:
+    status: int
+    body: bytes
+    encoding: str
+    expires: float  # clock value after which the response needs to be revalidated or fetched again
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    @property
+    def can_revalidate(self) -> bool:
+        return self.etag is not None or self.last_modified is not None
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0  # served from cache without contacting the API
+    revalidated: int = 0  # confirmed by the API as not modified (HTTP 304)
+    misses: int = 0  # fetched from the API
+    invalidated: int = 0  # entries dropped because of POST/PUT/DELETE to related resource
+    evicted: int = 0  # entries dropped because the cache was full
+
+
+class ResponseCache:
+    """
+    LRU cache of GET responses for APIConnector.
+    Responses are served from the cache for "ttl" seconds. Once expired, responses carrying ETag or Last-Modified
+    header are revalidated with a conditional request, others are fetched again.
+    POST, PUT and DELETE requests drop cached responses of the same resource group, i.e. the first segment
+    of URL path regardless of plural form: e.g. PUT /device/42 invalidates GET /devices and GET /device/42.
+    Groups embedding objects of other groups are invalidated as well (see RELATED_GROUPS) and requests to "/batch"
+    invalidate all entries.
+    One instance may be shared by any number of threads and APIConnector instances using the same credentials.
+    """
+
+    INVALIDATE_ALL_GROUPS = frozenset(["batch"])
+    # group modified -> other groups whose responses include its objects
+    RELATED_GROUPS: Dict[str, FrozenSet[str]] = {
+        "device": frozenset(["plan", "devicelabel"]),  # plans and labels list their devices
+        "devicelabel": frozenset(["device"]),
+        "site": frozenset(["device"]),
+    }
+
+    def __init__(
+        self,
+        ttl: float = 60.0,
+        max_entries: int = 256,
+        paths: Optional[Iterable[str]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        paths - URL path prefixes (relative to API root) of GET requests to cache, e.g. ["/devices", "/sites"];
+                all GET requests are cached if not provided
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._paths = tuple(paths) if paths is not None else None
+        self._clock = clock
+        self._entries: "OrderedDict[CacheKey, CachedResponse]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = CacheStats()
+        # number of invalidations per resource group, and of invalidations of all groups
+        self._generations: Dict[str, int] = {}
+        self._generation_all = 0
+
+    @property
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(**vars(self._stats))
+
+    def cacheable(self, method: str, url_path: str) -> bool:
+        return method == "GET" and (self._paths is None or url_path.startswith(self._paths))
+
+    @staticmethod
+    def make_key(method: str, url_path: str, params: Optional[Mapping[str, Any]]) -> CacheKey:
+        return method, url_path, json.dumps(params, sort_keys=True, default=str) if params else ""
+
+    def lookup(self, key: CacheKey) -> Tuple[Optional[CachedResponse], bool]:
+        """Return (cached response or None, whether the response is fresh)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats.misses += 1
+                return None, False
+            self._entries.move_to_end(key)
+            if self._clock() < entry.expires:
+                self._stats.hits += 1
+                return entry, True
+            if not entry.can_revalidate:
+                del self._entries[key]
+                self._stats.misses += 1
+                return None, False
+            return entry, False
+
+    def generation(self, url_path: str) -> int:
+        """
+        Return value that changes whenever responses of the resource group of url_path are invalidated.
+        Captured when a request is looked up in the cache and passed to store(), so that a response fetched while
+        the resource was being modified is not cached.
+        """
+        with self._lock:
+            return self._generation(url_path)
+
+    def _generation(self, url_path: str) -> int:
+        return self._generation_all + self._generations.get(_resource_group(url_path), 0)
+
+    def store(
+        self,
+        key: CacheKey,
+        status: int,
+        body: bytes,
+        encoding: str,
+        headers: Mapping[str, str],
+        generation: Optional[int] = None,
+    ) -> None:
+        """generation - value of generation() captured before the request was sent; None skips the check"""
+        if "no-store" in headers.get("Cache-Control", ""):
+            return
+        entry = CachedResponse(
+            status=status,
+            body=body,
+            encoding=encoding,
+            expires=self._clock() + self.ttl,
+            etag=headers.get("ETag"),
+            last_modified=headers.get("Last-Modified"),
+        )
+        with self._lock:
+            if generation is not None and generation != self._generation(key[1]):
+                log.debug("Not caching response to %s fetched concurrently with modification", key[1])
+                return
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats.evicted += 1
+
+    def revalidated(self, key: CacheKey, entry: CachedResponse) -> None:
+        """Mark entry as fresh again after the API responded with 304 Not Modified"""
+        with self._lock:
+            entry.expires = self._clock() + self.ttl
+            self._stats.revalidated += 1
+
+    def invalidate(self, url_path: str) -> None:
+        """Drop entries related to resource modified by request to url_path"""
+        group = _resource_group(url_path)
+        with self._lock:
+            if group in self.INVALIDATE_ALL_GROUPS:
+                self._generation_all += 1
+                stale = list(self._entries)
+            else:
+                groups = self.RELATED_GROUPS.get(group, frozenset()) | {group}
+                for related in groups:
+                    self._generations[related] = self._generations.get(related, 0) + 1
+                stale = [key for key in self._entries if _resource_group(key[1]) in groups]
+            for key in stale:
+                del self._entries[key]
+            self._stats.invalidated += len(stale)
+        if stale:
+            log.debug("Invalidated %d cached responses after request to %s", len(stale), url_path)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def conditional_headers(entry: CachedResponse) -> Dict[str, str]:
+    headers = {}
+    if entry.etag is not None:
+        headers["If-None-Match"] = entry.etag
+    if entry.last_modified is not None:
+        headers["If-Modified-Since"] = entry.last_modified
+    return headers
+
+
+def _resource_group(url_path: str) -> str:
+    """ "/devices" -> "device", "/device/42/labels" -> "device", "/saved-filters/custom" -> "saved-filter" """
+    segment = url_path.lstrip("/").split("/", 1)[0].split("?", 1)[0].lower()
+    return segment[:-1] if segment.endswith("s") else segment
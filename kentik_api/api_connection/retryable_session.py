@@ -1,16 +1,51 @@
+import inspect
 import logging
-from typing import Optional
+from typing import Callable, Optional
 
 from requests import Session
-from requests.adapters import HTTPAdapter
 from urllib3 import Retry
 
 from kentik_api.auth.auth import KentikAuth
 
+from .http_pool import HTTPPoolConfig, PooledHTTPAdapter, PoolStats
+
 log = logging.getLogger(__name__)
 
+HoldOffCallback = Callable[[str, float], None]  # (url, seconds)
+
 
 # mypy: ignore-errors
+class RateLimitAwareRetry(Retry):
+    """
+    Retry strategy which reports responses carrying Retry-After header (and 429 responses) to "on_hold_off" callback.
+    urllib3 sleeps only in the thread that received such response; the callback allows the rate limiter
+    to hold off requests issued by all other threads as well.
+    """
+
+    on_hold_off: Optional[HoldOffCallback] = None
+
+    @classmethod
+    def from_retry(cls, retry: Retry, on_hold_off: HoldOffCallback) -> "RateLimitAwareRetry":
+        init_params = inspect.signature(Retry.__init__).parameters
+        instance = cls(**{k: v for k, v in vars(retry).items() if k in init_params})
+        instance.on_hold_off = on_hold_off
+        return instance
+
+    def new(self, **kw):
+        instance = super().new(**kw)
+        instance.on_hold_off = self.on_hold_off
+        return instance
+
+    def increment(self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None):
+        if self.on_hold_off is not None and response is not None:
+            delay = self.get_retry_after(response)
+            if delay is None and response.status == 429:
+                delay = self.get_backoff_time()
+            if delay:
+                self.on_hold_off(url, delay)
+        return super().increment(method, url, response, error, _pool, _stacktrace)
+
+
 class RetryableSession(Session):
     DEFAULT_RETRY_STRATEGY = Retry(
         total=3,
@@ -19,14 +54,30 @@ class RetryableSession(Session):
         allowed_methods=["DELETE", "HEAD", "GET", "PUT", "OPTIONS", "PATCH", "POST"],
     )
 
-    def __init__(self, retry_strategy: Optional[Retry] = None) -> None:
+    def __init__(
+        self,
+        retry_strategy: Optional[Retry] = None,
+        on_hold_off: Optional[HoldOffCallback] = None,
+        pool_config: Optional[HTTPPoolConfig] = None,
+    ) -> None:
         super().__init__()
         if retry_strategy is None:
             retry_strategy = self.DEFAULT_RETRY_STRATEGY
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.mount("https://", adapter)
-        self.mount("http://", adapter)
-        log.debug("%s: retry_strategy: %s", self.__class__, retry_strategy)
+        if on_hold_off is not None:
+            retry_strategy = RateLimitAwareRetry.from_retry(retry_strategy, on_hold_off)
+        if pool_config is None:
+            pool_config = HTTPPoolConfig()
+        self._adapter = PooledHTTPAdapter(pool_config, max_retries=retry_strategy)
+        self.mount("https://", self._adapter)
+        self.mount("http://", self._adapter)
+        if not pool_config.keep_alive:
+            self.headers["Connection"] = "close"
+        log.debug("%s: retry_strategy: %s, pool_config: %s", self.__class__, retry_strategy, pool_config)
+
+    @property
+    def pool_stats(self) -> PoolStats:
+        """Snapshot of connection pool counters"""
+        return self._adapter.stats.snapshot()
 
 
 def prepare_kentik_api_http_session(
@@ -34,8 +85,10 @@ def prepare_kentik_api_http_session(
     auth_token: str,
     retry_strategy: Optional[Retry],
     proxy: Optional[str],
+    on_hold_off: Optional[HoldOffCallback] = None,
+    pool_config: Optional[HTTPPoolConfig] = None,
 ) -> RetryableSession:
-    session = RetryableSession(retry_strategy)
+    session = RetryableSession(retry_strategy, on_hold_off, pool_config)
     session.auth = KentikAuth(auth_email, auth_token)
     session.headers.update({"Content-Type": "application/json"})
     if proxy:
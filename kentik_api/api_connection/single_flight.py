@@ -0,0 +1,61 @@
+import logging
+import threading
+from typing import Callable, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+log = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class _Call(Generic[T]):
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Optional[T] = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class SingleFlight(Generic[T]):
+    """
+    Suppresses duplicate concurrent calls: while a call for given key is in flight, other callers asking for the same
+    key wait for it and receive its result (or exception) instead of performing the call themselves.
+    Results are not retained once the call completes - see ResponseCache for caching.
+    """
+
+    def __init__(self) -> None:
+        self._calls: Dict[Hashable, _Call[T]] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, func: Callable[[], T]) -> Tuple[T, bool]:
+        """Return (result of func or of concurrent call with the same key, whether the result comes from the latter)"""
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                call.waiters += 1
+                leader = False
+            else:
+                call = self._calls[key] = _Call()
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True  # type: ignore
+
+        try:
+            call.result = func()
+        except BaseException as err:
+            call.error = err
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+            if call.waiters:
+                log.debug("Shared result of %s with %d concurrent callers", key, call.waiters)
+        return call.result, False
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._calls)
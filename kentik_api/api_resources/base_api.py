@@ -1,8 +1,13 @@
-from typing import Any, Optional
+from typing import Any, Optional, cast
 
 from kentik_api.api_calls.api_call import APICall
 from kentik_api.api_connection.api_call_response import APICallResponse
-from kentik_api.api_connection.api_connector_protocol import APIConnectorProtocol
+from kentik_api.api_connection.api_connector_protocol import (
+    APIConnectorProtocol,
+    AsyncAPIConnectorProtocol,
+    StreamingAPIConnectorProtocol,
+)
+from kentik_api.internal.json_codec import JSONCodec, get_codec
 from kentik_api.requests_payload.conversions import as_dict
 
 
@@ -12,7 +17,41 @@ class BaseAPI:
     def __init__(self, api_connector: APIConnectorProtocol) -> None:
         self._api_connector = api_connector
 
+    @property
+    def _json_codec(self) -> JSONCodec:
+        """Codec for decoding responses: the one of API connector, or the default codec if connector has none"""
+        return get_codec(getattr(self._api_connector, "json_codec", None))
+
     def send(self, api_call: APICall, payload: Optional[Any] = None) -> APICallResponse:
         if payload is not None:
             payload = as_dict(payload)
         return self._api_connector.send(api_call, payload)
+
+    def send_stream(self, api_call: APICall, payload: Optional[Any] = None) -> APICallResponse:
+        """
+        Send request, leaving the response body to be streamed via APICallResponse.iter_content().
+        Connectors without send_stream (see StreamingAPIConnectorProtocol) return the whole body, which
+        APICallResponse.iter_content() yields at once.
+        """
+        if payload is not None:
+            payload = as_dict(payload)
+        if not hasattr(self._api_connector, "send_stream"):
+            return self.send(api_call, payload)
+        return cast(StreamingAPIConnectorProtocol, self._api_connector).send_stream(api_call, payload)
+
+
+class AsyncBaseAPI:
+    """Base class containing attributes common to all asyncio API handlers."""
+
+    def __init__(self, api_connector: AsyncAPIConnectorProtocol) -> None:
+        self._api_connector = api_connector
+
+    @property
+    def _json_codec(self) -> JSONCodec:
+        """Codec for decoding responses: the one of API connector, or the default codec if connector has none"""
+        return get_codec(getattr(self._api_connector, "json_codec", None))
+
+    async def send(self, api_call: APICall, payload: Optional[Any] = None) -> APICallResponse:
+        if payload is not None:
+            payload = as_dict(payload)
+        return await self._api_connector.send(api_call, payload)
@@ -1,5 +1,5 @@
 from kentik_api.api_calls import batch
-from kentik_api.api_resources.base_api import BaseAPI
+from kentik_api.api_resources.base_api import AsyncBaseAPI, BaseAPI
 from kentik_api.public.batch_operation import BatchOperationPart
 from kentik_api.requests_payload import batch_operations_payload
 from kentik_api.requests_payload.conversions import convert, enum_to_str
@@ -14,7 +14,7 @@ class BatchAPI(BaseAPI):
         api_call = batch.flow_tags_batch_operation()
         payload = self._get_payload(operation_part)
         response = self.send(api_call, payload)
-        return batch_operations_payload.BatchResponse.from_json(response.text)
+        return batch_operations_payload.BatchResponse.from_json(response.text, self._json_codec)
 
     def batch_operation_on_populators(
         self, dimension_name: str, operation_part: BatchOperationPart
@@ -22,12 +22,12 @@ class BatchAPI(BaseAPI):
         api_call = batch.populators_batch_operation(dimension_name)
         payload = self._get_payload(operation_part)
         response = self.send(api_call, payload)
-        return batch_operations_payload.BatchResponse.from_json(response.text)
+        return batch_operations_payload.BatchResponse.from_json(response.text, self._json_codec)
 
     def get_status(self, batch_operation_guid: str) -> batch_operations_payload.BatchStatusResponse:
         api_call = batch.get_batch_operation_status(batch_operation_guid)
         response = self.send(api_call)
-        return batch_operations_payload.BatchStatusResponse.from_json(response.text)
+        return batch_operations_payload.BatchStatusResponse.from_json(response.text, self._json_codec)
 
     @staticmethod
     def _get_payload(
@@ -51,3 +51,28 @@ class BatchAPI(BaseAPI):
             deletes=[batch_operations_payload.BatchRequest.Delete(i.value) for i in operation_part.deletes],
             guid=operation_part.guid,
         )
+
+
+class AsyncBatchAPI(AsyncBaseAPI):
+    """Asyncio variant of BatchAPI"""
+
+    async def batch_operation_on_flow_tags(
+        self, operation_part: BatchOperationPart
+    ) -> batch_operations_payload.BatchResponse:
+        api_call = batch.flow_tags_batch_operation()
+        payload = BatchAPI._get_payload(operation_part)
+        response = await self.send(api_call, payload)
+        return batch_operations_payload.BatchResponse.from_json(response.text, self._json_codec)
+
+    async def batch_operation_on_populators(
+        self, dimension_name: str, operation_part: BatchOperationPart
+    ) -> batch_operations_payload.BatchResponse:
+        api_call = batch.populators_batch_operation(dimension_name)
+        payload = BatchAPI._get_payload(operation_part)
+        response = await self.send(api_call, payload)
+        return batch_operations_payload.BatchResponse.from_json(response.text, self._json_codec)
+
+    async def get_status(self, batch_operation_guid: str) -> batch_operations_payload.BatchStatusResponse:
+        api_call = batch.get_batch_operation_status(batch_operation_guid)
+        response = await self.send(api_call)
+        return batch_operations_payload.BatchStatusResponse.from_json(response.text, self._json_codec)
@@ -2,8 +2,8 @@ from http import HTTPStatus
 from typing import List
 
 from kentik_api.api_calls import custom_dimensions
-from kentik_api.api_connection.api_connector_protocol import APIConnectorProtocol
-from kentik_api.api_resources.base_api import BaseAPI
+from kentik_api.api_connection.api_connector_protocol import APIConnectorProtocol, AsyncAPIConnectorProtocol
+from kentik_api.api_resources.base_api import AsyncBaseAPI, BaseAPI
 from kentik_api.public.custom_dimension import CustomDimension, Populator
 from kentik_api.public.types import ID
 from kentik_api.requests_payload import custom_dimensions_payload, populators_payload
@@ -16,13 +16,13 @@ class PopulatorsAPI(BaseAPI):
         apicall = custom_dimensions.create_populator(populator.dimension_id)
         payload = populators_payload.CreateRequest.from_populator(populator)
         response = self.send(apicall, payload)
-        return populators_payload.CreateResponse.from_json(response.text).to_populator()
+        return populators_payload.CreateResponse.from_json(response.text, self._json_codec).to_populator()
 
     def update(self, populator: Populator) -> Populator:
         apicall = custom_dimensions.update_populator(populator.dimension_id, populator.id)
         payload = populators_payload.UpdateRequest.from_populator(populator)
         response = self.send(apicall, payload)
-        return populators_payload.UpdateResponse.from_json(response.text).to_populator()
+        return populators_payload.UpdateResponse.from_json(response.text, self._json_codec).to_populator()
 
     def delete(self, custom_dimension_id: ID, populator_id: ID) -> bool:
         apicall = custom_dimensions.delete_populator(custom_dimension_id, populator_id)
@@ -40,24 +40,26 @@ class CustomDimensionsAPI(BaseAPI):
     def get(self, custom_dimension_id: ID) -> CustomDimension:
         apicall = custom_dimensions.get_custom_dimension_info(custom_dimension_id)
         response = self.send(apicall)
-        return custom_dimensions_payload.GetResponse.from_json(response.text).to_custom_dimension()
+        return custom_dimensions_payload.GetResponse.from_json(response.text, self._json_codec).to_custom_dimension()
 
     def get_all(self) -> List[CustomDimension]:
         apicall = custom_dimensions.get_custom_dimensions()
         response = self.send(apicall)
-        return custom_dimensions_payload.GetAllResponse.from_json(response.text).to_custom_dimensions()
+        return custom_dimensions_payload.GetAllResponse.from_json(
+            response.text, self._json_codec
+        ).to_custom_dimensions()
 
     def create(self, custom_dimension: CustomDimension) -> CustomDimension:
         apicall = custom_dimensions.create_custom_dimension()
         payload = custom_dimensions_payload.CreateRequest.from_custom_dimension(custom_dimension)
         response = self.send(apicall, payload)
-        return custom_dimensions_payload.CreateResponse.from_json(response.text).to_custom_dimension()
+        return custom_dimensions_payload.CreateResponse.from_json(response.text, self._json_codec).to_custom_dimension()
 
     def update(self, custom_dimension: CustomDimension) -> CustomDimension:
         apicall = custom_dimensions.update_custom_dimension(custom_dimension.id)
         payload = custom_dimensions_payload.UpdateRequest.from_custom_dimension(custom_dimension)
         response = self.send(apicall, payload)
-        return custom_dimensions_payload.UpdateResponse.from_json(response.text).to_custom_dimension()
+        return custom_dimensions_payload.UpdateResponse.from_json(response.text, self._json_codec).to_custom_dimension()
 
     def delete(self, custom_dimension_id: ID) -> bool:
         apicall = custom_dimensions.delete_custom_dimension(custom_dimension_id)
@@ -67,3 +69,65 @@ class CustomDimensionsAPI(BaseAPI):
     @property
     def populators(self) -> PopulatorsAPI:
         return self._populators
+
+
+class AsyncPopulatorsAPI(AsyncBaseAPI):
+    """Asyncio variant of PopulatorsAPI"""
+
+    async def create(self, populator: Populator) -> Populator:
+        apicall = custom_dimensions.create_populator(populator.dimension_id)
+        payload = populators_payload.CreateRequest.from_populator(populator)
+        response = await self.send(apicall, payload)
+        return populators_payload.CreateResponse.from_json(response.text, self._json_codec).to_populator()
+
+    async def update(self, populator: Populator) -> Populator:
+        apicall = custom_dimensions.update_populator(populator.dimension_id, populator.id)
+        payload = populators_payload.UpdateRequest.from_populator(populator)
+        response = await self.send(apicall, payload)
+        return populators_payload.UpdateResponse.from_json(response.text, self._json_codec).to_populator()
+
+    async def delete(self, custom_dimension_id: ID, populator_id: ID) -> bool:
+        apicall = custom_dimensions.delete_populator(custom_dimension_id, populator_id)
+        response = await self.send(apicall)
+        return response.http_status_code == HTTPStatus.NO_CONTENT
+
+
+class AsyncCustomDimensionsAPI(AsyncBaseAPI):
+    """Asyncio variant of CustomDimensionsAPI"""
+
+    def __init__(self, api_connector: AsyncAPIConnectorProtocol) -> None:
+        super(AsyncCustomDimensionsAPI, self).__init__(api_connector)
+        self._populators = AsyncPopulatorsAPI(api_connector)
+
+    async def get(self, custom_dimension_id: ID) -> CustomDimension:
+        apicall = custom_dimensions.get_custom_dimension_info(custom_dimension_id)
+        response = await self.send(apicall)
+        return custom_dimensions_payload.GetResponse.from_json(response.text, self._json_codec).to_custom_dimension()
+
+    async def get_all(self) -> List[CustomDimension]:
+        apicall = custom_dimensions.get_custom_dimensions()
+        response = await self.send(apicall)
+        return custom_dimensions_payload.GetAllResponse.from_json(
+            response.text, self._json_codec
+        ).to_custom_dimensions()
+
+    async def create(self, custom_dimension: CustomDimension) -> CustomDimension:
+        apicall = custom_dimensions.create_custom_dimension()
+        payload = custom_dimensions_payload.CreateRequest.from_custom_dimension(custom_dimension)
+        response = await self.send(apicall, payload)
+        return custom_dimensions_payload.CreateResponse.from_json(response.text, self._json_codec).to_custom_dimension()
+
+    async def update(self, custom_dimension: CustomDimension) -> CustomDimension:
+        apicall = custom_dimensions.update_custom_dimension(custom_dimension.id)
+        payload = custom_dimensions_payload.UpdateRequest.from_custom_dimension(custom_dimension)
+        response = await self.send(apicall, payload)
+        return custom_dimensions_payload.UpdateResponse.from_json(response.text, self._json_codec).to_custom_dimension()
+
+    async def delete(self, custom_dimension_id: ID) -> bool:
+        apicall = custom_dimensions.delete_custom_dimension(custom_dimension_id)
+        response = await self.send(apicall)
+        return response.http_status_code == HTTPStatus.NO_CONTENT
+
+    @property
+    def populators(self) -> AsyncPopulatorsAPI:
+        return self._populators
@@ -1,9 +1,9 @@
 from http import HTTPStatus
-from typing import List
+from typing import Iterator, List
 
 from kentik_api.api_calls import devices
-from kentik_api.api_connection.api_connector_protocol import APIConnectorProtocol
-from kentik_api.api_resources.base_api import BaseAPI
+from kentik_api.api_connection.api_connector_protocol import APIConnectorProtocol, AsyncAPIConnectorProtocol
+from kentik_api.api_resources.base_api import AsyncBaseAPI, BaseAPI
 from kentik_api.public.device import AppliedLabels, Device, Interface
 from kentik_api.public.types import ID
 from kentik_api.requests_payload import devices_payload, interfaces_payload
@@ -15,24 +15,24 @@ class InterfacesAPI(BaseAPI):
     def get_all(self, device_id: ID) -> List[Interface]:
         api_call = devices.get_device_interfaces(device_id)
         response = self.send(api_call)
-        return interfaces_payload.GetAllResponse.from_json(response.text).to_interfaces()
+        return interfaces_payload.GetAllResponse.from_json(response.text, self._json_codec).to_interfaces()
 
     def get(self, device_id: ID, interface_id: ID) -> Interface:
         api_call = devices.get_device_interface_info(device_id, interface_id)
         response = self.send(api_call)
-        return interfaces_payload.GetResponse.from_json(response.text).to_interface()
+        return interfaces_payload.GetResponse.from_json(response.text, self._json_codec).to_interface()
 
     def create(self, interface: Interface) -> Interface:
         api_call = devices.create_interface(interface.device_id)
         payload = interfaces_payload.CreateRequest.from_interface(interface)
         response = self.send(api_call, payload)
-        return interfaces_payload.CreateResponse.from_json(response.text).to_interface()
+        return interfaces_payload.CreateResponse.from_json(response.text, self._json_codec).to_interface()
 
     def update(self, interface: Interface) -> Interface:
         api_call = devices.update_interface(interface.device_id, interface.id)
         payload = interfaces_payload.UpdateRequest.from_interface(interface)
         response = self.send(api_call, payload)
-        return interfaces_payload.UpdateResponse.from_json(response.text).to_interface()
+        return interfaces_payload.UpdateResponse.from_json(response.text, self._json_codec).to_interface()
 
     def delete(self, device_id: ID, interface_id: ID) -> bool:
         api_call = devices.delete_interface(device_id, interface_id)
@@ -47,27 +47,37 @@ class DevicesAPI(BaseAPI):
         super(DevicesAPI, self).__init__(api_connector)
         self._interfaces = InterfacesAPI(api_connector)
 
-    def get_all(self) -> List[Device]:
+    def get_all(self, lazy: bool = False) -> List[Device]:
+        """
+        lazy - if True, nested objects (plan, site, labels, interfaces, SNMPv3 config) of returned devices are
+               converted on first access. Recommended for large accounts when only few attributes are used.
+        """
+        return list(self.iter_all(lazy))
+
+    def iter_all(self, lazy: bool = False) -> Iterator[Device]:
+        """Yield devices while the response is being received; memory use doesn't grow with size of the response"""
         api_call = devices.get_devices()
-        response = self.send(api_call)
-        return devices_payload.GetAllResponse.from_json(response.text).to_devices()
+        response = self.send_stream(api_call)
+        yield from devices_payload.GetAllResponse.iter_devices_from_json_stream(
+            response.iter_content(), response.encoding, lazy, self._json_codec
+        )
 
     def get(self, device_id: ID) -> Device:
         api_call = devices.get_device_info(device_id)
         response = self.send(api_call)
-        return devices_payload.GetResponse.from_json(response.text).to_device()
+        return devices_payload.GetResponse.from_json(response.text, self._json_codec).to_device()
 
     def create(self, device: Device) -> Device:
         api_call = devices.create_device()
         payload = devices_payload.CreateRequest.from_device(device)
         response = self.send(api_call, payload)
-        return devices_payload.CreateResponse.from_json(response.text).to_device()
+        return devices_payload.CreateResponse.from_json(response.text, self._json_codec).to_device()
 
     def update(self, device: Device) -> Device:
         api_call = devices.update_device(device.id)
         payload = devices_payload.UpdateRequest.from_device(device)
         response = self.send(api_call, payload)
-        return devices_payload.UpdateResponse.from_json(response.text).to_device()
+        return devices_payload.UpdateResponse.from_json(response.text, self._json_codec).to_device()
 
     def delete(self, device_id: ID) -> bool:
         """
@@ -82,8 +92,90 @@ class DevicesAPI(BaseAPI):
         api_call = devices.apply_device_labels(device_id)
         payload = devices_payload.ApplyLabelsRequest.from_id_list(label_ids)
         response = self.send(api_call, payload)
-        return devices_payload.ApplyLabelsResponse.from_json(response.text).to_applied_labels()
+        return devices_payload.ApplyLabelsResponse.from_json(response.text, self._json_codec).to_applied_labels()
 
     @property
     def interfaces(self) -> InterfacesAPI:
         return self._interfaces
+
+
+class AsyncInterfacesAPI(AsyncBaseAPI):
+    """Asyncio variant of InterfacesAPI"""
+
+    async def get_all(self, device_id: ID) -> List[Interface]:
+        api_call = devices.get_device_interfaces(device_id)
+        response = await self.send(api_call)
+        return interfaces_payload.GetAllResponse.from_json(response.text, self._json_codec).to_interfaces()
+
+    async def get(self, device_id: ID, interface_id: ID) -> Interface:
+        api_call = devices.get_device_interface_info(device_id, interface_id)
+        response = await self.send(api_call)
+        return interfaces_payload.GetResponse.from_json(response.text, self._json_codec).to_interface()
+
+    async def create(self, interface: Interface) -> Interface:
+        api_call = devices.create_interface(interface.device_id)
+        payload = interfaces_payload.CreateRequest.from_interface(interface)
+        response = await self.send(api_call, payload)
+        return interfaces_payload.CreateResponse.from_json(response.text, self._json_codec).to_interface()
+
+    async def update(self, interface: Interface) -> Interface:
+        api_call = devices.update_interface(interface.device_id, interface.id)
+        payload = interfaces_payload.UpdateRequest.from_interface(interface)
+        response = await self.send(api_call, payload)
+        return interfaces_payload.UpdateResponse.from_json(response.text, self._json_codec).to_interface()
+
+    async def delete(self, device_id: ID, interface_id: ID) -> bool:
+        api_call = devices.delete_interface(device_id, interface_id)
+        response = await self.send(api_call)
+        return response.http_status_code == HTTPStatus.OK
+
+
+class AsyncDevicesAPI(AsyncBaseAPI):
+    """Asyncio variant of DevicesAPI"""
+
+    def __init__(self, api_connector: AsyncAPIConnectorProtocol) -> None:
+        super(AsyncDevicesAPI, self).__init__(api_connector)
+        self._interfaces = AsyncInterfacesAPI(api_connector)
+
+    async def get_all(self, lazy: bool = False) -> List[Device]:
+        api_call = devices.get_devices()
+        response = await self.send(api_call)
+        if lazy:
+            return devices_payload.GetAllResponse.lazy_devices_from_json(response.text, self._json_codec)
+        return devices_payload.GetAllResponse.from_json(response.text, self._json_codec).to_devices()
+
+    async def get(self, device_id: ID) -> Device:
+        api_call = devices.get_device_info(device_id)
+        response = await self.send(api_call)
+        return devices_payload.GetResponse.from_json(response.text, self._json_codec).to_device()
+
+    async def create(self, device: Device) -> Device:
+        api_call = devices.create_device()
+        payload = devices_payload.CreateRequest.from_device(device)
+        response = await self.send(api_call, payload)
+        return devices_payload.CreateResponse.from_json(response.text, self._json_codec).to_device()
+
+    async def update(self, device: Device) -> Device:
+        api_call = devices.update_device(device.id)
+        payload = devices_payload.UpdateRequest.from_device(device)
+        response = await self.send(api_call, payload)
+        return devices_payload.UpdateResponse.from_json(response.text, self._json_codec).to_device()
+
+    async def delete(self, device_id: ID) -> bool:
+        """
+        Note: KentikAPI requires sending delete request twice to actually delete the device.
+        This is a safety measure preventing deletion by mistake.
+        """
+        api_call = devices.delete_device(device_id)
+        response = await self.send(api_call)
+        return response.http_status_code == HTTPStatus.NO_CONTENT
+
+    async def apply_labels(self, device_id: ID, label_ids: List[ID]) -> AppliedLabels:
+        api_call = devices.apply_device_labels(device_id)
+        payload = devices_payload.ApplyLabelsRequest.from_id_list(label_ids)
+        response = await self.send(api_call, payload)
+        return devices_payload.ApplyLabelsResponse.from_json(response.text, self._json_codec).to_applied_labels()
+
+    @property
+    def interfaces(self) -> AsyncInterfacesAPI:
+        return self._interfaces
@@ -1,7 +1,7 @@
 from typing import List
 
 from kentik_api.api_calls import plans
-from kentik_api.api_resources.base_api import BaseAPI
+from kentik_api.api_resources.base_api import AsyncBaseAPI, BaseAPI
 from kentik_api.public.plan import Plan
 from kentik_api.requests_payload import plans_payload
 
@@ -12,4 +12,13 @@ class PlansAPI(BaseAPI):
     def get_all(self) -> List[Plan]:
         api_call = plans.get_plans()
         response = self.send(api_call)
-        return plans_payload.GetAllResponse.from_json(response.text).to_plans()
+        return plans_payload.GetAllResponse.from_json(response.text, self._json_codec).to_plans()
+
+
+class AsyncPlansAPI(AsyncBaseAPI):
+    """Asyncio variant of PlansAPI"""
+
+    async def get_all(self) -> List[Plan]:
+        api_call = plans.get_plans()
+        response = await self.send(api_call)
+        return plans_payload.GetAllResponse.from_json(response.text, self._json_codec).to_plans()
@@ -1,5 +1,10 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Generator, Iterable, Union
+
 from kentik_api.api_calls import query_methods
-from kentik_api.api_resources.base_api import BaseAPI
+from kentik_api.api_resources.base_api import AsyncBaseAPI, BaseAPI
+from kentik_api.public.errors import DataFormatError
+from kentik_api.public.query_batch import QueryBatchResult
 from kentik_api.public.query_object import QueryChartResult, QueryDataResult, QueryObject, QueryURLResult
 from kentik_api.public.query_sql import QuerySQL, QuerySQLResult
 from kentik_api.requests_payload.queries_payload import QueryChartResponse, QueryDataResponse, QueryURLResponse
@@ -8,26 +13,96 @@ from kentik_api.requests_payload.queries_payload import QueryChartResponse, Quer
 class QueryAPI(BaseAPI):
     """Exposes Kentik API's Query API methods"""
 
+    # default number of queries in flight in run_many; kept below default size of the HTTP connection pool
+    DEFAULT_MAX_CONCURRENCY = 8
+
     def sql(self, query: QuerySQL) -> QuerySQLResult:
         apicall = query_methods.query_sql()
         payload = query
         response = self.send(apicall, payload)
-        return QuerySQLResult.from_json(response.text)
+        return QuerySQLResult.from_json(response.text, self._json_codec)
 
     def data(self, query: QueryObject) -> QueryDataResult:
         apicall = query_methods.query_data()
         payload = query
-        response = self.send(apicall, payload)
-        return QueryDataResponse.from_json(response.text).to_query_data_result()
+        response = self.send_stream(apicall, payload)
+        result = QueryDataResponse.from_json_stream(response.iter_content(), response.encoding, self._json_codec)
+        return result.to_query_data_result()
 
     def chart(self, query: QueryObject) -> QueryChartResult:
         apicall = query_methods.query_chart()
         payload = query
         response = self.send(apicall, payload)
-        return QueryChartResponse.from_json(response.text).to_query_chart_result()
+        return QueryChartResponse.from_json(response.text, self._json_codec).to_query_chart_result()
 
     def url(self, query: QueryObject) -> QueryURLResult:
         apicall = query_methods.query_url()
         payload = query
         response = self.send(apicall, payload)
         return QueryURLResponse(response.text).to_query_url_result()
+
+    def run_many(
+        self,
+        queries: Iterable[Union[QuerySQL, QueryObject]],
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        in_order: bool = True,
+    ) -> Generator[QueryBatchResult, None, None]:
+        """
+        Execute batch of independent queries concurrently in a pool of threads sharing the API connector.
+        QuerySQL items are executed via "sql" and QueryObject items via "data" method.
+        Failure of a query does not abort the batch - the error is captured in respective QueryBatchResult.
+        :param queries: queries to execute
+        :param max_concurrency: maximum number of queries in flight
+        :param in_order: if True results are yielded in submission order, otherwise as they complete
+        :return: generator yielding one QueryBatchResult per query (the batch is submitted on first iteration)
+        """
+        with ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="QueryAPI") as executor:
+            futures = [executor.submit(self._run_one, index, query) for index, query in enumerate(queries)]
+            try:
+                for future in futures if in_order else as_completed(futures):
+                    yield future.result()
+            finally:
+                # don't start queries which are still pending when the consumer stops iterating early
+                for future in futures:
+                    future.cancel()
+
+    def _run_one(self, index: int, query: Union[QuerySQL, QueryObject]) -> QueryBatchResult:
+        outcome = QueryBatchResult(index=index, query=query)
+        try:
+            if isinstance(query, QuerySQL):
+                outcome.result = self.sql(query)
+            elif isinstance(query, QueryObject):
+                outcome.result = self.data(query)
+            else:
+                raise DataFormatError(f"Unsupported query type: {type(query)}")
+        except Exception as err:  # pylint: disable=broad-except
+            outcome.error = err
+        return outcome
+
+
+class AsyncQueryAPI(AsyncBaseAPI):
+    """Asyncio variant of QueryAPI"""
+
+    async def sql(self, query: QuerySQL) -> QuerySQLResult:
+        apicall = query_methods.query_sql()
+        payload = query
+        response = await self.send(apicall, payload)
+        return QuerySQLResult.from_json(response.text, self._json_codec)
+
+    async def data(self, query: QueryObject) -> QueryDataResult:
+        apicall = query_methods.query_data()
+        payload = query
+        response = await self.send(apicall, payload)
+        return QueryDataResponse.from_json(response.text, self._json_codec).to_query_data_result()
+
+    async def chart(self, query: QueryObject) -> QueryChartResult:
+        apicall = query_methods.query_chart()
+        payload = query
+        response = await self.send(apicall, payload)
+        return QueryChartResponse.from_json(response.text, self._json_codec).to_query_chart_result()
+
+    async def url(self, query: QueryObject) -> QueryURLResult:
+        apicall = query_methods.query_url()
+        payload = query
+        response = await self.send(apicall, payload)
+        return QueryURLResponse(response.text).to_query_url_result()
@@ -2,7 +2,7 @@ from http import HTTPStatus
 from typing import List
 
 from kentik_api.api_calls import users
-from kentik_api.api_resources.base_api import BaseAPI
+from kentik_api.api_resources.base_api import AsyncBaseAPI, BaseAPI
 from kentik_api.public.types import ID
 from kentik_api.public.user import User
 from kentik_api.requests_payload import users_payload
@@ -14,12 +14,12 @@ class UsersAPI(BaseAPI):
     def get_all(self) -> List[User]:
         api_call = users.get_users()
         response = self.send(api_call)
-        return users_payload.GetAllResponse.from_json(response.text).to_users()
+        return users_payload.GetAllResponse.from_json(response.text, self._json_codec).to_users()
 
     def get(self, user_id: ID) -> User:
         api_call = users.get_user_info(user_id)
         response = self.send(api_call)
-        return users_payload.GetResponse.from_json(response.text).to_user()
+        return users_payload.GetResponse.from_json(response.text, self._json_codec).to_user()
 
     def create(self, user: User) -> User:
         api_call = users.create_user()
@@ -32,7 +32,7 @@ class UsersAPI(BaseAPI):
             email_product=user.email_product,
         )
         response = self.send(api_call, payload)
-        return users_payload.CreateResponse.from_json(response.text).to_user()
+        return users_payload.CreateResponse.from_json(response.text, self._json_codec).to_user()
 
     def update(self, user: User) -> User:
         api_call = users.update_user(user.id)
@@ -45,9 +45,54 @@ class UsersAPI(BaseAPI):
             email_product=user.email_product,
         )
         response = self.send(api_call, payload)
-        return users_payload.UpdateResponse.from_json(response.text).to_user()
+        return users_payload.UpdateResponse.from_json(response.text, self._json_codec).to_user()
 
     def delete(self, user_id: ID) -> bool:
         api_call = users.delete_user(user_id)
         response = self.send(api_call)
         return response.http_status_code == HTTPStatus.NO_CONTENT
+
+
+class AsyncUsersAPI(AsyncBaseAPI):
+    """Asyncio variant of UsersAPI"""
+
+    async def get_all(self) -> List[User]:
+        api_call = users.get_users()
+        response = await self.send(api_call)
+        return users_payload.GetAllResponse.from_json(response.text, self._json_codec).to_users()
+
+    async def get(self, user_id: ID) -> User:
+        api_call = users.get_user_info(user_id)
+        response = await self.send(api_call)
+        return users_payload.GetResponse.from_json(response.text, self._json_codec).to_user()
+
+    async def create(self, user: User) -> User:
+        api_call = users.create_user()
+        payload = users_payload.CreateRequest(
+            user_name=user.username,
+            user_full_name=user.full_name,
+            user_email=user.email,
+            role=user.role,
+            email_service=user.email_service,
+            email_product=user.email_product,
+        )
+        response = await self.send(api_call, payload)
+        return users_payload.CreateResponse.from_json(response.text, self._json_codec).to_user()
+
+    async def update(self, user: User) -> User:
+        api_call = users.update_user(user.id)
+        payload = users_payload.UpdateRequest(
+            user_name=user.username,
+            user_full_name=user.full_name,
+            user_email=user.email,
+            role=user.role,
+            email_service=user.email_service,
+            email_product=user.email_product,
+        )
+        response = await self.send(api_call, payload)
+        return users_payload.UpdateResponse.from_json(response.text, self._json_codec).to_user()
+
+    async def delete(self, user_id: ID) -> bool:
+        api_call = users.delete_user(user_id)
+        response = await self.send(api_call)
+        return response.http_status_code == HTTPStatus.NO_CONTENT
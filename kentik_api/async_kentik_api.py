@@ -0,0 +1,102 @@
+import logging
+from typing import Any, List, Optional, Tuple, Union
+
+from .api_connection.async_api_connector import AsyncAPIConnector
+from .api_connection.grpc_channel import GRPCChannelConfig
+from .api_connection.instrumentation import Instrumentation
+from .api_connection.rate_limiter import RateLimiter
+from .api_connection.retryable_session import Retry
+from .api_resources.alerting_api import AsyncAlertingAPI
+from .api_resources.batch_api import AsyncBatchAPI
+from .api_resources.custom_applications_api import AsyncCustomApplicationsAPI
+from .api_resources.custom_dimensions_api import AsyncCustomDimensionsAPI
+from .api_resources.device_labels_api import AsyncDeviceLabelsAPI
+from .api_resources.devices_api import AsyncDevicesAPI
+from .api_resources.plans_api import AsyncPlansAPI
+from .api_resources.query_api import AsyncQueryAPI
+from .api_resources.saved_filters_api import AsyncSavedFiltersAPI
+from .api_resources.sites_api import AsyncSitesAPI
+from .api_resources.tags_api import AsyncTagsAPI
+from .api_resources.tenants_api import AsyncMyKentikPortalAPI
+from .api_resources.users_api import AsyncUsersAPI
+from .cloudexport.async_api_connector import AsyncAPICloudExportConnector
+from .cloudexport.async_client import AsyncKentikCloudExportClient
+from .internal.json_codec import JSONCodec
+from .kentik_api import KentikAPI
+from .synthetics.async_api_connector import AsyncAPISyntheticsConnector
+from .synthetics.async_synth_client import AsyncKentikSynthClient
+
+
+class AsyncKentikAPI:
+    """
+    Root object for operating KentikAPI from asyncio code.
+    All resource methods are coroutines sharing single aiohttp session, so that many requests can be in flight
+    from one event loop. Use as async context manager or call close() to release the session.
+    """
+
+    API_HOST_EU = KentikAPI.API_HOST_EU
+    API_HOST_US = KentikAPI.API_HOST_US
+
+    def __init__(
+        self,
+        auth_email: str,
+        auth_token: str,
+        api_host: str = API_HOST_US,
+        timeout: Union[float, Tuple[float, float]] = (10.0, 60.0),
+        retry_strategy: Optional[Retry] = None,
+        proxy: Optional[str] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        json_codec: Optional[Union[str, JSONCodec]] = None,
+        grpc_client_options: Optional[List[Tuple[str, Any]]] = None,
+        grpc_channel: Optional[GRPCChannelConfig] = None,
+        instrumentation: Optional[Instrumentation] = None,
+    ) -> None:
+        """
+        grpc_client_options, grpc_channel - see KentikAPI; synthetics and cloud_export use grpc.aio channels,
+                                            which are opened on first call
+        instrumentation - receives CallEvent for every gRPC call
+        """
+        if not api_host:
+            logging.debug("AsyncKentikAPI: null api_host, setting to %s", self.API_HOST_US)
+            api_host = self.API_HOST_US
+        api_v5_url = KentikAPI.make_api_v5_url(api_host)
+        self._connector = AsyncAPIConnector(
+            api_v5_url, auth_email, auth_token, timeout, retry_strategy, proxy, rate_limiter, json_codec
+        )
+        connector = self._connector
+        self.device_labels = AsyncDeviceLabelsAPI(connector)
+        self.sites = AsyncSitesAPI(connector)
+        self.users = AsyncUsersAPI(connector)
+        self.tags = AsyncTagsAPI(connector)
+        self.saved_filters = AsyncSavedFiltersAPI(connector)
+        self.custom_dimensions = AsyncCustomDimensionsAPI(connector)
+        self.custom_applications = AsyncCustomApplicationsAPI(connector)
+        self.query = AsyncQueryAPI(connector)
+        self.plans = AsyncPlansAPI(connector)
+        self.my_kentik_portal = AsyncMyKentikPortalAPI(connector)
+        self.devices = AsyncDevicesAPI(connector)
+        self.batch = AsyncBatchAPI(connector)
+        self.alerting = AsyncAlertingAPI(connector)
+
+        grpc_client_options = grpc_client_options or KentikAPI.DEFAULT_GRPC_CLIENT_OPTIONS
+        api_v6_url = KentikAPI.make_grpc_endpoint(api_host)
+        self._synth_connector = AsyncAPISyntheticsConnector(
+            api_v6_url, auth_email, auth_token, grpc_client_options, instrumentation, grpc_channel
+        )
+        self.synthetics = AsyncKentikSynthClient(self._synth_connector)
+        self._cloud_export_connector = AsyncAPICloudExportConnector(
+            api_v6_url, auth_email, auth_token, grpc_client_options, instrumentation, grpc_channel
+        )
+        self.cloud_export = AsyncKentikCloudExportClient(self._cloud_export_connector)
+
+    async def __aenter__(self) -> "AsyncKentikAPI":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Release HTTP session and gRPC channels. The object must not be used afterwards."""
+        await self._connector.close()
+        await self._synth_connector.close()
+        await self._cloud_export_connector.close()
@@ -1,9 +1,11 @@
-from typing import Any, List, Tuple
+from typing import Any, List, Optional, Tuple
 
 from google.protobuf.field_mask_pb2 import FieldMask  # type: ignore
 
 import kentik_api.generated.kentik.cloud_export.v202101beta1.cloud_export_pb2 as pb
-from kentik_api.generated.kentik.cloud_export.v202101beta1.cloud_export_pb2_grpc import CloudExportAdminService
+from kentik_api.api_connection.grpc_channel import ChannelPool, GRPCChannelConfig
+from kentik_api.api_connection.instrumentation import Instrumentation
+from kentik_api.generated.kentik.cloud_export.v202101beta1.cloud_export_pb2_grpc import CloudExportAdminServiceStub
 from kentik_api.internal.grpc import wrap_grpc_errors
 from kentik_api.version import get_user_agent
 
@@ -11,7 +13,8 @@ from kentik_api.version import get_user_agent
 class APICloudExportConnector:
     """
     APICloudExportConnector implements APICloudExportConnectorProtocol.
-    Allows sending authorized gRPC requests to Kentik CloudExport API
+    Allows sending authorized gRPC requests to Kentik CloudExport API.
+    Owns long-lived gRPC channel(s) which are released by close().
     """
 
     def __init__(
@@ -20,54 +23,52 @@ class APICloudExportConnector:
         auth_email: str,
         auth_token: str,
         options: List[Tuple[str, Any]] = [],
+        instrumentation: Optional[Instrumentation] = None,
+        channel_config: Optional[GRPCChannelConfig] = None,
     ):
-        self._url = api_url
-        self._options = tuple(options)
-        self._admin = CloudExportAdminService()
+        self._instrumentation = instrumentation  # used by wrap_grpc_errors
+        self._channels = ChannelPool(api_url, CloudExportAdminServiceStub, channel_config, options)
         self._metadata = [
             ("x-ch-auth-email", auth_email),
             ("x-ch-auth-api-token", auth_token),
             ("user-agent", get_user_agent()),
         ]
 
+    @property
+    def _admin(self) -> CloudExportAdminServiceStub:
+        return self._channels.stub()
+
+    def close(self) -> None:
+        self._channels.close()
+
     @wrap_grpc_errors
     def get_all(self) -> pb.ListCloudExportResponse:
         request = pb.ListCloudExportRequest()
-        return self._admin.ListCloudExport(
-            request=request, metadata=self._metadata, target=self._url, options=self._options
-        )
+        return self._admin.ListCloudExport(request=request, metadata=self._metadata)
 
     @wrap_grpc_errors
     def get(self, export_id: str) -> pb.CloudExport:
         request = pb.GetCloudExportRequest(id=export_id)
-        return self._admin.GetCloudExport(
-            request=request, metadata=self._metadata, target=self._url, options=self._options
-        ).export
+        return self._admin.GetCloudExport(request=request, metadata=self._metadata).export
 
     @wrap_grpc_errors
     def create(self, export: pb.CloudExport) -> pb.CloudExport:
         request = pb.CreateCloudExportRequest(export=export)
-        return self._admin.CreateCloudExport(
-            request=request, metadata=self._metadata, target=self._url, options=self._options
-        ).export
+        return self._admin.CreateCloudExport(request=request, metadata=self._metadata).export
 
     @wrap_grpc_errors
     def patch(self, export: pb.CloudExport, modified: str) -> pb.CloudExport:
         """modified example: export.name"""
         mask = FieldMask(paths=[modified])
         request = pb.PatchCloudExportRequest(export=export, mask=mask)
-        return self._admin.PatchCloudExport(
-            request=request, metadata=self._metadata, target=self._url, options=self._options
-        ).export
+        return self._admin.PatchCloudExport(request=request, metadata=self._metadata).export
 
     @wrap_grpc_errors
     def update(self, export: pb.CloudExport) -> pb.CloudExport:
         request = pb.UpdateCloudExportRequest(export=export)
-        return self._admin.UpdateCloudExport(
-            request=request, metadata=self._metadata, target=self._url, options=self._options
-        ).export
+        return self._admin.UpdateCloudExport(request=request, metadata=self._metadata).export
 
     @wrap_grpc_errors
     def delete(self, export_id: str) -> None:
         request = pb.DeleteCloudExportRequest(id=export_id)
-        self._admin.DeleteCloudExport(request=request, metadata=self._metadata, target=self._url, options=self._options)
+        self._admin.DeleteCloudExport(request=request, metadata=self._metadata)
@@ -0,0 +1,76 @@
+from typing import Any, List, Optional, Tuple
+
+from google.protobuf.field_mask_pb2 import FieldMask  # type: ignore
+
+import kentik_api.generated.kentik.cloud_export.v202101beta1.cloud_export_pb2 as pb
+from kentik_api.api_connection.grpc_channel import AsyncChannelPool, GRPCChannelConfig
+from kentik_api.api_connection.instrumentation import Instrumentation
+from kentik_api.generated.kentik.cloud_export.v202101beta1.cloud_export_pb2_grpc import CloudExportAdminServiceStub
+from kentik_api.internal.grpc import wrap_grpc_errors_async
+from kentik_api.version import get_user_agent
+
+
+class AsyncAPICloudExportConnector:
+    """
+    AsyncAPICloudExportConnector is asyncio (grpc.aio) counterpart of APICloudExportConnector; it has the same
+    methods, as coroutines. Many calls may be in flight concurrently over one channel.
+    Owns long-lived gRPC channel(s) which are released by awaiting close().
+    """
+
+    def __init__(
+        self,
+        api_url: str,
+        auth_email: str,
+        auth_token: str,
+        options: List[Tuple[str, Any]] = [],
+        instrumentation: Optional[Instrumentation] = None,
+        channel_config: Optional[GRPCChannelConfig] = None,
+    ):
+        self._instrumentation = instrumentation  # used by wrap_grpc_errors_async
+        self._channels: AsyncChannelPool[CloudExportAdminServiceStub] = AsyncChannelPool(
+            api_url, CloudExportAdminServiceStub, channel_config, options
+        )
+        self._metadata = [
+            ("x-ch-auth-email", auth_email),
+            ("x-ch-auth-api-token", auth_token),
+            ("user-agent", get_user_agent()),
+        ]
+
+    @property
+    def _admin(self) -> CloudExportAdminServiceStub:
+        return self._channels.stub()
+
+    async def close(self) -> None:
+        await self._channels.close()
+
+    @wrap_grpc_errors_async
+    async def get_all(self) -> pb.ListCloudExportResponse:
+        request = pb.ListCloudExportRequest()
+        return await self._admin.ListCloudExport(request=request, metadata=self._metadata)
+
+    @wrap_grpc_errors_async
+    async def get(self, export_id: str) -> pb.CloudExport:
+        request = pb.GetCloudExportRequest(id=export_id)
+        return (await self._admin.GetCloudExport(request=request, metadata=self._metadata)).export
+
+    @wrap_grpc_errors_async
+    async def create(self, export: pb.CloudExport) -> pb.CloudExport:
+        request = pb.CreateCloudExportRequest(export=export)
+        return (await self._admin.CreateCloudExport(request=request, metadata=self._metadata)).export
+
+    @wrap_grpc_errors_async
+    async def patch(self, export: pb.CloudExport, modified: str) -> pb.CloudExport:
+        """modified example: export.name"""
+        mask = FieldMask(paths=[modified])
+        request = pb.PatchCloudExportRequest(export=export, mask=mask)
+        return (await self._admin.PatchCloudExport(request=request, metadata=self._metadata)).export
+
+    @wrap_grpc_errors_async
+    async def update(self, export: pb.CloudExport) -> pb.CloudExport:
+        request = pb.UpdateCloudExportRequest(export=export)
+        return (await self._admin.UpdateCloudExport(request=request, metadata=self._metadata)).export
+
+    @wrap_grpc_errors_async
+    async def delete(self, export_id: str) -> None:
+        request = pb.DeleteCloudExportRequest(id=export_id)
+        await self._admin.DeleteCloudExport(request=request, metadata=self._metadata)
@@ -0,0 +1,44 @@
+from typing import Optional
+
+from kentik_api.public.types import ID
+
+from .async_api_connector import AsyncAPICloudExportConnector
+from .cloud_export import CloudExport, ListCloudExportResponse
+from .snapshot import CloudExportSnapshot
+
+
+class AsyncKentikCloudExportClient:
+    """Asyncio counterpart of KentikCloudExportClient, backed by AsyncAPICloudExportConnector"""
+
+    def __init__(self, connector: AsyncAPICloudExportConnector) -> None:
+        self._connector = connector
+
+    async def get_all(self) -> ListCloudExportResponse:
+        pb_exports = await self._connector.get_all()
+        return ListCloudExportResponse.from_pb(pb_exports)
+
+    async def snapshot(self, previous: Optional[CloudExportSnapshot] = None) -> CloudExportSnapshot:
+        """See KentikCloudExportClient.snapshot"""
+        return CloudExportSnapshot.from_pb(await self._connector.get_all(), previous)
+
+    async def get(self, export_id: ID) -> CloudExport:
+        pb_export = await self._connector.get(str(export_id))
+        return CloudExport.from_pb(pb_export)
+
+    async def create(self, export: CloudExport) -> CloudExport:
+        pb_output_export = await self._connector.create(export.to_pb())
+        return CloudExport.from_pb(pb_output_export)
+
+    async def patch(self, export: CloudExport, modified: str) -> CloudExport:
+        """
+        :param modified comma-separated list of fields to be modified, eg. "export.name,export.description"
+        """
+        pb_output_export = await self._connector.patch(export.to_pb(), modified)
+        return CloudExport.from_pb(pb_output_export)
+
+    async def update(self, export: CloudExport) -> CloudExport:
+        pb_output_export = await self._connector.update(export.to_pb())
+        return CloudExport.from_pb(pb_output_export)
+
+    async def delete(self, export_id: ID) -> None:
+        await self._connector.delete(str(export_id))
@@ -1,7 +1,10 @@
+from typing import Optional
+
 from kentik_api.public.types import ID
 
 from .api_connector_protocol import APICloudExportConnectorProtocol
 from .cloud_export import CloudExport, ListCloudExportResponse
+from .snapshot import CloudExportSnapshot
 
 
 class KentikCloudExportClient:
@@ -12,6 +15,14 @@ class KentikCloudExportClient:
         pb_exports = self._connector.get_all()
         return ListCloudExportResponse.from_pb(pb_exports)
 
+    def snapshot(self, previous: Optional[CloudExportSnapshot] = None) -> CloudExportSnapshot:
+        """
+        Same as get_all, but returns CloudExportSnapshot with exports added, changed or removed since the previous
+        snapshot (all exports are reported as added if there is none). Only added and changed exports are deserialized;
+        unchanged ones are the same CloudExport objects as in previous, so they must not be modified in place.
+        """
+        return CloudExportSnapshot.from_pb(self._connector.get_all(), previous)
+
     def get(self, export_id: ID) -> CloudExport:
         pb_export = self._connector.get(str(export_id))
         return CloudExport.from_pb(pb_export)
@@ -0,0 +1,72 @@
+import hashlib
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Dict, List, Optional
+
+import kentik_api.generated.kentik.cloud_export.v202101beta1.cloud_export_pb2 as pb
+from kentik_api.public.types import ID
+
+from .cloud_export import CloudExport
+
+
+class ChangeType(Enum):
+    ADDED = "added"
+    CHANGED = "changed"
+    REMOVED = "removed"
+
+
+@dataclass
+class CloudExportChange:
+    type: ChangeType
+    export_id: ID
+    export: Optional[CloudExport]  # current state, None for removed exports
+    previous: Optional[CloudExport]  # state in previous snapshot, None for added exports
+
+
+def _digest(export: pb.CloudExport) -> bytes:
+    return hashlib.blake2b(export.SerializeToString(deterministic=True), digest_size=16).digest()
+
+
+@dataclass
+class CloudExportSnapshot:
+    """
+    State of cloud exports at one point in time, together with changes since the previous snapshot.
+    Exports are identified by digest of their serialized protobuf messages, so that only exports which were added
+    or changed since the previous snapshot need to be deserialized - unchanged ones are reused from it.
+    Reused CloudExport objects are shared between the snapshots (and CloudExportChange.previous refers to objects
+    of the previous snapshot), so treat them as read-only: modifying one changes all snapshots holding it, and is not
+    reported as a change. Use copy.deepcopy to obtain an export to modify (e.g. for KentikCloudExportClient.patch).
+    """
+
+    exports: Dict[ID, CloudExport] = field(default_factory=dict)
+    invalid_exports_count: int = 0
+    changes: List[CloudExportChange] = field(default_factory=list)  # changes since the previous snapshot
+    _digests: Dict[ID, bytes] = field(default_factory=dict, repr=False)
+
+    @classmethod
+    def from_pb(
+        cls, response: pb.ListCloudExportResponse, previous: Optional["CloudExportSnapshot"] = None
+    ) -> "CloudExportSnapshot":
+        previous = previous or cls()
+        snapshot = cls(invalid_exports_count=response.invalid_exports_count)
+        for pb_export in response.exports:
+            export_id = ID(pb_export.id)
+            digest = _digest(pb_export)
+            snapshot._digests[export_id] = digest
+            old = previous.exports.get(export_id)
+            if old is not None and previous._digests.get(export_id) == digest:
+                snapshot.exports[export_id] = old
+                continue
+            export = CloudExport.from_pb(pb_export)
+            snapshot.exports[export_id] = export
+            change_type = ChangeType.ADDED if old is None else ChangeType.CHANGED
+            snapshot.changes.append(CloudExportChange(change_type, export_id, export, old))
+        snapshot.changes.extend(
+            CloudExportChange(ChangeType.REMOVED, export_id, None, export)
+            for export_id, export in previous.exports.items()
+            if export_id not in snapshot.exports
+        )
+        return snapshot
+
+    def changes_of(self, change_type: ChangeType) -> List[CloudExportChange]:
+        return [c for c in self.changes if c.type == change_type]
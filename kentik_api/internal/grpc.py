@@ -1,12 +1,16 @@
 import functools
+import time
+from contextlib import contextmanager
 from dataclasses import fields
 from enum import Enum
-from typing import Any, Callable, Type, TypeVar, Union, get_args, get_origin
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Type, TypeVar, Union, get_args, get_origin
 
 from google.protobuf.wrappers_pb2 import BoolValue  # type: ignore
 from grpc import RpcError, StatusCode
 from grpc._channel import _InactiveRpcError
+from grpc.aio import AioRpcError
 
+from kentik_api.api_connection.instrumentation import PROTOCOL_GRPC, CallEvent, Instrumentation
 from kentik_api.public.errors import (
     AuthError,
     BadRequestError,
@@ -30,16 +34,78 @@ class SerializableEnum(Enum):
 
 
 def wrap_grpc_errors(func: Callable) -> Callable:
-    """Wrap GRPC error into KentikAPIError"""
+    """
+    Wrap GRPC error into KentikAPIError.
+    Calls are reported to Instrumentation held in "_instrumentation" attribute of the connector (first argument),
+    if there is one.
+    """
 
     @functools.wraps(func)
     def inner(*args, **kwargs) -> Any:
+        with _grpc_call(args[0] if args else None, func.__name__) as event:
+            return _succeeded(event, func(*args, **kwargs))
+
+    return inner
+
+
+def wrap_grpc_errors_async(func: Callable) -> Callable:
+    """Same as wrap_grpc_errors, for coroutine methods of asyncio (grpc.aio) connectors"""
+
+    @functools.wraps(func)
+    async def inner(*args, **kwargs) -> Any:
+        with _grpc_call(args[0] if args else None, func.__name__) as event:
+            return _succeeded(event, await func(*args, **kwargs))
+
+    return inner
+
+
+@contextmanager
+def _grpc_call(connector: Any, method_name: str) -> Iterator[Optional[CallEvent]]:
+    """
+    Translate gRPC errors raised in the block into KentikAPIError, and report the call to the connector's
+    Instrumentation if it has one; the block records the result with _succeeded
+    """
+    instrumentation: Optional[Instrumentation] = getattr(connector, "_instrumentation", None)
+    if instrumentation is None:
         try:
-            return func(*args, **kwargs)
+            yield None
         except RpcError as error:
             raise new_api_error(error) from error
-
-    return inner
+        return
+
+    # request messages are built inside the connector method, so their size is not known here
+    event = CallEvent(PROTOCOL_GRPC, f"{type(connector).__name__}.{method_name}", "RPC")
+    start = time.perf_counter()
+    try:
+        yield event
+    except RpcError as error:
+        event.error = type(error).__name__
+        code = _status_code(error)
+        event.status = code.name if code is not None else None
+        raise new_api_error(error) from error
+    except Exception as error:
+        event.error = type(error).__name__
+        raise
+    finally:
+        event.wall_time = time.perf_counter() - start
+        instrumentation.emit(event)
+
+
+def _succeeded(event: Optional[CallEvent], result: Any) -> Any:
+    if event is not None:
+        event.status = StatusCode.OK.name
+        event.response_bytes = _message_size(result)
+    return result
+
+
+def _message_size(obj: Any) -> Optional[int]:
+    """Serialized size of protobuf message or list of messages, None for other objects"""
+    if hasattr(obj, "ByteSize"):
+        return obj.ByteSize()
+    if isinstance(obj, list):
+        sizes = [_message_size(o) for o in obj]
+        return None if None in sizes else sum(s for s in sizes if s is not None)
+    return None
 
 
 class DoNotSerializeMarker:
@@ -52,112 +118,172 @@ class DoNotSerializeMarker:
 _ConfigElementT = TypeVar("_ConfigElementT", bound="_ConfigElement")
 
 
+Converter = Callable[[Any], Any]
+
+
+class _FromPbField(NamedTuple):
+    name: str  # dataclass field name
+    src_name: str  # protobuf field name
+    convert: Converter
+    init: bool  # passed to constructor, set as attribute afterwards otherwise
+
+
+class _ToPbField(NamedTuple):
+    name: str
+    dst_type: Type[Any]  # type of protobuf field value
+
+
+_from_pb_plans: Dict[type, List[_FromPbField]] = {}
+_to_pb_plans: Dict[type, List[_ToPbField]] = {}
+
+
+def _from_pb_converter(dst_type: Any) -> Converter:
+    """
+    Build function converting protobuf value to dst_type.
+    Decisions depending only on dst_type are made here, once per dataclass field, instead of on every conversion.
+    """
+    if hasattr(dst_type, "from_pb"):
+        return dst_type.from_pb
+
+    origin = get_origin(dst_type)
+    args = get_args(dst_type)
+    if origin is list:
+        convert_item = _from_pb_converter(args[0])
+        return _with_bool_value(lambda value: [convert_item(v) for v in value])
+    if origin is dict:
+        convert_value = _from_pb_converter(args[1])
+        return _with_bool_value(lambda value: {k: convert_value(v) for k, v in value.items()})
+    if origin is Union and len(args) == 2 and isinstance(None, args[1]):  # this means type is Optional[...]
+        convert_optional = _from_pb_converter(args[0])
+
+        def optional(value: Any) -> Any:
+            if value == type(value)():  # empty optional protobuf field
+                return None
+            return convert_optional(value)
+
+        return _with_bool_value(optional)
+
+    def construct(value: Any) -> Any:
+        try:
+            return dst_type(value)
+        except TypeError as error:
+            raise RuntimeError(f"Don't know how to instantiate '{dst_type}' (value: '{value}')") from error
+
+    return _with_bool_value(construct)
+
+
+def _with_bool_value(convert: Converter) -> Converter:
+    def inner(value: Any) -> Any:
+        if isinstance(value, BoolValue):  # protobuf BoolValue requires special treatment
+            return value.value
+        return convert(value)
+
+    return inner
+
+
+def _to_pb_value(dst_type: Type[Any], src_value: Any) -> Any:
+    if src_value is None or hasattr(src_value, "PB_TYPE") and src_value.PB_TYPE == DoNotSerializeMarker:
+        return None  # None values are not serialized into output protobuf object
+    if hasattr(src_value, "to_pb"):
+        return src_value.to_pb()
+    if isinstance(src_value, list):
+        return [_to_pb_value(type(e), e) for e in src_value]
+    if isinstance(src_value, dict):
+        return {k: _to_pb_value(type(v), v) for k, v in src_value.items()}
+    try:
+        return dst_type(src_value)
+    except TypeError as error:
+        raise RuntimeError(
+            f"Don't know how to serialize to '{dst_type}' (type: '{type(src_value)}', value: '{src_value}')"
+        ) from error
+
+
 class _ConfigElement:
     """
     Base class that enables automatic protobuf class <-> user facing dataclass serialization/deserialization.
     Protobuf class and user facing dataclass need to have fields named exactly the same, otherwise the deviations
     must be handled explicitly by defining custom from_pb/to_pb methods for the respective class.
     Fields starting with underscore "_" are treated as read-only and are not serialized to protobuf.
+    Conversion plans (field names and converters) are built on first use for every class and reused afterwards.
     """
 
     PB_TYPE = DoNotSerializeMarker  # Target protobuf type for serialization. To be overridden by inheriting class
 
+    @classmethod
+    def _to_pb_plan(cls) -> List[_ToPbField]:
+        plan = _to_pb_plans.get(cls)
+        if plan is None:
+            dummy_pb_instance = cls.PB_TYPE()  # used only for examining the destination protobuf object field types
+            plan = [
+                _ToPbField(f.name, type(getattr(dummy_pb_instance, f.name)))
+                for f in fields(cls)  # type: ignore
+                if f.name[0] != "_"  # don't serialize read-only fields
+            ]
+            _to_pb_plans[cls] = plan
+        return plan
+
     def to_pb(self) -> Any:
         """
         Serialize self to protobuf object type determined by "PB_TYPE"
         """
-
-        def skip_serialization(obj: Any) -> bool:
-            return obj is None or hasattr(obj, "PB_TYPE") and obj.PB_TYPE == DoNotSerializeMarker
-
-        def get_value(dst_type: Type[Any], src_value: Any) -> Any:
-            if skip_serialization(src_value):
-                return None  # None values are not serialized into output protobuf object
-            if hasattr(src_value, "to_pb"):
-                return src_value.to_pb()
-            if isinstance(src_value, list):
-                return [get_value(type(e), e) for e in src_value]
-            if isinstance(src_value, dict):
-                return {k: get_value(type(v), v) for k, v in src_value.items()}
-            try:
-                return dst_type(src_value)
-            except TypeError as error:
-                raise RuntimeError(
-                    f"Don't know how to serialize to '{dst_type}' (type: '{type(src_value)}', value: '{src_value}')"
-                ) from error
-
-        dummy_pb_instance = self.PB_TYPE()  # used only for examining the destination protobuf object field types
-        args = {}
-        for f in fields(self):
-            if f.name[0] == "_":
-                continue  # don't serialize read-only fields
-            dst_field_type = type(getattr(dummy_pb_instance, f.name))
-            src_field_value = getattr(self, f.name)
-            args[f.name] = get_value(dst_field_type, src_field_value)
+        args = {f.name: _to_pb_value(f.dst_type, getattr(self, f.name)) for f in self._to_pb_plan()}
         return self.PB_TYPE(**args)
 
+    @classmethod
+    def _from_pb_plan(cls) -> List[_FromPbField]:
+        plan = _from_pb_plans.get(cls)
+        if plan is None:
+            plan = [
+                _FromPbField(
+                    f.name,
+                    f.name[1:] if (f.name[0] == "_") else f.name,  # remove leading underscore from attribute name
+                    _from_pb_converter(f.type),
+                    f.init,
+                )
+                for f in fields(cls)  # type: ignore
+            ]
+            plan.sort(key=lambda f: not f.init)  # stable: constructor arguments first, in declaration order
+            _from_pb_plans[cls] = plan
+        return plan
+
     @classmethod
     def from_pb(cls: Type[_ConfigElementT], obj: Any) -> _ConfigElementT:
         """
         Deserialize protobuf obj into a respective dataclass
         """
-
-        def get_value(dst_type: Type[Any], src_value: Any) -> Any:
-            if hasattr(dst_type, "from_pb"):
-                return dst_type.from_pb(src_value)
-            if isinstance(src_value, BoolValue):  # protobuf BoolValue requires special treatment
-                return src_value.value
-            try:
-                return dst_type(src_value)
-            except TypeError as error:
-                args = get_args(dst_type)
-                origin = get_origin(dst_type)
-                if origin is list:
-                    return [get_value(args[0], elem) for elem in src_value]
-                if origin is dict:
-                    return {_k: get_value(args[1], _v) for _k, _v in src_value.items()}
-                if origin is Union and len(args) == 2 and isinstance(None, args[1]):  # this means type is Optional[...]
-                    if src_value == type(src_value)():  # empty optional protobuf field
-                        return None
-                    return get_value(args[0], src_value)
-                raise RuntimeError(f"Don't know how to instantiate '{dst_type}' (value: '{src_value}')") from error
-
-        _init_fields = [f for f in fields(cls) if f.init]
-        args = {}
-        for f in _init_fields:
-            src_name = f.name[1:] if (f.name[0] == "_") else f.name  # remove leading underscore from attribute name
-            args[f.name] = get_value(f.type, getattr(obj, src_name))
-        instance = cls(**args)
-
-        _remaining_fields = [f for f in fields(cls) if not f.init]
-        for f in _remaining_fields:
-            src_name = f.name[1:] if (f.name[0] == "_") else f.name  # remove leading underscore from attribute name
-            v = get_value(f.type, getattr(obj, src_name))
-            setattr(instance, f.name, v)
+        plan = cls._from_pb_plan()
+        instance = cls(**{f.name: f.convert(getattr(obj, f.src_name)) for f in plan if f.init})
+        for f in plan:
+            if not f.init:
+                setattr(instance, f.name, f.convert(getattr(obj, f.src_name)))
         return instance
 
 
+def _status_code(error: RpcError) -> Optional[StatusCode]:
+    """Status code of failed call; only _InactiveRpcError (sync) and AioRpcError (asyncio) hold error code details"""
+    if isinstance(error, (_InactiveRpcError, AioRpcError)):
+        return error.code()
+    return None
+
+
 def new_api_error(error: RpcError) -> KentikAPIError:
     """Create API error from gRPC error"""
 
-    protocol_grpc = "gRPC"
-
-    if not isinstance(error, _InactiveRpcError):
+    code = _status_code(error)
+    if code is None:
         return KentikAPIError(str(error))
 
-    # _InactiveRpcError holds error code details
-    code: StatusCode = error.code()
     status_code, status_name = code.value
 
     errors = {
-        StatusCode.INVALID_ARGUMENT: BadRequestError(protocol_grpc, status_code, status_name),
+        StatusCode.INVALID_ARGUMENT: BadRequestError(PROTOCOL_GRPC, status_code, status_name),
         StatusCode.DEADLINE_EXCEEDED: TimedOutError(f"grpc_status: {status_code} - '{status_name}'"),
-        StatusCode.NOT_FOUND: NotFoundError(protocol_grpc, status_code, status_name),
-        StatusCode.ALREADY_EXISTS: BadRequestError(protocol_grpc, status_code, status_name),
-        StatusCode.PERMISSION_DENIED: AuthError(protocol_grpc, status_code, status_name),
-        StatusCode.UNIMPLEMENTED: BadRequestError(protocol_grpc, status_code, status_name),
-        StatusCode.UNAVAILABLE: UnavailabilityError(protocol_grpc, status_code, status_name),
-        StatusCode.UNAUTHENTICATED: AuthError(protocol_grpc, status_code, status_name),
+        StatusCode.NOT_FOUND: NotFoundError(PROTOCOL_GRPC, status_code, status_name),
+        StatusCode.ALREADY_EXISTS: BadRequestError(PROTOCOL_GRPC, status_code, status_name),
+        StatusCode.PERMISSION_DENIED: AuthError(PROTOCOL_GRPC, status_code, status_name),
+        StatusCode.UNIMPLEMENTED: BadRequestError(PROTOCOL_GRPC, status_code, status_name),
+        StatusCode.UNAVAILABLE: UnavailabilityError(PROTOCOL_GRPC, status_code, status_name),
+        StatusCode.UNAUTHENTICATED: AuthError(PROTOCOL_GRPC, status_code, status_name),
     }
     # Status Codes covered by default_error:
     #   StatusCode.CANCELLED
@@ -167,6 +293,6 @@ def new_api_error(error: RpcError) -> KentikAPIError:
     #   StatusCode.OUT_OF_RANGE
     #   StatusCode.INTERNAL
     #   StatusCode.DATA_LOSS
-    default_error = ProtocolError(protocol_grpc, status_code, status_name)
+    default_error = ProtocolError(PROTOCOL_GRPC, status_code, status_name)
 
-    return errors.get(status_code, default_error)
+    return errors.get(code, default_error)
@@ -0,0 +1,97 @@
+import json
+import logging
+from typing import Any, Callable, Dict, Optional, Union
+
+log = logging.getLogger(__name__)
+
+JSONInput = Union[str, bytes]
+
+
+class JSONCodec:
+    """
+    JSON encoder/decoder used for API request and response bodies.
+    Optimized backends fall back to the standard library for input they don't handle (e.g. integers exceeding
+    64 bits, NaN), so that results and error messages are the same regardless of the backend in use.
+    """
+
+    def __init__(self, name: str, loads: Callable[[JSONInput], Any], dumps: Callable[[Any], bytes]) -> None:
+        self.name = name
+        self._loads = loads
+        self._dumps = dumps
+
+    def loads(self, data: JSONInput) -> Any:
+        try:
+            return self._loads(data)
+        except ValueError:
+            return json.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        try:
+            return self._dumps(obj)
+        except (TypeError, ValueError):
+            return _stdlib_dumps(obj)
+
+    def __repr__(self) -> str:
+        return f"JSONCodec({self.name})"
+
+
+def _stdlib_dumps(obj: Any) -> bytes:
+    # same as what requests does for json= argument
+    return json.dumps(obj, allow_nan=False).encode("utf-8")
+
+
+STDLIB = JSONCodec("json", json.loads, _stdlib_dumps)
+_CODECS: Dict[str, JSONCodec] = {STDLIB.name: STDLIB}
+
+try:
+    import orjson
+
+    _CODECS["orjson"] = JSONCodec("orjson", orjson.loads, lambda obj: orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS))
+except ImportError:
+    pass
+
+try:
+    import ujson
+
+    _CODECS["ujson"] = JSONCodec("ujson", ujson.loads, lambda obj: ujson.dumps(obj).encode("utf-8"))
+except ImportError:
+    pass
+
+_PREFERENCE = ["orjson", "ujson", "json"]
+_default = next(_CODECS[name] for name in _PREFERENCE if name in _CODECS)
+
+
+def get_codec(codec: Optional[Union[str, JSONCodec]] = None) -> JSONCodec:
+    """
+    Return codec by name ("orjson", "ujson" or "json"), the default codec if codec is None or "auto".
+    Raise ValueError if requested backend is not installed.
+    """
+    if codec is None or codec == "auto":
+        return _default
+    if isinstance(codec, JSONCodec):
+        return codec
+    try:
+        return _CODECS[codec]
+    except KeyError:
+        raise ValueError(f"JSON codec '{codec}' is not available (available: {', '.join(_CODECS)})")
+
+
+def set_default_codec(codec: Optional[Union[str, JSONCodec]]) -> JSONCodec:
+    """Set codec used for decoding of API responses in the whole process. None or "auto" selects the fastest one."""
+    global _default  # pylint: disable=global-statement
+    if codec is None or codec == "auto":
+        _default = next(_CODECS[name] for name in _PREFERENCE if name in _CODECS)
+    else:
+        _default = get_codec(codec)
+    log.debug("Default JSON codec: %s", _default.name)
+    return _default
+
+
+def loads(data: JSONInput) -> Any:
+    """Decode JSON using the default codec"""
+    return _default.loads(data)
+
+
+def dumps(obj: Any) -> bytes:
+    """Encode obj to JSON (as UTF-8 bytes) using the default codec"""
+    return _default.dumps(obj)
@@ -2,6 +2,11 @@ import logging
 from typing import Any, List, Optional, Tuple, Union
 
 from .api_connection.api_connector import APIConnector
+from .api_connection.grpc_channel import GRPCChannelConfig
+from .api_connection.http_pool import HTTPPoolConfig, PoolStats
+from .api_connection.instrumentation import Instrumentation
+from .api_connection.rate_limiter import RateLimiter
+from .api_connection.response_cache import ResponseCache
 from .api_connection.retryable_session import Retry
 from .api_resources.alerting_api import AlertingAPI
 from .api_resources.batch_api import BatchAPI
@@ -18,6 +23,7 @@ from .api_resources.tenants_api import MyKentikPortalAPI
 from .api_resources.users_api import UsersAPI
 from .cloudexport.api_connector import APICloudExportConnector
 from .cloudexport.client import KentikCloudExportClient
+from .internal.json_codec import JSONCodec
 from .synthetics.api_connector import APISyntheticsConnector
 from .synthetics.synth_client import KentikSynthClient
 
@@ -27,6 +33,10 @@ class KentikAPI:
 
     API_HOST_EU = "api.kentik.eu"
     API_HOST_US = "api.kentik.com"
+    DEFAULT_GRPC_CLIENT_OPTIONS: List[Tuple[str, Any]] = [
+        ("grpc.enable_deadline_checking", 0),
+        ("grpc.max_receive_message_length", 40 * 1024 * 1024),
+    ]
 
     def __init__(
         self,
@@ -37,12 +47,45 @@ class KentikAPI:
         retry_strategy: Optional[Retry] = None,
         proxy: Optional[str] = None,
         grpc_client_options: Optional[List[Tuple[str, Any]]] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        http_pool: Optional[HTTPPoolConfig] = None,
+        json_codec: Optional[Union[str, JSONCodec]] = None,
+        response_cache: Optional[ResponseCache] = None,
+        instrumentation: Optional[Instrumentation] = None,
+        coalesce_requests: bool = False,
+        grpc_channel: Optional[GRPCChannelConfig] = None,
     ) -> None:
+        """
+        json_codec - JSON backend ("orjson", "ujson", "json" or JSONCodec instance) used for request bodies and
+                     decoding of responses of this client; by default the process-wide default (see
+                     set_default_codec), which is the fastest installed backend unless changed, is used
+                     Only "json" decodes streamed responses (devices.iter_all, query.data) incrementally; other
+                     backends are faster but decode the whole response at once
+        response_cache - cache for responses to GET requests to REST API; disabled by default
+        instrumentation - receives CallEvent for every REST and gRPC call (see LatencyHistogram for built-in collector)
+        coalesce_requests - send identical concurrent GET requests to REST API only once and share the response
+        grpc_channel - keepalive, compression and pooling of gRPC channels used by synthetics and cloud_export;
+                       the channels stay open until close() is called
+        """
         if not api_host:
             logging.debug("KentikAPI: null api_host, setting to %s", self.API_HOST_US)
             api_host = self.API_HOST_US
         api_v5_url = self.make_api_v5_url(api_host)
-        connector = APIConnector(api_v5_url, auth_email, auth_token, timeout, retry_strategy, proxy)
+        connector = APIConnector(
+            api_v5_url,
+            auth_email,
+            auth_token,
+            timeout,
+            retry_strategy,
+            proxy,
+            rate_limiter,
+            http_pool,
+            json_codec,
+            response_cache,
+            instrumentation,
+            coalesce_requests,
+        )
+        self._connector = connector
         self.device_labels = DeviceLabelsAPI(connector)
         self.sites = SitesAPI(connector)
         self.users = UsersAPI(connector)
@@ -58,18 +101,36 @@ class KentikAPI:
         self.alerting = AlertingAPI(connector)
 
         if not grpc_client_options:
-            grpc_client_options = [
-                ("grpc.enable_deadline_checking", 0),
-                ("grpc.max_receive_message_length", 40 * 1024 * 1024),
-            ]
+            grpc_client_options = self.DEFAULT_GRPC_CLIENT_OPTIONS
 
         api_v6_url = self.make_grpc_endpoint(api_host)
 
-        synth_connector = APISyntheticsConnector(api_v6_url, auth_email, auth_token, grpc_client_options)
-        self.synthetics = KentikSynthClient(synth_connector)
+        self._synth_connector = APISyntheticsConnector(
+            api_v6_url, auth_email, auth_token, grpc_client_options, instrumentation, grpc_channel
+        )
+        self.synthetics = KentikSynthClient(self._synth_connector)
 
-        cloud_export_connector = APICloudExportConnector(api_v6_url, auth_email, auth_token, grpc_client_options)
-        self.cloud_export = KentikCloudExportClient(cloud_export_connector)
+        self._cloud_export_connector = APICloudExportConnector(
+            api_v6_url, auth_email, auth_token, grpc_client_options, instrumentation, grpc_channel
+        )
+        self.cloud_export = KentikCloudExportClient(self._cloud_export_connector)
+
+    def __enter__(self) -> "KentikAPI":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Release HTTP connections and gRPC channels. The object must not be used afterwards."""
+        self._connector.close()
+        self._synth_connector.close()
+        self._cloud_export_connector.close()
+
+    @property
+    def http_pool_stats(self) -> PoolStats:
+        """Connection pool counters of the REST API session (created, reused and discarded connections)"""
+        return self._connector.pool_stats
 
     @staticmethod
     def make_api_v5_url(api_host: str) -> str:
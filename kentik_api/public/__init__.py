@@ -34,6 +34,7 @@ from .errors import (
 )
 from .manual_mitigation import Alarm, AlertFilter, HistoricalAlert, ManualMitigation
 from .plan import Plan, PlanDevice, PlanDeviceType
+from .query_batch import QueryBatchResult
 from .query_object import (
     Aggregate,
     AggregateFunctionType,
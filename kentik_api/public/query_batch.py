@@ -0,0 +1,19 @@
+from dataclasses import dataclass
+from typing import Optional, Union
+
+from kentik_api.public.query_object import QueryDataResult, QueryObject
+from kentik_api.public.query_sql import QuerySQL, QuerySQLResult
+
+
+@dataclass
+class QueryBatchResult:
+    """Outcome of a single query executed as part of a batch (see QueryAPI.run_many)"""
+
+    index: int  # position of the query in the submitted batch
+    query: Union[QuerySQL, QueryObject]
+    result: Union[QuerySQLResult, QueryDataResult, None] = None
+    error: Optional[Exception] = None  # exception raised while executing the query, if any
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
@@ -1,6 +1,7 @@
-import json
 from dataclasses import dataclass
-from typing import Dict, List
+from typing import Dict, List, Optional
+
+from kentik_api.internal.json_codec import JSONCodec, get_codec
 
 
 @dataclass
@@ -13,6 +14,6 @@ class QuerySQLResult:
     rows: List[Dict]
 
     @classmethod
-    def from_json(cls, json_string):
-        params = json.loads(json_string)
+    def from_json(cls, json_string, codec: Optional[JSONCodec] = None):
+        params = get_codec(codec).loads(json_string)
         return cls(**params)
@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from typing import List, Optional
 
+from kentik_api.internal.json_codec import JSONCodec
 from kentik_api.requests_payload.conversions import dict_from_json, from_dict
 
 
@@ -36,8 +37,8 @@ class BatchResponse:
     guid: str
 
     @classmethod
-    def from_json(cls, json_string: str):
-        dic = dict_from_json(class_name=cls.__name__, json_string=json_string)
+    def from_json(cls, json_string: str, codec: Optional[JSONCodec] = None):
+        dic = dict_from_json(class_name=cls.__name__, json_string=json_string, codec=codec)
         return from_dict(data_class=cls, data=dic)
 
 
@@ -92,6 +93,6 @@ class BatchStatusResponse:
     is_pending: Optional[bool] = None
 
     @classmethod
-    def from_json(cls, json_string: str):
-        dic = dict_from_json(class_name=cls.__name__, json_string=json_string)
+    def from_json(cls, json_string: str, codec: Optional[JSONCodec] = None):
+        dic = dict_from_json(class_name=cls.__name__, json_string=json_string, codec=codec)
         return from_dict(data_class=cls, data=dic)
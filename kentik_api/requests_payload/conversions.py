@@ -1,11 +1,15 @@
 import json
 from enum import Enum
-from typing import Any, Dict, Iterable, List, Optional, Type, TypeVar
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Type, TypeVar
 
 import dacite
 
+from kentik_api.internal.json_codec import JSONCodec, get_codec
 from kentik_api.public.errors import DataFormatError, DeserializationError
 
+from . import dataclass_loader
+from .json_stream import iter_array
+
 
 def as_dict(obj: Any) -> Dict[str, Any]:
     """Convert obj to dict, removing all keys with None values"""
@@ -57,42 +61,72 @@ def from_dict(data_class: Type[T], data: Data) -> T:
     """Converts given dictionary to the data class of given type. It converts Dacite errors into
     DeserializationError"""
 
+    # compiled loader is used when possible; dacite handles the remaining types and reports errors in input data
+    try:
+        return dataclass_loader.load(data_class, data)
+    except (dataclass_loader.UnsupportedType, dataclass_loader.LoaderMismatch):
+        pass
     try:
         return dacite.from_dict(data_class=data_class, data=data)
     except dacite.DaciteError as err:
         raise DeserializationError(data_class.__name__, str(err)) from err
 
 
-def dict_from_json(class_name: str, json_string: str, root: str = "") -> Dict[str, Any]:
+def dict_from_json(
+    class_name: str, json_string: str, root: str = "", codec: Optional[JSONCodec] = None
+) -> Dict[str, Any]:
     """
     Decodes given JSON to a dictionary. It converts json errors into DeserializationError.
     root - use it to extract data that is nested under a root object e.g. "interface": {...}
+    codec - JSON codec used for decoding (usually the one of API connector); None means the default codec
     """
-    result = _from_json(class_name, json_string, root)
+    result = _from_json(class_name, json_string, root, codec)
     if not isinstance(result, dict):
         raise DeserializationError(class_name, f"Expected dict, got {type(result)}")
     return result
 
 
-def list_from_json(class_name: str, json_string: str, root: str = "") -> List[Any]:
+def list_from_json(class_name: str, json_string: str, root: str = "", codec: Optional[JSONCodec] = None) -> List[Any]:
     """
     Decodes given JSON to a list. It converts json errors into DeserializationError.
     root - use it to extract data that is nested under a root object e.g. "interface": {...}
     """
-    result = _from_json(class_name, json_string, root)
+    result = _from_json(class_name, json_string, root, codec)
     if not isinstance(result, list):
         raise DeserializationError(class_name, f"Expected list, got {type(result)}")
     return result
 
 
-def _from_json(class_name: str, json_string: str, root: str = "") -> Any:
+def iter_list_from_json(
+    class_name: str,
+    chunks: Iterable[bytes],
+    root: str = "",
+    encoding: str = "utf-8",
+    codec: Optional[JSONCodec] = None,
+) -> Iterator[Any]:
+    """
+    Incrementally decodes JSON list arriving in chunks of bytes, yielding one list item at a time.
+    It converts json errors into DeserializationError.
+    root - use it to extract list that is nested under a root object e.g. "devices": [...]
+    codec - JSON codec used for decoding, see json_stream.iter_array
+    """
+    try:
+        yield from iter_array(chunks, root, encoding, codec)
+    except KeyError as err:  # no "root" key in top-level object
+        raise DeserializationError(class_name, str(err)) from err
+    except ValueError as err:  # includes json.JSONDecodeError and UnicodeDecodeError
+        raise DeserializationError(class_name, str(err)) from err
+
+
+def _from_json(class_name: str, json_string: str, root: str = "", codec: Optional[JSONCodec] = None) -> Any:
     """
     Decodes given JSON to a python object. It converts json errors into DeserializationError.
     root - use it to extract data that is nested under a root object e.g. "interface": {...}
     """
 
     try:
-        return json.loads(json_string) if root == "" else json.loads(json_string)[root]
+        data = get_codec(codec).loads(json_string)
+        return data if root == "" else data[root]
     except json.JSONDecodeError as err:
         raise DeserializationError(class_name, str(err)) from err
     except KeyError as err:  # deserialized dict has no "root" key
@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from typing import List, Optional
 
+from kentik_api.internal.json_codec import JSONCodec
 from kentik_api.public.custom_application import CustomApplication
 from kentik_api.public.errors import IncompleteObjectError
 from kentik_api.public.types import ID
@@ -47,8 +48,8 @@ class GetResponse:
     edate: Optional[str] = None
 
     @classmethod
-    def from_json(cls, json_string: str):
-        dic = dict_from_json(cls.__name__, json_string)
+    def from_json(cls, json_string: str, codec: Optional[JSONCodec] = None):
+        dic = dict_from_json(cls.__name__, json_string, codec=codec)
         return from_dict(cls, dic)
 
     def to_custom_application(self) -> CustomApplication:
@@ -72,8 +73,8 @@ class GetResponse:
 
 class GetAllResponse(List[GetResponse]):
     @classmethod
-    def from_json(cls, json_string: str):
-        data = list_from_json(cls.__name__, json_string)
+    def from_json(cls, json_string: str, codec: Optional[JSONCodec] = None):
+        data = list_from_json(cls.__name__, json_string, codec=codec)
         apps = cls()
         for item in data:
             a = from_dict(GetResponse, item)
@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from typing import List, Optional
 
+from kentik_api.internal.json_codec import JSONCodec
 from kentik_api.public.custom_dimension import CustomDimension
 from kentik_api.public.errors import IncompleteObjectError
 from kentik_api.public.types import ID
@@ -35,9 +36,9 @@ class GetResponse:
     company_id: str
 
     @classmethod
-    def from_json(cls, json_string: str):
+    def from_json(cls, json_string: str, codec: Optional[JSONCodec] = None):
         dic = dict_from_json(
-            cls.__name__, json_string, "customDimension"
+            cls.__name__, json_string, "customDimension", codec=codec
         )  # payload is embeded under "customDimension" key
         dic["populators"] = PopulatorArray.from_list(dic["populators"])
         return from_dict(cls, dic)
@@ -55,9 +56,9 @@ class GetResponse:
 
 class GetAllResponse(List[GetResponse]):
     @classmethod
-    def from_json(cls, json_string: str):
+    def from_json(cls, json_string: str, codec: Optional[JSONCodec] = None):
         # payload is embeded under "customDimensions" key
-        items = list_from_json(cls.__name__, json_string, "customDimensions")
+        items = list_from_json(cls.__name__, json_string, "customDimensions", codec=codec)
         dimensions = cls()
         for dic in items:
             dic["populators"] = PopulatorArray.from_list(dic["populators"])
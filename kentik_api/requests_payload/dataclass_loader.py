@@ -0,0 +1,210 @@
+"""
+Fast construction of dataclasses from dictionaries decoded from JSON.
+
+For every dataclass type a loader is compiled on first use: field converters are resolved from type hints once
+and memoized, so that constructing an object is a plain loop over its fields. Loaders support the subset of typing
+used by API payloads (plain classes, Any, Optional/Union, List, Dict and nested dataclasses) and implement the same
+rules as dacite.from_dict with default config (type checking, numeric tower, defaults, None for missing Optional).
+Types outside of this subset make the loader for given dataclass unavailable; callers are expected to use dacite then.
+Input not matching the declared types raises LoaderMismatch; callers re-run dacite to get its detailed error.
+"""
+
+import dataclasses
+import threading
+import typing
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple, Type
+
+Converter = Callable[[Any], Any]
+Loader = Callable[[Mapping[str, Any]], Any]
+
+
+class LoaderMismatch(Exception):
+    """Input data does not match the dataclass definition"""
+
+
+class UnsupportedType(Exception):
+    """Loader can't be compiled for a type"""
+
+
+_loaders: Dict[type, Optional[Loader]] = {}
+_lock = threading.Lock()
+
+_MISSING = object()
+# handling of fields missing in input data
+_REQUIRED = 0  # fail
+_DEFAULT = 1  # leave it to dataclass default value or default_factory
+_NONE = 2  # Optional field without default is set to None
+
+
+class _CompileContext:
+    def __init__(self) -> None:
+        self.compiled: Dict[type, Loader] = {}
+        self.in_progress: Dict[type, List[Loader]] = {}
+
+
+def get_loader(data_class: type) -> Optional[Loader]:
+    """Return memoized loader for data_class, None if the loader can't be compiled for it"""
+    try:
+        return _loaders[data_class]
+    except KeyError:
+        pass
+    with _lock:
+        if data_class not in _loaders:
+            ctx = _CompileContext()
+            try:
+                _compile(data_class, ctx)
+            except UnsupportedType:
+                _loaders[data_class] = None
+            else:
+                # publish loaders only when whole graph of nested dataclasses compiled successfully
+                _loaders.update(ctx.compiled)
+        return _loaders[data_class]
+
+
+def _compile(data_class: type, ctx: _CompileContext) -> Loader:
+    known = _loaders.get(data_class, _MISSING) if data_class not in ctx.compiled else ctx.compiled[data_class]
+    if known is None:
+        raise UnsupportedType(data_class)
+    if known is not _MISSING:
+        return known  # type: ignore
+    if data_class in ctx.in_progress:
+        # recursive reference - resolved once the loader is compiled
+        ref = ctx.in_progress[data_class]
+        return lambda data: ref[0](data)
+
+    ctx.in_progress[data_class] = []
+    try:
+        hints = typing.get_type_hints(data_class)
+    except Exception as err:
+        raise UnsupportedType(data_class) from err
+    fields: List[Tuple[str, Converter, int]] = []
+    for field in dataclasses.fields(data_class):
+        if not field.init:
+            raise UnsupportedType(data_class)
+        field_type = hints[field.name]
+        if field.default is not dataclasses.MISSING or field.default_factory is not dataclasses.MISSING:
+            if_missing = _DEFAULT
+        elif _is_optional(field_type):
+            if_missing = _NONE
+        else:
+            if_missing = _REQUIRED
+        fields.append((field.name, _converter(field_type, ctx), if_missing))
+
+    def loader(data: Mapping[str, Any]) -> Any:
+        kwargs = {}
+        for name, convert, if_missing in fields:
+            value = data.get(name, _MISSING)
+            if value is not _MISSING:
+                kwargs[name] = convert(value)
+            elif if_missing == _NONE:
+                kwargs[name] = None
+            elif if_missing == _REQUIRED:
+                raise LoaderMismatch(f'missing value for field "{name}"')
+        return data_class(**kwargs)
+
+    ctx.in_progress[data_class].append(loader)
+    ctx.compiled[data_class] = loader
+    return loader
+
+
+def _is_optional(type_: Any) -> bool:
+    return typing.get_origin(type_) is typing.Union and type(None) in typing.get_args(type_)
+
+
+def _converter(type_: Any, ctx: _CompileContext) -> Converter:
+    if type_ is Any:
+        return _identity
+    origin = typing.get_origin(type_)
+    if origin is typing.Union:
+        return _union_converter([_converter(t, ctx) for t in typing.get_args(type_)])
+    if origin is list:
+        args = typing.get_args(type_)
+        return _list_converter(_converter(args[0], ctx) if args else _identity)
+    if origin is dict:
+        args = typing.get_args(type_)
+        if args:
+            return _dict_converter(_converter(args[0], ctx), _converter(args[1], ctx))
+        return _dict_converter(_identity, _identity)
+    if origin is not None:
+        raise UnsupportedType(type_)  # tuples, sets, Literal, abstract collections, ...
+    if type_ is type(None):
+        return _none_converter
+    if dataclasses.is_dataclass(type_) and isinstance(type_, type):
+        return _dataclass_converter(_compile(type_, ctx))
+    if isinstance(type_, type) and type_.__module__ != "typing":
+        return _instance_converter(type_)
+    raise UnsupportedType(type_)  # NewType, TypeVar, InitVar, forward references, ...
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _none_converter(value: Any) -> Any:
+    if value is not None:
+        raise LoaderMismatch(f"expected None, got {type(value)}")
+    return value
+
+
+def _instance_converter(cls: type) -> Converter:
+    accepted: Tuple[type, ...] = (int, float) if cls in (float, complex) else (cls,)  # numeric tower, as in PEP 484
+
+    def convert(value: Any) -> Any:
+        if not isinstance(value, accepted):
+            raise LoaderMismatch(f"expected {cls}, got {type(value)}")
+        return value
+
+    return convert
+
+
+def _dataclass_converter(loader: Loader) -> Converter:
+    def convert(value: Any) -> Any:
+        if not isinstance(value, Mapping):
+            raise LoaderMismatch(f"expected mapping, got {type(value)}")
+        return loader(value)
+
+    return convert
+
+
+def _list_converter(item: Converter) -> Converter:
+    def convert(value: Any) -> Any:
+        if type(value) is not list:
+            raise LoaderMismatch(f"expected list, got {type(value)}")
+        if item is _identity:
+            return list(value)
+        return [item(v) for v in value]
+
+    return convert
+
+
+def _dict_converter(key: Converter, item: Converter) -> Converter:
+    def convert(value: Any) -> Any:
+        if type(value) is not dict:
+            raise LoaderMismatch(f"expected dict, got {type(value)}")
+        if key is _identity and item is _identity:
+            return dict(value)
+        return {key(k): item(v) for k, v in value.items()}
+
+    return convert
+
+
+def _union_converter(options: List[Converter]) -> Converter:
+    def convert(value: Any) -> Any:
+        for option in options:
+            try:
+                return option(value)
+            except LoaderMismatch:
+                pass
+        raise LoaderMismatch(f"no union member matches {type(value)}")
+
+    return convert
+
+
+def load(data_class: Type[Any], data: Mapping[str, Any]) -> Any:
+    """Construct data_class from data using compiled loader; raise UnsupportedType or LoaderMismatch"""
+    loader = get_loader(data_class)
+    if loader is None:
+        raise UnsupportedType(data_class)
+    if not isinstance(data, Mapping):
+        raise LoaderMismatch(f"expected mapping, got {type(data)}")
+    return loader(data)
@@ -1,6 +1,7 @@
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
 
+from kentik_api.internal.json_codec import JSONCodec
 from kentik_api.public.device import (
     AppliedLabels,
     AuthenticationProtocol,
@@ -15,6 +16,7 @@ from kentik_api.public.device import (
 )
 from kentik_api.public.device_label import DeviceLabel
 from kentik_api.public.errors import IncompleteObjectError
+from kentik_api.public.plan import Plan
 from kentik_api.public.site import Site
 from kentik_api.public.types import ID
 from kentik_api.requests_payload.conversions import (
@@ -23,6 +25,7 @@ from kentik_api.requests_payload.conversions import (
     convert_or_none,
     dict_from_json,
     from_dict,
+    iter_list_from_json,
     list_from_json,
     permissive_enum_to_str,
 )
@@ -189,43 +192,51 @@ class DevicePayload:
     bgpPeerIP4: Optional[str] = None
     bgpPeerIP6: Optional[str] = None
 
+    REQUIRED_FIELDS = [
+        "id",
+        "company_id",
+        "device_name",
+        "device_type",
+        "device_subtype",
+        "plan",
+        "device_sample_rate",
+        "created_date",
+        "updated_date",
+    ]
+
     @classmethod
     def from_dict(cls, dic: Dict[str, Any]):
-        required_fields = [
-            "id",
-            "company_id",
-            "device_name",
-            "device_type",
-            "device_subtype",
-            "plan",
-            "device_sample_rate",
-            "created_date",
-            "updated_date",
-        ]
-        validate_fields(class_name=cls.__name__, required_fields=required_fields, dic=dic)
+        validate_fields(class_name=cls.__name__, required_fields=cls.REQUIRED_FIELDS, dic=dic)
 
         # recreate GET/POST/PUT response payload: fill all available fields
         return cls(
+            plan=PlanPayload.from_dict(dic["plan"]),
+            site=convert_or_none(dic.get("site"), SitePayload.from_dict),
+            labels=convert_list_or_none(dic.get("labels"), LabelPayload.from_dict),
+            all_interfaces=convert_list_or_none(dic.get("all_interfaces"), DeviceInterfacePayload.from_dict),
+            device_snmp_v3_conf=convert_or_none(dic.get("device_snmp_v3_conf"), SNMPv3ConfPayload.from_dict),
+            **cls._scalar_fields_from_dict(dic),
+        )
+
+    @classmethod
+    def _scalar_fields_from_dict(cls, dic: Dict[str, Any]) -> Dict[str, Any]:
+        """All fields except for nested objects"""
+        return dict(
             # always returned fields
             id=dic["id"],
             company_id=dic["company_id"],
             device_name=dic["device_name"],
             device_type=dic["device_type"],
             device_subtype=dic["device_subtype"],
-            plan=PlanPayload.from_dict(dic["plan"]),
             device_sample_rate=dic["device_sample_rate"],
             created_date=dic["created_date"],
             updated_date=dic["updated_date"],
             # optional fields
             sending_ips=dic.get("sending_ips"),
-            site=convert_or_none(dic.get("site"), SitePayload.from_dict),
-            labels=convert_list_or_none(dic.get("labels"), LabelPayload.from_dict),
-            all_interfaces=convert_list_or_none(dic.get("all_interfaces"), DeviceInterfacePayload.from_dict),
             cdn_attr=dic.get("cdn_attr"),
             device_description=dic.get("device_description"),
             device_snmp_ip=dic.get("device_snmp_ip"),
             device_snmp_community=dic.get("device_snmp_community"),
-            device_snmp_v3_conf=convert_or_none(dic.get("device_snmp_v3_conf"), SNMPv3ConfPayload.from_dict),
             minimize_snmp=dic.get("minimize_snmp"),
             device_bgp_type=dic.get("device_bgp_type"),
             device_bgp_neighbor_ip=dic.get("device_bgp_neighbor_ip"),
@@ -269,9 +280,18 @@ class DevicePayload:
 
     def to_device(self) -> Device:
         return Device(
-            id=convert_or_none(self.id, ID),
             plan=convert_or_none(self.plan, PlanPayload.to_plan),
             site=convert_or_none(self.site, SitePayload.to_site),
+            labels=convert_list_or_none(self.labels, LabelPayload.to_device_label),
+            interfaces=convert_list_or_none(self.all_interfaces, DeviceInterfacePayload.to_device_interface),
+            device_snmp_v3_conf=convert_or_none(self.device_snmp_v3_conf, SNMPv3ConfPayload.to_conf),
+            **self._scalar_device_args(),
+        )
+
+    def _scalar_device_args(self) -> Dict[str, Any]:
+        """Device constructor arguments, except for nested objects"""
+        return dict(
+            id=convert_or_none(self.id, ID),
             device_name=self.device_name,
             device_type=DeviceType(self.device_type),
             device_subtype=DeviceSubtype(self.device_subtype),
@@ -296,21 +316,95 @@ class DevicePayload:
             updated_date=self.updated_date,
             bgp_peer_ip4=self.bgpPeerIP4,
             bgp_peer_ip6=self.bgpPeerIP6,
-            labels=convert_list_or_none(self.labels, LabelPayload.to_device_label),
-            interfaces=convert_list_or_none(self.all_interfaces, DeviceInterfacePayload.to_device_interface),
-            device_snmp_v3_conf=convert_or_none(self.device_snmp_v3_conf, SNMPv3ConfPayload.to_conf),
             cdn_attr=convert_or_none(self.cdn_attr, CDNAttribute),
         )
 
 
+class LazyDevice(Device):
+    """
+    Device backed by the device dict decoded from API response.
+    Scalar attributes are converted upfront; nested objects (plan, site, labels, interfaces and SNMPv3 config)
+    are converted on first access, so reading just e.g. id and device_name of many devices is cheap.
+    """
+
+    def __init__(self, dic: Dict[str, Any]) -> None:
+        validate_fields(class_name=DevicePayload.__name__, required_fields=DevicePayload.REQUIRED_FIELDS, dic=dic)
+        self._raw = dic
+        self._materialized: Dict[str, Any] = {}
+        payload = DevicePayload(**DevicePayload._scalar_fields_from_dict(dic))
+        super().__init__(**payload._scalar_device_args())
+        self._materialized.clear()  # Device.__init__ sets device_snmp_v3_conf to None
+
+    def _get(self, name: str, convert: Callable[[Dict[str, Any]], Any]) -> Any:
+        try:
+            return self._materialized[name]
+        except KeyError:
+            value = self._materialized[name] = convert(self._raw)
+            return value
+
+    @property
+    def plan(self) -> Plan:
+        return self._get("plan", lambda dic: PlanPayload.from_dict(dic["plan"]).to_plan())
+
+    @property
+    def site(self) -> Optional[Site]:
+        return self._get(
+            "site",
+            lambda dic: convert_or_none(convert_or_none(dic.get("site"), SitePayload.from_dict), SitePayload.to_site),
+        )
+
+    @property
+    def labels(self) -> List[DeviceLabel]:
+        labels = self._get(
+            "labels",
+            lambda dic: convert_list_or_none(
+                convert_list_or_none(dic.get("labels"), LabelPayload.from_dict), LabelPayload.to_device_label
+            ),
+        )
+        return list(labels) if labels is not None else []
+
+    @property
+    def interfaces(self) -> List[DeviceInterface]:
+        interfaces = self._get_interfaces()
+        return list(interfaces) if interfaces is not None else []
+
+    def get_interface(self, name):
+        return self._interfaces_by_name_map().get(name)
+
+    @property  # type: ignore
+    def device_snmp_v3_conf(self) -> Optional[SNMPv3Conf]:  # type: ignore
+        return self._get(
+            "device_snmp_v3_conf",
+            lambda dic: convert_or_none(
+                convert_or_none(dic.get("device_snmp_v3_conf"), SNMPv3ConfPayload.from_dict), SNMPv3ConfPayload.to_conf
+            ),
+        )
+
+    @device_snmp_v3_conf.setter
+    def device_snmp_v3_conf(self, value: Optional[SNMPv3Conf]) -> None:
+        self._materialized["device_snmp_v3_conf"] = value
+
+    def _get_interfaces(self) -> Optional[List[DeviceInterface]]:
+        return self._get(
+            "interfaces",
+            lambda dic: convert_list_or_none(
+                convert_list_or_none(dic.get("all_interfaces"), DeviceInterfacePayload.from_dict),
+                DeviceInterfacePayload.to_device_interface,
+            ),
+        )
+
+    def _interfaces_by_name_map(self) -> Dict[str, DeviceInterface]:
+        return self._get("interfaces_by_name", lambda _: {i.name: i for i in self._get_interfaces() or []})
+
+
 @dataclass
 class GetResponse:
     device: DevicePayload
 
     @classmethod
-    def from_json(cls, json_string: str):
+    def from_json(cls, json_string: str, codec: Optional[JSONCodec] = None):
         # for GET response the payload json is like: "device": {...}
-        dic = dict_from_json(class_name=cls.__name__, json_string=json_string, root="device")
+        dic = dict_from_json(class_name=cls.__name__, json_string=json_string, root="device", codec=codec)
         return cls.from_dict(dic)
 
     @classmethod
@@ -326,11 +420,29 @@ class GetAllResponse:
     devices: List[GetResponse]
 
     @classmethod
-    def from_json(cls, json_string: str):
-        items = list_from_json(class_name=cls.__name__, json_string=json_string, root="devices")
+    def from_json(cls, json_string: str, codec: Optional[JSONCodec] = None):
+        items = list_from_json(class_name=cls.__name__, json_string=json_string, root="devices", codec=codec)
         devices = [GetResponse.from_dict(item) for item in items]
         return cls(devices=devices)
 
+    @classmethod
+    def iter_devices_from_json_stream(
+        cls,
+        chunks: Iterable[bytes],
+        encoding: str = "utf-8",
+        lazy: bool = False,
+        codec: Optional[JSONCodec] = None,
+    ) -> Iterator[Device]:
+        """Decode devices one by one while the response is being received"""
+        items = iter_list_from_json(cls.__name__, chunks, root="devices", encoding=encoding, codec=codec)
+        for item in items:
+            yield LazyDevice(item) if lazy else GetResponse.from_dict(item).to_device()
+
+    @classmethod
+    def lazy_devices_from_json(cls, json_string: str, codec: Optional[JSONCodec] = None) -> List[Device]:
+        items = list_from_json(class_name=cls.__name__, json_string=json_string, root="devices", codec=codec)
+        return [LazyDevice(item) for item in items]
+
     def to_devices(self) -> List[Device]:
         return [item.to_device() for item in self.devices]
 
@@ -476,8 +588,8 @@ class ApplyLabelsResponse:
     labels: List[LabelPayload]
 
     @classmethod
-    def from_json(cls, json_string: str):
-        dic = dict_from_json(class_name=cls.__name__, json_string=json_string)
+    def from_json(cls, json_string: str, codec: Optional[JSONCodec] = None):
+        dic = dict_from_json(class_name=cls.__name__, json_string=json_string, codec=codec)
         required_fields = ["id", "device_name", "labels"]
         validate_fields(class_name=cls.__name__, required_fields=required_fields, dic=dic)
         labels = [LabelPayload.from_dict(item) for item in dic["labels"]]
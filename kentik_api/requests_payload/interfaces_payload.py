@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 
+from kentik_api.internal.json_codec import JSONCodec
 from kentik_api.public.device import Interface, SecondaryIP, TopNextHopASN, VRFAttributes
 from kentik_api.public.errors import IncompleteObjectError
 from kentik_api.public.types import ID
@@ -210,9 +211,9 @@ class GetResponse:
     interface: InterfacePayload
 
     @classmethod
-    def from_json(cls, json_string: str):
+    def from_json(cls, json_string: str, codec: Optional[JSONCodec] = None):
         # for GET response the payload json is like: "interface": {...}
-        dic = dict_from_json(class_name=cls.__name__, json_string=json_string, root="interface")
+        dic = dict_from_json(class_name=cls.__name__, json_string=json_string, root="interface", codec=codec)
         return cls.from_dict(dic)
 
     @classmethod
@@ -228,8 +229,8 @@ class GetAllResponse:
     interfaces: List[GetResponse]
 
     @classmethod
-    def from_json(cls, json_string: str):
-        items = list_from_json(class_name=cls.__name__, json_string=json_string)
+    def from_json(cls, json_string: str, codec: Optional[JSONCodec] = None):
+        items = list_from_json(class_name=cls.__name__, json_string=json_string, codec=codec)
         interfaces = [GetResponse.from_dict(item) for item in items]
         return cls(interfaces=interfaces)
 
@@ -272,8 +273,8 @@ class CreateResponse:
     interface: InterfacePayload
 
     @classmethod
-    def from_json(cls, json_string: str):
-        dic = dict_from_json(class_name=cls.__name__, json_string=json_string)
+    def from_json(cls, json_string: str, codec: Optional[JSONCodec] = None):
+        dic = dict_from_json(class_name=cls.__name__, json_string=json_string, codec=codec)
         return cls(interface=InterfacePayload.from_dict(dic))
 
     def to_interface(self) -> Interface:
@@ -0,0 +1,143 @@
+import codecs
+import json
+from typing import Any, Iterable, Iterator, Optional
+
+from kentik_api.internal.json_codec import STDLIB, JSONCodec, get_codec
+
+_WHITESPACE = " \t\n\r"
+_MIN_TRIM = 64 * 1024  # don't bother trimming consumed part of the buffer below this size
+
+
+class _StreamReader:
+    """
+    Incremental reader of JSON document arriving in chunks of bytes.
+    Values are decoded one at a time using json.JSONDecoder.raw_decode, so only currently decoded value and
+    a chunk of not yet decoded input are held in memory.
+    """
+
+    def __init__(self, chunks: Iterable[bytes], encoding: str) -> None:
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder(encoding)()
+        self._json = json.JSONDecoder()
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        """Read more input, at least doubling the number of pending characters. Return False at end of input."""
+        if self._eof:
+            return False
+        if self._pos > _MIN_TRIM and self._pos * 2 > len(self._buf):
+            self._buf = self._buf[self._pos :]
+            self._pos = 0
+        wanted = max(1, 2 * (len(self._buf) - self._pos))
+        parts = [self._buf]
+        received = 0
+        while received < wanted:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                parts.append(self._decoder.decode(b"", final=True))
+                self._eof = True
+                break
+            text = self._decoder.decode(chunk)
+            parts.append(text)
+            received += len(text)
+        self._buf = "".join(parts)
+        return True
+
+    def peek(self) -> str:
+        """Return next non-whitespace character without consuming it"""
+        while True:
+            buf = self._buf
+            pos = self._pos
+            while pos < len(buf) and buf[pos] in _WHITESPACE:
+                pos += 1
+            self._pos = pos
+            if pos < len(buf):
+                return buf[pos]
+            if not self._fill():
+                raise ValueError("Unexpected end of JSON input")
+
+    def expect(self, char: str) -> None:
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Expected '{char}' at position {self._pos}, got '{found}'")
+        self._pos += 1
+
+    def value(self) -> Any:
+        """Decode next JSON value"""
+        self.peek()
+        while True:
+            try:
+                obj, end = self._json.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            if end == len(self._buf) and self._fill():
+                continue  # value touching end of the buffer (e.g. a number) may continue in the next chunk
+            self._pos = end
+            return obj
+
+    def drain(self) -> None:
+        """Consume remaining input without decoding it"""
+        for _ in self._chunks:
+            pass
+        self._eof = True
+
+
+def iter_array(
+    chunks: Iterable[bytes], root: str = "", encoding: str = "utf-8", codec: Optional[JSONCodec] = None
+) -> Iterator[Any]:
+    """
+    Yield items of JSON array one by one, while the document is being received.
+    root - name of the top-level key holding the array (e.g. "devices": [...]); empty means the document is the array.
+    Other top-level values preceding the array are decoded and discarded, input following the array is not decoded.
+    codec - JSON codec used for decoding; None means the default codec. Only the standard library decoder can decode
+            the document incrementally. Other codecs (orjson, ujson) have no incremental API, so the whole document
+            is received and decoded at once: faster, but the document is held in memory.
+    """
+    codec = get_codec(codec)
+    if codec is not STDLIB:
+        yield from _decode_whole_array(chunks, root, encoding, codec)
+        return
+    reader = _StreamReader(chunks, encoding)
+    if root:
+        reader.expect("{")
+        while True:
+            if reader.peek() == "}":
+                raise KeyError(root)
+            key = reader.value()
+            reader.expect(":")
+            if key == root:
+                break
+            reader.value()
+            if reader.peek() == ",":
+                reader.expect(",")
+            else:
+                reader.expect("}")
+                raise KeyError(root)
+    reader.expect("[")
+    if reader.peek() == "]":
+        reader.expect("]")
+    else:
+        while True:
+            yield reader.value()
+            if reader.peek() == ",":
+                reader.expect(",")
+            else:
+                reader.expect("]")
+                break
+    reader.drain()
+
+
+def _decode_whole_array(chunks: Iterable[bytes], root: str, encoding: str, codec: JSONCodec) -> Iterator[Any]:
+    data = b"".join(chunks)
+    document = codec.loads(data if codecs.lookup(encoding).name == "utf-8" else data.decode(encoding))
+    if root:
+        if not isinstance(document, dict):
+            raise ValueError(f"Expected object, got {type(document).__name__}")
+        document = document[root]
+    if not isinstance(document, list):
+        raise ValueError(f"Expected array, got {type(document).__name__}")
+    yield from document
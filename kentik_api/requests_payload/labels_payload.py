@@ -2,6 +2,7 @@
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 
+from kentik_api.internal.json_codec import JSONCodec
 from kentik_api.public.device_label import DeviceItem, DeviceLabel
 from kentik_api.public.types import ID
 
@@ -54,8 +55,8 @@ class GetResponse:
     order: Optional[int] = None
 
     @classmethod
-    def from_json(cls, json_string: str):
-        dic = dict_from_json(cls.__name__, json_string)
+    def from_json(cls, json_string: str, codec: Optional[JSONCodec] = None):
+        dic = dict_from_json(cls.__name__, json_string, codec=codec)
         dic["devices"] = _DeviceArray.from_list(dic["devices"])
         return from_dict(cls, dic)
 
@@ -77,8 +78,8 @@ class GetResponse:
 
 class GetAllResponse(List[GetResponse]):
     @classmethod
-    def from_json(cls, json_string: str):
-        items = list_from_json(cls.__name__, json_string)
+    def from_json(cls, json_string: str, codec: Optional[JSONCodec] = None):
+        items = list_from_json(cls.__name__, json_string, codec=codec)
         labels = cls()
         for item in items:
             item["devices"] = _DeviceArray.from_list(item["devices"])
@@ -112,6 +113,6 @@ class DeleteResponse:
     success: bool
 
     @classmethod
-    def from_json(cls, json_string: str):
-        dic = dict_from_json(cls.__name__, json_string)
+    def from_json(cls, json_string: str, codec: Optional[JSONCodec] = None):
+        dic = dict_from_json(cls.__name__, json_string, codec=codec)
         return from_dict(cls, dic)
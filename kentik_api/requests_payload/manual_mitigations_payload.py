@@ -3,6 +3,7 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import List, Optional
 
+from kentik_api.internal.json_codec import JSONCodec
 from kentik_api.public.errors import DataFormatError
 from kentik_api.public.manual_mitigation import Alarm, HistoricalAlert
 from kentik_api.public.types import ID
@@ -14,8 +15,8 @@ class CreateResponse:
         self.result = result
 
     @classmethod
-    def from_json(cls, json_string: str):
-        dic = dict_from_json(cls.__name__, json_string, "response")
+    def from_json(cls, json_string: str, codec: Optional[JSONCodec] = None):
+        dic = dict_from_json(cls.__name__, json_string, "response", codec=codec)
         return cls(dic["result"])
 
     def status(self) -> str:
@@ -83,8 +84,8 @@ class _Alarm:
 
 class GetActiveAlertsResponse(List[_Alarm]):
     @classmethod
-    def from_json(cls, json_string: str):
-        items = list_from_json(cls.__name__, json_string)
+    def from_json(cls, json_string: str, codec: Optional[JSONCodec] = None):
+        items = list_from_json(cls.__name__, json_string, codec=codec)
         obj = cls()
         for i in items:
             # Workaround for manual mitigation entries which do not comply with general schema
@@ -160,8 +161,8 @@ class _HistoricalAlert:
 
 class GetHistoricalAlertsResponse(List[_HistoricalAlert]):
     @classmethod
-    def from_json(cls, json_string: str):
-        items = list_from_json(cls.__name__, json_string)
+    def from_json(cls, json_string: str, codec: Optional[JSONCodec] = None):
+        items = list_from_json(cls.__name__, json_string, codec=codec)
         obj = cls()
         for i in items:
             obj.append(from_dict(data_class=_HistoricalAlert, data=i))
@@ -1,7 +1,8 @@
 from copy import deepcopy
 from dataclasses import dataclass
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
+from kentik_api.internal.json_codec import JSONCodec
 from kentik_api.public.plan import Plan, PlanDevice, PlanDeviceType
 from kentik_api.public.types import ID
 from kentik_api.requests_payload.conversions import convert, convert_or_none, dict_from_json, from_dict
@@ -43,8 +44,8 @@ class GetAllResponse:
     plans: List[Dict[str, Any]]
 
     @classmethod
-    def from_json(cls, json_string: str):
-        dic = dict_from_json(cls.__name__, json_string)
+    def from_json(cls, json_string: str, codec: Optional[JSONCodec] = None):
+        dic = dict_from_json(cls.__name__, json_string, codec=codec)
         return from_dict(cls, dic)
 
     def to_plans(self) -> List[Plan]:
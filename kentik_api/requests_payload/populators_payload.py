@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 
+from kentik_api.internal.json_codec import JSONCodec
 from kentik_api.public.custom_dimension import Populator
 from kentik_api.public.errors import IncompleteObjectError
 from kentik_api.public.types import ID
@@ -143,9 +144,9 @@ class PopulatorArray(List[PopulatorGetPayload]):
 
 class GetResponse(PopulatorGetPayload):
     @classmethod
-    def from_json(cls, json_string: str):
+    def from_json(cls, json_string: str, codec: Optional[JSONCodec] = None):
         # payload is embeded under "populator" key
-        dic = dict_from_json(class_name=cls.__name__, json_string=json_string, root="populator")
+        dic = dict_from_json(class_name=cls.__name__, json_string=json_string, root="populator", codec=codec)
         return from_dict(data_class=cls, data=dic)
 
 
@@ -1,9 +1,11 @@
 from base64 import b64decode
 from dataclasses import dataclass
-from typing import Dict, List, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 
+from kentik_api.internal.json_codec import JSONCodec
+from kentik_api.public.errors import DeserializationError
 from kentik_api.public.query_object import ImageType, QueryChartResult, QueryDataResult, QueryURLResult
-from kentik_api.requests_payload.conversions import dict_from_json, from_dict
+from kentik_api.requests_payload.conversions import dict_from_json, from_dict, iter_list_from_json
 
 
 @dataclass
@@ -20,10 +22,20 @@ class QueryDataResponse:
     results: List[Dict]
 
     @classmethod
-    def from_json(cls, json_string: str):
-        params = dict_from_json(cls.__name__, json_string)
+    def from_json(cls, json_string: str, codec: Optional[JSONCodec] = None):
+        params = dict_from_json(cls.__name__, json_string, codec=codec)
         return from_dict(cls, params)
 
+    @classmethod
+    def from_json_stream(cls, chunks: Iterable[bytes], encoding: str = "utf-8", codec: Optional[JSONCodec] = None):
+        """Decode results one by one while the response is being received, without materializing whole document"""
+        results = []
+        for item in iter_list_from_json(cls.__name__, chunks, root="results", encoding=encoding, codec=codec):
+            if not isinstance(item, dict):
+                raise DeserializationError(cls.__name__, f"Expected dict result, got {type(item)}")
+            results.append(item)
+        return cls(results=results)
+
     def to_query_data_result(self) -> QueryDataResult:
         return QueryDataResult(results=self.results)
 
@@ -33,8 +45,8 @@ class QueryChartResponse:
     dataUri: str  # like: "data:image/png;base64,iVBORw0KGgoAAAA..."
 
     @classmethod
-    def from_json(cls, json_string: str):
-        params = dict_from_json(cls.__name__, json_string)
+    def from_json(cls, json_string: str, codec: Optional[JSONCodec] = None):
+        params = dict_from_json(cls.__name__, json_string, codec=codec)
         return from_dict(cls, params)
 
     def to_query_chart_result(self) -> QueryChartResult:
@@ -2,6 +2,7 @@ from copy import deepcopy
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 
+from kentik_api.internal.json_codec import JSONCodec
 from kentik_api.public.errors import IncompleteObjectError
 from kentik_api.public.saved_filter import Filter, FilterGroups, Filters, SavedFilter
 from kentik_api.public.types import ID
@@ -63,8 +64,8 @@ class GetResponse:
     filter_level: Optional[str] = None
 
     @classmethod
-    def from_json(cls, json_string: str):
-        dic = dict_from_json(cls.__name__, json_string)
+    def from_json(cls, json_string: str, codec: Optional[JSONCodec] = None):
+        dic = dict_from_json(cls.__name__, json_string, codec=codec)
         return from_dict(cls, dic)
 
     def to_saved_filter(self) -> SavedFilter:
@@ -106,8 +107,8 @@ class GetResponse:
 
 class GetAllResponse(List[GetResponse]):
     @classmethod
-    def from_json(cls, json_string: str):
-        items = list_from_json(cls.__name__, json_string)
+    def from_json(cls, json_string: str, codec: Optional[JSONCodec] = None):
+        items = list_from_json(cls.__name__, json_string, codec=codec)
         saved_filters = cls()
         for item in items:
             saved_filter = from_dict(GetResponse, item)
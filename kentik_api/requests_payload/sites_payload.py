@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 
+from kentik_api.internal.json_codec import JSONCodec
 from kentik_api.public.errors import IncompleteObjectError
 from kentik_api.public.site import Site
 from kentik_api.public.types import ID
@@ -37,8 +38,8 @@ class GetResponse:
     site: _Site  # sites api payload is embedded under "site" key
 
     @classmethod
-    def from_json(cls, json_string: str):
-        dic = dict_from_json(class_name=cls.__name__, json_string=json_string, root="site")
+    def from_json(cls, json_string: str, codec: Optional[JSONCodec] = None):
+        dic = dict_from_json(class_name=cls.__name__, json_string=json_string, root="site", codec=codec)
         return cls.from_dict(dic=dic)
 
     @classmethod
@@ -60,8 +61,8 @@ class GetAllResponse:
     sites: List[GetResponse]
 
     @classmethod
-    def from_json(cls, json_string: str):
-        items = list_from_json(class_name=cls.__name__, json_string=json_string, root="sites")
+    def from_json(cls, json_string: str, codec: Optional[JSONCodec] = None):
+        items = list_from_json(class_name=cls.__name__, json_string=json_string, root="sites", codec=codec)
         sites = [GetResponse.from_dict(item) for item in items]
         return cls(sites=sites)
 
@@ -82,8 +83,8 @@ class CreateResponse:
     site: _Site  # sites api payload is embedded under "site" key
 
     @classmethod
-    def from_json(cls, json_string: str):
-        dic = dict_from_json(class_name=cls.__name__, json_string=json_string, root="site")
+    def from_json(cls, json_string: str, codec: Optional[JSONCodec] = None):
+        dic = dict_from_json(class_name=cls.__name__, json_string=json_string, root="site", codec=codec)
         return cls(site=from_dict(data_class=CreateResponse._Site, data=dic))
 
     def to_site(self) -> Site:
@@ -109,8 +110,8 @@ class UpdateResponse:
     site: _Site  # sites api payload is embedded under "site" key
 
     @classmethod
-    def from_json(cls, json_string):
-        dic = dict_from_json(class_name=cls.__name__, json_string=json_string, root="site")
+    def from_json(cls, json_string: str, codec: Optional[JSONCodec] = None):
+        dic = dict_from_json(class_name=cls.__name__, json_string=json_string, root="site", codec=codec)
         return cls(site=from_dict(data_class=UpdateResponse._Site, data=dic))
 
     def to_site(self) -> Site:
@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 
+from kentik_api.internal.json_codec import JSONCodec
 from kentik_api.public.errors import IncompleteObjectError
 from kentik_api.public.tag import Tag
 from kentik_api.public.types import ID
@@ -115,8 +116,8 @@ class GetResponse:
     tag: TagPayload  # tags api payload is embedded under "tag" key
 
     @classmethod
-    def from_json(cls, json_string: str):
-        dic = dict_from_json(cls.__name__, json_string, "tag")
+    def from_json(cls, json_string: str, codec: Optional[JSONCodec] = None):
+        dic = dict_from_json(cls.__name__, json_string, "tag", codec=codec)
         return cls(tag=TagPayload.from_dict(dic))
 
     def to_tag(self) -> Tag:
@@ -128,8 +129,8 @@ class GetAllResponse:
     responses: List[GetResponse]
 
     @classmethod
-    def from_json(cls, json_string: str):
-        items = list_from_json(cls.__name__, json_string, "tags")
+    def from_json(cls, json_string: str, codec: Optional[JSONCodec] = None):
+        items = list_from_json(cls.__name__, json_string, "tags", codec=codec)
         responses = [GetResponse(TagPayload.from_dict(item)) for item in items]
         return cls(responses)
 
@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 
+from kentik_api.internal.json_codec import JSONCodec
 from kentik_api.public.tenant import Tenant, TenantUser
 from kentik_api.public.types import ID
 from kentik_api.requests_payload.conversions import convert, dict_from_json, from_dict, list_from_json
@@ -28,8 +29,8 @@ class GetResponse:
     updated_date: str
 
     @classmethod
-    def from_json(cls, json_string: str):
-        dic = dict_from_json(cls.__name__, json_string)
+    def from_json(cls, json_string: str, codec: Optional[JSONCodec] = None):
+        dic = dict_from_json(cls.__name__, json_string, codec=codec)
         return from_dict(cls, dic)
 
     def to_tenant(self) -> Tenant:
@@ -46,8 +47,8 @@ class GetResponse:
 
 class GetAllResponse(List[GetResponse]):
     @classmethod
-    def from_json(cls, json_string: str):
-        items = list_from_json(cls.__name__, json_string)
+    def from_json(cls, json_string: str, codec: Optional[JSONCodec] = None):
+        items = list_from_json(cls.__name__, json_string, codec=codec)
         tenants = cls()
         for item in items:
             tenant = from_dict(GetResponse, item)
@@ -74,8 +75,8 @@ class CreateUserResponse:
     user_full_name: Optional[str] = None
 
     @classmethod
-    def from_json(cls, json_string: str):
-        dic = dict_from_json(cls.__name__, json_string)
+    def from_json(cls, json_string: str, codec: Optional[JSONCodec] = None):
+        dic = dict_from_json(cls.__name__, json_string, codec=codec)
         return from_dict(cls, dic)
 
     def to_tenant_user(self):
@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from typing import Dict, List, Optional
 
+from kentik_api.internal.json_codec import JSONCodec
 from kentik_api.public.types import ID
 from kentik_api.public.user import User
 from kentik_api.requests_payload.conversions import convert, dict_from_json, from_dict, list_from_json
@@ -50,8 +51,8 @@ class GetResponse:
     user: _User
 
     @classmethod
-    def from_json(cls, json_string: str):
-        dic = dict_from_json(cls.__name__, json_string, "user")
+    def from_json(cls, json_string: str, codec: Optional[JSONCodec] = None):
+        dic = dict_from_json(cls.__name__, json_string, "user", codec=codec)
         dic["email_service"] = convert(dic["email_service"], bool)
         dic["email_product"] = convert(dic["email_product"], bool)
         return cls(from_dict(_User, dic))
@@ -66,8 +67,8 @@ class GetAllResponse:
     users: List[_User]
 
     @classmethod
-    def from_json(cls, json_string: str):
-        items = list_from_json(cls.__name__, json_string, "users")
+    def from_json(cls, json_string: str, codec: Optional[JSONCodec] = None):
+        items = list_from_json(cls.__name__, json_string, "users", codec=codec)
         response = cls([])
         for item in items:
             user = from_dict(_User, item)
@@ -1,20 +1,32 @@
-from typing import Any, List, Optional, Tuple
+from typing import Any, List, NamedTuple, Optional, Tuple
 
 from google.protobuf.timestamp_pb2 import Timestamp  # type: ignore
 
 import kentik_api.generated.kentik.synthetics.v202202.synthetics_pb2 as pb
+from kentik_api.api_connection.grpc_channel import ChannelPool, GRPCChannelConfig
+from kentik_api.api_connection.instrumentation import Instrumentation
 from kentik_api.generated.kentik.synthetics.v202202.synthetics_pb2_grpc import (
-    SyntheticsAdminService,
-    SyntheticsDataService,
+    SyntheticsAdminServiceStub,
+    SyntheticsDataServiceStub,
 )
 from kentik_api.internal.grpc import wrap_grpc_errors
 from kentik_api.version import get_user_agent
 
 
+class _Stubs(NamedTuple):
+    admin: SyntheticsAdminServiceStub
+    data: SyntheticsDataServiceStub
+
+
+def _make_stubs(channel: Any) -> _Stubs:
+    return _Stubs(SyntheticsAdminServiceStub(channel), SyntheticsDataServiceStub(channel))
+
+
 class APISyntheticsConnector:
     """
     APISyntheticsConnector implements APISyntheticsConnectorProtocol.
-    Allows sending authorized gRPC requests to Kentik Synthetics API
+    Allows sending authorized gRPC requests to Kentik Synthetics API.
+    Owns long-lived gRPC channel(s) which are released by close().
     """
 
     def __init__(
@@ -23,83 +35,80 @@ class APISyntheticsConnector:
         auth_email: str,
         auth_token: str,
         options: List[Tuple[str, Any]] = [],
+        instrumentation: Optional[Instrumentation] = None,
+        channel_config: Optional[GRPCChannelConfig] = None,
     ):
-        self._url = api_url
-        self._options = tuple(options)
-        self._admin = SyntheticsAdminService()
-        self._data = SyntheticsDataService()
+        self._instrumentation = instrumentation  # used by wrap_grpc_errors
+        self._channels = ChannelPool(api_url, _make_stubs, channel_config, options)
         self._metadata = [
             ("x-ch-auth-email", auth_email),
             ("x-ch-auth-api-token", auth_token),
             ("user-agent", get_user_agent()),
         ]
 
+    @property
+    def _admin(self) -> SyntheticsAdminServiceStub:
+        return self._channels.stub().admin
+
+    @property
+    def _data(self) -> SyntheticsDataServiceStub:
+        return self._channels.stub().data
+
+    def close(self) -> None:
+        self._channels.close()
+
     @wrap_grpc_errors
     def get_all_agents(self) -> List[pb.Agent]:
         request = pb.ListAgentsRequest()
-        agents = self._admin.ListAgents(
-            request=request, metadata=self._metadata, target=self._url, options=self._options
-        ).agents
+        agents = self._admin.ListAgents(request=request, metadata=self._metadata).agents
         return list(agents)
 
     @wrap_grpc_errors
     def get_agent(self, agent_id: str) -> pb.Agent:
         request = pb.GetAgentRequest(id=agent_id)
-        return self._admin.GetAgent(
-            request=request, metadata=self._metadata, target=self._url, options=self._options
-        ).agent
+        return self._admin.GetAgent(request=request, metadata=self._metadata).agent
 
     @wrap_grpc_errors
     def update_agent(self, agent: pb.Agent) -> pb.Agent:
         request = pb.UpdateAgentRequest(agent=agent)
-        return self._admin.UpdateAgent(
-            request=request, metadata=self._metadata, target=self._url, options=self._options
-        ).agent
+        return self._admin.UpdateAgent(request=request, metadata=self._metadata).agent
 
     @wrap_grpc_errors
     def delete_agent(self, agent_id: str) -> None:
         request = pb.DeleteAgentRequest(id=agent_id)
-        self._admin.DeleteAgent(request=request, metadata=self._metadata, target=self._url, options=self._options)
+        self._admin.DeleteAgent(request=request, metadata=self._metadata)
 
     @wrap_grpc_errors
     def get_all_tests(self) -> List[pb.Test]:
         request = pb.ListTestsRequest()
-        tests = self._admin.ListTests(
-            request=request, metadata=self._metadata, target=self._url, options=self._options
-        ).tests
+        tests = self._admin.ListTests(request=request, metadata=self._metadata).tests
         return list(tests)
 
     @wrap_grpc_errors
     def get_test(self, test_id: str) -> pb.Test:
         request = pb.GetTestRequest(id=test_id)
-        return self._admin.GetTest(
-            request=request, metadata=self._metadata, target=self._url, options=self._options
-        ).test
+        return self._admin.GetTest(request=request, metadata=self._metadata).test
 
     @wrap_grpc_errors
     def create_test(self, test: pb.Test) -> pb.Test:
         test.ClearField("id")  # CreateTestRequest doesn't accept id
         request = pb.CreateTestRequest(test=test)
-        return self._admin.CreateTest(
-            request=request, metadata=self._metadata, target=self._url, options=self._options
-        ).test
+        return self._admin.CreateTest(request=request, metadata=self._metadata).test
 
     @wrap_grpc_errors
     def update_test(self, test: pb.Test) -> pb.Test:
         request = pb.UpdateTestRequest(test=test)
-        return self._admin.UpdateTest(
-            request=request, metadata=self._metadata, target=self._url, options=self._options
-        ).test
+        return self._admin.UpdateTest(request=request, metadata=self._metadata).test
 
     @wrap_grpc_errors
     def delete_test(self, test_id: str) -> None:
         request = pb.DeleteTestRequest(id=test_id)
-        self._admin.DeleteTest(request=request, metadata=self._metadata, target=self._url, options=self._options)
+        self._admin.DeleteTest(request=request, metadata=self._metadata)
 
     @wrap_grpc_errors
     def test_status_update(self, test_id: str, status: pb.TestStatus) -> None:
         request = pb.SetTestStatusRequest(id=test_id, status=status)
-        self._admin.SetTestStatus(request=request, metadata=self._metadata, target=self._url, options=self._options)
+        self._admin.SetTestStatus(request=request, metadata=self._metadata)
 
     @wrap_grpc_errors
     def results_for_tests(
@@ -110,6 +119,7 @@ class APISyntheticsConnector:
         agent_ids: Optional[List[str]] = None,
         task_ids: Optional[List[str]] = None,
         aggregate: bool = False,
+        timeout: Optional[float] = None,
     ) -> pb.GetResultsForTestsResponse:
         request = pb.GetResultsForTestsRequest(
             ids=test_ids,
@@ -119,9 +129,7 @@ class APISyntheticsConnector:
             targets=task_ids or [],
             aggregate=aggregate,
         )
-        return self._data.GetResultsForTests(
-            request=request, metadata=self._metadata, target=self._url, options=self._options
-        )
+        return self._data.GetResultsForTests(request=request, metadata=self._metadata, timeout=timeout)
 
     @wrap_grpc_errors
     def trace_for_test(
@@ -139,6 +147,4 @@ class APISyntheticsConnector:
             agent_ids=agent_ids or [],
             target_ips=target_ips or [],
         )
-        return self._data.GetTraceForTest(
-            request=request, metadata=self._metadata, target=self._url, options=self._options
-        )
+        return self._data.GetTraceForTest(request=request, metadata=self._metadata)
@@ -45,6 +45,7 @@ class APISyntheticsConnectorProtocol(Protocol):
         agent_ids: Optional[List[str]] = None,
         task_ids: Optional[List[str]] = None,
         aggregate: bool = False,
+        timeout: Optional[float] = None,
     ) -> pb.GetResultsForTestsResponse:
         pass
 
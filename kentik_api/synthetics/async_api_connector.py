@@ -0,0 +1,142 @@
+from typing import Any, List, Optional, Tuple
+
+from google.protobuf.timestamp_pb2 import Timestamp  # type: ignore
+
+import kentik_api.generated.kentik.synthetics.v202202.synthetics_pb2 as pb
+from kentik_api.api_connection.grpc_channel import AsyncChannelPool, GRPCChannelConfig
+from kentik_api.api_connection.instrumentation import Instrumentation
+from kentik_api.generated.kentik.synthetics.v202202.synthetics_pb2_grpc import (
+    SyntheticsAdminServiceStub,
+    SyntheticsDataServiceStub,
+)
+from kentik_api.internal.grpc import wrap_grpc_errors_async
+from kentik_api.synthetics.api_connector import _make_stubs, _Stubs
+from kentik_api.version import get_user_agent
+
+
+class AsyncAPISyntheticsConnector:
+    """
+    AsyncAPISyntheticsConnector is asyncio (grpc.aio) counterpart of APISyntheticsConnector; it has the same methods,
+    as coroutines. Many calls may be in flight concurrently over one channel.
+    Owns long-lived gRPC channel(s) which are released by awaiting close().
+    """
+
+    def __init__(
+        self,
+        api_url: str,
+        auth_email: str,
+        auth_token: str,
+        options: List[Tuple[str, Any]] = [],
+        instrumentation: Optional[Instrumentation] = None,
+        channel_config: Optional[GRPCChannelConfig] = None,
+    ):
+        self._instrumentation = instrumentation  # used by wrap_grpc_errors_async
+        self._channels: AsyncChannelPool[_Stubs] = AsyncChannelPool(api_url, _make_stubs, channel_config, options)
+        self._metadata = [
+            ("x-ch-auth-email", auth_email),
+            ("x-ch-auth-api-token", auth_token),
+            ("user-agent", get_user_agent()),
+        ]
+
+    @property
+    def _admin(self) -> SyntheticsAdminServiceStub:
+        return self._channels.stub().admin
+
+    @property
+    def _data(self) -> SyntheticsDataServiceStub:
+        return self._channels.stub().data
+
+    async def close(self) -> None:
+        await self._channels.close()
+
+    @wrap_grpc_errors_async
+    async def get_all_agents(self) -> List[pb.Agent]:
+        request = pb.ListAgentsRequest()
+        response = await self._admin.ListAgents(request=request, metadata=self._metadata)
+        return list(response.agents)
+
+    @wrap_grpc_errors_async
+    async def get_agent(self, agent_id: str) -> pb.Agent:
+        request = pb.GetAgentRequest(id=agent_id)
+        return (await self._admin.GetAgent(request=request, metadata=self._metadata)).agent
+
+    @wrap_grpc_errors_async
+    async def update_agent(self, agent: pb.Agent) -> pb.Agent:
+        request = pb.UpdateAgentRequest(agent=agent)
+        return (await self._admin.UpdateAgent(request=request, metadata=self._metadata)).agent
+
+    @wrap_grpc_errors_async
+    async def delete_agent(self, agent_id: str) -> None:
+        request = pb.DeleteAgentRequest(id=agent_id)
+        await self._admin.DeleteAgent(request=request, metadata=self._metadata)
+
+    @wrap_grpc_errors_async
+    async def get_all_tests(self) -> List[pb.Test]:
+        request = pb.ListTestsRequest()
+        response = await self._admin.ListTests(request=request, metadata=self._metadata)
+        return list(response.tests)
+
+    @wrap_grpc_errors_async
+    async def get_test(self, test_id: str) -> pb.Test:
+        request = pb.GetTestRequest(id=test_id)
+        return (await self._admin.GetTest(request=request, metadata=self._metadata)).test
+
+    @wrap_grpc_errors_async
+    async def create_test(self, test: pb.Test) -> pb.Test:
+        test.ClearField("id")  # CreateTestRequest doesn't accept id
+        request = pb.CreateTestRequest(test=test)
+        return (await self._admin.CreateTest(request=request, metadata=self._metadata)).test
+
+    @wrap_grpc_errors_async
+    async def update_test(self, test: pb.Test) -> pb.Test:
+        request = pb.UpdateTestRequest(test=test)
+        return (await self._admin.UpdateTest(request=request, metadata=self._metadata)).test
+
+    @wrap_grpc_errors_async
+    async def delete_test(self, test_id: str) -> None:
+        request = pb.DeleteTestRequest(id=test_id)
+        await self._admin.DeleteTest(request=request, metadata=self._metadata)
+
+    @wrap_grpc_errors_async
+    async def test_status_update(self, test_id: str, status: pb.TestStatus) -> None:
+        request = pb.SetTestStatusRequest(id=test_id, status=status)
+        await self._admin.SetTestStatus(request=request, metadata=self._metadata)
+
+    @wrap_grpc_errors_async
+    async def results_for_tests(
+        self,
+        test_ids: List[str],
+        start: Timestamp,
+        end: Timestamp,
+        agent_ids: Optional[List[str]] = None,
+        task_ids: Optional[List[str]] = None,
+        aggregate: bool = False,
+        timeout: Optional[float] = None,
+    ) -> pb.GetResultsForTestsResponse:
+        request = pb.GetResultsForTestsRequest(
+            ids=test_ids,
+            start_time=start,
+            end_time=end,
+            agent_ids=agent_ids or [],
+            targets=task_ids or [],
+            aggregate=aggregate,
+        )
+        return await self._data.GetResultsForTests(request=request, metadata=self._metadata, timeout=timeout)
+
+    @wrap_grpc_errors_async
+    async def trace_for_test(
+        self,
+        test_id: str,
+        start: Timestamp,
+        end: Timestamp,
+        agent_ids: Optional[List[str]] = None,
+        target_ips: Optional[List[str]] = None,
+    ) -> pb.GetTraceForTestResponse:
+        request = pb.GetTraceForTestRequest(
+            id=test_id,
+            start_time=start,
+            end_time=end,
+            agent_ids=agent_ids or [],
+            target_ips=target_ips or [],
+        )
+        return await self._data.GetTraceForTest(request=request, metadata=self._metadata)
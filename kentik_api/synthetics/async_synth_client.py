@@ -0,0 +1,126 @@
+from datetime import datetime
+from typing import Any, List, Optional
+
+import kentik_api.generated.kentik.synthetics.v202202.synthetics_pb2 as pb
+from kentik_api.public.errors import KentikAPIError
+from kentik_api.public.types import ID, IP
+from kentik_api.synthetics.agent import Agent, AgentOwnershipType
+from kentik_api.synthetics.async_api_connector import AsyncAPISyntheticsConnector
+from kentik_api.synthetics.synth_client import KentikSynthClient, make_synth_test
+from kentik_api.synthetics.synth_tests import SynTest, TestResults, TraceResponse
+from kentik_api.synthetics.synth_tests.base import DateTime
+from kentik_api.synthetics.synth_tests.results import results_data_frame
+from kentik_api.synthetics.types import TestStatus
+
+
+class AsyncKentikSynthClient:
+    """
+    Asyncio counterpart of KentikSynthClient: same methods as coroutines, backed by AsyncAPISyntheticsConnector.
+    Concurrent calls (e.g. via asyncio.gather) are multiplexed over the connector's gRPC channel(s).
+    """
+
+    IGNORED_TEST_TYPES = KentikSynthClient.IGNORED_TEST_TYPES
+
+    def __init__(self, connector: AsyncAPISyntheticsConnector):
+        self._connector = connector
+
+    async def get_all_agents(self, private_only=False) -> List[Agent]:
+        pb_agents = await self._connector.get_all_agents()
+        return [Agent.from_pb(agent) for agent in pb_agents if not private_only or agent.type == "private"]
+
+    async def get_agent(self, agent_id: ID) -> Agent:
+        pb_agent = await self._connector.get_agent(str(agent_id))
+        return Agent.from_pb(pb_agent)
+
+    async def update_agent(self, agent: Agent) -> Agent:
+        if agent.type != AgentOwnershipType.PRIVATE:
+            raise KentikAPIError("Only agents of type 'private' can be modified")
+        pb_output_agent = await self._connector.update_agent(agent.to_pb())
+        return Agent.from_pb(pb_output_agent)
+
+    async def delete_agent(self, agent_id: ID) -> None:
+        await self._connector.delete_agent(str(agent_id))
+
+    async def get_all_tests(self) -> List[SynTest]:
+        pb_tests = await self._connector.get_all_tests()
+        return [make_synth_test(pb_test) for pb_test in pb_tests if str(pb_test.type) not in self.IGNORED_TEST_TYPES]
+
+    async def get_test(self, test_id: ID) -> SynTest:
+        pb_test = await self._connector.get_test(str(test_id))
+        if str(pb_test.type) in self.IGNORED_TEST_TYPES:
+            raise KentikAPIError(f"Unsupported test type: {str(pb_test.type)}")
+        return make_synth_test(pb_test)
+
+    async def create_test(self, test: SynTest) -> SynTest:
+        pb_output_test = await self._connector.create_test(test.to_pb())
+        return make_synth_test(pb_output_test)
+
+    async def update_test(self, test: SynTest) -> SynTest:
+        pb_output_test = await self._connector.update_test(test.to_pb())
+        return make_synth_test(pb_output_test)
+
+    async def delete_test(self, test_id: ID) -> None:
+        await self._connector.delete_test(str(test_id))
+
+    async def set_test_status(self, test_id: ID, status: TestStatus) -> None:
+        await self._connector.test_status_update(str(test_id), status.value)
+
+    async def results_for_tests(
+        self,
+        test_ids: List[ID],
+        start: datetime,
+        end: datetime,
+        agent_ids: Optional[List[ID]] = None,
+        task_ids: Optional[List[ID]] = None,
+        aggregate: bool = False,
+    ) -> List[TestResults]:
+        response = await self._get_results(test_ids, start, end, agent_ids, task_ids, aggregate)
+        return [TestResults.from_pb(tr) for tr in response.results]
+
+    async def results_for_tests_df(
+        self,
+        test_ids: List[ID],
+        start: datetime,
+        end: datetime,
+        agent_ids: Optional[List[ID]] = None,
+        task_ids: Optional[List[ID]] = None,
+        aggregate: bool = False,
+    ) -> Any:
+        """Same as results_for_tests, but returns pandas DataFrame (see KentikSynthClient.results_for_tests_df)"""
+        response = await self._get_results(test_ids, start, end, agent_ids, task_ids, aggregate)
+        return results_data_frame(response.results)
+
+    async def _get_results(
+        self,
+        test_ids: List[ID],
+        start: datetime,
+        end: datetime,
+        agent_ids: Optional[List[ID]],
+        task_ids: Optional[List[ID]],
+        aggregate: bool,
+    ) -> pb.GetResultsForTestsResponse:
+        return await self._connector.results_for_tests(
+            test_ids=[str(id) for id in test_ids],
+            start=DateTime.fromtimestamp(start.timestamp(), start.tzinfo).to_pb(),
+            end=DateTime.fromtimestamp(end.timestamp(), end.tzinfo).to_pb(),
+            agent_ids=[str(id) for id in agent_ids] if agent_ids else [],
+            task_ids=[str(id) for id in task_ids] if task_ids else [],
+            aggregate=aggregate,
+        )
+
+    async def trace_for_test(
+        self,
+        test_id: ID,
+        start: datetime,
+        end: datetime,
+        agent_ids: Optional[List[ID]] = None,
+        target_ips: Optional[List[IP]] = None,
+    ) -> TraceResponse:
+        response = await self._connector.trace_for_test(
+            test_id=str(test_id),
+            start=DateTime.fromtimestamp(start.timestamp(), start.tzinfo).to_pb(),
+            end=DateTime.fromtimestamp(end.timestamp(), end.tzinfo).to_pb(),
+            agent_ids=[str(id) for id in agent_ids] if agent_ids else [],
+            target_ips=[str(ip) for ip in target_ips] if target_ips else [],
+        )
+        return TraceResponse.from_pb(response)
@@ -0,0 +1,179 @@
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Hashable, Iterable, List, Optional, TypeVar
+
+from kentik_api.public.types import ID
+from kentik_api.synthetics.agent import Agent
+from kentik_api.synthetics.synth_client import KentikSynthClient
+from kentik_api.synthetics.synth_tests import SynTest
+
+log = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def _group(items: Iterable[T], keys: Callable[[T], Iterable[Hashable]]) -> Dict[Hashable, List[T]]:
+    out: Dict[Hashable, List[T]] = {}
+    for item in items:
+        for key in keys(item):
+            out.setdefault(key, []).append(item)
+    return out
+
+
+@dataclass
+class _Snapshot:
+    """Immutable set of indexes built from one fetch of agents and tests"""
+
+    agents: Dict[ID, Agent] = field(default_factory=dict)
+    tests: Dict[ID, SynTest] = field(default_factory=dict)
+    agents_by: Dict[str, Dict[Hashable, List[Agent]]] = field(default_factory=dict)
+    tests_by: Dict[str, Dict[Hashable, List[SynTest]]] = field(default_factory=dict)
+    agent_tests: Dict[ID, List[SynTest]] = field(default_factory=dict)
+    fetched_at: float = 0.0
+
+    @classmethod
+    def build(cls, agents: List[Agent], tests: List[SynTest], fetched_at: float) -> "_Snapshot":
+        agents_by = {
+            "alias": _group(agents, lambda a: [a.alias]),
+            "name": _group(agents, lambda a: {name for name in (a.alias, a.site_name) if name}),
+            "site_id": _group(agents, lambda a: [str(a.site_id)]),
+            "asn": _group(agents, lambda a: [a.asn]),
+            "ip": _group(agents, lambda a: {str(ip) for ip in (a.ip, a.local_ip) if str(ip)}),
+            "label": _group(agents, lambda a: set(a.labels)),
+        }
+        tests_by = {
+            "name": _group(tests, lambda t: [t.name]),
+            "label": _group(tests, lambda t: set(t.labels)),
+            "target": _group(tests, lambda t: {str(target) for target in t.targets}),
+        }
+        by_id = {t.id: t for t in tests}
+        # agents report tests they run (_test_ids); tests list agents they run on (settings.agent_ids)
+        agent_test_ids: Dict[ID, Dict[ID, None]] = {a.id: dict.fromkeys(a.test_ids) for a in agents}
+        for test in tests:
+            for agent_id in test.settings.agent_ids:
+                agent_test_ids.setdefault(ID(agent_id), {})[test.id] = None
+        agent_tests = {
+            agent_id: [by_id[test_id] for test_id in test_ids if test_id in by_id]
+            for agent_id, test_ids in agent_test_ids.items()
+        }
+        return cls({a.id: a for a in agents}, by_id, agents_by, tests_by, agent_tests, fetched_at)
+
+
+class SynthCatalog:
+    """
+    Indexed view of synthetic agents and tests for repeated lookups without listing them from the API every time.
+    Agents and tests are fetched together and indexed by id, alias, name, site, ASN, IP and label (agents) and by id,
+    name, label and target (tests). Indexes are rebuilt on first lookup after ttl seconds since the last fetch (ttl=None
+    disables automatic refresh), or explicitly by refresh(). Lookups are safe from multiple threads; a refresh
+    replaces all indexes at once, so lookups never observe partially updated data.
+    Lookups by attribute return lists, since the attributes are not unique.
+    """
+
+    def __init__(
+        self,
+        client: KentikSynthClient,
+        ttl: Optional[float] = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._client = client
+        self.ttl = ttl
+        self._clock = clock
+        self._snapshot: Optional[_Snapshot] = None
+        self._lock = threading.Lock()
+
+    def refresh(self) -> None:
+        """Fetch agents and tests from the API and rebuild indexes"""
+        with self._lock:
+            self._fetch()
+
+    def _fetch(self) -> _Snapshot:
+        agents = self._client.get_all_agents()
+        tests = self._client.get_all_tests()
+        self._snapshot = _Snapshot.build(agents, tests, self._clock())
+        log.debug("Catalog refreshed: %d agents, %d tests", len(agents), len(tests))
+        return self._snapshot
+
+    def _expired(self, snapshot: Optional[_Snapshot]) -> bool:
+        return snapshot is None or (self.ttl is not None and self._clock() - snapshot.fetched_at >= self.ttl)
+
+    def invalidate(self) -> None:
+        """Drop indexes, the next lookup fetches data from the API"""
+        self._snapshot = None
+
+    @property
+    def age(self) -> Optional[float]:
+        """Seconds since last fetch, None if not fetched yet"""
+        snapshot = self._snapshot
+        return None if snapshot is None else self._clock() - snapshot.fetched_at
+
+    def _current(self) -> _Snapshot:
+        snapshot = self._snapshot
+        if self._expired(snapshot):
+            with self._lock:
+                # another thread may have refreshed the catalog while we were waiting for the lock
+                snapshot = self._snapshot
+                if self._expired(snapshot):
+                    snapshot = self._fetch()
+        assert snapshot is not None
+        return snapshot
+
+    # agents
+
+    @property
+    def agents(self) -> List[Agent]:
+        return list(self._current().agents.values())
+
+    def agent(self, agent_id: ID) -> Optional[Agent]:
+        return self._current().agents.get(ID(agent_id))
+
+    def agents_by_alias(self, alias: str) -> List[Agent]:
+        return list(self._current().agents_by["alias"].get(alias, []))
+
+    def agents_by_name(self, name: str) -> List[Agent]:
+        """Agents with given alias or site name (agents have no separate name attribute)"""
+        return list(self._current().agents_by["name"].get(name, []))
+
+    def agents_by_site(self, site_id: ID) -> List[Agent]:
+        return list(self._current().agents_by["site_id"].get(str(site_id), []))
+
+    def agents_by_asn(self, asn: int) -> List[Agent]:
+        return list(self._current().agents_by["asn"].get(asn, []))
+
+    def agents_by_ip(self, ip: str) -> List[Agent]:
+        """Agents with given public or local IP address"""
+        return list(self._current().agents_by["ip"].get(str(ip), []))
+
+    def agents_by_label(self, label: str) -> List[Agent]:
+        return list(self._current().agents_by["label"].get(label, []))
+
+    def agents_for_test(self, test_id: ID) -> List[Agent]:
+        """Agents the test runs on (known to the catalog)"""
+        snapshot = self._current()
+        test = snapshot.tests.get(ID(test_id))
+        if test is None:
+            return []
+        return [snapshot.agents[ID(a)] for a in test.settings.agent_ids if ID(a) in snapshot.agents]
+
+    # tests
+
+    @property
+    def tests(self) -> List[SynTest]:
+        return list(self._current().tests.values())
+
+    def test(self, test_id: ID) -> Optional[SynTest]:
+        return self._current().tests.get(ID(test_id))
+
+    def tests_by_name(self, name: str) -> List[SynTest]:
+        return list(self._current().tests_by["name"].get(name, []))
+
+    def tests_by_label(self, label: str) -> List[SynTest]:
+        return list(self._current().tests_by["label"].get(label, []))
+
+    def tests_by_target(self, target: str) -> List[SynTest]:
+        return list(self._current().tests_by["target"].get(str(target), []))
+
+    def tests_for_agent(self, agent_id: ID) -> List[SynTest]:
+        """Tests running on the agent (according to agent's test_ids and tests' agent_ids)"""
+        return list(self._current().agent_tests.get(ID(agent_id), []))
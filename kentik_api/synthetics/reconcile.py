@@ -0,0 +1,206 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from copy import copy
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set
+
+from kentik_api.public.errors import KentikAPIError
+from kentik_api.public.types import ID
+from kentik_api.synthetics.synth_tests import SynTest
+from kentik_api.synthetics.types import TestStatus
+
+log = logging.getLogger(__name__)
+
+# protobuf fields not compared when looking for configuration changes
+_IGNORED_FIELDS = ["id", "status", "edate"]
+
+
+class ReconcileAction(Enum):
+    CREATE = "create"
+    UPDATE = "update"
+    DELETE = "delete"
+    SET_STATUS = "set_status"
+
+
+@dataclass
+class PlannedChange:
+    """Actions needed to bring one test to the desired state"""
+
+    name: str
+    actions: List[ReconcileAction]
+    desired: Optional[SynTest] = None  # None for deleted tests
+    existing: Optional[SynTest] = None  # None for created tests
+    conflict: Optional[str] = None  # reason why the desired test can't be matched to existing one; no actions then
+
+    @property
+    def test_id(self) -> ID:
+        if self.existing is not None:
+            return self.existing.id
+        return self.desired.id if self.desired is not None and self.desired.deployed else ID()
+
+
+@dataclass
+class ReconcileOutcome:
+    """Result of reconciliation of one test"""
+
+    name: str
+    test_id: ID
+    actions: List[ReconcileAction] = field(default_factory=list)  # actions performed successfully
+    test: Optional[SynTest] = None  # test as returned by the API after create/update
+    error: Optional[KentikAPIError] = None
+
+    @property
+    def failed(self) -> bool:
+        return self.error is not None
+
+
+@dataclass
+class ReconcileReport:
+    outcomes: List[ReconcileOutcome] = field(default_factory=list)
+    unchanged: List[str] = field(default_factory=list)  # names of tests already in the desired state
+
+    @property
+    def failed(self) -> List[ReconcileOutcome]:
+        return [o for o in self.outcomes if o.failed]
+
+    def count(self, action: ReconcileAction) -> int:
+        return sum(action in o.actions for o in self.outcomes)
+
+
+def _config(test: SynTest) -> Any:
+    obj = test.to_pb()
+    for name in _IGNORED_FIELDS:
+        obj.ClearField(name)
+    obj.labels.sort()  # order of labels is not significant
+    return obj
+
+
+def plan_changes(
+    desired: Sequence[SynTest], existing: Sequence[SynTest], delete_missing: bool = False
+) -> List[PlannedChange]:
+    """
+    Diff desired tests against existing ones. Desired tests with id (i.e. deployed) are matched by id, other ones by
+    name. Test configuration is compared via protobuf serialization of test fields; status changes are applied via
+    separate set_test_status call.
+    Desired tests which can't be matched unambiguously (unknown id, name shared by multiple existing tests, existing
+    test matched by another desired test) are planned as conflicts, without actions; other tests are not affected.
+    delete_missing - delete existing tests not matched by any desired test (nor by a conflicting one)
+    """
+    by_id = {t.id: t for t in existing}
+    by_name: Dict[str, List[SynTest]] = {}
+    for t in existing:
+        by_name.setdefault(t.name, []).append(t)
+    matched: Set[ID] = set()
+    changes = []
+    for test in desired:
+        if test.deployed:
+            current = by_id.get(test.id)
+            if current is None:
+                changes.append(_conflict(test, f"Test '{test.name}' (id: {test.id}) does not exist"))
+                continue
+        else:
+            candidates = by_name.get(test.name, [])
+            if len(candidates) > 1:
+                changes.append(_conflict(test, f"Test name '{test.name}' is ambiguous ({len(candidates)} tests)"))
+                matched.update(t.id for t in candidates)  # don't delete tests the desired one may refer to
+                continue
+            current = candidates[0] if candidates else None
+        if current is None:
+            actions = [ReconcileAction.CREATE]
+            if test.status not in (TestStatus.ACTIVE, TestStatus.UNSPECIFIED):
+                actions.append(ReconcileAction.SET_STATUS)
+            changes.append(PlannedChange(test.name, actions, test))
+            continue
+        if current.id in matched:
+            changes.append(
+                _conflict(test, f"Test '{current.name}' (id: {current.id}) is matched by multiple desired tests")
+            )
+            continue
+        matched.add(current.id)
+        actions = []
+        if _config(test) != _config(current):
+            actions.append(ReconcileAction.UPDATE)
+        if test.status != current.status:
+            actions.append(ReconcileAction.SET_STATUS)
+        changes.append(PlannedChange(test.name, actions, test, current))
+    if delete_missing:
+        changes.extend(
+            PlannedChange(t.name, [ReconcileAction.DELETE], existing=t) for t in existing if t.id not in matched
+        )
+    return changes
+
+
+def _conflict(test: SynTest, reason: str) -> PlannedChange:
+    log.debug("Not reconciling test '%s': %s", test.name, reason)
+    return PlannedChange(test.name, [], test, conflict=reason)
+
+
+class TestReconciler:
+    """
+    Applies planned changes (see plan_changes) concurrently, issuing at most max_workers calls at a time.
+    Failure of one test does not stop processing of the others; it is reported in its ReconcileOutcome.
+    Conflicting changes are reported as failed outcomes without issuing any calls.
+    """
+
+    __test__ = False  # mark class as "Not a test"; to avoid pytest warnings
+
+    def __init__(
+        self,
+        create: Callable[[SynTest], SynTest],
+        update: Callable[[SynTest], SynTest],
+        delete: Callable[[ID], None],
+        set_status: Callable[[ID, TestStatus], None],
+        max_workers: int = 8,
+    ) -> None:
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self._create = create
+        self._update = update
+        self._delete = delete
+        self._set_status = set_status
+        self.max_workers = max_workers
+
+    def apply(self, changes: List[PlannedChange]) -> ReconcileReport:
+        report = ReconcileReport(
+            outcomes=[
+                ReconcileOutcome(c.name, c.test_id, error=KentikAPIError(c.conflict)) for c in changes if c.conflict
+            ],
+            unchanged=[c.name for c in changes if not c.actions and c.conflict is None],
+        )
+        pending = [c for c in changes if c.actions]
+        if not pending:
+            return report
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="synth-reconcile") as pool:
+            report.outcomes.extend(pool.map(self._apply_one, pending))
+        log.debug(
+            "Reconciled %d test(s): %d failed, %d unchanged",
+            len(report.outcomes),
+            len(report.failed),
+            len(report.unchanged),
+        )
+        return report
+
+    def _apply_one(self, change: PlannedChange) -> ReconcileOutcome:
+        outcome = ReconcileOutcome(change.name, change.test_id)
+        try:
+            for action in change.actions:
+                if action == ReconcileAction.CREATE:
+                    assert change.desired is not None
+                    outcome.test = self._create(change.desired)
+                    outcome.test_id = outcome.test.id
+                elif action == ReconcileAction.UPDATE:
+                    assert change.desired is not None
+                    test = copy(change.desired)
+                    test.id = outcome.test_id
+                    outcome.test = self._update(test)
+                elif action == ReconcileAction.DELETE:
+                    self._delete(outcome.test_id)
+                elif action == ReconcileAction.SET_STATUS:
+                    assert change.desired is not None
+                    self._set_status(outcome.test_id, change.desired.status)
+                outcome.actions.append(action)
+        except KentikAPIError as err:
+            log.debug("Failed to reconcile test '%s': %s", change.name, err)
+            outcome.error = err
+        return outcome
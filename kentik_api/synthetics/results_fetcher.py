@@ -0,0 +1,188 @@
+import logging
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Deque, Iterator, List, Optional, Set, Tuple
+
+from google.protobuf.timestamp_pb2 import Timestamp  # type: ignore
+from typing_extensions import Protocol
+
+import kentik_api.generated.kentik.synthetics.v202202.synthetics_pb2 as pb
+from kentik_api.public.errors import IntermittentError, ProtocolError, TimedOutError
+from kentik_api.synthetics.synth_tests.base import DateTime
+
+log = logging.getLogger(__name__)
+
+GRPC_RESOURCE_EXHAUSTED = 8  # status code of responses exceeding maximum message size
+
+
+class ResultsConnectorProtocol(Protocol):
+    """Part of APISyntheticsConnectorProtocol used by ResultsFetcher"""
+
+    def results_for_tests(
+        self,
+        test_ids: List[str],
+        start: Timestamp,
+        end: Timestamp,
+        agent_ids: Optional[List[str]] = None,
+        task_ids: Optional[List[str]] = None,
+        aggregate: bool = False,
+        timeout: Optional[float] = None,
+    ) -> pb.GetResultsForTestsResponse:
+        pass
+
+
+@dataclass(frozen=True)
+class ResultsChunk:
+    test_ids: Tuple[str, ...]
+    start: datetime
+    end: datetime
+
+
+def split_chunks(
+    test_ids: List[str], start: datetime, end: datetime, window: timedelta, batch_size: int
+) -> List[ResultsChunk]:
+    """Split request into chunks covering at most "window" of time and "batch_size" tests, ordered by time"""
+    if window <= timedelta(0) or batch_size < 1:
+        raise ValueError("window must be positive and batch_size at least 1")
+    batches = [tuple(test_ids[i : i + batch_size]) for i in range(0, len(test_ids), batch_size)]
+    chunks: List[ResultsChunk] = []
+    chunk_start = start
+    while chunk_start < end:
+        chunk_end = min(chunk_start + window, end)
+        chunks.extend(ResultsChunk(batch, chunk_start, chunk_end) for batch in batches)
+        chunk_start = chunk_end
+    return chunks
+
+
+class ResultsFetcher:
+    """
+    Fetches synthetic test results over long time ranges and/or for many tests.
+    The request is split into chunks by time window and test-id batches (see split_chunks); chunks are fetched
+    concurrently and their results yielded in chunk order, so that memory use is bounded by the number of chunks
+    in flight rather than by the size of the whole result set.
+    A chunk failing with IntermittentError is retried with exponential backoff; a chunk whose response exceeds
+    maximum gRPC message size (RESOURCE_EXHAUSTED), or which keeps timing out (TimedOutError), is split into halves
+    by time (down to min_window). Halves of a chunk split after timeouts share its remaining retries, so that
+    the number of calls per chunk stays bounded.
+    timeout - maximum duration of a single call in seconds, passed to gRPC as deadline; calls exceeding it fail
+              with TimedOutError. None means no limit.
+    """
+
+    def __init__(
+        self,
+        connector: ResultsConnectorProtocol,
+        window: timedelta = timedelta(hours=6),
+        batch_size: int = 50,
+        max_workers: int = 4,
+        retries: int = 3,
+        backoff: float = 1.0,
+        min_window: timedelta = timedelta(minutes=10),
+        timeout: Optional[float] = None,
+    ) -> None:
+        self._connector = connector
+        self.window = window
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+        self.retries = retries
+        self.backoff = backoff
+        self.min_window = min_window
+        self.timeout = timeout
+
+    def iter_pb(
+        self,
+        test_ids: List[str],
+        start: datetime,
+        end: datetime,
+        agent_ids: Optional[List[str]] = None,
+        task_ids: Optional[List[str]] = None,
+        aggregate: bool = False,
+    ) -> Iterator[pb.TestResults]:
+        """Yield protobuf TestResults for all chunks of the request"""
+        chunks = iter(split_chunks(test_ids, start, end, self.window, self.batch_size))
+        # results at chunk boundaries may be returned for both adjacent chunks; keep only the first copy
+        boundary_seen: Set[Tuple[str, int]] = set()
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="synth-results") as pool:
+            pending: Deque[Tuple[ResultsChunk, "Future[List[pb.TestResults]]"]] = deque()
+
+            def submit_next() -> None:
+                chunk = next(chunks, None)
+                if chunk is not None:
+                    pending.append((chunk, pool.submit(self._fetch, chunk, agent_ids, task_ids, aggregate)))
+
+            for _ in range(2 * self.max_workers):  # keep workers busy while results are consumed
+                submit_next()
+            try:
+                while pending:
+                    chunk, future = pending.popleft()
+                    results = future.result()
+                    submit_next()
+                    yield from _dedup_boundaries(results, chunk, boundary_seen)
+            finally:
+                for _, future in pending:
+                    future.cancel()
+
+    def _fetch(
+        self,
+        chunk: ResultsChunk,
+        agent_ids: Optional[List[str]],
+        task_ids: Optional[List[str]],
+        aggregate: bool,
+        retries: Optional[int] = None,
+    ) -> List[pb.TestResults]:
+        retries_left = self.retries if retries is None else retries
+        while True:
+            try:
+                response = self._connector.results_for_tests(
+                    test_ids=list(chunk.test_ids),
+                    start=DateTime.fromtimestamp(chunk.start.timestamp(), chunk.start.tzinfo).to_pb(),
+                    end=DateTime.fromtimestamp(chunk.end.timestamp(), chunk.end.tzinfo).to_pb(),
+                    agent_ids=agent_ids or [],
+                    task_ids=task_ids or [],
+                    aggregate=aggregate,
+                    timeout=self.timeout,
+                )
+                return list(response.results)
+            except (IntermittentError, ProtocolError) as err:
+                too_large = isinstance(err, ProtocolError) and err.status_code == GRPC_RESOURCE_EXHAUSTED
+                if not too_large and not isinstance(err, IntermittentError):
+                    raise
+                if not too_large and retries_left > 0:
+                    delay = self.backoff * 2 ** (self.retries - retries_left)
+                    retries_left -= 1
+                    log.debug("Retrying chunk %s in %.1f s after error: %s", chunk, delay, err)
+                    time.sleep(delay)
+                    continue
+                if not (too_large or isinstance(err, TimedOutError)) or chunk.end - chunk.start <= self.min_window:
+                    raise
+                log.debug("Splitting chunk %s after error: %s", chunk, err)
+                middle = chunk.start + (chunk.end - chunk.start) / 2
+                halves = [
+                    ResultsChunk(chunk.test_ids, chunk.start, middle),
+                    ResultsChunk(chunk.test_ids, middle, chunk.end),
+                ]
+                seen: Set[Tuple[str, int]] = set()
+                return [
+                    result
+                    for half in halves
+                    for result in _dedup_boundaries(
+                        self._fetch(half, agent_ids, task_ids, aggregate, retries_left), half, seen
+                    )
+                ]
+
+
+def _dedup_boundaries(
+    results: List[pb.TestResults], chunk: ResultsChunk, seen: Set[Tuple[str, int]]
+) -> Iterator[pb.TestResults]:
+    start = int(chunk.start.timestamp())
+    end = int(chunk.end.timestamp())
+    for result in results:
+        seconds = result.time.seconds
+        if seconds == start or seconds == end:
+            key = (result.test_id, result.time.ToNanoseconds())
+            if key in seen:
+                continue
+            seen.add(key)
+        yield result
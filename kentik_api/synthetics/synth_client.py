@@ -1,12 +1,14 @@
 import logging
-from datetime import datetime
-from typing import Any, List, Optional
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any, Iterator, List, Optional, Sequence
 
 import kentik_api.generated.kentik.synthetics.v202202.synthetics_pb2 as pb
 from kentik_api.public.errors import KentikAPIError
 from kentik_api.public.types import ID, IP
 from kentik_api.synthetics.agent import Agent, AgentOwnershipType
 from kentik_api.synthetics.api_connector_protocol import APISyntheticsConnectorProtocol
+from kentik_api.synthetics.reconcile import PlannedChange, ReconcileReport, TestReconciler, plan_changes
+from kentik_api.synthetics.results_fetcher import ResultsFetcher
 from kentik_api.synthetics.synth_tests import (
     AgentTest,
     DNSGridTest,
@@ -23,8 +25,12 @@ from kentik_api.synthetics.synth_tests import (
     UrlTest,
 )
 from kentik_api.synthetics.synth_tests.base import DateTime
+from kentik_api.synthetics.synth_tests.results import results_data_frame
 from kentik_api.synthetics.types import TestStatus, TestType
 
+if TYPE_CHECKING:
+    from kentik_api.synthetics.synth_tests.trace_graph import TraceGraph
+
 log = logging.getLogger("synth_tests")
 
 
@@ -79,6 +85,24 @@ class KentikSynthClient:
     def set_test_status(self, test_id: ID, status: TestStatus) -> None:
         self._connector.test_status_update(str(test_id), status.value)
 
+    def plan_tests_reconcile(self, desired: Sequence[SynTest], delete_missing: bool = False) -> List[PlannedChange]:
+        """Return changes needed to bring existing tests to the desired state (see reconcile.plan_changes)"""
+        return plan_changes(desired, self.get_all_tests(), delete_missing)
+
+    def reconcile_tests(
+        self, desired: Sequence[SynTest], delete_missing: bool = False, max_workers: int = 8
+    ) -> ReconcileReport:
+        """
+        Bring existing tests to the desired state, issuing only necessary create/update/delete/set_test_status calls,
+        with at most max_workers calls in flight. Returns outcome for every test which needed a change.
+        delete_missing - delete existing tests not present in desired
+        """
+        changes = self.plan_tests_reconcile(desired, delete_missing)
+        reconciler = TestReconciler(
+            self.create_test, self.update_test, self.delete_test, self.set_test_status, max_workers
+        )
+        return reconciler.apply(changes)
+
     def results_for_tests(
         self,
         test_ids: List[ID],
@@ -88,10 +112,89 @@ class KentikSynthClient:
         task_ids: Optional[List[ID]] = None,
         aggregate: bool = False,
     ) -> List[TestResults]:
+        response = self._get_results(test_ids, start, end, agent_ids, task_ids, aggregate)
+        return [TestResults.from_pb(tr) for tr in response.results]
+
+    def results_for_tests_df(
+        self,
+        test_ids: List[ID],
+        start: datetime,
+        end: datetime,
+        agent_ids: Optional[List[ID]] = None,
+        task_ids: Optional[List[ID]] = None,
+        aggregate: bool = False,
+        window: Optional[timedelta] = None,
+        batch_size: int = 50,
+        max_workers: int = 4,
+        chunk_timeout: Optional[float] = None,
+    ) -> Any:
+        """
+        Same as results_for_tests, but returns pandas DataFrame with one row per test, agent, task and time
+        (see results_data_frame for columns). The response is flattened without building TestResults objects,
+        which is considerably faster and uses less memory for large result sets. Requires pandas.
+        window - if provided, results are fetched in chunks (see iter_results_for_tests)
+        chunk_timeout - maximum duration of fetching one chunk in seconds (see iter_results_for_tests)
+        """
+        if window is None:
+            response = self._get_results(test_ids, start, end, agent_ids, task_ids, aggregate)
+            return results_data_frame(response.results)
+        fetcher = ResultsFetcher(self._connector, window, batch_size, max_workers, timeout=chunk_timeout)
+        return results_data_frame(
+            fetcher.iter_pb(
+                [str(i) for i in test_ids],
+                start,
+                end,
+                [str(i) for i in agent_ids or []],
+                [str(i) for i in task_ids or []],
+                aggregate,
+            )
+        )
+
+    def iter_results_for_tests(
+        self,
+        test_ids: List[ID],
+        start: datetime,
+        end: datetime,
+        agent_ids: Optional[List[ID]] = None,
+        task_ids: Optional[List[ID]] = None,
+        aggregate: bool = False,
+        window: timedelta = timedelta(hours=6),
+        batch_size: int = 50,
+        max_workers: int = 4,
+        chunk_timeout: Optional[float] = None,
+    ) -> Iterator[TestResults]:
+        """
+        Fetch results over long time ranges and/or for many tests without hitting gRPC message size limit.
+        The request is split into time windows of "window" size and batches of "batch_size" tests which are fetched
+        concurrently by "max_workers" threads. Results are yielded ordered by window as soon as they are available.
+        Failing chunks are retried individually (see ResultsFetcher).
+        chunk_timeout - maximum duration of fetching one chunk in seconds; chunks timing out are retried and then
+                        split into smaller time windows. None means no limit.
+        """
+        fetcher = ResultsFetcher(self._connector, window, batch_size, max_workers, timeout=chunk_timeout)
+        for result in fetcher.iter_pb(
+            [str(i) for i in test_ids],
+            start,
+            end,
+            [str(i) for i in agent_ids or []],
+            [str(i) for i in task_ids or []],
+            aggregate,
+        ):
+            yield TestResults.from_pb(result)
+
+    def _get_results(
+        self,
+        test_ids: List[ID],
+        start: datetime,
+        end: datetime,
+        agent_ids: Optional[List[ID]],
+        task_ids: Optional[List[ID]],
+        aggregate: bool,
+    ) -> pb.GetResultsForTestsResponse:
         ids = [str(id) for id in test_ids]
         agents = [str(id) for id in agent_ids] if agent_ids else []
         tasks = [str(id) for id in task_ids] if task_ids else []
-        response = self._connector.results_for_tests(
+        return self._connector.results_for_tests(
             test_ids=ids,
             start=DateTime.fromtimestamp(start.timestamp(), start.tzinfo).to_pb(),
             end=DateTime.fromtimestamp(end.timestamp(), end.tzinfo).to_pb(),
@@ -99,7 +202,6 @@ class KentikSynthClient:
             task_ids=tasks,
             aggregate=aggregate,
         )
-        return [TestResults.from_pb(tr) for tr in response.results]
 
     def trace_for_test(
         self,
@@ -120,6 +222,32 @@ class KentikSynthClient:
         )
         return TraceResponse.from_pb(response)
 
+    def trace_graph_for_test(
+        self,
+        test_id: ID,
+        start: datetime,
+        end: datetime,
+        agent_ids: Optional[List[ID]] = None,
+        target_ips: Optional[List[IP]] = None,
+    ) -> "TraceGraph":
+        """
+        Same as trace_for_test, but returns compact TraceGraph (see synth_tests.trace_graph) built directly from
+        the response, which is preferable for analysing large numbers of traces. Requires numpy.
+        """
+        # pylint: disable-next=import-outside-toplevel,redefined-outer-name
+        from kentik_api.synthetics.synth_tests.trace_graph import TraceGraph
+
+        agents = [str(id) for id in agent_ids] if agent_ids else []
+        targets = [str(ip) for ip in target_ips] if target_ips else []
+        response = self._connector.trace_for_test(
+            test_id=str(test_id),
+            start=DateTime.fromtimestamp(start.timestamp(), start.tzinfo).to_pb(),
+            end=DateTime.fromtimestamp(end.timestamp(), end.tzinfo).to_pb(),
+            agent_ids=agents,
+            target_ips=targets,
+        )
+        return TraceGraph.from_pb(response)
+
 
 def make_synth_test(pb_object: pb.Test) -> SynTest:
     def _cls_from_type(test_type: TestType) -> Any:
@@ -1,5 +1,4 @@
 import logging
-from copy import deepcopy
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from ipaddress import ip_address
@@ -145,6 +144,17 @@ class HealthSettings(_ConfigElement):
 SynTestSettingsT = TypeVar("SynTestSettingsT", bound="SynTestSettings")
 
 
+class _TasksOverride:
+    """Read-only view of protobuf TestSettings with replaced list of tasks (avoids copying the message)"""
+
+    def __init__(self, obj: Any, tasks: List[str]) -> None:
+        self._obj = obj
+        self.tasks = tasks
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._obj, name)
+
+
 @dataclass
 class SynTestSettings(_ConfigElement):
     PB_TYPE = pb.TestSettings
@@ -156,27 +166,19 @@ class SynTestSettings(_ConfigElement):
     health_settings: HealthSettings = field(default_factory=HealthSettings)
     notification_channels: List[str] = field(default_factory=list)
 
+    IGNORED_TASK_TYPES = ["bgp-monitor"]
+    LEGACY_TASK_TYPES = {"knock": "ping"}
+
     @classmethod
     def from_pb(cls: Type[SynTestSettingsT], obj: Any) -> SynTestSettingsT:
         """Tweak inherited "from_pb" method to handle ignored and legacy task types"""
 
-        IGNORED_TASK_TYPES = ["bgp-monitor"]
-        LEGACY_TASK_TYPES = {"knock": "ping"}
-
-        obj = deepcopy(obj)
-
-        # remove ignored task types
-        for ignored in IGNORED_TASK_TYPES:
-            while ignored in obj.tasks:
-                obj.tasks.remove(ignored)
-
-        # replace legacy task types
-        for legacy, replacement in LEGACY_TASK_TYPES.items():
-            while legacy in obj.tasks:
-                obj.tasks.remove(legacy)
-                obj.tasks.append(replacement)
-
-        return super().from_pb(obj)
+        tasks = [t for t in obj.tasks if t not in cls.IGNORED_TASK_TYPES and t not in cls.LEGACY_TASK_TYPES]
+        if len(tasks) == len(obj.tasks):
+            return super().from_pb(obj)
+        # replacements of legacy task types go to the end of the list
+        tasks.extend(cls.LEGACY_TASK_TYPES[t] for t in obj.tasks if t in cls.LEGACY_TASK_TYPES)
+        return super().from_pb(_TasksOverride(obj, tasks))
 
 
 @dataclass
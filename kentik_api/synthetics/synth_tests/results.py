@@ -1,6 +1,6 @@
 from dataclasses import dataclass, field
 from datetime import timezone
-from typing import List, Type, TypeVar, Union
+from typing import Any, Dict, Iterable, List, Type, TypeVar, Union
 
 import kentik_api.generated.kentik.synthetics.v202202.synthetics_pb2 as pb
 from kentik_api.public.errors import DeserializationError
@@ -130,3 +130,123 @@ class TestResults(_ConfigElement):
     time: DateTime = DateTime.fromtimestamp(0, tz=timezone.utc)
     health: Health = Health.NONE
     agents: List[AgentResults] = field(default_factory=list)
+
+
+RESULTS_COLUMNS = [
+    "time",
+    "test_id",
+    "test_health",
+    "agent_id",
+    "agent_health",
+    "task_type",
+    "task_health",
+    "target",
+    "dst_ip",
+    "dns_server",
+    "latency_current",
+    "latency_rolling_avg",
+    "latency_rolling_stddev",
+    "latency_health",
+    "jitter_current",
+    "jitter_rolling_avg",
+    "jitter_rolling_stddev",
+    "jitter_health",
+    "packet_loss_current",
+    "packet_loss_health",
+    "response_status",
+    "response_size",
+]
+_CATEGORICAL_COLUMNS = [c for c in RESULTS_COLUMNS if c.endswith("health")] + ["task_type"]
+
+
+def results_columns(src: Iterable[pb.TestResults]) -> Dict[str, List[Any]]:
+    """
+    Flatten protobuf test results into columns (see RESULTS_COLUMNS) with one row per task result.
+    Metrics not applicable to given task type (e.g. jitter for HTTP tasks) are None.
+    "time" contains nanoseconds since epoch.
+    """
+    columns: Dict[str, List[Any]] = {name: [] for name in RESULTS_COLUMNS}
+    # column lists are bound to local variables to avoid dictionary lookups in the loop
+    time, test_id, test_health, agent_id, agent_health = (
+        columns[c] for c in ["time", "test_id", "test_health", "agent_id", "agent_health"]
+    )
+    task_type, task_health, target, dst_ip, dns_server = (
+        columns[c] for c in ["task_type", "task_health", "target", "dst_ip", "dns_server"]
+    )
+    lat_cur, lat_avg, lat_std, lat_health = (
+        columns[c] for c in ["latency_current", "latency_rolling_avg", "latency_rolling_stddev", "latency_health"]
+    )
+    jit_cur, jit_avg, jit_std, jit_health = (
+        columns[c] for c in ["jitter_current", "jitter_rolling_avg", "jitter_rolling_stddev", "jitter_health"]
+    )
+    loss_cur, loss_health, resp_status, resp_size = (
+        columns[c] for c in ["packet_loss_current", "packet_loss_health", "response_status", "response_size"]
+    )
+
+    for test in src:
+        ts = test.time.seconds * 1_000_000_000 + test.time.nanos
+        for agent in test.agents:
+            for task in agent.tasks:
+                kind = task.WhichOneof("task_type")
+                if kind == "ping":
+                    data = task.ping
+                    jitter, loss = data.jitter, data.packet_loss
+                    jit_cur.append(jitter.current)
+                    jit_avg.append(jitter.rolling_avg)
+                    jit_std.append(jitter.rolling_stddev)
+                    jit_health.append(jitter.health)
+                    loss_cur.append(loss.current)
+                    loss_health.append(loss.health)
+                    resp_status.append(None)
+                    resp_size.append(None)
+                    dst_ip.append(data.dst_ip)
+                    dns_server.append(None)
+                else:
+                    if kind == "http":
+                        data = task.http
+                        resp_size.append(data.response.size)
+                        dst_ip.append(data.dst_ip)
+                        dns_server.append(None)
+                    elif kind == "dns":
+                        data = task.dns
+                        resp_size.append(None)
+                        dst_ip.append(None)
+                        dns_server.append(data.server)
+                    else:
+                        raise DeserializationError(
+                            TaskResults.__name__, "none of ping/http/dns fields found in source protobuf object"
+                        )
+                    resp_status.append(data.response.status)
+                    for column in (jit_cur, jit_avg, jit_std, jit_health, loss_cur, loss_health):
+                        column.append(None)
+                latency = data.latency
+                lat_cur.append(latency.current)
+                lat_avg.append(latency.rolling_avg)
+                lat_std.append(latency.rolling_stddev)
+                lat_health.append(latency.health)
+                target.append(data.target)
+                task_type.append(kind)
+                task_health.append(task.health)
+                time.append(ts)
+                test_id.append(test.test_id)
+                test_health.append(test.health)
+                agent_id.append(agent.agent_id)
+                agent_health.append(agent.health)
+    return columns
+
+
+def results_data_frame(src: Iterable[pb.TestResults]) -> Any:
+    """
+    Flatten protobuf test results into pandas DataFrame with columns RESULTS_COLUMNS (see results_columns).
+    "time" column is converted to timezone aware (UTC) datetime, health and task type columns are categorical.
+    """
+    try:
+        import pandas as pd  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        raise RuntimeError("Conversion of results to DataFrame requires 'pandas'")
+
+    df = pd.DataFrame(results_columns(src), columns=RESULTS_COLUMNS)
+    df["time"] = pd.to_datetime(df["time"], unit="ns", utc=True)
+    for column in _CATEGORICAL_COLUMNS:
+        df[column] = df[column].astype("category")
+    return df
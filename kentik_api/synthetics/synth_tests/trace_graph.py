@@ -0,0 +1,203 @@
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+import kentik_api.generated.kentik.synthetics.v202202.synthetics_pb2 as pb
+from kentik_api.synthetics.synth_tests.traces import TraceResponse
+
+try:
+    import numpy as np
+except ImportError:
+    raise RuntimeError("TraceGraph requires 'numpy' (install kentik-api[analytics])")
+
+NO_NODE = -1  # hop matrix value for missing hops (padding, or hops without node_id)
+
+
+class NodeLatency(NamedTuple):
+    """Latency statistics per node; arrays are indexed by node index (see TraceGraph.node_ids)"""
+
+    count: Any  # number of hops via the node
+    mean: Any
+    min: Any
+    max: Any
+
+
+class PathChange(NamedTuple):
+    agent_id: str
+    target_ip: str
+    time: datetime  # time of the first path with changed route
+    previous: int  # index of the last path with previous route
+    current: int  # index of the path with changed route
+
+
+@dataclass
+class TraceGraph:
+    """
+    Compact, array-backed representation of trace_for_test results.
+    Nodes are interned into a table (node_ids, node_asn) and referred to by index. Traces of all paths are stored
+    in padded matrices with one row per trace:
+      hops[trace, hop] - node index or NO_NODE
+      latency[trace, hop] - hop latency (0 for missing hops)
+      as_paths[trace, i] - AS path (NO_NODE padded)
+    trace_path[trace] maps traces to paths, which are described by path_agent, path_target and path_time.
+    node_table maps node_id to node index (built from node_ids if not provided).
+    """
+
+    node_ids: List[str]
+    node_asn: Any
+    path_agent: List[str]
+    path_target: List[str]
+    path_time: Any  # datetime64[ns], UTC
+    trace_path: Any
+    trace_complete: Any
+    hop_count: Any  # number of hops of each trace
+    hops: Any
+    latency: Any
+    as_paths: Any
+    node_table: Dict[str, int] = field(default_factory=dict, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if len(self.node_table) != len(self.node_ids):
+            self.node_table = {node_id: i for i, node_id in enumerate(self.node_ids)}
+
+    @classmethod
+    def from_pb(cls, src: pb.GetTraceForTestResponse) -> "TraceGraph":
+        return cls._build(src.nodes, src.paths, lambda p: p.time.seconds * 1_000_000_000 + p.time.nanos)
+
+    @classmethod
+    def from_response(cls, src: TraceResponse) -> "TraceGraph":
+        return cls._build(src.nodes, src.paths, lambda p: round(p.time.timestamp() * 1_000_000) * 1000)
+
+    @classmethod
+    def _build(cls, nodes: Dict[str, Any], paths: Iterable[Any], time_ns: Callable[[Any], int]) -> "TraceGraph":
+        node_ids = list(nodes)
+        index = {node_id: i for i, node_id in enumerate(node_ids)}
+        node_asn = [nodes[node_id].asn for node_id in node_ids]
+        path_agent: List[str] = []
+        path_target: List[str] = []
+        path_time: List[int] = []
+        trace_path: List[int] = []
+        trace_complete: List[bool] = []
+        trace_hops: List[List[int]] = []
+        trace_latency: List[List[int]] = []
+        trace_as_paths: List[List[int]] = []
+        for path_index, path in enumerate(paths):
+            path_agent.append(str(path.agent_id))
+            path_target.append(str(path.target_ip))
+            path_time.append(time_ns(path))
+            for trace in path.traces:
+                hops = []
+                for hop in trace.hops:
+                    node = index.get(hop.node_id)
+                    if node is None and hop.node_id:
+                        # hop referring to node missing in the node table
+                        node = index[hop.node_id] = len(node_ids)
+                        node_ids.append(hop.node_id)
+                        node_asn.append(0)
+                    hops.append(NO_NODE if node is None else node)
+                trace_path.append(path_index)
+                trace_complete.append(trace.is_complete)
+                trace_hops.append(hops)
+                trace_latency.append([hop.latency for hop in trace.hops])
+                trace_as_paths.append(list(trace.as_path))
+        return cls(
+            node_ids=node_ids,
+            node_asn=np.array(node_asn, dtype=np.int64),
+            path_agent=path_agent,
+            path_target=path_target,
+            path_time=np.array(path_time, dtype="datetime64[ns]"),
+            trace_path=np.array(trace_path, dtype=np.int32),
+            trace_complete=np.array(trace_complete, dtype=bool),
+            hop_count=np.array([len(h) for h in trace_hops], dtype=np.int32),
+            hops=_padded(trace_hops, NO_NODE, np.int32),
+            latency=_padded(trace_latency, 0, np.int64),
+            as_paths=_padded(trace_as_paths, NO_NODE, np.int64),
+            node_table=index,
+        )
+
+    @property
+    def path_count(self) -> int:
+        return len(self.path_agent)
+
+    @property
+    def trace_count(self) -> int:
+        return len(self.trace_path)
+
+    def node_index(self, node_id: str) -> int:
+        return self.node_table[node_id]
+
+    def path_traces(self, path: int) -> Any:
+        """Indices of traces of given path"""
+        return np.flatnonzero(self.trace_path == path)
+
+    def node_latency(self) -> NodeLatency:
+        """Hop latency statistics for every node, computed over all traces"""
+        valid = self.hops != NO_NODE
+        nodes = self.hops[valid]
+        latency = self.latency[valid]
+        size = len(self.node_ids)
+        count = np.bincount(nodes, minlength=size)
+        total = np.bincount(nodes, weights=latency, minlength=size)
+        lat_min: Any = np.full(size, np.iinfo(np.int64).max, dtype=np.int64)
+        lat_max: Any = np.full(size, np.iinfo(np.int64).min, dtype=np.int64)
+        np.minimum.at(lat_min, nodes, latency)
+        np.maximum.at(lat_max, nodes, latency)
+        seen = count > 0
+        mean = np.divide(total, count, out=np.full(size, np.nan), where=seen)
+        return NodeLatency(
+            count=count,
+            mean=mean,
+            min=np.where(seen, lat_min, 0),
+            max=np.where(seen, lat_max, 0),
+        )
+
+    def route_ids(self, by: str = "hops") -> Any:
+        """
+        Identifier of the route of every trace; traces with identical sequence of nodes ("hops") or AS path
+        ("as_path") share the identifier
+        """
+        matrix = self._route_matrix(by)
+        if matrix.shape[0] == 0:
+            return np.zeros(0, dtype=np.int64)
+        _, inverse = np.unique(matrix, axis=0, return_inverse=True)
+        return inverse.reshape(-1)
+
+    def path_changes(self, by: str = "hops", agent_id: Optional[str] = None) -> List[PathChange]:
+        """
+        Detect changes of route between consecutive (in time) paths from the same agent to the same target.
+        Route of a path is the set of routes of its traces (see route_ids).
+        """
+        routes = self.route_ids(by)
+        order = np.argsort(self.trace_path, kind="stable")
+        bounds: Any = np.searchsorted(self.trace_path[order], np.arange(self.path_count + 1)).tolist()
+        sorted_routes = routes[order].tolist()
+        signatures = [frozenset(sorted_routes[bounds[p] : bounds[p + 1]]) for p in range(self.path_count)]
+        series: Dict[Tuple[str, str], List[int]] = {}
+        for p in np.argsort(self.path_time, kind="stable").tolist():
+            if agent_id is None or self.path_agent[p] == agent_id:
+                series.setdefault((self.path_agent[p], self.path_target[p]), []).append(p)
+        changes = []
+        for (agent, target), indices in series.items():
+            for previous, current in zip(indices, indices[1:]):
+                if signatures[previous] != signatures[current]:
+                    changes.append(PathChange(agent, target, _to_datetime(self.path_time[current]), previous, current))
+        return sorted(changes, key=lambda c: c.time)
+
+    def _route_matrix(self, by: str) -> Any:
+        if by == "hops":
+            return self.hops
+        if by == "as_path":
+            return self.as_paths
+        raise ValueError(f"Unsupported route type: {by} (supported: hops, as_path)")
+
+
+def _padded(rows: List[List[int]], fill: int, dtype: Any) -> Any:
+    width = max((len(r) for r in rows), default=0)
+    out = np.full((len(rows), width), fill, dtype=dtype)
+    for i, row in enumerate(rows):
+        out[i, : len(row)] = row
+    return out
+
+
+def _to_datetime(t: Any) -> datetime:
+    return datetime.fromtimestamp(int(t.astype(np.int64)) / 1e9, tz=timezone.utc)
@@ -0,0 +1,105 @@
+import asyncio
+from typing import Any, Awaitable, Callable, List
+
+import pytest
+from aiohttp import web
+from urllib3 import Retry
+
+from kentik_api.api_calls import sites
+from kentik_api.api_connection.async_api_connector import AsyncAPIConnector
+from kentik_api.api_resources.sites_api import AsyncSitesAPI
+from kentik_api.auth.auth import AUTH_API_TOKEN_KEY, AUTH_EMAIL_KEY
+from kentik_api.public.errors import KentikAPIError, NotFoundError
+
+DUMMY_AUTH_EMAIL: str = "email@example.com"
+DUMMY_TOKEN: str = "api-test-token"
+NO_BACKOFF_RETRY = Retry(total=3, backoff_factor=0, status_forcelist=[429, 502, 503, 504], allowed_methods=None)
+
+
+async def _with_server(routes: List[web.RouteDef], test: Callable[[str], Awaitable[Any]]) -> Any:
+    app = web.Application()
+    app.add_routes(routes)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]  # type: ignore
+    try:
+        return await test(f"http://127.0.0.1:{port}/api/v5")
+    finally:
+        await runner.cleanup()
+
+
+def test_async_get_all_sites() -> None:
+    # given
+    received_headers = []
+
+    async def get_sites(request: web.Request) -> web.Response:
+        received_headers.append(request.headers)
+        return web.Response(text='{"sites": [{"id": 42, "site_name": "site-1", "company_id": 3250}]}')
+
+    async def test(url: str) -> Any:
+        async with AsyncAPIConnector(url, DUMMY_AUTH_EMAIL, DUMMY_TOKEN) as connector:
+            return await AsyncSitesAPI(connector).get_all()
+
+    # when
+    result = asyncio.run(_with_server([web.get("/api/v5/sites", get_sites)], test))
+
+    # then
+    assert len(result) == 1
+    assert result[0].site_name == "site-1"
+    assert received_headers[0][AUTH_EMAIL_KEY] == DUMMY_AUTH_EMAIL
+    assert received_headers[0][AUTH_API_TOKEN_KEY] == DUMMY_TOKEN
+    assert "kentik_community_sdk_python/" in received_headers[0]["User-Agent"]
+
+
+def test_async_retry_on_unavailable() -> None:
+    # given
+    responses = [503, 503, 200]
+
+    async def get_sites(_: web.Request) -> web.Response:
+        return web.Response(status=responses.pop(0), text='{"sites": []}')
+
+    async def test(url: str) -> Any:
+        async with AsyncAPIConnector(url, DUMMY_AUTH_EMAIL, DUMMY_TOKEN, retry_strategy=NO_BACKOFF_RETRY) as c:
+            return await c.send(sites.get_sites())
+
+    # when
+    response = asyncio.run(_with_server([web.get("/api/v5/sites", get_sites)], test))
+
+    # then
+    assert response.http_status_code == 200
+    assert not responses
+
+
+def test_async_retries_exhausted() -> None:
+    # given
+    calls = []
+
+    async def get_sites(_: web.Request) -> web.Response:
+        calls.append(1)
+        return web.Response(status=429, text="slow down")
+
+    async def test(url: str) -> Any:
+        async with AsyncAPIConnector(url, DUMMY_AUTH_EMAIL, DUMMY_TOKEN, retry_strategy=NO_BACKOFF_RETRY) as c:
+            return await c.send(sites.get_sites())
+
+    # when - then
+    with pytest.raises(KentikAPIError):
+        asyncio.run(_with_server([web.get("/api/v5/sites", get_sites)], test))
+    assert len(calls) == 4  # initial request + 3 retries
+
+
+def test_async_error_mapping() -> None:
+    # given
+    async def get_site(_: web.Request) -> web.Response:
+        return web.Response(status=404, text="no such site")
+
+    async def test(url: str) -> Any:
+        async with AsyncAPIConnector(url, DUMMY_AUTH_EMAIL, DUMMY_TOKEN, retry_strategy=NO_BACKOFF_RETRY) as c:
+            return await c.send(sites.get_site_info(42))
+
+    # when - then
+    with pytest.raises(NotFoundError) as exc_info:
+        asyncio.run(_with_server([web.get("/api/v5/site/42", get_site)], test))
+    assert exc_info.value.status_code == 404
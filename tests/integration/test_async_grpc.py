@@ -0,0 +1,131 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Iterator, List
+
+import grpc
+import pytest
+
+import kentik_api.generated.kentik.cloud_export.v202101beta1.cloud_export_pb2 as ce_pb
+import kentik_api.generated.kentik.synthetics.v202202.synthetics_pb2 as pb
+from kentik_api.api_connection.grpc_channel import GRPCChannelConfig
+from kentik_api.api_connection.instrumentation import CallEvent, Instrumentation
+from kentik_api.cloudexport.async_api_connector import AsyncAPICloudExportConnector
+from kentik_api.cloudexport.async_client import AsyncKentikCloudExportClient
+from kentik_api.generated.kentik.cloud_export.v202101beta1.cloud_export_pb2_grpc import (
+    CloudExportAdminServiceServicer,
+    add_CloudExportAdminServiceServicer_to_server,
+)
+from kentik_api.generated.kentik.synthetics.v202202.synthetics_pb2_grpc import (
+    SyntheticsAdminServiceServicer,
+    add_SyntheticsAdminServiceServicer_to_server,
+)
+from kentik_api.public.errors import NotFoundError
+from kentik_api.synthetics.async_api_connector import AsyncAPISyntheticsConnector
+from kentik_api.synthetics.async_synth_client import AsyncKentikSynthClient
+
+DUMMY_AUTH_EMAIL: str = "email@example.com"
+DUMMY_TOKEN: str = "api-test-token"
+CONCURRENT_CALLS = 8
+
+
+class _AdminService(SyntheticsAdminServiceServicer):
+    def __init__(self) -> None:
+        self.peers: List[str] = []
+        # all concurrent calls must arrive before any of them is answered
+        self.barrier = threading.Barrier(CONCURRENT_CALLS, timeout=5)
+
+    def ListAgents(self, request: pb.ListAgentsRequest, context: grpc.ServicerContext) -> pb.ListAgentsResponse:
+        self.peers.append(context.peer())
+        self.barrier.wait()
+        return pb.ListAgentsResponse(agents=[pb.Agent(id="1", site_name="test")])
+
+    def GetAgent(self, request: pb.GetAgentRequest, context: grpc.ServicerContext) -> pb.GetAgentResponse:
+        context.abort(grpc.StatusCode.NOT_FOUND, f"agent {request.id} not found")
+
+
+class _CloudExportService(CloudExportAdminServiceServicer):
+    def GetCloudExport(
+        self, request: ce_pb.GetCloudExportRequest, context: grpc.ServicerContext
+    ) -> ce_pb.GetCloudExportResponse:
+        return ce_pb.GetCloudExportResponse(
+            export=ce_pb.CloudExport(id=request.id, name="export", cloud_provider="aws")
+        )
+
+
+@pytest.fixture
+def service() -> Iterator[Any]:
+    admin = _AdminService()
+    server = grpc.server(ThreadPoolExecutor(max_workers=CONCURRENT_CALLS + 2))
+    add_SyntheticsAdminServiceServicer_to_server(admin, server)
+    add_CloudExportAdminServiceServicer_to_server(_CloudExportService(), server)
+    port = server.add_insecure_port("127.0.0.1:0")
+    server.start()
+    admin.target = f"127.0.0.1:{port}"  # type: ignore
+    yield admin
+    server.stop(None)
+
+
+def test_concurrent_calls_over_one_channel(service: Any) -> None:
+    # given
+    events: List[CallEvent] = []
+    connector = AsyncAPISyntheticsConnector(
+        service.target,
+        DUMMY_AUTH_EMAIL,
+        DUMMY_TOKEN,
+        instrumentation=Instrumentation([events.append]),
+        channel_config=GRPCChannelConfig(insecure=True),
+    )
+    client = AsyncKentikSynthClient(connector)
+
+    async def run() -> List[Any]:
+        try:
+            return await asyncio.gather(*(client.get_all_agents() for _ in range(CONCURRENT_CALLS)))
+        finally:
+            await connector.close()
+
+    # when
+    results = asyncio.run(run())
+
+    # then
+    assert [agents[0].site_name for agents in results] == ["test"] * CONCURRENT_CALLS
+    assert len(set(service.peers)) == 1
+    assert [e.status for e in events] == ["OK"] * CONCURRENT_CALLS
+
+
+def test_errors_mapped(service: Any) -> None:
+    # given
+    connector = AsyncAPISyntheticsConnector(
+        service.target, DUMMY_AUTH_EMAIL, DUMMY_TOKEN, channel_config=GRPCChannelConfig(insecure=True)
+    )
+    client = AsyncKentikSynthClient(connector)
+
+    async def run() -> None:
+        try:
+            await client.get_agent("42")
+        finally:
+            await connector.close()
+
+    # when - then
+    with pytest.raises(NotFoundError):
+        asyncio.run(run())
+
+
+def test_cloud_export_client(service: Any) -> None:
+    # given
+    connector = AsyncAPICloudExportConnector(
+        service.target, DUMMY_AUTH_EMAIL, DUMMY_TOKEN, channel_config=GRPCChannelConfig(insecure=True)
+    )
+    client = AsyncKentikCloudExportClient(connector)
+
+    async def run() -> Any:
+        try:
+            return await client.get("7")
+        finally:
+            await connector.close()
+
+    # when
+    export = asyncio.run(run())
+
+    # then
+    assert (export.id, export.name) == ("7", "export")
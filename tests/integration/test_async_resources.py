@@ -0,0 +1,47 @@
+import asyncio
+import itertools
+from http import HTTPStatus
+from typing import Any, List, Type
+
+import pytest
+from aiohttp import web
+from urllib3 import Retry
+
+from kentik_api.api_connection.async_api_connector import AsyncAPIConnector
+from kentik_api.public.errors import AuthError, BadRequestError, KentikAPIError, NotFoundError, ProtocolError
+from tests.integration.test_async_api_connector import DUMMY_AUTH_EMAIL, DUMMY_TOKEN, _with_server
+from tests.unit.api_resources.test_async_resources import CASES, _Case
+
+NO_RETRY = Retry(total=0, allowed_methods=None)
+ERRORS = [
+    (HTTPStatus.BAD_REQUEST, BadRequestError),
+    (HTTPStatus.UNAUTHORIZED, AuthError),
+    (HTTPStatus.FORBIDDEN, AuthError),
+    (HTTPStatus.NOT_FOUND, NotFoundError),
+    (HTTPStatus.INTERNAL_SERVER_ERROR, ProtocolError),
+]
+# every async resource family with one of the error responses
+ERROR_CASES = [(name, case, *error) for (name, case), error in zip(CASES.items(), itertools.cycle(ERRORS))]
+
+
+@pytest.mark.parametrize(
+    "case, status, expected", [c[1:] for c in ERROR_CASES], ids=[f"{c[0]}-{c[2].value}" for c in ERROR_CASES]
+)
+def test_async_api_error_mapping(case: _Case, status: HTTPStatus, expected: Type[KentikAPIError]) -> None:
+    # given
+    paths: List[str] = []
+
+    async def handler(request: web.Request) -> web.Response:
+        paths.append(request.path)
+        return web.Response(status=status, text="error message")
+
+    async def test(url: str) -> Any:
+        async with AsyncAPIConnector(url, DUMMY_AUTH_EMAIL, DUMMY_TOKEN, retry_strategy=NO_RETRY) as connector:
+            return await case.call(case.async_api(connector))
+
+    # when - then
+    with pytest.raises(expected) as exc_info:
+        asyncio.run(_with_server([web.route("*", "/{tail:.*}", handler)], test))
+    assert type(exc_info.value) is expected  # pylint: disable=unidiomatic-typecheck
+    assert isinstance(exc_info.value, ProtocolError) and exc_info.value.status_code == status
+    assert len(paths) == 1
@@ -0,0 +1,81 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Iterator, List, Set
+
+import grpc
+import pytest
+
+import kentik_api.generated.kentik.synthetics.v202202.synthetics_pb2 as pb
+from kentik_api.api_connection.grpc_channel import GRPCChannelConfig
+from kentik_api.generated.kentik.synthetics.v202202.synthetics_pb2_grpc import (
+    SyntheticsAdminServiceServicer,
+    add_SyntheticsAdminServiceServicer_to_server,
+)
+from kentik_api.synthetics.api_connector import APISyntheticsConnector
+
+DUMMY_AUTH_EMAIL: str = "email@example.com"
+DUMMY_TOKEN: str = "api-test-token"
+
+
+class _AdminService(SyntheticsAdminServiceServicer):
+    def __init__(self) -> None:
+        self.peers: List[str] = []
+        self.metadata: List[Any] = []
+
+    def ListAgents(self, request: pb.ListAgentsRequest, context: grpc.ServicerContext) -> pb.ListAgentsResponse:
+        self.peers.append(context.peer())
+        self.metadata.append(dict(context.invocation_metadata()))
+        return pb.ListAgentsResponse(agents=[pb.Agent(id="1", site_name="test")])
+
+
+@pytest.fixture
+def service() -> Iterator[Any]:
+    admin = _AdminService()
+    server = grpc.server(ThreadPoolExecutor(max_workers=4))
+    add_SyntheticsAdminServiceServicer_to_server(admin, server)
+    port = server.add_insecure_port("127.0.0.1:0")
+    server.start()
+    admin.target = f"127.0.0.1:{port}"  # type: ignore
+    yield admin
+    server.stop(None)
+
+
+def test_channel_reused_across_calls(service: Any) -> None:
+    # given
+    config = GRPCChannelConfig(insecure=True, compression="gzip")
+    connector = APISyntheticsConnector(service.target, DUMMY_AUTH_EMAIL, DUMMY_TOKEN, channel_config=config)
+
+    # when
+    agents = [connector.get_all_agents() for _ in range(3)]
+    connector.close()
+
+    # then
+    assert [a[0].site_name for a in agents] == ["test"] * 3
+    assert len(set(service.peers)) == 1  # all calls over the same connection
+    assert service.metadata[0]["x-ch-auth-email"] == DUMMY_AUTH_EMAIL
+
+
+def test_calls_distributed_over_pool(service: Any) -> None:
+    # given
+    config = GRPCChannelConfig(insecure=True, pool_size=2)
+    connector = APISyntheticsConnector(service.target, DUMMY_AUTH_EMAIL, DUMMY_TOKEN, channel_config=config)
+
+    # when
+    for _ in range(4):
+        connector.get_all_agents()
+    connector.close()
+
+    # then
+    peers: Set[str] = set(service.peers)
+    assert len(peers) == 2
+
+
+def test_closed_connector_rejects_calls(service: Any) -> None:
+    # given
+    connector = APISyntheticsConnector(
+        service.target, DUMMY_AUTH_EMAIL, DUMMY_TOKEN, channel_config=GRPCChannelConfig(insecure=True)
+    )
+    connector.close()
+
+    # when - then
+    with pytest.raises(RuntimeError):
+        connector.get_all_agents()
@@ -0,0 +1,103 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Iterator
+
+import pytest
+
+from kentik_api.api_calls import sites
+from kentik_api.api_connection.api_connector import APIConnector
+from kentik_api.api_connection.http_pool import HTTPPoolConfig
+
+DUMMY_AUTH_EMAIL: str = "email@example.com"
+DUMMY_TOKEN: str = "api-test-token"
+SITES_BODY = b'{"sites": []}'
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep connections open
+    barrier: Any = None
+
+    def do_GET(self) -> None:
+        if self.barrier is not None:
+            self.barrier.wait(timeout=5)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(SITES_BODY)))
+        self.end_headers()
+        self.wfile.write(SITES_BODY)
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+
+@pytest.fixture
+def server() -> Iterator[Callable[[Any], str]]:
+    servers = []
+
+    def start(barrier: Any = None) -> str:
+        handler = type("Handler", (_Handler,), {"barrier": barrier})
+        srv = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        srv.daemon_threads = True
+        threading.Thread(target=srv.serve_forever, daemon=True).start()
+        servers.append(srv)
+        return f"http://127.0.0.1:{srv.server_address[1]}/api/v5"
+
+    yield start
+    for srv in servers:
+        srv.shutdown()
+        srv.server_close()
+
+
+def test_connection_reused(server: Callable[[Any], str]) -> None:
+    # given
+    connector = APIConnector(server(None), DUMMY_AUTH_EMAIL, DUMMY_TOKEN)
+
+    # when
+    for _ in range(3):
+        connector.send(sites.get_sites())
+
+    # then
+    stats = connector.pool_stats
+    assert stats.created == 1
+    assert stats.reused == 2
+    assert stats.discarded == 0
+
+
+def test_keep_alive_disabled(server: Callable[[Any], str]) -> None:
+    # given
+    connector = APIConnector(server(None), DUMMY_AUTH_EMAIL, DUMMY_TOKEN, pool_config=HTTPPoolConfig(keep_alive=False))
+
+    # when
+    for _ in range(3):
+        connector.send(sites.get_sites())
+
+    # then
+    assert connector.pool_stats.created == 3
+
+
+def test_connections_discarded_when_pool_too_small(server: Callable[[Any], str]) -> None:
+    # given
+    workers = 4
+    url = server(threading.Barrier(workers))
+    connector = APIConnector(url, DUMMY_AUTH_EMAIL, DUMMY_TOKEN, pool_config=HTTPPoolConfig(pool_maxsize=1))
+
+    # when
+    with ThreadPoolExecutor(workers) as executor:
+        responses = list(executor.map(lambda _: connector.send(sites.get_sites()), range(workers)))
+
+    # then
+    assert all(r.http_status_code == 200 for r in responses)
+    stats = connector.pool_stats
+    assert stats.created == workers
+    assert stats.discarded == workers - 1
+
+
+def test_tcp_keepalive_socket_options() -> None:
+    # when
+    options = HTTPPoolConfig(tcp_keepalive_idle=30).socket_options()
+
+    # then
+    assert options is not None
+    assert any(opt[2] == 30 for opt in options)
+    assert HTTPPoolConfig().socket_options() is None
@@ -0,0 +1,77 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Iterator, List
+
+import pytest
+
+from kentik_api.api_calls import sites
+from kentik_api.api_connection.api_connector import APIConnector
+from kentik_api.api_connection.instrumentation import PROTOCOL_HTTP, CallEvent, Instrumentation
+from kentik_api.api_connection.response_cache import ResponseCache
+from kentik_api.internal.json_codec import get_codec
+from kentik_api.public.errors import NotFoundError
+
+DUMMY_AUTH_EMAIL: str = "email@example.com"
+DUMMY_TOKEN: str = "api-test-token"
+SITES_BODY = b'{"sites": []}'
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        if self.path.endswith("/sites"):
+            self._respond(200, SITES_BODY)
+        else:
+            self._respond(404, b"not found")
+
+    def do_POST(self) -> None:
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self._respond(201, b'{"site": {"id": 1}}')
+
+    def _respond(self, status: int, body: bytes) -> None:
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+
+@pytest.fixture
+def api_url() -> Iterator[str]:
+    srv = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    srv.daemon_threads = True
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{srv.server_address[1]}/api/v5"
+    srv.shutdown()
+    srv.server_close()
+
+
+def test_http_calls_reported(api_url: str) -> None:
+    # given
+    received: List[CallEvent] = []
+    instrumentation = Instrumentation([received.append])
+    connector = APIConnector(
+        api_url, DUMMY_AUTH_EMAIL, DUMMY_TOKEN, response_cache=ResponseCache(), instrumentation=instrumentation
+    )
+    payload = {"site": {"site_name": "test"}}
+
+    # when
+    connector.send(sites.get_sites())
+    connector.send(sites.get_sites())
+    connector.send(sites.create_site(), payload)
+    with pytest.raises(NotFoundError):
+        connector.send(sites.get_site_info(42))
+
+    # then
+    assert [(e.protocol, e.method, e.endpoint, e.status, e.cached, e.error) for e in received] == [
+        (PROTOCOL_HTTP, "GET", "/sites", 200, False, None),
+        (PROTOCOL_HTTP, "GET", "/sites", 200, True, None),
+        (PROTOCOL_HTTP, "POST", "/site", 201, False, None),
+        (PROTOCOL_HTTP, "GET", "/site/42", 404, False, "NotFoundError"),
+    ]
+    assert received[0].response_bytes == len(SITES_BODY)
+    assert received[2].request_bytes == len(get_codec().dumps(payload))
+    assert all(e.retries == 0 and e.wall_time > 0 for e in received)
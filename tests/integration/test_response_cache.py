@@ -0,0 +1,131 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Iterator, List, Optional
+
+import pytest
+
+from kentik_api.api_calls import sites
+from kentik_api.api_connection.api_connector import APIConnector
+from kentik_api.api_connection.response_cache import ResponseCache
+
+DUMMY_AUTH_EMAIL: str = "email@example.com"
+DUMMY_TOKEN: str = "api-test-token"
+SITES_BODY = b'{"sites": []}'
+ETAG = '"sites-v1"'
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    requests: List[str] = []
+    get_received = threading.Event()
+    release_get: Optional[threading.Event] = None  # if set, GET responses are held until the event is set
+
+    def do_GET(self) -> None:
+        self.requests.append(f"GET {self.headers.get('If-None-Match', '')}")
+        self.get_received.set()
+        if self.release_get is not None:
+            self.release_get.wait(5)
+        if self.headers.get("If-None-Match") == ETAG:
+            self.send_response(304)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self._respond(SITES_BODY)
+
+    def do_PUT(self) -> None:
+        self.requests.append("PUT")
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self._respond(b'{"site": {"id": 1, "site_name": "x"}}')
+
+    def _respond(self, body: bytes) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", ETAG)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+
+@pytest.fixture
+def api_url() -> Iterator[str]:
+    _Handler.requests = []
+    _Handler.get_received = threading.Event()
+    _Handler.release_get = None
+    srv = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    srv.daemon_threads = True
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{srv.server_address[1]}/api/v5"
+    srv.shutdown()
+    srv.server_close()
+
+
+def test_fresh_response_served_from_cache(api_url: str) -> None:
+    # given
+    connector = APIConnector(api_url, DUMMY_AUTH_EMAIL, DUMMY_TOKEN, response_cache=ResponseCache(ttl=60))
+
+    # when
+    responses = [connector.send(sites.get_sites()) for _ in range(3)]
+
+    # then
+    assert [r.content for r in responses] == [SITES_BODY] * 3
+    assert _Handler.requests == ["GET "]
+
+
+def test_expired_response_revalidated(api_url: str) -> None:
+    # given
+    cache = ResponseCache(ttl=0)
+    connector = APIConnector(api_url, DUMMY_AUTH_EMAIL, DUMMY_TOKEN, response_cache=cache)
+
+    # when
+    first = connector.send(sites.get_sites())
+    second = connector.send(sites.get_sites())
+
+    # then
+    assert first.http_status_code == second.http_status_code == 200
+    assert second.content == SITES_BODY
+    assert _Handler.requests == ["GET ", f"GET {ETAG}"]
+    assert cache.stats.revalidated == 1
+
+
+def test_update_invalidates_cached_response(api_url: str) -> None:
+    # given
+    connector = APIConnector(api_url, DUMMY_AUTH_EMAIL, DUMMY_TOKEN, response_cache=ResponseCache(ttl=60))
+    connector.send(sites.get_sites())
+
+    # when
+    connector.send(sites.update_site(1), {"site": {"site_name": "x"}})
+    connector.send(sites.get_sites())
+
+    # then
+    assert _Handler.requests == ["GET ", "PUT", "GET "]
+
+
+class _NotifyingCache(ResponseCache):
+    def __init__(self) -> None:
+        super().__init__(ttl=60)
+        self.invalidated = threading.Event()
+
+    def invalidate(self, url_path: str) -> None:
+        super().invalidate(url_path)
+        self.invalidated.set()
+
+
+def test_response_fetched_during_update_is_not_cached(api_url: str) -> None:
+    # given GET request in flight, answered only after concurrent PUT has invalidated the cache
+    cache = _NotifyingCache()
+    connector = APIConnector(api_url, DUMMY_AUTH_EMAIL, DUMMY_TOKEN, response_cache=cache)
+    _Handler.release_get = cache.invalidated
+    in_flight = threading.Thread(target=connector.send, args=(sites.get_sites(),))
+    in_flight.start()
+    assert _Handler.get_received.wait(5)
+
+    # when
+    connector.send(sites.update_site(1), {"site": {"site_name": "x"}})
+    in_flight.join(5)
+    connector.send(sites.get_sites())
+
+    # then the response to the first GET, possibly from before the update, is not served from cache
+    assert _Handler.requests == ["GET ", "PUT", "GET "]
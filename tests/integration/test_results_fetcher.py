@@ -0,0 +1,71 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Any, Iterator, List, Tuple
+
+import grpc
+import pytest
+from google.protobuf.timestamp_pb2 import Timestamp  # type: ignore
+
+import kentik_api.generated.kentik.synthetics.v202202.synthetics_pb2 as pb
+from kentik_api.api_connection.grpc_channel import GRPCChannelConfig
+from kentik_api.generated.kentik.synthetics.v202202.synthetics_pb2_grpc import (
+    SyntheticsDataServiceServicer,
+    add_SyntheticsDataServiceServicer_to_server,
+)
+from kentik_api.synthetics.api_connector import APISyntheticsConnector
+from kentik_api.synthetics.results_fetcher import ResultsFetcher
+
+DUMMY_AUTH_EMAIL: str = "email@example.com"
+DUMMY_TOKEN: str = "api-test-token"
+START = datetime(2022, 4, 1, tzinfo=timezone.utc)
+HOUR = 3600
+
+
+class _DataService(SyntheticsDataServiceServicer):
+    """Returns one result per hour; requests over more than 2 hours take longer than the client's deadline"""
+
+    def __init__(self) -> None:
+        self.requests: List[Tuple[int, int]] = []
+
+    def GetResultsForTests(
+        self, request: pb.GetResultsForTestsRequest, context: grpc.ServicerContext
+    ) -> pb.GetResultsForTestsResponse:
+        start, end = request.start_time.seconds, request.end_time.seconds
+        self.requests.append((start, end))
+        if end - start > 2 * HOUR:
+            time.sleep(0.5)
+        return pb.GetResultsForTestsResponse(
+            results=[pb.TestResults(test_id=request.ids[0], time=Timestamp(seconds=t)) for t in range(start, end, HOUR)]
+        )
+
+
+@pytest.fixture
+def service() -> Iterator[Any]:
+    data = _DataService()
+    server = grpc.server(ThreadPoolExecutor(max_workers=8))
+    add_SyntheticsDataServiceServicer_to_server(data, server)
+    port = server.add_insecure_port("127.0.0.1:0")
+    server.start()
+    data.target = f"127.0.0.1:{port}"  # type: ignore
+    yield data
+    server.stop(None)
+
+
+def test_chunk_exceeding_deadline_is_split(service: Any) -> None:
+    # given
+    connector = APISyntheticsConnector(
+        service.target, DUMMY_AUTH_EMAIL, DUMMY_TOKEN, channel_config=GRPCChannelConfig(insecure=True)
+    )
+    fetcher = ResultsFetcher(
+        connector, window=timedelta(hours=8), retries=0, backoff=0, min_window=timedelta(hours=1), timeout=0.2
+    )
+
+    # when
+    results = list(fetcher.iter_pb(["1"], START, START + timedelta(hours=8)))
+    connector.close()
+
+    # then the 8-hour chunk and its 4-hour halves time out; 2-hour quarters are fetched
+    first = int(START.timestamp())
+    assert [r.time.seconds for r in results] == [first + h * HOUR for h in range(8)]
+    assert sorted(end - start for start, end in service.requests) == [2 * HOUR] * 4 + [4 * HOUR] * 2 + [8 * HOUR]
@@ -0,0 +1,68 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Iterator, List
+
+import pytest
+
+from kentik_api.api_calls import sites
+from kentik_api.api_connection.api_connector import APIConnector
+
+DUMMY_AUTH_EMAIL: str = "email@example.com"
+DUMMY_TOKEN: str = "api-test-token"
+SITES_BODY = b'{"sites": []}'
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    requests: List[str] = []
+
+    def do_GET(self) -> None:
+        self.requests.append(self.path)
+        time.sleep(0.5)  # keep the request in flight while other callers arrive
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(SITES_BODY)))
+        self.end_headers()
+        self.wfile.write(SITES_BODY)
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+
+@pytest.fixture
+def api_url() -> Iterator[str]:
+    _Handler.requests = []
+    srv = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    srv.daemon_threads = True
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{srv.server_address[1]}/api/v5"
+    srv.shutdown()
+    srv.server_close()
+
+
+@pytest.mark.parametrize("coalesce, expected_requests", [(True, 1), (False, 4)])
+def test_concurrent_gets_coalesced(api_url: str, coalesce: bool, expected_requests: int) -> None:
+    # given
+    connector = APIConnector(api_url, DUMMY_AUTH_EMAIL, DUMMY_TOKEN, coalesce_requests=coalesce)
+
+    # when
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        responses = list(pool.map(lambda _: connector.send(sites.get_sites()), range(4)))
+
+    # then
+    assert [r.content for r in responses] == [SITES_BODY] * 4
+    assert len(_Handler.requests) == expected_requests
+
+
+def test_concurrent_streamed_gets_coalesced(api_url: str) -> None:
+    # given
+    connector = APIConnector(api_url, DUMMY_AUTH_EMAIL, DUMMY_TOKEN, coalesce_requests=True)
+
+    # when
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        responses = list(pool.map(lambda _: connector.send_stream(sites.get_sites()), range(4)))
+
+    # then every caller can read the shared body
+    assert [b"".join(r.iter_content()) for r in responses] == [SITES_BODY] * 4
+    assert len(_Handler.requests) == 1
@@ -0,0 +1,353 @@
+import importlib.util
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+
+# pylint: disable=wrong-import-position
+from kentik_api.analytics.data_frame_cache import DFCache  # noqa: E402
+from kentik_api.analytics.df_manifest import DFManifest  # noqa: E402
+
+START = datetime(2022, 4, 1, tzinfo=timezone.utc)
+HOUR = timedelta(hours=1)
+
+# storing data requires a Parquet engine; tests of pyarrow specific functionality skip themselves
+pytestmark = pytest.mark.skipif(
+    not any(importlib.util.find_spec(engine) for engine in ("pyarrow", "fastparquet")),
+    reason="pyarrow or fastparquet is required",
+)
+
+
+def _frame(start: datetime, hours: int) -> Any:
+    index = pd.date_range(start, periods=hours * 6, freq="10min", name="time")
+    return pd.DataFrame({"value": range(len(index))}, index=index)
+
+
+def test_manifest_tracks_stored_and_dropped_files(tmp_path: Path) -> None:
+    # given
+    cache = DFCache(tmp_path)
+    for i in range(4):
+        cache.store(_frame(START + i * 2 * HOUR, 2))
+
+    # when
+    manifest = (tmp_path / DFManifest.filename).exists()
+
+    # then
+    assert manifest
+    assert cache.file_count == 4
+    assert cache.data_size == sum(f.stat().st_size for f in tmp_path.glob("*.parquet"))
+    assert cache.oldest == START
+    assert cache.newest == START + 8 * HOUR - timedelta(minutes=10)
+    assert [e.rows for e in cache.manifest.entries] == [12] * 4
+
+    # when
+    cache.drop(START, START + 4 * HOUR)
+
+    # then
+    assert cache.file_count == 2
+    assert cache.oldest == START + 4 * HOUR
+    assert len(list(tmp_path.glob("*.parquet"))) == 2
+
+
+def test_manifest_changes_visible_to_other_instances(tmp_path: Path) -> None:
+    # given - reader opened before writer stores anything
+    writer = DFCache(tmp_path)
+    reader = DFCache(tmp_path)
+
+    # when
+    writer.store(_frame(START, 1))
+
+    # then
+    assert reader.file_count == 1
+    assert reader.newest == writer.newest
+    assert [f.name for f in reader.files_in_range(START, START + HOUR)] == [f.name for f in writer.files]
+
+    # when - reader drops data, writer continues
+    reader.drop(START, START + HOUR)
+    writer.store(_frame(START + HOUR, 1))
+
+    # then
+    assert writer.file_count == reader.file_count == 1
+    assert reader.oldest == START + HOUR
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_files_in_range(tmp_path: Path) -> None:
+    # given
+    cache = DFCache(tmp_path)
+    for i in range(10):
+        cache.store(_frame(START + i * HOUR, 1))
+    # long file overlapping many others
+    cache.store(_frame(START + 30 * timedelta(minutes=1), 5))
+
+    # when
+    overlapping = [cache.parse_df_filename(f) for f in cache.files_in_range(START + 6 * HOUR, START + 7 * HOUR)]
+    contained = [cache.parse_df_filename(f) for f in cache.files_in_range(START, START + 3 * HOUR, contained=True)]
+
+    # then
+    assert [s for s, _ in overlapping] == [START + 6 * HOUR, START + 7 * HOUR]
+    assert [s for s, _ in contained] == [START, START + HOUR, START + 2 * HOUR]
+    # files overlapping [start, end] (brute force)
+    for s, e in [(START, START + HOUR), (START + 3 * HOUR, START + 4 * HOUR), (START - HOUR, START + 20 * HOUR)]:
+        expected = set()
+        for f in tmp_path.glob("*.parquet"):
+            fs, fe = cache.parse_df_filename(f)
+            if fs <= e and fe > s:  # type: ignore
+                expected.add(f.name)
+        assert {f.name for f in cache.files_in_range(s, e)} == expected
+
+
+def test_manifest_is_rebuilt_from_directory(tmp_path: Path) -> None:
+    # given
+    cache = DFCache(tmp_path)
+    for i in range(3):
+        cache.store(_frame(START + i * HOUR, 1))
+    # manifest deleted and one file removed behind cache's back
+    (tmp_path / DFManifest.filename).unlink()
+    next(iter(cache.files)).unlink()
+
+    # when
+    reopened = DFCache(tmp_path)
+
+    # then
+    assert reopened.file_count == 2
+    assert reopened.oldest == START + HOUR
+    assert [e.rows for e in reopened.manifest.entries] == [6, 6]
+    df = reopened.get()
+    assert df is not None and df.shape[0] == 12
+
+    # given - corrupted manifest
+    (tmp_path / DFManifest.filename).write_text("{not json")
+
+    # when
+    reopened = DFCache(tmp_path)
+
+    # then
+    assert reopened.file_count == 2
+
+    # when - file copied into the directory while cache is open
+    _frame(START + 5 * HOUR, 1).to_parquet(
+        tmp_path
+        / DFCache.filename_format.format(start=(START + 5 * HOUR).isoformat(), end=(START + 6 * HOUR).isoformat())
+    )
+    reopened.rebuild_manifest()
+
+    # then
+    assert reopened.file_count == 3
+    assert reopened.newest == START + 6 * HOUR
+
+
+def _links_frame(start: datetime, hours: int) -> Any:
+    index = pd.date_range(start, periods=hours * 6, freq="10min", name="time").repeat(3)
+    return pd.DataFrame(
+        {
+            "link": ["dev1:eth0", "dev1:eth1", "dev2:eth0"] * (hours * 6),
+            "bps": [float(i) for i in range(hours * 18)],
+            "period": [600] * (hours * 18),
+        },
+        index=index,
+    )
+
+
+@pytest.mark.parametrize("pushdown", [True, False])
+def test_get_with_columns_and_filters(tmp_path: Path, pushdown: bool, monkeypatch: pytest.MonkeyPatch) -> None:
+    # given
+    if pushdown:
+        pytest.importorskip("pyarrow")
+    cache = DFCache(tmp_path)
+    for i in range(4):
+        cache.store(_links_frame(START + i * HOUR, 1))
+    if not pushdown:
+        monkeypatch.setattr("kentik_api.analytics.data_frame_cache.ds", None)
+
+    # when
+    df = cache.get(
+        START + 30 * timedelta(minutes=1),
+        START + 2 * HOUR,
+        columns=["bps"],
+        filters=[("link", "in", ["dev1:eth1", "dev2:eth0"]), ("bps", ">=", 20.0)],
+    )
+
+    # then
+    assert df is not None
+    expected = pd.concat([_links_frame(START + i * HOUR, 1) for i in range(4)])
+    expected = expected.loc[
+        (expected.index >= START + 30 * timedelta(minutes=1))
+        & (expected.index <= START + 2 * HOUR)
+        & expected["link"].isin(["dev1:eth1", "dev2:eth0"])
+        & (expected["bps"] >= 20.0),
+        ["bps"],
+    ]
+    assert list(df.columns) == ["bps"]
+    assert df.index.name == "time"
+    pd.testing.assert_frame_equal(df.sort_values("bps"), expected.sort_values("bps"), check_freq=False)
+
+    # when - disjunction of filters, dedup on column not selected
+    cache.store(_links_frame(START, 1))  # duplicate data
+    df = cache.get(
+        columns=["bps"],
+        filters=[[("link", "==", "dev1:eth0"), ("bps", "<", 9.0)], [("link", "=", "dev2:eth0"), ("bps", ">", 15.0)]],
+        dedup_columns=["time", "link"],
+    )
+
+    # then
+    assert df is not None
+    assert list(df.columns) == ["bps"]
+    assert sorted(df["bps"]) == [0.0] * 4 + [3.0] * 4 + [6.0] * 4 + [17.0] * 4
+
+
+def test_get_with_filters_on_pyarrow_without_filters_to_expression(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # given - pyarrow < 10 provides no pq.filters_to_expression
+    pq = pytest.importorskip("pyarrow.parquet")
+    cache = DFCache(tmp_path)
+    for i in range(2):
+        cache.store(_links_frame(START + i * HOUR, 1))
+    monkeypatch.delattr(pq, "filters_to_expression", raising=False)
+
+    # when
+    df = cache.get(columns=["bps"], filters=[("link", "==", "dev2:eth0"), ("bps", ">=", 14.0)])
+
+    # then - filters are applied after reading each file
+    assert df is not None
+    assert list(df.columns) == ["bps"]
+    assert list(df["bps"]) == [14.0, 17.0, 14.0, 17.0]
+
+
+@pytest.mark.parametrize("pushdown", [True, False])
+def test_get_chunks_with_different_schemas(tmp_path: Path, pushdown: bool, monkeypatch: pytest.MonkeyPatch) -> None:
+    # given - "v" stored as int64 and float64, "w" present only in the last chunk
+    if pushdown:
+        pytest.importorskip("pyarrow")
+    cache = DFCache(tmp_path)
+    first = _frame(START, 1).rename(columns={"value": "v"})
+    second = _frame(START + HOUR, 1).rename(columns={"value": "v"}).astype({"v": "float64"})
+    third = _frame(START + 2 * HOUR, 1).rename(columns={"value": "v"}).assign(w=1.5)
+    for df in (first, second, third):
+        cache.store(df)
+    if not pushdown:
+        monkeypatch.setattr("kentik_api.analytics.data_frame_cache.ds", None)
+
+    # when
+    everything = cache.get()
+    selected = cache.get(columns=["v", "w"], filters=[("v", ">=", 3)])
+    with_w = cache.get(columns=["v"], filters=[("w", ">", 1.0)])
+
+    # then
+    assert everything is not None and selected is not None
+    assert everything.shape == (18, 2)
+    assert everything["v"].dtype == "float64"
+    assert everything["w"].isna().sum() == 12
+    assert list(selected.columns) == ["v", "w"]
+    assert selected.shape[0] == 9
+    assert selected["v"].dtype == "float64"
+    assert list(selected["w"].isna()) == [True] * 6 + [False] * 3
+    assert with_w is not None and list(with_w["v"]) == list(range(6))
+
+
+def test_compact(tmp_path: Path) -> None:
+    # given - 2 days of hourly chunks, some of them overlapping
+    cache = DFCache(tmp_path)
+    for i in range(48):
+        cache.store(_links_frame(START + i * HOUR, 1))
+    for i in range(0, 48, 6):
+        cache.store(_links_frame(START + i * HOUR + timedelta(minutes=30), 1))
+    before = cache.get(dedup_columns=["time", "link"])
+
+    # when - first day only
+    written = cache.compact(dedup_columns=["time", "link"], before=START + 24 * HOUR)
+
+    # then
+    assert len(written) == 1
+    assert cache.file_count == 1 + 24 + 4
+    assert not list(tmp_path.glob("*.tmp"))
+    assert cache.manifest.entries[0].rows == 24 * 6 * 3
+    compacted = pd.read_parquet(written[0])
+    assert compacted.index.is_monotonic_increasing
+    assert not compacted.reset_index().duplicated(["time", "link"]).any()
+
+    # when - everything, run twice
+    written = cache.compact(dedup_columns=["time", "link"])
+    again = cache.compact(dedup_columns=["time", "link"])
+
+    # then
+    assert len(written) == 1
+    assert again == []
+    assert cache.file_count == 2
+    assert len(list(tmp_path.glob("*.parquet"))) == 2
+    after = cache.get()
+    assert after is not None and before is not None
+    pd.testing.assert_frame_equal(
+        after.reset_index().sort_values(["time", "link"]).reset_index(drop=True),
+        before.reset_index().sort_values(["time", "link"]).reset_index(drop=True),
+        check_freq=False,
+    )
+
+
+def test_compact_splits_files_crossing_partitions(tmp_path: Path) -> None:
+    # given - hourly chunks on 2 days, one chunk crossing midnight; the second day has a chunk with the same rows
+    # as the crossing chunk has after midnight
+    def chunk(start: datetime, hours: int) -> Any:
+        df = _frame(start, hours)
+        df["value"] = (df.index - START) // timedelta(minutes=10)  # same rows for the same time in all chunks
+        return df
+
+    cache = DFCache(tmp_path)
+    for i in range(20, 28):
+        cache.store(chunk(START + i * HOUR, 1))
+    cache.store(chunk(START + 22 * HOUR, 4))
+    cache.store(chunk(START + 24 * HOUR, 2))
+    before = cache.get()
+    # first day ends at midnight UTC, i.e. 02:00 in UTC+2
+    midnight = datetime(2022, 4, 2, 2, tzinfo=timezone(timedelta(hours=2)))
+
+    # when - first day only
+    written = cache.compact(before=midnight)
+
+    # then - rows of the crossing chunk after midnight merged with the second day chunk of the same name
+    assert [cache.parse_df_filename(f) for f in written] == [
+        (START + 20 * HOUR, START + 24 * HOUR - timedelta(minutes=10)),
+        (START + 24 * HOUR, START + 26 * HOUR - timedelta(minutes=10)),
+    ]
+    assert cache.file_count == 1 + 4 + 1
+    rows = {e.name: e.rows for e in cache.manifest.entries}
+    assert [rows[f.name] for f in written] == [4 * 6, 2 * 6]
+
+    # when
+    written = cache.compact()
+
+    # then - one file per day, no data lost
+    assert [cache.parse_df_filename(f)[0] for f in written] == [START + 24 * HOUR]
+    assert cache.file_count == 2
+    after = cache.get()
+    assert after is not None and before is not None
+    pd.testing.assert_frame_equal(after, before.drop_duplicates().sort_index(), check_freq=False)
+
+
+def test_compact_weekly_incremental(tmp_path: Path) -> None:
+    # given - 4 weeks of daily chunks; START is Friday
+    cache = DFCache(tmp_path)
+    for i in range(28):
+        cache.store(_frame(START + i * 24 * HOUR, 1))
+
+    # when
+    written = cache.compact(partition="week", max_partitions=2)
+
+    # then - partial first week (Fri - Sun) and the following week
+    assert [cache.parse_df_filename(f)[0] for f in written] == [START, START + 3 * 24 * HOUR]
+    assert cache.file_count == 2 + 28 - 3 - 7
+    assert cache.data_size == sum(f.stat().st_size for f in tmp_path.glob("*.parquet"))
+
+    # when
+    cache.compact(partition="week")
+
+    # then
+    assert cache.file_count == 5
+    df = cache.get()
+    assert df is not None and df.shape[0] == 28 * 6
+    with pytest.raises(ValueError):
+        cache.compact(partition="month")
@@ -0,0 +1,159 @@
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+
+# pylint: disable=wrong-import-position
+from google.protobuf.timestamp_pb2 import Timestamp  # type: ignore  # noqa: E402
+
+import kentik_api.generated.kentik.synthetics.v202202.synthetics_pb2 as pb  # noqa: E402
+from kentik_api.analytics.synth_results_cache import (  # noqa: E402
+    SynthResultsCache,
+    merge_intervals,
+    subtract_intervals,
+)
+from kentik_api.synthetics.synth_client import KentikSynthClient  # noqa: E402
+
+START = datetime(2022, 4, 1, tzinfo=timezone.utc)
+HOUR = timedelta(hours=1)
+
+
+class _Connector:
+    """Returns results for 2 agents every 10 minutes in [start, end)"""
+
+    def __init__(self) -> None:
+        self.calls: List[Tuple[List[str], datetime, datetime]] = []
+
+    def results_for_tests(
+        self,
+        test_ids: List[str],
+        start: Timestamp,
+        end: Timestamp,
+        agent_ids: Optional[List[str]] = None,
+        task_ids: Optional[List[str]] = None,
+        aggregate: bool = False,
+        timeout: Optional[float] = None,
+    ) -> pb.GetResultsForTestsResponse:
+        self.calls.append((test_ids, start.ToDatetime(timezone.utc), end.ToDatetime(timezone.utc)))
+        return pb.GetResultsForTestsResponse(
+            results=[
+                pb.TestResults(
+                    test_id=test_id,
+                    time=Timestamp(seconds=t),
+                    agents=[
+                        pb.AgentResults(
+                            agent_id=agent_id,
+                            tasks=[pb.TaskResults(ping=pb.PingResults(target="1.2.3.4"), health="healthy")],
+                        )
+                        for agent_id in ["a1", "a2"]
+                    ],
+                )
+                for t in range(start.seconds, end.seconds, 600)
+                for test_id in test_ids
+            ]
+        )
+
+
+def test_intervals() -> None:
+    # given
+    t = [START + i * HOUR for i in range(10)]
+
+    # when - then
+    assert merge_intervals([(t[3], t[5]), (t[0], t[1]), (t[1], t[2]), (t[4], t[6])]) == [(t[0], t[2]), (t[3], t[6])]
+    assert subtract_intervals(t[0], t[9], [(t[0], t[2]), (t[3], t[6])]) == [(t[2], t[3]), (t[6], t[9])]
+    assert subtract_intervals(t[1], t[2], [(t[0], t[3])]) == []
+
+
+def test_fetch_only_gaps(tmp_path: Path) -> None:
+    # given
+    connector = _Connector()
+    client = KentikSynthClient(connector)  # type: ignore
+    cache = SynthResultsCache(tmp_path / "synth")
+
+    # when
+    first = cache.fetch(client, ["1", "2"], START, START + 2 * HOUR)
+    second = cache.fetch(client, ["1", "2"], START + HOUR, START + 4 * HOUR, agent_ids=["a1"])
+
+    # then
+    assert [(ids, s - START, e - START) for ids, s, e in connector.calls] == [
+        (["1", "2"], timedelta(0), 2 * HOUR),
+        (["1", "2"], 2 * HOUR, 4 * HOUR),
+    ]
+    assert cache.coverage("1") == [(START, START + 4 * HOUR)]
+    assert len(first) == 2 * 2 * 12  # tests x agents x 10 minute steps in 2 hours
+    assert set(second["agent_id"]) == {"a1"}
+    assert second["time"].min() == START + HOUR
+    assert len(second) == 2 * 18  # 10 minute steps from START + 1h until START + 4h (exclusive)
+    assert not second.duplicated(subset=["test_id", "agent_id", "time"]).any()
+
+
+def test_empty_interval_recorded(tmp_path: Path) -> None:
+    # given
+    class _EmptyConnector(_Connector):
+        def results_for_tests(self, *args, **kwargs) -> pb.GetResultsForTestsResponse:  # type: ignore
+            super().results_for_tests(*args, **kwargs)
+            return pb.GetResultsForTestsResponse()
+
+    connector = _EmptyConnector()
+    client = KentikSynthClient(connector)  # type: ignore
+    cache = SynthResultsCache(tmp_path)
+
+    # when
+    cache.fetch(client, ["1"], START, START + HOUR)
+    df = cache.fetch(client, ["1"], START, START + HOUR)
+
+    # then
+    assert len(connector.calls) == 1
+    assert df.empty
+    assert cache.gaps("1", START, START + 2 * HOUR) == [(START + HOUR, START + 2 * HOUR)]
+
+
+def test_recent_interval_not_recorded(tmp_path: Path) -> None:
+    # given - results of the last 10 minutes may still arrive
+    connector = _Connector()
+    client = KentikSynthClient(connector)  # type: ignore
+    now = START + 3 * HOUR
+    cache = SynthResultsCache(tmp_path, settle_delay=timedelta(minutes=10), clock=lambda: now)
+
+    # when
+    first = cache.fetch(client, ["1"], START, now)
+    second = cache.fetch(client, ["1"], START, now)
+
+    # then
+    settled = now - timedelta(minutes=10)
+    assert cache.coverage("1") == [(START, settled)]
+    assert [(s - START, e - START) for _, s, e in connector.calls] == [
+        (timedelta(0), 3 * HOUR),
+        (settled - START, 3 * HOUR),
+    ]
+    assert first["time"].max() == settled  # results from the unsettled interval are returned as well
+    assert len(first) == len(second) == 2 * 18
+
+    # when - the interval settled
+    now = START + 4 * HOUR
+    cache.fetch(client, ["1"], START, START + 3 * HOUR)
+
+    # then
+    assert cache.coverage("1") == [(START, START + 3 * HOUR)]
+    assert len(connector.calls) == 3
+
+
+def test_interrupted_store_leaves_no_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    # given - writing fails half-way
+    def failing_to_parquet(self, path, *args, **kwargs) -> None:
+        Path(path).write_bytes(b"PAR1 partial")
+        raise OSError("disk full")
+
+    cache = SynthResultsCache(tmp_path)
+    monkeypatch.setattr(pd.DataFrame, "to_parquet", failing_to_parquet)
+
+    # when
+    with pytest.raises(OSError):
+        cache.store("1", START, START + HOUR, pd.DataFrame({"test_id": ["1"]}))
+
+    # then
+    assert cache.coverage("1") == []
+    assert list((tmp_path / "1").iterdir()) == []
@@ -0,0 +1,50 @@
+import grpc
+import pytest
+
+from kentik_api.api_connection.grpc_channel import ChannelPool, GRPCChannelConfig
+
+
+def test_channel_options() -> None:
+    # given
+    config = GRPCChannelConfig(keepalive_time=120, keepalive_timeout=10, keepalive_permit_without_calls=False)
+
+    # when
+    options = dict(config.channel_options())
+
+    # then
+    assert options["grpc.keepalive_time_ms"] == 120000
+    assert options["grpc.keepalive_timeout_ms"] == 10000
+    assert options["grpc.keepalive_permit_without_calls"] == 0
+    assert "grpc.http2.max_pings_without_data" not in options
+    assert GRPCChannelConfig(keepalive_time=None).channel_options() == []
+    # keepalive is opt-in: servers reject pings they don't permit
+    assert GRPCChannelConfig().channel_options() == []
+    idle = dict(GRPCChannelConfig(keepalive_time=300, keepalive_permit_without_calls=True).channel_options())
+    assert idle["grpc.keepalive_permit_without_calls"] == 1
+    assert idle["grpc.http2.max_pings_without_data"] == 0
+
+
+def test_invalid_config() -> None:
+    # when - then
+    with pytest.raises(ValueError):
+        GRPCChannelConfig(compression="brotli")
+    with pytest.raises(ValueError):
+        GRPCChannelConfig(pool_size=0)
+
+
+def test_pool_round_robin_and_close() -> None:
+    # given
+    pool = ChannelPool("localhost:1", lambda channel: channel, GRPCChannelConfig(pool_size=3, insecure=True))
+
+    # when
+    stubs = [pool.stub() for _ in range(6)]
+    pool.close()
+    pool.close()  # idempotent
+
+    # then
+    assert stubs[:3] == stubs[3:]
+    assert len({id(s) for s in stubs}) == 3
+    assert all(isinstance(s, grpc.Channel) for s in stubs)
+    assert pool.closed
+    with pytest.raises(RuntimeError):
+        pool.stub()
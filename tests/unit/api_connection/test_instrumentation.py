@@ -0,0 +1,143 @@
+import asyncio
+from typing import List
+
+import pytest
+from google.protobuf.wrappers_pb2 import StringValue  # type: ignore
+from grpc import RpcError
+
+from kentik_api.api_connection.instrumentation import (
+    PROTOCOL_GRPC,
+    PROTOCOL_HTTP,
+    CallEvent,
+    Instrumentation,
+    LatencyHistogram,
+    route,
+)
+from kentik_api.internal.grpc import wrap_grpc_errors, wrap_grpc_errors_async
+from kentik_api.public.errors import KentikAPIError
+
+
+def test_route() -> None:
+    # when - then
+    assert route("/devices") == "/devices"
+    assert route("/device/123/labels") == "/device/{id}/labels"
+    assert route("/site/7?x=1") == "/site/{id}"
+    assert route("/tests/0a1b2c3d-0000-1111-2222-333344445555") == "/tests/{id}"
+
+
+def test_failing_observer_ignored() -> None:
+    # given
+    received: List[CallEvent] = []
+
+    def failing(_: CallEvent) -> None:
+        raise RuntimeError("observer error")
+
+    instrumentation = Instrumentation([failing, received.append])
+
+    # when
+    instrumentation.emit(CallEvent(PROTOCOL_HTTP, "/sites", "GET"))
+
+    # then
+    assert len(received) == 1
+
+
+def test_latency_histogram() -> None:
+    # given
+    histogram = LatencyHistogram(buckets=[0.1, 1.0, float("inf")])
+    events = [
+        CallEvent(PROTOCOL_HTTP, "/device/1", "GET", 200, response_bytes=100, wall_time=0.05),
+        CallEvent(PROTOCOL_HTTP, "/device/2", "GET", 200, response_bytes=200, wall_time=0.5),
+        CallEvent(PROTOCOL_HTTP, "/device/3", "GET", 404, error="NotFoundError", wall_time=0.08, retries=2),
+        CallEvent(PROTOCOL_HTTP, "/query/topXdata", "POST", 200, request_bytes=50, wall_time=5.0, wait_time=1.0),
+    ]
+
+    # when
+    for event in events:
+        histogram(event)
+    stats = histogram.stats()
+
+    # then
+    device = stats[(PROTOCOL_HTTP, "GET", "/device/{id}")]
+    assert device.counts == [2, 1, 0]
+    assert device.calls == 3
+    assert device.errors == 1
+    assert device.retries == 2
+    assert device.response_bytes == 300
+    assert device.total_time == pytest.approx(0.63)
+    assert device.percentile(50) == 0.1
+    assert device.percentile(100) == 0.5
+    query = stats[(PROTOCOL_HTTP, "POST", "/query/topXdata")]
+    assert query.percentile(99) == 5.0
+    assert query.wait_time == 1.0
+    assert [key for key, _ in histogram.top(1)] == [(PROTOCOL_HTTP, "POST", "/query/topXdata")]
+    assert [key for key, _ in histogram.top(1, by="calls")] == [(PROTOCOL_HTTP, "GET", "/device/{id}")]
+
+
+def test_latency_histogram_requires_inf_bucket() -> None:
+    # when - then
+    with pytest.raises(ValueError):
+        LatencyHistogram(buckets=[1.0, 2.0])
+
+
+class _Connector:
+    def __init__(self, instrumentation: Instrumentation) -> None:
+        self._instrumentation = instrumentation
+
+    @wrap_grpc_errors
+    def get_all(self) -> List[int]:
+        return [1, 2]
+
+    @wrap_grpc_errors
+    def fail(self) -> None:
+        raise RpcError()
+
+
+def test_grpc_calls_reported() -> None:
+    # given
+    received: List[CallEvent] = []
+    connector = _Connector(Instrumentation([received.append]))
+
+    # when
+    connector.get_all()
+    with pytest.raises(KentikAPIError):
+        connector.fail()
+
+    # then
+    assert [(e.protocol, e.endpoint, e.status, e.error) for e in received] == [
+        (PROTOCOL_GRPC, "_Connector.get_all", "OK", None),
+        (PROTOCOL_GRPC, "_Connector.fail", None, "RpcError"),
+    ]
+    assert all(e.wall_time >= 0 for e in received)
+    # sizes are unknown: requests are built inside connector methods and the results aren't protobuf messages
+    assert [(e.request_bytes, e.response_bytes) for e in received] == [(None, None), (None, None)]
+
+
+class _AsyncConnector:
+    def __init__(self, instrumentation: Instrumentation) -> None:
+        self._instrumentation = instrumentation
+
+    @wrap_grpc_errors_async
+    async def get(self) -> StringValue:
+        return StringValue(value="agent")
+
+    @wrap_grpc_errors_async
+    async def fail(self) -> None:
+        raise RpcError()
+
+
+def test_async_grpc_calls_reported() -> None:
+    # given
+    received: List[CallEvent] = []
+    connector = _AsyncConnector(Instrumentation([received.append]))
+
+    # when
+    result = asyncio.run(connector.get())
+    with pytest.raises(KentikAPIError):
+        asyncio.run(connector.fail())
+
+    # then
+    assert result.value == "agent"
+    assert [(e.endpoint, e.status, e.error, e.response_bytes) for e in received] == [
+        ("_AsyncConnector.get", "OK", None, result.ByteSize()),
+        ("_AsyncConnector.fail", None, "RpcError", None),
+    ]
@@ -0,0 +1,103 @@
+from typing import List, Tuple
+
+import pytest
+from urllib3 import HTTPResponse, Retry
+
+from kentik_api.api_connection.rate_limiter import RateLimit, RateLimiter, TokenBucket, parse_retry_after
+from kentik_api.api_connection.retryable_session import RateLimitAwareRetry
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_token_bucket_burst_and_refill() -> None:
+    # given
+    clock = FakeClock()
+    bucket = TokenBucket(RateLimit(requests=2, period=1.0), clock)
+
+    # when - then
+    assert bucket.try_take() == 0.0
+    assert bucket.try_take() == 0.0
+    assert bucket.try_take() == 0.5
+    clock.now += 0.5
+    assert bucket.try_take() == 0.0
+
+
+def test_token_bucket_hold_off() -> None:
+    # given
+    clock = FakeClock()
+    bucket = TokenBucket(RateLimit(requests=10, period=1.0), clock)
+
+    # when
+    bucket.hold_off(3.0)
+
+    # then
+    assert bucket.try_take() == 3.0
+    clock.now += 3.0
+    assert bucket.try_take() == pytest.approx(0.1)  # no burst after hold-off
+    clock.now += 0.11
+    assert bucket.try_take() == 0.0
+
+
+def test_rate_limiter_longest_prefix_match() -> None:
+    # given
+    limiter = RateLimiter(
+        {"/query/*": RateLimit(1), "/query/sql": RateLimit(2), "/devices": RateLimit(3)},
+        default=RateLimit(4),
+        clock=FakeClock(),
+    )
+
+    # when
+    query_data = limiter.bucket("/query/topxdata")
+    query_sql = limiter.bucket("/query/sql")
+    device = limiter.bucket("/device/42")
+    devices = limiter.bucket("/devices")
+
+    # then
+    assert query_data is not None and query_sql is not None
+    assert query_data is not query_sql
+    assert limiter.bucket("/query/url") is query_data
+    assert devices is not None and devices is not device
+    assert device is limiter.bucket("/sites")
+
+
+def test_rate_limiter_without_default() -> None:
+    # given
+    limiter = RateLimiter({"/query/": RateLimit(1)})
+
+    # when - then
+    assert limiter.bucket("/sites") is None
+    assert limiter.acquire("/sites") == 0.0
+    limiter.hold_off("/sites", 10.0)  # no-op
+
+
+def test_parse_retry_after() -> None:
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("") is None
+    assert parse_retry_after("2") == 2.0
+    assert parse_retry_after("1.5") == 1.5
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0  # in the past
+    assert parse_retry_after("soon") is None
+
+
+def test_rate_limit_aware_retry_reports_retry_after() -> None:
+    # given
+    calls: List[Tuple[str, float]] = []
+    retry = RateLimitAwareRetry.from_retry(
+        Retry(total=3, backoff_factor=0, status_forcelist=[429, 503]), lambda url, s: calls.append((url, s))
+    )
+    response = HTTPResponse(headers={"Retry-After": "7"}, status=503)
+
+    # when
+    retry = retry.increment("GET", "/api/v5/query/sql", response=response)
+    retry.increment("GET", "/api/v5/query/sql", response=HTTPResponse(status=502))
+
+    # then
+    assert isinstance(retry, RateLimitAwareRetry)
+    assert retry.total == 2
+    assert calls == [("/api/v5/query/sql", 7.0)]
@@ -0,0 +1,160 @@
+from kentik_api.api_connection.response_cache import ResponseCache, conditional_headers
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _store(cache: ResponseCache, path: str, **headers: str) -> None:
+    cache.store(cache.make_key("GET", path, None), 200, b"{}", "utf-8", headers)
+
+
+def test_cacheable() -> None:
+    # given
+    cache = ResponseCache(paths=["/devices", "/sites"])
+
+    # when - then
+    assert cache.cacheable("GET", "/devices")
+    assert cache.cacheable("GET", "/sites")
+    assert not cache.cacheable("GET", "/users")
+    assert not cache.cacheable("POST", "/devices")
+    assert ResponseCache().cacheable("GET", "/users")
+
+
+def test_make_key_ignores_params_order() -> None:
+    # when - then
+    assert ResponseCache.make_key("GET", "/a", {"x": 1, "y": 2}) == ResponseCache.make_key(
+        "GET", "/a", {"y": 2, "x": 1}
+    )
+    assert ResponseCache.make_key("GET", "/a", None) == ResponseCache.make_key("GET", "/a", {})
+
+
+def test_entry_expires_after_ttl() -> None:
+    # given
+    clock = FakeClock()
+    cache = ResponseCache(ttl=10, clock=clock)
+    key = cache.make_key("GET", "/sites", None)
+    _store(cache, "/sites")
+
+    # when
+    fresh_entry, fresh = cache.lookup(key)
+    clock.now += 10
+    expired_entry, expired_fresh = cache.lookup(key)
+
+    # then
+    assert fresh_entry is not None and fresh
+    assert expired_entry is None and not expired_fresh
+    assert len(cache) == 0
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 1
+
+
+def test_expired_entry_with_etag_is_revalidated() -> None:
+    # given
+    clock = FakeClock()
+    cache = ResponseCache(ttl=10, clock=clock)
+    key = cache.make_key("GET", "/sites", None)
+    _store(cache, "/sites", ETag='"v1"', **{"Last-Modified": "Wed, 21 Oct 2015 07:28:00 GMT"})
+    clock.now += 20
+
+    # when
+    entry, fresh = cache.lookup(key)
+    assert entry is not None and not fresh
+    headers = conditional_headers(entry)
+    cache.revalidated(key, entry)
+
+    # then
+    assert headers == {"If-None-Match": '"v1"', "If-Modified-Since": "Wed, 21 Oct 2015 07:28:00 GMT"}
+    assert cache.lookup(key) == (entry, True)
+    assert cache.stats.revalidated == 1
+
+
+def test_no_store_response_not_cached() -> None:
+    # given
+    cache = ResponseCache()
+
+    # when
+    _store(cache, "/sites", **{"Cache-Control": "private, no-store"})
+
+    # then
+    assert len(cache) == 0
+
+
+def test_least_recently_used_entry_evicted() -> None:
+    # given
+    cache = ResponseCache(max_entries=2)
+    _store(cache, "/site/1")
+    _store(cache, "/site/2")
+    cache.lookup(cache.make_key("GET", "/site/1", None))
+
+    # when
+    _store(cache, "/site/3")
+
+    # then
+    assert cache.lookup(cache.make_key("GET", "/site/1", None))[0] is not None
+    assert cache.lookup(cache.make_key("GET", "/site/2", None))[0] is None
+    assert cache.stats.evicted == 1
+
+
+def test_invalidate_resource_group() -> None:
+    # given
+    cache = ResponseCache()
+    for path in ["/devices", "/device/1", "/plans", "/deviceLabels", "/sites", "/saved-filters/custom", "/users"]:
+        _store(cache, path)
+
+    # when
+    cache.invalidate("/device/1/labels")
+    cache.invalidate("/saved-filter/custom/7")
+
+    # then
+    remaining = {key[1] for key in cache._entries}  # pylint: disable=protected-access
+    assert remaining == {"/sites", "/users"}
+    assert cache.stats.invalidated == 5
+
+
+def test_batch_invalidates_everything() -> None:
+    # given
+    cache = ResponseCache()
+    _store(cache, "/sites")
+    _store(cache, "/customdimensions")
+
+    # when
+    cache.invalidate("/batch/customdimensions/c_test/populators")
+
+    # then
+    assert len(cache) == 0
+
+
+def test_response_fetched_during_invalidation_is_not_stored() -> None:
+    # given
+    cache = ResponseCache()
+    key = cache.make_key("GET", "/devices", None)
+    generation = cache.generation("/devices")
+    unrelated_generation = cache.generation("/users")
+
+    # when
+    cache.invalidate("/site/1")  # sites are embedded in devices
+    cache.store(key, 200, b"{}", "utf-8", {}, generation)
+    cache.store(cache.make_key("GET", "/users", None), 200, b"{}", "utf-8", {}, unrelated_generation)
+
+    # then
+    assert cache.lookup(key) == (None, False)
+    assert len(cache) == 1
+    assert cache.generation("/devices") != generation
+    assert cache.generation("/users") == unrelated_generation
+
+
+def test_batch_changes_generation_of_all_groups() -> None:
+    # given
+    cache = ResponseCache()
+    generation = cache.generation("/sites")
+
+    # when
+    cache.invalidate("/batch/customdimensions/c_test/populators")
+
+    # then
+    assert cache.generation("/sites") != generation
@@ -0,0 +1,78 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+import pytest
+
+from kentik_api.api_connection.single_flight import SingleFlight
+
+
+def _wait_for_waiters(flight: SingleFlight, key: str, count: int) -> None:
+    deadline = time.monotonic() + 5
+    while time.monotonic() < deadline:
+        with flight._lock:  # pylint: disable=protected-access
+            call = flight._calls.get(key)  # pylint: disable=protected-access
+            if call is not None and call.waiters == count:
+                return
+        time.sleep(0.001)
+    raise TimeoutError(f"{count} waiters expected")
+
+
+def test_concurrent_calls_share_result() -> None:
+    # given
+    flight: SingleFlight[List[int]] = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def fetch() -> List[int]:
+        calls.append(1)
+        release.wait(timeout=5)
+        return [1, 2, 3]
+
+    # when
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = [pool.submit(flight.do, "key", fetch) for _ in range(4)]
+        _wait_for_waiters(flight, "key", 3)
+        release.set()
+        results = [f.result() for f in futures]
+
+    # then
+    assert len(calls) == 1
+    assert sorted(shared for _, shared in results) == [False, True, True, True]
+    assert all(result is results[0][0] for result, _ in results)
+    assert flight.in_flight() == 0
+
+
+def test_error_propagated_to_waiters() -> None:
+    # given
+    flight: SingleFlight[int] = SingleFlight()
+    release = threading.Event()
+
+    def fetch() -> int:
+        release.wait(timeout=5)
+        raise ValueError("failed")
+
+    # when
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        futures = [pool.submit(flight.do, "key", fetch) for _ in range(2)]
+        _wait_for_waiters(flight, "key", 1)
+        release.set()
+
+        # then
+        for future in futures:
+            with pytest.raises(ValueError):
+                future.result()
+    assert flight.in_flight() == 0
+
+
+def test_sequential_calls_not_shared() -> None:
+    # given
+    flight: SingleFlight[int] = SingleFlight()
+    counter = iter(range(10))
+
+    # when
+    results = [flight.do("key", lambda: next(counter)) for _ in range(3)]
+
+    # then
+    assert results == [(0, False), (1, False), (2, False)]
@@ -0,0 +1,186 @@
+import asyncio
+from datetime import datetime
+from enum import Enum
+from http import HTTPStatus
+from typing import Any, Callable, NamedTuple
+
+import pytest
+
+from kentik_api.api_resources.alerting_api import AlertingAPI, AsyncAlertingAPI
+from kentik_api.api_resources.batch_api import AsyncBatchAPI, BatchAPI
+from kentik_api.api_resources.custom_applications_api import AsyncCustomApplicationsAPI, CustomApplicationsAPI
+from kentik_api.api_resources.custom_dimensions_api import AsyncCustomDimensionsAPI, CustomDimensionsAPI
+from kentik_api.api_resources.device_labels_api import AsyncDeviceLabelsAPI, DeviceLabelsAPI
+from kentik_api.api_resources.devices_api import AsyncDevicesAPI, DevicesAPI
+from kentik_api.api_resources.plans_api import AsyncPlansAPI, PlansAPI
+from kentik_api.api_resources.query_api import AsyncQueryAPI, QueryAPI
+from kentik_api.api_resources.saved_filters_api import AsyncSavedFiltersAPI, SavedFiltersAPI
+from kentik_api.api_resources.sites_api import AsyncSitesAPI, SitesAPI
+from kentik_api.api_resources.tags_api import AsyncTagsAPI, TagsAPI
+from kentik_api.api_resources.tenants_api import AsyncMyKentikPortalAPI, MyKentikPortalAPI
+from kentik_api.api_resources.users_api import AsyncUsersAPI, UsersAPI
+from kentik_api.public.query_sql import QuerySQL
+from kentik_api.public.types import ID
+from tests.unit.api_resources.test_alerting import get_active_filter_response_payload
+from tests.unit.api_resources.test_devices import LAZY_DEVICES_RESPONSE
+from tests.unit.stub_api_connector import AsyncStubAPIConnector, StubAPIConnector
+
+
+class _Case(NamedTuple):
+    sync_api: Callable[[Any], Any]
+    async_api: Callable[[Any], Any]
+    call: Callable[[Any], Any]  # performs the call on API object; returns coroutine for async APIs
+    response: str
+    status: int = HTTPStatus.OK
+
+
+# one call per async resource family, with response payload of the corresponding sync test
+CASES = {
+    "alerting": _Case(
+        AlertingAPI,
+        AsyncAlertingAPI,
+        lambda api: api.get_active_alerts(datetime(2020, 10, 15, 22, 15), datetime(2021, 1, 20, 9, 15)),
+        get_active_filter_response_payload,
+    ),
+    "batch": _Case(
+        BatchAPI,
+        AsyncBatchAPI,
+        lambda api: api.get_status("guid12345"),
+        """{"custom_dimension": {"id": 98, "name": "MY_FAVE_DIM"}, "guid": "guid12345", "is_multipart": false,
+            "is_pending": false, "is_complete": true, "number_of_parts": 1,
+            "user": {"id": 2233, "email": "username@domain.com"},
+            "upserts": {"total": 9955, "applied": 9898, "invalid": 0, "unchanged": 0, "over_limit": 57},
+            "deletes": {"total": 0, "applied": 0, "unchanged": 0, "invalid": 0},
+            "replace_all": {"requested": true, "deletes_performed": 0, "successful": true},
+            "batch_date": "2018-09-25T21:41:18.88816Z"}""",
+    ),
+    "custom_applications": _Case(
+        CustomApplicationsAPI,
+        AsyncCustomApplicationsAPI,
+        lambda api: api.get_all(),
+        """[{"id": 42, "company_id": "74333", "user_id": null, "name": "apitest-customapp-1",
+            "description": "TESTING CUSTOM APPS 1", "ip_range": "192.168.0.1,192.168.0.2", "protocol": "6,17",
+            "port": "9001,9002,9003", "asn": "asn1,asn2,asn3", "cdate": "2020-12-11T07:07:20.968Z",
+            "edate": "2020-12-11T07:07:20.968Z"}]""",
+    ),
+    "custom_dimensions": _Case(
+        CustomDimensionsAPI,
+        AsyncCustomDimensionsAPI,
+        lambda api: api.get_all(),
+        """{"customDimensions": [{"id": 42, "name": "c_testapi_dimension_1", "display_name": "dimension_display_name",
+            "type": "string", "populators": [], "company_id": "74333"}]}""",
+    ),
+    "populators": _Case(
+        lambda c: CustomDimensionsAPI(c).populators,
+        lambda c: AsyncCustomDimensionsAPI(c).populators,
+        lambda api: api.delete(ID(4002), ID(42)),
+        "",
+        HTTPStatus.NO_CONTENT,
+    ),
+    "device_labels": _Case(
+        DeviceLabelsAPI,
+        AsyncDeviceLabelsAPI,
+        lambda api: api.get(ID(32)),
+        """{"id": 32, "name": "ISP", "color": "#f1d5b9", "user_id": null, "company_id": "72", "order": 0,
+            "devices": [{"id": "42", "device_name": "my_device_1", "device_subtype": "router"}],
+            "created_date": "2018-05-16T20:21:10.406Z", "updated_date": "2018-05-16T20:21:10.406Z"}""",
+    ),
+    "devices": _Case(DevicesAPI, AsyncDevicesAPI, lambda api: api.get_all(), LAZY_DEVICES_RESPONSE),
+    "interfaces": _Case(
+        lambda c: DevicesAPI(c).interfaces,
+        lambda c: AsyncDevicesAPI(c).interfaces,
+        lambda api: api.get(ID(42), ID(43)),
+        """{"interface": {"id": "43", "company_id": "74333", "device_id": "42", "snmp_id": "1", "snmp_speed": "15",
+            "snmp_type": null, "snmp_alias": null, "interface_ip": null, "interface_description": null,
+            "cdate": "2021-01-13T08:50:37.068Z", "edate": "2021-01-13T08:55:59.403Z", "initial_snmp_id": null,
+            "initial_snmp_alias": null, "initial_interface_description": null, "initial_snmp_speed": null,
+            "interface_ip_netmask": null, "top_nexthop_asns": null, "provider": null, "vrf_id": null, "vrf": null,
+            "secondary_ips": null}}""",
+    ),
+    "plans": _Case(
+        PlansAPI,
+        AsyncPlansAPI,
+        lambda api: api.get_all(),
+        """{"plans": [{"active": true, "bgp_enabled": true, "cdate": "2020-09-03T08:41:57.489Z", "company_id": 74333,
+            "description": "Free Trial", "deviceTypes": [{"device_type": "router"}],
+            "devices": [{"id": "77714", "device_name": "testapi_router_minimal_1", "device_type": "router"}],
+            "edate": "2020-09-03T08:41:57.489Z", "fast_retention": 30, "full_retention": 30, "id": 11466,
+            "max_bigdata_fps": 30, "max_devices": 6, "max_fps": 1000, "name": "Free Trial Plan", "metadata": {}}]}""",
+    ),
+    "query": _Case(
+        QueryAPI,
+        AsyncQueryAPI,
+        lambda api: api.sql(QuerySQL("SELECT 1")),
+        """{"rows": [{"f_sum_in_bytes": 10, "i_start_time": "2021-01-25T11:39:00Z"}]}""",
+    ),
+    "saved_filters": _Case(
+        SavedFiltersAPI,
+        AsyncSavedFiltersAPI,
+        lambda api: api.get(ID(8153)),
+        """{"id": 8153, "company_id": "74333", "filters": {"connector": "All", "filterGroups": [{"connector": "All",
+            "filters": [{"filterField": "dst_as", "filterValue": "81", "operator": "="}], "not": false}]},
+            "filter_name": "test_filter1", "filter_description": "This is test filter description",
+            "cdate": "2020-12-16T11:26:18.578Z", "edate": "2020-12-26T11:26:19.187Z", "filter_level": "company"}""",
+    ),
+    "sites": _Case(
+        SitesAPI,
+        AsyncSitesAPI,
+        lambda api: api.get_all(),
+        """{"sites": [{"id": 42, "site_name": "apitest-site-1", "lat": 54.349276, "lon": 18.659577,
+            "company_id": 3250}]}""",
+    ),
+    "tags": _Case(
+        TagsAPI,
+        AsyncTagsAPI,
+        lambda api: api.get(ID(42)),
+        """{"tag": {"id": 42, "flow_tag": "APITEST-TAG-1", "device_name": "192.168.5.100,device1",
+            "addr": "192.168.0.1/32", "addr_count": 1, "user": "144319", "company_id": "74333",
+            "created_date": "2020-12-10T11:53:48.752418Z", "updated_date": "2020-12-10T11:53:48.752418Z"}}""",
+    ),
+    "tenants": _Case(
+        MyKentikPortalAPI,
+        AsyncMyKentikPortalAPI,
+        lambda api: api.get(ID(577)),
+        """{"id": 577, "name": "test_tenant", "description": "This is test tenant", "users": [{"id": "148099",
+            "user_email": "test@tenant.user", "last_login": null, "tenant_id": "577", "company_id": "74333"}],
+            "created_date": "2020-12-21T10:55:52.449Z", "updated_date": "2020-12-22T10:55:52.449Z"}""",
+    ),
+    "users": _Case(
+        UsersAPI,
+        AsyncUsersAPI,
+        lambda api: api.get(ID(145999)),
+        """{"user": {"id": "145999", "username": "test@user.example", "user_full_name": "Test User",
+            "user_email": "test@user.example", "role": "Member", "email_service": true, "email_product": true,
+            "last_login": null, "created_date": "2020-12-09T14:48:42.187Z",
+            "updated_date": "2020-12-09T14:48:43.243Z", "company_id": "74333", "filters": {},
+            "saved_filters": []}}""",
+    ),
+}
+
+
+def _comparable(obj: Any) -> Any:
+    """Public API objects don't all implement __eq__; compare their attributes instead"""
+    if isinstance(obj, (list, tuple)):
+        return [_comparable(o) for o in obj]
+    if isinstance(obj, dict):
+        return {k: _comparable(v) for k, v in obj.items()}
+    if isinstance(obj, Enum) or not hasattr(obj, "__dict__"):
+        return obj
+    return (type(obj).__name__, _comparable(vars(obj)))
+
+
+@pytest.mark.parametrize("case", CASES.values(), ids=CASES.keys())
+def test_async_api_matches_sync_api(case: _Case) -> None:
+    # given
+    sync_connector = StubAPIConnector(case.response, case.status)
+    async_connector = AsyncStubAPIConnector(case.response, case.status)
+
+    # when
+    expected = case.call(case.sync_api(sync_connector))
+    result = asyncio.run(case.call(case.async_api(async_connector)))
+
+    # then the same request is sent and the response is parsed the same way
+    assert async_connector.last_url_path == sync_connector.last_url_path
+    assert async_connector.last_method == sync_connector.last_method
+    assert async_connector.last_payload == sync_connector.last_payload
+    assert _comparable(result) == _comparable(expected)
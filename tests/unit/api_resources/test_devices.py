@@ -1,5 +1,8 @@
+import json
 from datetime import datetime, timezone
+from enum import Enum
 from http import HTTPStatus
+from typing import Any, Dict
 
 from kentik_api.api_calls.api_call import APICallMethods
 from kentik_api.api_resources.devices_api import DevicesAPI
@@ -1180,6 +1183,113 @@ def test_get_all_devices_success() -> None:
     assert device.device_subtype == DeviceSubtype.router
 
 
+_PLAN = {
+    "active": True,
+    "bgp_enabled": True,
+    "cdate": "2020-09-03T08:41:57.489Z",
+    "company_id": 74333,
+    "description": "Free Trial Plan",
+    "deviceTypes": [{"device_type": "router"}],
+    "devices": [{"id": "42", "device_name": "lazy_router", "device_type": "router"}],
+    "edate": "2020-09-03T08:41:57.489Z",
+    "fast_retention": 30,
+    "full_retention": 30,
+    "id": 11466,
+    "max_bigdata_fps": 30,
+    "max_devices": 6,
+    "max_fps": 1000,
+    "name": "Free Trial Plan",
+    "metadata": {},
+}
+
+
+def _lazy_device(device_id: str, name: str, **fields: Any) -> Dict[str, Any]:
+    device = {
+        "id": device_id,
+        "company_id": "74333",
+        "device_name": name,
+        "device_type": "router",
+        "device_subtype": "router",
+        "device_sample_rate": "1001",
+        "created_date": "2020-12-17T08:24:45.074Z",
+        "updated_date": "2020-12-17T08:24:45.074Z",
+        "plan": _PLAN,
+    }
+    device.update(fields)
+    return device
+
+
+LAZY_DEVICES_RESPONSE = json.dumps(
+    {
+        "devices": [
+            _lazy_device(
+                "42",
+                "lazy_router",
+                site={"id": 8483, "site_name": "marina", "lat": 54.3, "lon": 18.6, "company_id": 74333},
+                labels=[
+                    {
+                        "id": 2590,
+                        "name": "AWS: terraform-demo-aws",
+                        "edate": "2020-10-05T15:28:00.276Z",
+                        "cdate": "2020-10-05T15:28:00.276Z",
+                        "user_id": "133210",
+                        "company_id": "74333",
+                        "color": "#5340A5",
+                    }
+                ],
+                all_interfaces=[
+                    {
+                        "device_id": "42",
+                        "snmp_speed": "75",
+                        "interface_description": "eth0",
+                        "initial_snmp_speed": None,
+                    }
+                ],
+                sending_ips=["128.0.0.11"],
+                device_snmp_v3_conf={"UserName": "John", "AuthenticationProtocol": "MD5"},
+                bgpPeerIP4="208.76.14.223",
+            ),
+            _lazy_device("43", "lazy_minimal", device_type="host-nprobe-dns-www", device_subtype="kprobe"),
+        ]
+    }
+)
+
+
+def _state(value: Any) -> Any:
+    if isinstance(value, list):
+        return [_state(v) for v in value]
+    if hasattr(value, "__dict__") and not isinstance(value, Enum):
+        return {k: _state(v) for k, v in vars(value).items()}
+    return value
+
+
+def _public_state(device: Device) -> Dict[str, Any]:
+    names = [n for n, v in vars(Device).items() if isinstance(v, property)] + ["device_snmp_v3_conf", "sending_ips"]
+    return {n: _state(getattr(device, n)) for n in names}
+
+
+def test_get_all_devices_lazy() -> None:
+    # given
+    connector = StubAPIConnector(LAZY_DEVICES_RESPONSE, HTTPStatus.OK)
+    devices_api = DevicesAPI(connector)
+    eager = devices_api.get_all()
+
+    # when
+    lazy = devices_api.get_all(lazy=True)
+
+    # then nested objects are materialized on first access only
+    assert len(lazy) == len(eager) == 2
+    assert lazy[0]._materialized == {}  # type: ignore
+    assert lazy[0].device_name == eager[0].device_name
+    assert "plan" not in lazy[0]._materialized  # type: ignore
+    assert lazy[0].plan is lazy[0].plan
+    assert lazy[0].has_label("AWS: terraform-demo-aws")
+
+    # and lazy devices expose the same data as eagerly converted ones
+    for lazy_device, eager_device in zip(lazy, eager):
+        assert _public_state(lazy_device) == _public_state(eager_device)
+
+
 def test_apply_labels_success() -> None:
     # given
     apply_labels_response_payload = """
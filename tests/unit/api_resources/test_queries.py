@@ -1,7 +1,12 @@
+import threading
+import time
 from http import HTTPStatus
+from typing import Any
 
-from kentik_api.api_calls.api_call import APICallMethods
+from kentik_api.api_calls.api_call import APICall, APICallMethods
+from kentik_api.api_connection.api_call_response import APICallResponse
 from kentik_api.api_resources.query_api import QueryAPI
+from kentik_api.public.errors import BadRequestError
 from kentik_api.public.query_object import (
     Aggregate,
     AggregateFunctionType,
@@ -192,6 +197,39 @@ def test_query_data_success() -> None:
     assert result.results[0]["data"] is not None
 
 
+class StreamingStubConnector(StubAPIConnector):
+    """Returns the response body in small chunks via send_stream"""
+
+    def __init__(self, response_text: str) -> None:
+        super().__init__(response_text, HTTPStatus.OK)
+        self.streamed = False
+
+    def send_stream(self, api_call: APICall, payload: Any = None) -> APICallResponse:
+        response = self.send(api_call, payload)
+        body = response.content
+        self.streamed = True
+        return APICallResponse(response.http_status_code, stream=(body[i : i + 7] for i in range(0, len(body), 7)))
+
+
+def test_query_data_uses_send_stream_if_available() -> None:
+    # given
+    payload = '{"results": [{"bucket": "b1", "data": [{"key": "Total"}]}, {"bucket": "b2", "data": []}]}'
+    buffered = StubAPIConnector(payload, HTTPStatus.OK)
+    streaming = StreamingStubConnector(payload)
+    query_object = QueryObject(
+        queries=[QueryArrayItem(query=Query(dimension=[DimensionType.Traffic], metric=[MetricType.bytes]), bucket="b1")]
+    )
+
+    # when
+    from_buffered = QueryAPI(buffered).data(query_object)
+    from_stream = QueryAPI(streaming).data(query_object)
+
+    # then
+    assert streaming.streamed
+    assert from_stream.results == from_buffered.results
+    assert [r["bucket"] for r in from_stream.results] == ["b1", "b2"]
+
+
 def test_query_chart_success() -> None:
     # given
     query_response_payload = """{"dataUri": "data:image/png;base64,ImageDataEncodedBase64=="}"""
@@ -358,3 +396,62 @@ def test_query_url_success() -> None:
 
     # and response properly parsed
     assert result.url == unquoted_response
+
+
+class EchoSQLConnector:
+    """Responds to SQL query "<n>" with single row {"n": <n>} after n milliseconds; query "fail" is rejected"""
+
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def send(self, api_call: APICall, payload: Any = None) -> APICallResponse:
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            query = payload["query"]
+            if query == "fail":
+                raise BadRequestError("HTTP", HTTPStatus.BAD_REQUEST, "invalid query")
+            time.sleep(int(query) / 1000)
+            return APICallResponse(HTTPStatus.OK, f'{{"rows": [{{"n": {query}}}]}}')
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+def test_run_many_in_order() -> None:
+    # given
+    connector = EchoSQLConnector()
+    query_api = QueryAPI(connector)
+    queries = [QuerySQL(query=q) for q in ["30", "fail", "10", "20", "0"]]
+
+    # when
+    results = list(query_api.run_many(queries, max_concurrency=2))
+
+    # then results are in submission order
+    assert [r.index for r in results] == [0, 1, 2, 3, 4]
+    assert [r.query for r in results] == queries
+    assert connector.max_in_flight <= 2
+
+    # and the failed query doesn't abort the batch
+    assert not results[1].ok
+    assert isinstance(results[1].error, BadRequestError)
+    assert all(r.ok for i, r in enumerate(results) if i != 1)
+    assert results[0].result.rows == [{"n": 30}]  # type: ignore
+    assert results[4].result.rows == [{"n": 0}]  # type: ignore
+
+
+def test_run_many_as_completed() -> None:
+    # given
+    connector = EchoSQLConnector()
+    query_api = QueryAPI(connector)
+    queries = [QuerySQL(query=q) for q in ["200", "0"]]
+
+    # when
+    results = list(query_api.run_many(queries, max_concurrency=2, in_order=False))
+
+    # then the fast query is returned first
+    assert [r.index for r in results] == [1, 0]
+    assert all(r.ok for r in results)
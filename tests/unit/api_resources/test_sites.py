@@ -1,10 +1,11 @@
+import asyncio
 from http import HTTPStatus
 
 from kentik_api.api_calls.api_call import APICallMethods
-from kentik_api.api_resources.sites_api import SitesAPI
+from kentik_api.api_resources.sites_api import AsyncSitesAPI, SitesAPI
 from kentik_api.public.site import Site
 from kentik_api.public.types import ID
-from tests.unit.stub_api_connector import StubAPIConnector
+from tests.unit.stub_api_connector import AsyncStubAPIConnector, StubAPIConnector
 
 
 def test_create_site_success() -> None:
@@ -129,3 +130,33 @@ def test_delete_site_success() -> None:
 
     # then response properly parsed
     assert delete_successful
+
+
+def test_async_get_site_success() -> None:
+    # given
+    get_response_payload = """
+    {
+        "site": {
+            "id": 42,
+            "site_name": "apitest-site-1",
+            "lat": 54.349276,
+            "lon": 18.659577,
+            "company_id": 3250
+        }
+    }"""
+    connector = AsyncStubAPIConnector(get_response_payload, HTTPStatus.OK)
+    sites_api = AsyncSitesAPI(connector)
+
+    # when
+    site_id = ID(42)
+    site = asyncio.run(sites_api.get(site_id))
+
+    # then request properly formed
+    assert connector.last_url_path == f"/site/{site_id}"
+    assert connector.last_method == APICallMethods.GET
+    assert connector.last_payload is None
+
+    # and response properly parsed
+    assert site.id == ID(42)
+    assert site.site_name == "apitest-site-1"
+    assert site.company_id == ID(3250)
@@ -0,0 +1,39 @@
+import kentik_api.generated.kentik.cloud_export.v202101beta1.cloud_export_pb2 as pb
+from kentik_api.cloudexport.client import KentikCloudExportClient
+from kentik_api.cloudexport.snapshot import ChangeType
+from tests.unit.cloudexport.stub_api_connector import StubAPICloudExportConnector
+
+from .test_aws import AWS, PB_AWS
+from .test_gce import PB_GCE
+
+
+def _export(src: pb.CloudExport, export_id: str) -> pb.CloudExport:
+    export = pb.CloudExport()
+    export.CopyFrom(src)
+    export.id = export_id
+    return export
+
+
+def test_snapshot_changes() -> None:
+    # given
+    aws, gce, ibm = _export(PB_AWS, "1"), _export(PB_GCE, "2"), _export(PB_GCE, "3")
+    connector = StubAPICloudExportConnector(exports_response=pb.ListCloudExportResponse(exports=[aws, gce, ibm]))
+    client = KentikCloudExportClient(connector)
+
+    # when
+    first = client.snapshot()
+    gce.description = "changed"
+    connector._exports_response = pb.ListCloudExportResponse(exports=[aws, gce], invalid_exports_count=1)
+    second = client.snapshot(first)
+    third = client.snapshot(second)
+
+    # then
+    assert [(c.type, c.export_id) for c in first.changes] == [(ChangeType.ADDED, i) for i in ["1", "2", "3"]]
+    assert first.exports["1"].name == AWS.name
+    assert [(c.type, c.export_id) for c in second.changes] == [(ChangeType.CHANGED, "2"), (ChangeType.REMOVED, "3")]
+    changed = second.changes_of(ChangeType.CHANGED)[0]
+    assert (changed.export.description, changed.previous.description) == ("changed", PB_GCE.description)  # type: ignore
+    assert second.exports["1"] is first.exports["1"]  # unchanged export is not deserialized again
+    assert second.invalid_exports_count == 1
+    assert third.changes == []
+    assert list(third.exports) == ["1", "2"]
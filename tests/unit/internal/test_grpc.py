@@ -0,0 +1,126 @@
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import Dict, List, Optional, Type
+
+import pytest
+from google.protobuf.wrappers_pb2 import BoolValue  # type: ignore
+from grpc import StatusCode
+from grpc._channel import _InactiveRpcError
+
+from kentik_api.internal.grpc import _ConfigElement, _from_pb_plans, wrap_grpc_errors
+from kentik_api.public.errors import (
+    AuthError,
+    BadRequestError,
+    KentikAPIError,
+    NotFoundError,
+    ProtocolError,
+    TimedOutError,
+    UnavailabilityError,
+)
+
+
+@dataclass
+class _Inner(_ConfigElement):
+    value: int = 0
+
+
+@dataclass
+class _Outer(_ConfigElement):
+    name: str = ""
+    enabled: bool = False
+    inner: Optional[_Inner] = None
+    items: List[_Inner] = field(default_factory=list)
+    labels: Dict[str, str] = field(default_factory=dict)
+    comment: Optional[str] = None
+    _id: str = field(default="", init=False, compare=False)
+
+
+def test_from_pb() -> None:
+    # given
+    src = SimpleNamespace(
+        name="test",
+        enabled=BoolValue(value=True),
+        inner=SimpleNamespace(value=1),
+        items=[SimpleNamespace(value=2), SimpleNamespace(value=3)],
+        labels={"a": "b"},
+        comment="",
+        id="42",
+    )
+
+    # when
+    obj = _Outer.from_pb(src)
+
+    # then
+    assert obj == _Outer(name="test", enabled=True, inner=_Inner(1), items=[_Inner(2), _Inner(3)], labels={"a": "b"})
+    assert obj.comment is None  # empty optional protobuf field
+    assert obj._id == "42"  # pylint: disable=protected-access
+
+
+def test_from_pb_plan_built_once() -> None:
+    # given
+    src = SimpleNamespace(value=7)
+
+    # when
+    _Inner.from_pb(src)
+    plan = _from_pb_plans[_Inner]
+    _Inner.from_pb(src)
+
+    # then
+    assert _from_pb_plans[_Inner] is plan
+
+
+def test_from_pb_unsupported_value() -> None:
+    # given
+    src = SimpleNamespace(value=object())
+
+    # when - then
+    with pytest.raises(RuntimeError):
+        _Inner.from_pb(src)
+
+
+class _RpcError(_InactiveRpcError):
+    """Error raised by synchronous stubs for failed calls"""
+
+    def __init__(self, code: StatusCode) -> None:  # pylint: disable=super-init-not-called
+        self._code = code
+
+    def code(self) -> StatusCode:
+        return self._code
+
+    def __str__(self) -> str:
+        return self._code.name
+
+
+# Before the mapping was looked up by StatusCode, every failed call was reported as plain ProtocolError carrying
+# the numeric status code. Specific errors stay ProtocolError subclasses (so existing handlers keep matching),
+# except for TimedOutError, which is an IntermittentError like its HTTP counterpart.
+@pytest.mark.parametrize(
+    "code, expected, compatible",
+    [
+        (StatusCode.INVALID_ARGUMENT, BadRequestError, True),
+        (StatusCode.DEADLINE_EXCEEDED, TimedOutError, False),
+        (StatusCode.NOT_FOUND, NotFoundError, True),
+        (StatusCode.PERMISSION_DENIED, AuthError, True),
+        (StatusCode.UNAUTHENTICATED, AuthError, True),
+        (StatusCode.UNAVAILABLE, UnavailabilityError, True),
+        (StatusCode.RESOURCE_EXHAUSTED, ProtocolError, True),
+        (StatusCode.INTERNAL, ProtocolError, True),
+    ],
+)
+def test_wrap_grpc_errors_maps_status_code(code: StatusCode, expected: Type[KentikAPIError], compatible: bool) -> None:
+    # given
+    @wrap_grpc_errors
+    def call() -> None:
+        raise _RpcError(code)
+
+    # when
+    with pytest.raises(KentikAPIError) as exc_info:
+        call()
+
+    # then
+    error = exc_info.value
+    assert type(error) is expected  # pylint: disable=unidiomatic-typecheck
+    assert isinstance(error, ProtocolError) == compatible
+    if isinstance(error, ProtocolError):
+        # same protocol and status code as the ProtocolError reported before
+        assert (error.protocol, error.status_code) == ("gRPC", code.value[0])
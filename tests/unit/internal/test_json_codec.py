@@ -0,0 +1,159 @@
+import json
+from http import HTTPStatus
+from typing import Any, List
+
+import pytest
+
+from kentik_api import KentikAPI
+from kentik_api.api_calls.api_call import APICall
+from kentik_api.api_connection.api_call_response import APICallResponse
+from kentik_api.api_resources.devices_api import DevicesAPI
+from kentik_api.api_resources.query_api import QueryAPI
+from kentik_api.api_resources.sites_api import SitesAPI
+from kentik_api.internal import json_codec
+from kentik_api.internal.json_codec import STDLIB, JSONCodec, JSONInput, get_codec, set_default_codec
+from kentik_api.public.query_object import DimensionType, MetricType, Query, QueryArrayItem, QueryObject
+from kentik_api.public.types import ID
+from tests.unit.api_resources.test_devices import LAZY_DEVICES_RESPONSE
+from tests.unit.stub_api_connector import StubAPIConnector
+
+DATA = {"name": "żółw", "ids": [1, 2**70], "nested": {"ok": True, "none": None, "ratio": 0.5}}
+
+
+@pytest.fixture(autouse=True)
+def restore_default_codec():
+    yield
+    set_default_codec(None)
+
+
+@pytest.mark.parametrize("name", ["orjson", "ujson", "json"])
+def test_codec_round_trip(name: str) -> None:
+    # given
+    try:
+        codec = get_codec(name)
+    except ValueError:
+        pytest.skip(f"{name} not installed")
+
+    # when
+    encoded = codec.dumps(DATA)
+
+    # then
+    assert isinstance(encoded, bytes)
+    assert json.loads(encoded) == DATA
+    assert codec.loads(encoded) == DATA
+    assert codec.loads(encoded.decode()) == DATA
+
+
+def test_codec_falls_back_to_stdlib() -> None:
+    # given
+    def failing(_):
+        raise ValueError("unsupported")
+
+    codec = JSONCodec("failing", failing, failing)
+
+    # when - then
+    assert codec.loads('{"a": NaN}')["a"] != 0
+    assert codec.dumps({"a": 1}) == b'{"a": 1}'
+    with pytest.raises(json.JSONDecodeError):
+        codec.loads("{invalid")
+
+
+def test_set_default_codec() -> None:
+    # when
+    set_default_codec("json")
+
+    # then
+    assert get_codec() is STDLIB
+    assert json_codec.dumps({"a": [1]}) == b'{"a": [1]}'
+    with pytest.raises(ValueError):
+        set_default_codec("no-such-codec")
+
+
+class _CodecConnector(StubAPIConnector):
+    def __init__(self, response_text: str, codec: JSONCodec) -> None:
+        super().__init__(response_text, HTTPStatus.OK)
+        self.json_codec = codec
+
+
+class _StreamingCodecConnector(_CodecConnector):
+    def send_stream(self, api_call: APICall, payload: Any = None) -> APICallResponse:
+        body = self.send(api_call, payload).content
+        return APICallResponse(HTTPStatus.OK, stream=(body[i : i + 100] for i in range(0, len(body), 100)))
+
+
+def _counting_codec(name: str, calls: List[str]) -> JSONCodec:
+    def loads(data: JSONInput) -> Any:
+        calls.append(name)
+        return json.loads(data)
+
+    return JSONCodec(name, loads, STDLIB.dumps)
+
+
+def test_connector_codec_is_used_for_its_responses_only() -> None:
+    # given
+    calls: List[str] = []
+
+    def counting(name: str) -> JSONCodec:
+        return _counting_codec(name, calls)
+
+    default = get_codec()
+    response = (
+        '{"site": {"id": 42, "site_name": "apitest-site-1", "lat": 54.349276, "lon": 18.659577, "company_id": 3250}}'
+    )
+    sites_a = SitesAPI(_CodecConnector(response, counting("a")))
+    sites_b = SitesAPI(_CodecConnector(response, counting("b")))
+    sites_default = SitesAPI(StubAPIConnector(response, HTTPStatus.OK))
+
+    # when
+    site_a = sites_a.get(ID(42))
+    site_b = sites_b.get(ID(42))
+    site_default = sites_default.get(ID(42))
+
+    # then
+    assert calls == ["a", "b"]
+    assert site_a.id == site_b.id == site_default.id == ID(42)
+    assert get_codec() is default
+    # and decoding outside of API handlers is not affected by codec of the last connector used
+    json_codec.loads("{}")
+    assert calls == ["a", "b"]
+
+
+QUERY_OBJECT = QueryObject(
+    queries=[QueryArrayItem(query=Query(dimension=[DimensionType.Traffic], metric=[MetricType.bytes]), bucket="b1")]
+)
+
+
+@pytest.mark.parametrize("connector_class", [_CodecConnector, _StreamingCodecConnector], ids=["buffered", "streamed"])
+@pytest.mark.parametrize(
+    "response, call, count",
+    [
+        (LAZY_DEVICES_RESPONSE, lambda c: DevicesAPI(c).get_all(), 2),
+        (LAZY_DEVICES_RESPONSE, lambda c: DevicesAPI(c).get_all(lazy=True), 2),
+        (LAZY_DEVICES_RESPONSE, lambda c: list(DevicesAPI(c).iter_all()), 2),
+        ('{"results": [{"bucket": "b1", "data": []}]}', lambda c: QueryAPI(c).data(QUERY_OBJECT).results, 1),
+    ],
+    ids=["devices_get_all", "devices_get_all_lazy", "devices_iter_all", "query_data"],
+)
+def test_connector_codec_is_used_for_devices_and_query_data(connector_class, response, call, count) -> None:
+    # given
+    calls: List[str] = []
+    connector = connector_class(response, _counting_codec("selected", calls))
+
+    # when
+    result = call(connector)
+
+    # then
+    assert len(result) == count
+    assert calls == ["selected"]
+
+
+def test_kentik_api_json_codec_does_not_change_default() -> None:
+    # given
+    default = get_codec()
+
+    # when
+    client = KentikAPI("email", "token", json_codec="json")
+
+    # then
+    assert get_codec() is default
+    assert client._connector.json_codec is STDLIB  # pylint: disable=protected-access
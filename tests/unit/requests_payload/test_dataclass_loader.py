@@ -0,0 +1,85 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import dacite
+import pytest
+
+from kentik_api.public.errors import DeserializationError
+from kentik_api.requests_payload import dataclass_loader
+from kentik_api.requests_payload.conversions import from_dict
+
+
+@dataclass
+class _Label:
+    id: int
+    name: str
+    color: Optional[str]
+
+
+@dataclass
+class _Node:
+    name: str
+    ratio: float
+    labels: List[_Label]
+    attrs: Dict[str, Any]
+    raw: Dict
+    tags: List[str] = field(default_factory=list)
+    parent: Optional["_Node"] = None
+    value: Union[int, str] = 0
+
+
+@dataclass
+class _WithTuple:
+    pair: Tuple[int, int]
+
+
+NODE_DATA: Dict[str, Any] = {
+    "name": "child",
+    "ratio": 1,  # int is accepted for float
+    "labels": [{"id": 1, "name": "l1", "color": None}, {"id": 2, "name": "l2"}],
+    "attrs": {"a": [1, 2]},
+    "raw": {"b": None},
+    "parent": {"name": "root", "ratio": 0.5, "labels": [], "attrs": {}, "raw": {}, "value": "x"},
+    "extra": "ignored",
+}
+
+
+def test_loader_matches_dacite() -> None:
+    # when
+    loaded = dataclass_loader.load(_Node, NODE_DATA)
+
+    # then
+    assert loaded == dacite.from_dict(_Node, NODE_DATA)
+    assert loaded.labels[1].color is None
+    assert loaded.parent is not None and loaded.parent.value == "x"
+    assert loaded.tags == []
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {**NODE_DATA, "name": 5},
+        {**NODE_DATA, "ratio": "1.0"},
+        {**NODE_DATA, "labels": [{"id": "1", "name": "l1"}]},
+        {**NODE_DATA, "labels": {"id": 1}},
+        {**NODE_DATA, "value": 1.5},
+        {k: v for k, v in NODE_DATA.items() if k != "attrs"},
+    ],
+)
+def test_mismatch_reports_dacite_error(data: Dict[str, Any]) -> None:
+    # given
+    with pytest.raises(dacite.DaciteError) as dacite_error:
+        dacite.from_dict(_Node, data)
+
+    # when - then
+    with pytest.raises(dataclass_loader.LoaderMismatch):
+        dataclass_loader.load(_Node, data)
+    with pytest.raises(DeserializationError) as error:
+        from_dict(_Node, data)
+    assert str(dacite_error.value) in str(error.value)
+
+
+def test_unsupported_type_falls_back_to_dacite() -> None:
+    # when - then
+    assert dataclass_loader.get_loader(_WithTuple) is None
+    assert from_dict(_WithTuple, {"pair": (1, 2)}) == _WithTuple(pair=(1, 2))
@@ -0,0 +1,118 @@
+import json
+from typing import Any, Iterator, List
+
+import pytest
+
+from kentik_api.api_connection.api_call_response import APICallResponse
+from kentik_api.internal.json_codec import STDLIB, JSONCodec, JSONInput
+from kentik_api.public.errors import DeserializationError
+from kentik_api.requests_payload.conversions import iter_list_from_json
+from kentik_api.requests_payload.json_stream import iter_array
+
+
+def _chunked(data: bytes, size: int) -> Iterator[bytes]:
+    for i in range(0, len(data), size):
+        yield data[i : i + size]
+
+
+DOCUMENT = {
+    "meta": {"count": 3, "tags": ["a", "b"]},
+    "devices": [{"id": 12345, "name": "żółw-1"}, {"id": 2, "name": 'quote " and \\ backslash'}, 1.5e3, None, True],
+    "trailing": "ignored",
+}
+
+
+def _buffering_codec(calls: List[JSONInput]) -> JSONCodec:
+    def loads(data: JSONInput) -> Any:
+        calls.append(data)
+        return json.loads(data)
+
+    return JSONCodec("buffering", loads, STDLIB.dumps)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 1024])
+@pytest.mark.parametrize("codec", [STDLIB, _buffering_codec([])], ids=["stdlib", "other"])
+def test_iter_array_nested_under_root(chunk_size: int, codec: JSONCodec) -> None:
+    # given
+    data = json.dumps(DOCUMENT, ensure_ascii=False, indent=2).encode()
+
+    # when
+    items = list(iter_array(_chunked(data, chunk_size), root="devices", codec=codec))
+
+    # then
+    assert items == DOCUMENT["devices"]
+
+
+def test_iter_array_top_level() -> None:
+    # given
+    data = b" [ 1 , 22 , 333 ] "
+
+    # when
+    items = list(iter_array(_chunked(data, 1), codec=STDLIB))
+
+    # then
+    assert items == [1, 22, 333]
+
+
+def test_iter_array_empty() -> None:
+    assert list(iter_array([b'{"devices": []}'], root="devices")) == []
+
+
+def test_iter_array_yields_before_end_of_input() -> None:
+    # given
+    consumed: List[bytes] = []
+
+    def chunks() -> Iterator[bytes]:
+        for chunk in [b'{"devices": [{"id": 1}, ', b'{"id": 2}', b"]}"]:
+            consumed.append(chunk)
+            yield chunk
+
+    # when
+    items = iter_array(chunks(), root="devices", codec=STDLIB)
+    first = next(items)
+
+    # then
+    assert first == {"id": 1}
+    assert len(consumed) < 3
+
+
+def test_iter_array_decodes_whole_document_with_other_codecs() -> None:
+    # given
+    calls: List[JSONInput] = []
+    codec = _buffering_codec(calls)
+    data = json.dumps(DOCUMENT).encode()
+
+    # when
+    items = list(iter_array(_chunked(data, 7), root="devices", codec=codec))
+
+    # then
+    assert items == DOCUMENT["devices"]
+    assert calls == [data]
+
+
+@pytest.mark.parametrize("codec", [STDLIB, _buffering_codec([])], ids=["stdlib", "other"])
+def test_iter_list_from_json_missing_root(codec: JSONCodec) -> None:
+    with pytest.raises(DeserializationError):
+        list(iter_list_from_json("Test", [b'{"sites": [1, 2]}'], root="devices", codec=codec))
+
+
+@pytest.mark.parametrize("codec", [STDLIB, _buffering_codec([])], ids=["stdlib", "other"])
+def test_iter_list_from_json_invalid_json(codec: JSONCodec) -> None:
+    with pytest.raises(DeserializationError):
+        list(iter_list_from_json("Test", [b'{"devices": [1, 2'], root="devices", codec=codec))
+    with pytest.raises(DeserializationError):
+        list(iter_list_from_json("Test", [b'{"devices": {"id": 1}}'], root="devices", codec=codec))
+    with pytest.raises(DeserializationError):
+        list(iter_list_from_json("Test", [b'[{"devices": []}]'], root="devices", codec=codec))
+
+
+def test_api_call_response_body_access() -> None:
+    # given
+    streamed = APICallResponse(200, stream=iter([b'{"a": "\xc5', b'\xbc"}']))
+    text = APICallResponse(200, '{"a": "ż"}')
+
+    # when - then
+    assert streamed.text == '{"a": "ż"}'
+    assert streamed.content == '{"a": "ż"}'.encode()
+    assert b"".join(text.iter_content()) == text.content
+    assert APICallResponse(200, b"abc").text == "abc"
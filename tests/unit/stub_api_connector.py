@@ -22,3 +22,10 @@ class StubAPIConnector:
         self.last_method = api_call.method
         self.last_payload = payload
         return APICallResponse(self.response_code, self.response_text)
+
+
+class AsyncStubAPIConnector(StubAPIConnector):
+    """AsyncStubAPIConnector implements AsyncAPIConnectorProtocol. Allows for stubbed responses for api requests."""
+
+    async def send(self, api_call: APICall, payload: Any = None) -> APICallResponse:  # type: ignore
+        return super().send(api_call, payload)
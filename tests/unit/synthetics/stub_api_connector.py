@@ -68,6 +68,7 @@ class StubAPISyntheticsConnector:
         agent_ids: Optional[List[str]] = None,
         task_ids: Optional[List[str]] = None,
         aggregate: bool = False,
+        timeout: Optional[float] = None,
     ) -> pb.GetResultsForTestsResponse:
         return self._results_response
 
@@ -0,0 +1,79 @@
+from typing import List
+
+import kentik_api.generated.kentik.synthetics.v202202.synthetics_pb2 as pb
+from kentik_api.synthetics.catalog import SynthCatalog
+from kentik_api.synthetics.synth_client import KentikSynthClient
+from kentik_api.synthetics.synth_tests import IPTest
+from tests.unit.synthetics.stub_api_connector import StubAPISyntheticsConnector
+from tests.unit.synthetics.test_agents import PB_AGENTS
+
+
+class _CountingConnector(StubAPISyntheticsConnector):
+    def __init__(self, agents: List[pb.Agent], tests: List[pb.Test]) -> None:
+        super().__init__(agents_response=agents, tests_response=tests)
+        self.fetches = 0
+
+    def get_all_tests(self) -> List[pb.Test]:
+        self.fetches += 1
+        return super().get_all_tests()
+
+
+def _pb_test(test_id: str, name: str, targets: List[str], agent_ids: List[str], labels: List[str]) -> pb.Test:
+    test = IPTest.create(name, targets, agent_ids)
+    test.labels = labels
+    obj = test.to_pb()
+    obj.id = test_id
+    return obj
+
+
+def test_catalog_lookups() -> None:
+    # given
+    tests = [
+        _pb_test("100", "ping dns", ["1.1.1.1", "8.8.8.8"], ["1234"], ["dns"]),
+        _pb_test("400", "ping google", ["8.8.8.8"], ["1234", "999"], ["dns", "google"]),
+    ]
+    catalog = SynthCatalog(
+        KentikSynthClient(StubAPISyntheticsConnector(agents_response=PB_AGENTS, tests_response=tests))
+    )
+
+    # when - then
+    assert [a.id for a in catalog.agents_by_alias("agent alias")] == ["1234"]
+    assert [a.id for a in catalog.agents_by_site("7")] == ["1234"]
+    assert [a.id for a in catalog.agents_by_asn(1500)] == ["1234"]
+    assert [a.id for a in catalog.agents_by_ip("150.15.250.25")] == ["1234"]
+    assert catalog.agents_by_alias("missing") == []
+    assert [a.id for a in catalog.agents_by_name("agent alias")] == ["1234"]
+    assert [a.id for a in catalog.agents_by_name(PB_AGENTS[0].site_name)] == ["1234"]
+    assert catalog.agents_by_name("") == []
+    assert catalog.test("400").name == "ping google"  # type: ignore
+    assert [t.id for t in catalog.tests_by_name("ping dns")] == ["100"]
+    assert [t.id for t in catalog.tests_by_label("dns")] == ["100", "400"]
+    assert [t.id for t in catalog.tests_by_target("8.8.8.8")] == ["100", "400"]
+    # agent reports tests 100, 200 and 300 (only 100 exists), test 400 lists the agent in its settings
+    assert [t.id for t in catalog.tests_for_agent("1234")] == ["100", "400"]
+    assert [t.id for t in catalog.tests_for_agent("999")] == ["400"]
+    assert [a.id for a in catalog.agents_for_test("400")] == ["1234"]
+
+
+def test_catalog_ttl() -> None:
+    # given
+    now = [0.0]
+    connector = _CountingConnector(PB_AGENTS, [_pb_test("100", "test", ["1.1.1.1"], ["1234"], [])])
+    catalog = SynthCatalog(KentikSynthClient(connector), ttl=60, clock=lambda: now[0])
+
+    # when
+    catalog.test("100")
+    now[0] = 59
+    catalog.tests_by_name("test")
+    fetches_within_ttl = connector.fetches
+    now[0] = 60
+    catalog.test("100")
+    fetches_after_ttl = connector.fetches
+    catalog.invalidate()
+    catalog.test("100")
+
+    # then
+    assert fetches_within_ttl == 1
+    assert fetches_after_ttl == 2
+    assert connector.fetches == 3
+    assert catalog.age == 0
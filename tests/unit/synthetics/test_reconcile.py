@@ -0,0 +1,147 @@
+import threading
+from typing import Dict, List
+
+import kentik_api.generated.kentik.synthetics.v202202.synthetics_pb2 as pb
+from kentik_api.public.errors import KentikAPIError
+from kentik_api.synthetics.reconcile import ReconcileAction
+from kentik_api.synthetics.synth_client import KentikSynthClient
+from kentik_api.synthetics.synth_tests import IPTest
+from kentik_api.synthetics.types import TestStatus
+from tests.unit.synthetics.stub_api_connector import StubAPISyntheticsConnector
+
+
+class _TestStore(StubAPISyntheticsConnector):
+    """In-memory test store recording issued calls"""
+
+    def __init__(self, tests: List[pb.Test]) -> None:
+        super().__init__()
+        self.tests: Dict[str, pb.Test] = {t.id: t for t in tests}
+        self.calls: List[str] = []
+        self._lock = threading.Lock()
+        self._next_id = 1000
+
+    def get_all_tests(self) -> List[pb.Test]:
+        return list(self.tests.values())
+
+    def create_test(self, test: pb.Test) -> pb.Test:
+        if test.name == "broken":
+            raise KentikAPIError("create failed")
+        with self._lock:
+            self.calls.append(f"create {test.name}")
+            self._next_id += 1
+            created = pb.Test()
+            created.CopyFrom(test)
+            created.id = str(self._next_id)
+            created.status = pb.TestStatus.TEST_STATUS_ACTIVE
+            self.tests[created.id] = created
+        return created
+
+    def update_test(self, test: pb.Test) -> pb.Test:
+        with self._lock:
+            self.calls.append(f"update {test.id}")
+            test.status = self.tests[test.id].status
+            self.tests[test.id] = test
+        return test
+
+    def delete_test(self, test_id: str) -> None:
+        with self._lock:
+            self.calls.append(f"delete {test_id}")
+            del self.tests[test_id]
+
+    def test_status_update(self, test_id: str, status: pb.TestStatus) -> None:
+        with self._lock:
+            self.calls.append(f"status {test_id} {status}")
+            self.tests[test_id].status = status
+
+
+def _deployed(test: IPTest, test_id: str) -> pb.Test:
+    obj = test.to_pb()
+    obj.id = test_id
+    obj.status = pb.TestStatus.TEST_STATUS_ACTIVE
+    return obj
+
+
+def test_reconcile_tests() -> None:
+    # given
+    unchanged = IPTest.create("unchanged", ["1.1.1.1"], ["10"])
+    modified = IPTest.create("modified", ["2.2.2.2"], ["10"])
+    paused = IPTest.create("paused", ["3.3.3.3"], ["10"])
+    store = _TestStore(
+        [
+            _deployed(unchanged, "1"),
+            _deployed(modified, "2"),
+            _deployed(paused, "3"),
+            _deployed(IPTest.create("obsolete", ["4.4.4.4"], ["10"]), "4"),
+        ]
+    )
+    client = KentikSynthClient(store)
+    modified.settings.agent_ids.append("11")
+    paused.status = TestStatus.PAUSED
+    new = IPTest.create("new", ["5.5.5.5"], ["10"])
+    new.status = TestStatus.PAUSED
+    desired = [unchanged, modified, paused, new, IPTest.create("broken", ["6.6.6.6"], ["10"])]
+
+    # when
+    report = client.reconcile_tests(desired, delete_missing=True, max_workers=4)
+
+    # then only necessary calls are issued
+    paused_status = pb.TestStatus.TEST_STATUS_PAUSED
+    assert sorted(store.calls) == sorted(
+        ["update 2", f"status 3 {paused_status}", "create new", f"status 1001 {paused_status}", "delete 4"]
+    )
+    assert report.unchanged == ["unchanged"]
+    outcomes = {o.name: o for o in report.outcomes}
+    assert outcomes["new"].actions == [ReconcileAction.CREATE, ReconcileAction.SET_STATUS]
+    assert outcomes["new"].test_id == "1001"
+    assert outcomes["obsolete"].actions == [ReconcileAction.DELETE]
+    assert [o.name for o in report.failed] == ["broken"]
+    assert report.count(ReconcileAction.UPDATE) == 1
+
+    # and the next reconcile finds nothing to do
+    store.calls.clear()
+    report = client.reconcile_tests(desired[:4], delete_missing=True)
+    assert store.calls == []
+    assert sorted(report.unchanged) == ["modified", "new", "paused", "unchanged"]
+
+
+def test_conflicts_reported_per_test() -> None:
+    # given
+    twin_a = _deployed(IPTest.create("twin", ["1.1.1.1"], ["10"]), "1")
+    twin_b = _deployed(IPTest.create("twin", ["2.2.2.2"], ["10"]), "2")
+    single = IPTest.create("single", ["3.3.3.3"], ["10"])
+    store = _TestStore([twin_a, twin_b, _deployed(single, "3")])
+    client = KentikSynthClient(store)
+    unknown = IPTest.create("unknown", ["4.4.4.4"], ["10"])
+    unknown.id = "99"
+    duplicate = IPTest.create("single", ["3.3.3.3"], ["10"])
+    modified = IPTest.create("single", ["3.3.3.3"], ["10", "11"])
+    desired = [IPTest.create("twin", ["1.1.1.1"], ["10"]), unknown, modified, duplicate, IPTest.create("new", [], [])]
+
+    # when
+    report = client.reconcile_tests(desired, delete_missing=True)
+
+    # then the other tests are reconciled, and tests the ambiguous name may refer to are not deleted
+    assert sorted(store.calls) == ["create new", "update 3"]
+    errors = {(o.name, o.test_id): str(o.error) for o in report.failed}
+    assert errors == {
+        ("twin", ""): "Test name 'twin' is ambiguous (2 tests)",
+        ("unknown", "99"): "Test 'unknown' (id: 99) does not exist",
+        ("single", ""): "Test 'single' (id: 3) is matched by multiple desired tests",
+    }
+    assert report.unchanged == []
+    assert [o.actions for o in report.outcomes if not o.failed] == [[ReconcileAction.UPDATE], [ReconcileAction.CREATE]]
+
+
+def test_labels_order_ignored() -> None:
+    # given
+    existing = IPTest.create("labelled", ["1.1.1.1"], ["10"])
+    existing.labels = ["b", "a"]
+    desired = IPTest.create("labelled", ["1.1.1.1"], ["10"])
+    desired.labels = ["a", "b"]
+    client = KentikSynthClient(_TestStore([_deployed(existing, "1")]))
+
+    # when
+    changes = client.plan_tests_reconcile([desired])
+
+    # then
+    assert [(c.name, c.actions, c.conflict) for c in changes] == [("labelled", [], None)]
@@ -1,5 +1,6 @@
 from datetime import datetime, timezone
 
+import pytest
 from google.protobuf.timestamp_pb2 import Timestamp  # type: ignore
 
 import kentik_api.generated.kentik.synthetics.v202202.synthetics_pb2 as pb
@@ -7,6 +8,7 @@ from kentik_api.public.types import ID, IP
 from kentik_api.synthetics.synth_client import KentikSynthClient
 from kentik_api.synthetics.synth_tests.base import DateTime
 from kentik_api.synthetics.synth_tests.results import (
+    RESULTS_COLUMNS,
     AgentResults,
     DnsResponseData,
     DnsTaskResults,
@@ -183,3 +185,48 @@ def test_results_for_tests() -> None:
 
     # then
     assert results == RESULTS
+
+
+def test_results_for_tests_df() -> None:
+    # given
+    pd = pytest.importorskip("pandas")
+    connector = StubAPISyntheticsConnector(results_response=pb.GetResultsForTestsResponse(results=PB_RESULTS))
+    client = KentikSynthClient(connector)
+
+    # when
+    df = client.results_for_tests_df(test_ids=[ID("1234")], start=datetime(1970, 1, 1), end=datetime.now())
+
+    # then
+    assert list(df.columns) == RESULTS_COLUMNS
+    rows = df.to_dict("records")
+    expected = [
+        (test, agent, task) for test in RESULTS for agent in test.agents for task in agent.tasks  # type: ignore
+    ]
+    assert len(rows) == len(expected)
+    for row, (test, agent, task) in zip(rows, expected):
+        assert row["time"].timestamp() == test.time.timestamp()
+        assert (row["test_id"], row["test_health"]) == (test.test_id, test.health.value)
+        assert (row["agent_id"], row["agent_health"]) == (agent.agent_id, agent.health.value)
+        assert row["task_health"] == task.health.value
+        assert task.task is not None
+        assert row["target"] == task.task.target
+        assert row["latency_current"] == task.task.latency.current
+        assert row["latency_rolling_stddev"] == task.task.latency.rolling_stddev
+        if isinstance(task.task, PingTaskResults):
+            assert row["task_type"] == "ping"
+            assert row["jitter_rolling_avg"] == task.task.jitter.rolling_avg
+            assert row["packet_loss_current"] == task.task.packet_loss.current
+            assert pd.isna(row["response_status"])
+        elif isinstance(task.task, HttpTaskResults):
+            assert row["task_type"] == "http"
+            assert (row["response_status"], row["response_size"]) == (
+                task.task.response.status,
+                task.task.response.size,
+            )
+            assert row["dst_ip"] == str(task.task.dst_ip)
+            assert pd.isna(row["jitter_current"])
+        else:
+            assert isinstance(task.task, DnsTaskResults)
+            assert row["task_type"] == "dns"
+            assert row["dns_server"] == task.task.server
+            assert row["response_status"] == task.task.response.status
@@ -0,0 +1,194 @@
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional, Set, Tuple
+
+import pytest
+from google.protobuf.timestamp_pb2 import Timestamp  # type: ignore
+
+import kentik_api.generated.kentik.synthetics.v202202.synthetics_pb2 as pb
+from kentik_api.public.errors import NotFoundError, ProtocolError, TimedOutError, UnavailabilityError
+from kentik_api.synthetics.results_fetcher import GRPC_RESOURCE_EXHAUSTED, ResultsFetcher, split_chunks
+from kentik_api.synthetics.synth_client import KentikSynthClient
+
+START = datetime(2022, 4, 1, tzinfo=timezone.utc)
+HOUR = 3600
+
+
+class _Connector:
+    """Returns one result per test per hour in [start, end] (both inclusive, to exercise de-duplication)"""
+
+    def __init__(self, fail: Optional[Set[int]] = None, too_large_over: Optional[int] = None) -> None:
+        self.calls: List[Tuple[Tuple[str, ...], int, int]] = []
+        self.timeouts: List[Optional[float]] = []
+        self._fail = fail or set()  # numbers of calls to fail with TimedOutError
+        self._too_large_over = too_large_over  # fail requests longer than this many seconds
+        self._lock = threading.Lock()
+
+    def results_for_tests(
+        self,
+        test_ids: List[str],
+        start: Timestamp,
+        end: Timestamp,
+        agent_ids: Optional[List[str]] = None,
+        task_ids: Optional[List[str]] = None,
+        aggregate: bool = False,
+        timeout: Optional[float] = None,
+    ) -> pb.GetResultsForTestsResponse:
+        with self._lock:
+            self.calls.append((tuple(test_ids), start.seconds, end.seconds))
+            self.timeouts.append(timeout)
+            call = len(self.calls)
+        if call in self._fail:
+            raise TimedOutError("timeout")
+        if self._too_large_over is not None and end.seconds - start.seconds > self._too_large_over:
+            raise ProtocolError("gRPC", GRPC_RESOURCE_EXHAUSTED, "resource exhausted")
+        first = -(-start.seconds // HOUR) * HOUR
+        return pb.GetResultsForTestsResponse(
+            results=[
+                pb.TestResults(test_id=test_id, time=Timestamp(seconds=t))
+                for t in range(first, end.seconds + 1, HOUR)
+                for test_id in test_ids
+            ]
+        )
+
+
+def _keys(results: List[pb.TestResults]) -> List[Tuple[str, int]]:
+    return [(r.test_id, r.time.seconds) for r in results]
+
+
+def _expected(test_ids: List[str], hours: int) -> Set[Tuple[str, int]]:
+    first = int(START.timestamp())
+    return {(test_id, first + h * HOUR) for h in range(hours + 1) for test_id in test_ids}
+
+
+def test_split_chunks() -> None:
+    # when
+    chunks = split_chunks(["1", "2", "3"], START, START + timedelta(hours=5), timedelta(hours=2), batch_size=2)
+
+    # then
+    assert [(c.test_ids, c.end - c.start) for c in chunks] == [
+        (("1", "2"), timedelta(hours=2)),
+        (("3",), timedelta(hours=2)),
+        (("1", "2"), timedelta(hours=2)),
+        (("3",), timedelta(hours=2)),
+        (("1", "2"), timedelta(hours=1)),
+        (("3",), timedelta(hours=1)),
+    ]
+    with pytest.raises(ValueError):
+        split_chunks(["1"], START, START, timedelta(0), 1)
+
+
+def test_results_merged_in_order_without_duplicates() -> None:
+    # given
+    connector = _Connector()
+    fetcher = ResultsFetcher(connector, window=timedelta(hours=4), batch_size=2, max_workers=3)
+    test_ids = ["1", "2", "3"]
+
+    # when
+    results = _keys(list(fetcher.iter_pb(test_ids, START, START + timedelta(hours=24))))
+
+    # then
+    assert len(connector.calls) == 12
+    assert len(results) == len(set(results))
+    assert set(results) == _expected(test_ids, 24)
+    first, window = int(START.timestamp()), 4 * HOUR
+    windows = [max(0, -(-(t - first) // window) - 1) for _, t in results]  # results at window end belong to it
+    assert windows == sorted(windows)
+
+
+def test_failing_chunk_retried() -> None:
+    # given
+    connector = _Connector(fail={2, 3})
+    fetcher = ResultsFetcher(connector, window=timedelta(hours=4), max_workers=1, backoff=0)
+
+    # when
+    results = _keys(list(fetcher.iter_pb(["1"], START, START + timedelta(hours=8))))
+
+    # then
+    assert set(results) == _expected(["1"], 8)
+    assert len(connector.calls) == 4
+    assert connector.calls[1] == connector.calls[2] == connector.calls[3]  # only the failing chunk repeated
+
+
+def test_too_large_chunk_split() -> None:
+    # given
+    connector = _Connector(too_large_over=2 * HOUR)
+    fetcher = ResultsFetcher(connector, window=timedelta(hours=8), backoff=0)
+
+    # when
+    results = _keys(list(fetcher.iter_pb(["1"], START, START + timedelta(hours=8))))
+
+    # then
+    assert set(results) == _expected(["1"], 8)
+    assert len(results) == len(set(results))
+
+
+def test_timing_out_chunk_split_with_shared_retries() -> None:
+    # given - every call times out
+    connector = _Connector(fail=set(range(1, 1000)))
+    fetcher = ResultsFetcher(connector, window=timedelta(hours=8), retries=2, backoff=0, min_window=timedelta(hours=2))
+
+    # when - then
+    with pytest.raises(TimedOutError):
+        list(fetcher.iter_pb(["1"], START, START + timedelta(hours=8)))
+    # 3 calls of the whole chunk, then the first half (4 hours), its first quarter (2 hours, minimal); no retries left
+    assert [end - start for _, start, end in connector.calls] == [8 * HOUR] * 3 + [4 * HOUR, 2 * HOUR]
+
+
+def test_timeout_passed_to_every_call() -> None:
+    # given
+    connector = _Connector()
+    client = KentikSynthClient(connector)  # type: ignore
+
+    # when
+    list(
+        client.iter_results_for_tests(
+            ["1"], START, START + timedelta(hours=9), window=timedelta(hours=3), chunk_timeout=2.5
+        )
+    )
+
+    # then
+    assert connector.timeouts == [2.5] * 3
+
+
+def test_unavailable_chunk_not_split() -> None:
+    # given
+    class _UnavailableConnector(_Connector):
+        def results_for_tests(self, *args, **kwargs) -> pb.GetResultsForTestsResponse:  # type: ignore
+            super().results_for_tests(*args, **kwargs)
+            raise UnavailabilityError("gRPC", 14, "unavailable")
+
+    connector = _UnavailableConnector()
+    fetcher = ResultsFetcher(connector, window=timedelta(hours=8), retries=2, backoff=0)
+
+    # when - then
+    with pytest.raises(UnavailabilityError):
+        list(fetcher.iter_pb(["1"], START, START + timedelta(hours=8)))
+    assert len(connector.calls) == 3
+
+
+def test_non_intermittent_error_raised() -> None:
+    # given
+    class _FailingConnector(_Connector):
+        def results_for_tests(self, *args, **kwargs) -> pb.GetResultsForTestsResponse:  # type: ignore
+            raise NotFoundError("gRPC", 5, "not found")
+
+    fetcher = ResultsFetcher(_FailingConnector(), window=timedelta(hours=1), backoff=0)
+
+    # when - then
+    with pytest.raises(NotFoundError):
+        list(fetcher.iter_pb(["1"], START, START + timedelta(hours=3)))
+
+
+def test_iter_results_for_tests() -> None:
+    # given
+    client = KentikSynthClient(_Connector())  # type: ignore
+
+    # when
+    results = list(
+        client.iter_results_for_tests(["1", "2"], START, START + timedelta(hours=10), window=timedelta(hours=3))
+    )
+
+    # then
+    assert {(str(r.test_id), int(r.time.timestamp())) for r in results} == _expected(["1", "2"], 10)
+    assert len(results) == len(_expected(["1", "2"], 10))
@@ -30,3 +30,16 @@ def test_replace_legacy_tasks() -> None:
 
     # then
     assert REPLACEMENT_TASK in settings.tasks
+
+
+def test_filter_tasks_without_modifying_source() -> None:
+    # given
+    pb_settings = pb.TestSettings(tasks=["knock", "bgp-monitor", "traceroute"], period=60)
+
+    # when
+    settings = SynTestSettings.from_pb(pb_settings)
+
+    # then
+    assert settings.tasks == [TaskType.TRACE_ROUTE, TaskType.PING]
+    assert settings.period == 60
+    assert list(pb_settings.tasks) == ["knock", "bgp-monitor", "traceroute"]
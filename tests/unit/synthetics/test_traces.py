@@ -1,5 +1,6 @@
 from datetime import datetime, timezone
 
+import pytest
 from google.protobuf.timestamp_pb2 import Timestamp  # type: ignore
 
 import kentik_api.generated.kentik.synthetics.v202202.synthetics_pb2 as pb
@@ -267,3 +268,46 @@ def test_results_for_tests() -> None:
 
     # then
     assert traces == TRACES
+
+
+def test_trace_graph() -> None:
+    np = pytest.importorskip("numpy")
+    from kentik_api.synthetics.synth_tests.trace_graph import NO_NODE, TraceGraph
+
+    # given
+    later = pb.Path()
+    later.CopyFrom(PB_TRACES.paths[0])
+    later.time.seconds += 600
+    del later.traces[1].hops[1]  # route of the incomplete trace changed, AS path did not
+    response = pb.GetTraceForTestResponse(nodes=PB_TRACES.nodes, paths=[later, PB_TRACES.paths[0]])
+    connector = StubAPISyntheticsConnector(traces_response=response)
+    client = KentikSynthClient(connector)
+
+    # when
+    graph = client.trace_graph_for_test(
+        ID(1), datetime(2022, 1, 1, tzinfo=timezone.utc), datetime(2022, 1, 2, tzinfo=timezone.utc)
+    )
+    stats = graph.node_latency()
+
+    # then
+    assert (graph.path_count, graph.trace_count) == (2, 4)
+    assert graph.hop_count.tolist() == [5, 2, 5, 3]
+    assert graph.hops.shape == (4, 5)
+    assert graph.hops[1, 2] == NO_NODE
+    # "145.11.183.168" is missing in the node table and is interned when building the graph
+    unknown = graph.node_index("145.11.183.168")
+    assert graph.node_ids[unknown] == "145.11.183.168"
+    assert graph.node_table == {node_id: i for i, node_id in enumerate(graph.node_ids)}
+    assert stats.count[unknown] == 3
+    first = graph.node_index("10.100.20.200")
+    assert (stats.count[first], stats.mean[first], stats.min[first], stats.max[first]) == (4, 15.0, 15, 15)
+    assert np.isnan(stats.mean[graph.node_index("45.11.183.168")])
+    changes = graph.path_changes()
+    assert [(c.agent_id, c.target_ip, c.previous, c.current) for c in changes] == [("1000", "151.139.44.19", 1, 0)]
+    assert changes[0].time == datetime.fromtimestamp(1577923200 + 600, timezone.utc)
+    assert graph.path_changes(by="as_path") == []
+    from_response, from_pb = TraceGraph.from_response(TRACES), TraceGraph.from_pb(PB_TRACES)
+    assert [[from_response.node_ids[n] for n in row if n != NO_NODE] for row in from_response.hops] == [
+        [from_pb.node_ids[n] for n in row if n != NO_NODE] for row in from_pb.hops
+    ]
+    assert from_response.path_time.tolist() == from_pb.path_time.tolist()